@@ -4004,4 +4004,43 @@ class DataLoadConfigViewTests(TestCase, AdminTestMixin):
         self.assertEqual(
             DataLoadConfig.objects.filter(is_loaded=True).count(),
             0
-        )
\ No newline at end of file
+        )
+
+# =============================================================================
+# AI USAGE PAGE TESTS
+# =============================================================================
+
+class AIUsageViewTest(AdminTestMixin, TestCase):
+    """Tests for the AI usage (latency/cost) page."""
+
+    def setUp(self):
+        self.admin = self.create_admin()
+        self.client.login(email='admin@example.com', password='adminpass123')
+
+    def test_requires_staff(self):
+        self.client.logout()
+        self.create_user()
+        self.client.login(email='user@example.com', password='testpass123')
+
+        response = self.client.get(reverse('admin_console:ai_usage'))
+        self.assertEqual(response.status_code, 302)
+
+    def test_shows_percentiles_per_feature(self):
+        from apps.ai.models import AIUsageLog
+
+        for latency in (100, 200, 300, 400, 1000):
+            AIUsageLog.objects.create(endpoint='daily_insight', model_used='gpt-4o-mini',
+                                      latency_ms=latency, total_tokens=10)
+        AIUsageLog.objects.create(endpoint='daily_insight', model_used='gpt-4o-mini',
+                                  cache_hit=True)
+
+        response = self.client.get(reverse('admin_console:ai_usage'), {'days': 30})
+
+        self.assertEqual(response.status_code, 200)
+        row = response.context['rows'][0]
+        self.assertEqual(row['endpoint'], 'daily_insight')
+        self.assertEqual(row['calls'], 6)
+        self.assertEqual(row['cache_hits'], 1)
+        self.assertEqual(row['p50_ms'], 300)
+        self.assertEqual(row['p95_ms'], 1000)
+        self.assertContains(response, 'daily_insight')
@@ -4,7 +4,7 @@
 # Description: Admin console URL configuration
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-01
-# Last Updated: 2026-01-03 (Added DataLoadConfig management routes)
+# Last Updated: 2026-10-16 (Added AI usage page)
 # ==============================================================================
 """
 Admin Console URLs
@@ -51,6 +51,9 @@ urlpatterns = [
     path("choices/options/<int:pk>/edit/", views.ChoiceOptionUpdateView.as_view(), name="choice_option_update"),
     path("choices/options/<int:pk>/delete/", views.ChoiceOptionDeleteView.as_view(), name="choice_option_delete"),
 
+    # AI Usage
+    path("ai-usage/", views.AIUsageView.as_view(), name="ai_usage"),
+
     # Test History
     path("tests/", views.TestRunListView.as_view(), name="test_run_list"),
     path("tests/run/", views.RunTestsView.as_view(), name="run_tests"),
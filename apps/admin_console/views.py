@@ -4,7 +4,7 @@
 # Description: Admin console views for site management and project task intake
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-01
-# Last Updated: 2026-01-03 (Added HelpContextMixin to Project views, DataLoadConfig management views)
+# Last Updated: 2026-10-16 (Added AI usage page)
 # ==============================================================================
 """
 Admin Views - Custom admin interface for site management.
@@ -264,6 +264,39 @@ class UserListView(HelpContextMixin, AdminRequiredMixin, ListView):
         return User.objects.all().order_by('-date_joined')
 
 
+# ============================================================
+# AI Usage
+# ============================================================
+
+class AIUsageView(AdminRequiredMixin, TemplateView):
+    """Per-feature AI latency (p50/p95), tokens and cost from AIUsageLog."""
+    template_name = "admin_console/ai_usage.html"
+    period_choices = (1, 7, 30)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.ai.instrumentation import usage_report
+
+        try:
+            days = int(self.request.GET.get('days', 7))
+        except ValueError:
+            days = 7
+        if days not in self.period_choices:
+            days = 7
+
+        rows = usage_report(since=timezone.now() - timedelta(days=days))
+        context['rows'] = rows
+        context['days'] = days
+        context['period_choices'] = self.period_choices
+        context['total_calls'] = sum(r['calls'] for r in rows)
+        context['total_cache_hits'] = sum(r['cache_hits'] for r in rows)
+        context['total_tokens'] = sum(r['tokens'] or 0 for r in rows)
+        context['total_cost'] = sum(r['cost'] or 0 for r in rows)
+        return context
+
+
 # ============================================================
 # Choice Category & Option Views (Phase 3)
 # ============================================================
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import CoachingStyle, AIInsight, AIUsageLog, AIPromptConfig
+from .models import CoachingStyle, AIInsight, AIUsageLog, AIPromptConfig, AIResponseCache
 
 
 @admin.register(CoachingStyle)
@@ -40,13 +40,22 @@ class AIInsightAdmin(admin.ModelAdmin):
 
 @admin.register(AIUsageLog)
 class AIUsageLogAdmin(admin.ModelAdmin):
-    list_display = ['endpoint', 'user', 'model_used', 'total_tokens', 'success', 'created_at']
-    list_filter = ['endpoint', 'model_used', 'success', 'created_at']
+    list_display = ['endpoint', 'user', 'model_used', 'total_tokens', 'latency_ms', 'cache_hit', 'success', 'created_at']
+    list_filter = ['endpoint', 'model_used', 'cache_hit', 'success', 'created_at']
     search_fields = ['user__email', 'endpoint']
     readonly_fields = ['created_at']
     date_hierarchy = 'created_at'
 
 
+@admin.register(AIResponseCache)
+class AIResponseCacheAdmin(admin.ModelAdmin):
+    list_display = ['key', 'model_used', 'hit_count', 'last_used_at', 'expires_at']
+    list_filter = ['model_used']
+    search_fields = ['key', 'response']
+    readonly_fields = ['key', 'model_used', 'response', 'hit_count', 'created_at', 'last_used_at', 'expires_at']
+    ordering = ['-last_used_at']
+
+
 @admin.register(AIPromptConfig)
 class AIPromptConfigAdmin(admin.ModelAdmin):
     list_display = ['name', 'prompt_type', 'min_sentences', 'max_sentences', 'is_active', 'updated_at']
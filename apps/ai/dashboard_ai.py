@@ -6,7 +6,7 @@
 #              intentions, faith, health, projects, and nutrition data.
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-28
-# Last Updated: 2025-12-31 (Enhanced AI context with comprehensive user data)
+# Last Updated: 2026-10-16 (Batched insight generation via get_insights)
 # ==============================================================================
 """
 Dashboard AI Integration - With Coaching Style Support
@@ -25,6 +25,7 @@ Gathers comprehensive user data including:
 """
 import logging
 from datetime import timedelta
+from functools import partial
 from django.db import models
 from django.utils import timezone
 from django.db.models import Count, F
@@ -35,6 +36,16 @@ from .models import AIInsight
 logger = logging.getLogger(__name__)
 
 
+class InsightPlan:
+    """Cached results plus the AI calls still needed for one user."""
+
+    def __init__(self, nudge_count: int = 0):
+        self.results = {'daily_insight': None, 'weekly_summary': None, 'nudges': []}
+        self.calls = {}
+        self.user_data = None
+        self.nudge_count = nudge_count
+
+
 class DashboardAI:
     """
     AI services specifically for dashboard insights.
@@ -55,81 +66,142 @@ class DashboardAI:
         Returns cached insight if available and valid, otherwise generates new one.
         Cache is invalidated when coaching style changes.
         """
-        # Check for cached valid insight with matching coaching style
-        if not force_refresh:
-            cached = AIInsight.objects.filter(
-                user=self.user,
-                insight_type='daily',
-                coaching_style=self.coaching_style,  # Must match current style
-                valid_until__gt=timezone.now()
-            ).first()
-
-            if cached:
-                return cached.content
-
-        # Generate new insight
-        user_data = self._gather_user_data()
-        content = ai_service.generate_daily_insight(
-            user_data,
-            self.faith_enabled,
-            self.coaching_style,
-            self.user_profile
-        )
-
-        if content:
-            # Cache until end of day
-            end_of_day = timezone.now().replace(hour=23, minute=59, second=59)
-            AIInsight.objects.create(
-                user=self.user,
-                insight_type='daily',
-                content=content,
-                context_summary=str(user_data)[:500],
-                coaching_style=self.coaching_style,  # Store the style used
-                valid_until=end_of_day
-            )
-
-        return content or self._get_fallback_insight()
+        return self.get_insights(
+            force_refresh=force_refresh, include_weekly=False
+        )['daily_insight']
     
     def get_weekly_summary(self, force_refresh: bool = False) -> str:
         """
         Get or generate weekly journal summary.
         Cache is invalidated when coaching style changes.
         """
-        # Check cache (valid for a day, must match coaching style)
-        if not force_refresh:
-            cached = AIInsight.objects.filter(
-                user=self.user,
-                insight_type='weekly_summary',
-                coaching_style=self.coaching_style,  # Must match current style
-                created_at__gte=timezone.now() - timedelta(days=1)
-            ).first()
+        return self.get_insights(
+            force_refresh=force_refresh, include_daily=False
+        )['weekly_summary']
 
-            if cached:
-                return cached.content
+    def get_insights(self, force_refresh: bool = False, include_daily: bool = True,
+                     include_weekly: bool = True, nudges: list = None) -> dict:
+        """
+        Get the daily insight, weekly summary and optional nudge messages.
 
-        # Gather journal entries
-        entries = self._get_journal_entries(days=7)
+        Cached insights are reused; everything that needs generating is sent
+        to OpenAI in one ai_service.run_batch() call, so the requests run
+        concurrently rather than one after another.
 
-        if not entries:
-            return None
+        Args:
+            force_refresh: Ignore cached insights
+            include_daily: Include the daily insight
+            include_weekly: Include the weekly journal summary
+            nudges: Optional list of (nudge_type, context) tuples, as for
+                get_nudge_message()
+
+        Returns:
+            dict with daily_insight, weekly_summary and nudges (list of str)
+        """
+        plan = self.plan_insights(force_refresh, include_daily, include_weekly, nudges)
+        generated = ai_service.run_batch(plan.calls) if plan.calls else {}
+        return self.finish_insights(plan, generated)
 
-        content = ai_service.generate_journal_summary(
-            entries,
-            'week',
-            self.faith_enabled,
-            self.coaching_style
-        )
+    def plan_insights(self, force_refresh: bool = False, include_daily: bool = True,
+                      include_weekly: bool = True, nudges: list = None) -> 'InsightPlan':
+        """
+        Read cached insights and prepare the AI calls still needed.
 
-        if content:
-            AIInsight.objects.create(
-                user=self.user,
-                insight_type='weekly_summary',
-                content=content,
-                coaching_style=self.coaching_style,  # Store the style used
-                valid_until=timezone.now() + timedelta(days=1)
+        Split from finish_insights() so callers can batch the calls of
+        several users together (see pregenerate_insights()).
+        """
+        plan = InsightPlan(nudge_count=len(nudges or []))
+
+        if include_daily:
+            cached = None if force_refresh else self._cached_insight(
+                'daily', valid_until__gt=timezone.now()
             )
+            if cached:
+                plan.results['daily_insight'] = cached
+            else:
+                plan.user_data = self._gather_user_data()
+                plan.calls['daily_insight'] = partial(
+                    ai_service.generate_daily_insight,
+                    plan.user_data,
+                    self.faith_enabled,
+                    self.coaching_style,
+                    self.user_profile,
+                    bypass_cache=force_refresh,
+                )
+
+        if include_weekly:
+            # Weekly summary is valid for a day
+            cached = None if force_refresh else self._cached_insight(
+                'weekly_summary', created_at__gte=timezone.now() - timedelta(days=1)
+            )
+            if cached:
+                plan.results['weekly_summary'] = cached
+            else:
+                entries = self._get_journal_entries(days=7)
+                if entries:
+                    plan.calls['weekly_summary'] = partial(
+                        ai_service.generate_journal_summary,
+                        entries,
+                        'week',
+                        self.faith_enabled,
+                        self.coaching_style,
+                        bypass_cache=force_refresh,
+                    )
+
+        for index, (nudge_type, context) in enumerate(nudges or []):
+            plan.calls[f'nudge_{index}'] = partial(self.get_nudge_message, nudge_type, context)
+
+        return plan
+
+    def finish_insights(self, plan: 'InsightPlan', generated: dict) -> dict:
+        """Store newly generated insights and return the combined results."""
+        from apps.core.utils import get_user_now
+
+        results = plan.results
+
+        if 'daily_insight' in plan.calls:
+            content = generated.get('daily_insight')
+            if content:
+                # Cache until the end of the user's local day
+                end_of_day = get_user_now(self.user).replace(
+                    hour=23, minute=59, second=59, microsecond=0
+                )
+                AIInsight.objects.create(
+                    user=self.user,
+                    insight_type='daily',
+                    content=content,
+                    context_summary=str(plan.user_data)[:500],
+                    coaching_style=self.coaching_style,  # Store the style used
+                    valid_until=end_of_day
+                )
+            results['daily_insight'] = content or self._get_fallback_insight()
+
+        if 'weekly_summary' in plan.calls:
+            content = generated.get('weekly_summary')
+            if content:
+                AIInsight.objects.create(
+                    user=self.user,
+                    insight_type='weekly_summary',
+                    content=content,
+                    coaching_style=self.coaching_style,  # Store the style used
+                    valid_until=timezone.now() + timedelta(days=1)
+                )
+            results['weekly_summary'] = content
+
+        results['nudges'] = [
+            generated.get(f'nudge_{index}') for index in range(plan.nudge_count)
+        ]
+        return results
 
-        return content
+    def _cached_insight(self, insight_type: str, **filters):
+        """Content of a cached insight matching the current coaching style."""
+        cached = AIInsight.objects.filter(
+            user=self.user,
+            insight_type=insight_type,
+            coaching_style=self.coaching_style,  # Must match current style
+            **filters
+        ).first()
+        return cached.content if cached else None
     
     def get_nudge_message(self, nudge_type: str, context: dict) -> str:
         """
@@ -553,28 +625,11 @@ class DashboardAI:
     
     def _calculate_journal_streak(self) -> int:
         """Calculate current journal streak in days."""
-        from apps.journal.models import JournalEntry
-        
-        entries = JournalEntry.objects.filter(
-            user=self.user
-        ).order_by('-entry_date').values_list('entry_date', flat=True).distinct()[:30]
-
-        if not entries:
-            return 0
-
+        from apps.core.models import UserActivityCounters
         from apps.core.utils import get_user_today
-        today = get_user_today(self.user)
-        streak = 0
-        expected_date = today
-        
-        for entry_date in entries:
-            if entry_date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            elif entry_date < expected_date:
-                break
-        
-        return streak
+
+        counters = UserActivityCounters.for_user(self.user)
+        return counters.journal_streak(get_user_today(self.user))
     
     def _get_fallback_insight(self) -> str:
         """Fallback insight when AI is unavailable."""
@@ -621,3 +676,54 @@ def get_dashboard_insight(user) -> dict:
         'daily_insight': dashboard_ai.get_daily_insight(),
         'weekly_summary': dashboard_ai.get_weekly_summary(),
     }
+
+
+def pregenerate_insights(users, force_refresh: bool = False) -> dict:
+    """
+    Generate daily insights and weekly summaries for a batch of users.
+
+    Each user's prompts are built and cached rows checked on this thread;
+    the OpenAI requests for the whole batch then run together through
+    ai_service.run_batch(), bounded by the executor's pool size.
+
+    Args:
+        users: Iterable of users (preferences should be select_related)
+        force_refresh: Regenerate even if a valid insight exists
+
+    Returns:
+        dict with users, generated and failed counts
+    """
+    stats = {'users': 0, 'generated': 0, 'failed': 0}
+    if not ai_service.is_available:
+        return stats
+
+    planned = []
+    calls = {}
+    for user in users:
+        stats['users'] += 1
+        try:
+            dashboard_ai = DashboardAI(user)
+            plan = dashboard_ai.plan_insights(force_refresh=force_refresh)
+        except Exception as e:
+            logger.error(f"Failed to plan AI insights for user {user.pk}: {e}")
+            stats['failed'] += 1
+            continue
+        planned.append((dashboard_ai, plan))
+        for name, call in plan.calls.items():
+            calls[(user.pk, name)] = call
+
+    generated = ai_service.run_batch(calls) if calls else {}
+
+    for dashboard_ai, plan in planned:
+        user_id = dashboard_ai.user.pk
+        user_generated = {name: generated.get((user_id, name)) for name in plan.calls}
+        try:
+            dashboard_ai.finish_insights(plan, user_generated)
+        except Exception as e:
+            logger.error(f"Failed to store AI insights for user {user_id}: {e}")
+            stats['failed'] += 1
+            continue
+        stats['generated'] += sum(1 for content in user_generated.values() if content)
+        stats['failed'] += sum(1 for content in user_generated.values() if not content)
+
+    return stats
@@ -0,0 +1,90 @@
+# ==============================================================================
+# File: executor.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Bounded, coalescing thread pool for outbound OpenAI requests
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+AI Execution Engine
+
+Runs OpenAI HTTP requests on a small shared thread pool so several calls
+for one page can be in flight at once, and so identical prompts that are
+already in flight share a single request.
+
+Worker threads only perform the HTTP call. Prompt building (which reads
+coaching styles and prompt configs from the database) and saving results
+stay on the calling thread, so no database connections are opened by the
+pool.
+
+Settings:
+    OPENAI_MAX_CONCURRENCY: Pool size (default 4)
+    OPENAI_TIMEOUT: Seconds to wait for one call (default 20)
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AIExecutor:
+    """
+    Thread pool with request coalescing.
+
+    submit() returns a Future; while a call for the same key is running,
+    later submissions receive the same Future instead of a new request.
+    """
+
+    def __init__(self, max_workers=None, timeout=None):
+        self.max_workers = max_workers or getattr(settings, 'OPENAI_MAX_CONCURRENCY', 4)
+        self.timeout = timeout or getattr(settings, 'OPENAI_TIMEOUT', 20)
+        self._pool = None
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def submit(self, key, fn) -> Future:
+        """Run fn() on the pool, sharing the Future with identical in-flight calls."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='wlj-ai',
+                )
+            future = self._pool.submit(fn)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda f: self._forget(key, f))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def result(self, future, timeout=None, default=None):
+        """Wait for a Future, returning default on timeout or error."""
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeoutError:
+            logger.error(f"OpenAI call timed out after {timeout or self.timeout}s")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+        return default
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+# Shared by every AIService instance in the process
+ai_executor = AIExecutor()
@@ -0,0 +1,158 @@
+# ==============================================================================
+# File: instrumentation.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Token, latency and cost accounting for every OpenAI call
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+AI Instrumentation
+
+Every OpenAI request in the app is recorded as an AIUsageLog row with the
+feature that made it (endpoint), model, prompt/completion tokens, wall
+time and estimated cost.
+
+- create_completion() wraps client.chat.completions.create() for code that
+  calls OpenAI directly (scan vision, barcode, medicine and product AI
+  fallbacks, provider lookup)
+- record_usage() is used by AIService, whose requests run on executor
+  threads: the worker measures the call and the calling thread records it,
+  so the pool never opens database connections
+- usage_report() aggregates the log into per-feature latency percentiles
+  and cost for the admin console
+
+Recording never raises; a failed write is logged and the AI result is
+returned as usual.
+"""
+import logging
+import math
+import time
+from decimal import Decimal
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# USD per 1M tokens (input, output)
+MODEL_PRICING = {
+    'gpt-4o-mini': (Decimal('0.15'), Decimal('0.60')),
+    'gpt-4o': (Decimal('2.50'), Decimal('10.00')),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> Decimal:
+    """Estimated USD cost of one call; unknown models cost 0."""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        # Dated snapshots, e.g. gpt-4o-mini-2024-07-18
+        pricing = next(
+            (price for name, price in sorted(MODEL_PRICING.items(), key=lambda p: -len(p[0]))
+             if model.startswith(name)),
+            (Decimal('0'), Decimal('0')),
+        )
+    input_price, output_price = pricing
+    return (input_price * prompt_tokens + output_price * completion_tokens) / Decimal(1_000_000)
+
+
+def token_counts(response) -> tuple:
+    """(prompt_tokens, completion_tokens) from an OpenAI response, 0 if absent."""
+    usage = getattr(response, 'usage', None)
+    try:
+        return (int(getattr(usage, 'prompt_tokens', 0) or 0),
+                int(getattr(usage, 'completion_tokens', 0) or 0))
+    except (TypeError, ValueError):
+        return (0, 0)
+
+
+def record_usage(endpoint: str, model: str, *, user=None, response=None,
+                 latency_ms: int = 0, success: bool = True, error: str = '',
+                 cache_hit: bool = False):
+    """Write one AIUsageLog row. Never raises."""
+    try:
+        from .models import AIUsageLog
+
+        prompt_tokens, completion_tokens = token_counts(response)
+        AIUsageLog.objects.create(
+            user=user if getattr(user, 'is_authenticated', False) else None,
+            endpoint=endpoint[:50],
+            model_used=(model or '')[:50],
+            cache_hit=cache_hit,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            estimated_cost_usd=estimate_cost(model or '', prompt_tokens, completion_tokens),
+            latency_ms=max(int(latency_ms), 0),
+            success=success,
+            error_message=error[:500],
+        )
+    except Exception as e:
+        logger.warning(f"Could not record AI usage for {endpoint}: {e}")
+
+
+def create_completion(client, endpoint: str, user=None, **kwargs):
+    """
+    Call client.chat.completions.create(**kwargs) and record the call.
+
+    Exceptions from OpenAI are recorded as failures and re-raised so the
+    caller's existing error handling still applies.
+    """
+    started = time.monotonic()
+    try:
+        response = client.chat.completions.create(**kwargs)
+    except Exception as e:
+        record_usage(endpoint, kwargs.get('model', ''), user=user,
+                     latency_ms=(time.monotonic() - started) * 1000,
+                     success=False, error=str(e))
+        raise
+    record_usage(endpoint, kwargs.get('model', ''), user=user, response=response,
+                 latency_ms=(time.monotonic() - started) * 1000)
+    return response
+
+
+def percentile(values: list, pct: float) -> Optional[int]:
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return None
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+def usage_report(since=None) -> list:
+    """
+    Per-feature usage since a datetime, slowest p95 first.
+
+    Each row has endpoint, calls, cache_hits, errors, tokens, cost and
+    p50/p95 latency of the successful calls that reached OpenAI. Failed
+    calls are counted in errors only, so timeouts do not skew latency.
+    """
+    from django.db.models import Count, Q, Sum
+
+    from .models import AIUsageLog
+
+    logs = AIUsageLog.objects.all()
+    if since is not None:
+        logs = logs.filter(created_at__gte=since)
+
+    rows = {
+        row['endpoint']: dict(row, p50_ms=None, p95_ms=None)
+        for row in logs.order_by().values('endpoint').annotate(
+            calls=Count('id'),
+            cache_hits=Count('id', filter=Q(cache_hit=True)),
+            errors=Count('id', filter=Q(success=False)),
+            tokens=Sum('total_tokens'),
+            cost=Sum('estimated_cost_usd'),
+        )
+    }
+
+    latencies = {}
+    for endpoint, latency in (logs.filter(cache_hit=False, success=True)
+                              .order_by('endpoint', 'latency_ms')
+                              .values_list('endpoint', 'latency_ms')
+                              .iterator()):
+        latencies.setdefault(endpoint, []).append(latency)
+
+    for endpoint, values in latencies.items():
+        rows[endpoint]['p50_ms'] = percentile(values, 50)
+        rows[endpoint]['p95_ms'] = percentile(values, 95)
+
+    return sorted(rows.values(), key=lambda r: (r['p95_ms'] is None, -(r['p95_ms'] or 0)))
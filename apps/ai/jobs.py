@@ -0,0 +1,114 @@
+# ==============================================================================
+# File: apps/ai/jobs.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: AI scheduler job functions (must be importable by APScheduler)
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+AI Jobs - Background job functions for APScheduler.
+
+These functions are called by APScheduler using textual references
+(e.g., 'apps.ai.jobs:pregenerate_ai_insights'). They must be importable
+and cannot be nested/local functions.
+
+The insight job runs hourly. Each run picks the timezones where it is
+currently PREGENERATE_LOCAL_HOUR and generates the day's insights for
+consenting users there, so the dashboard only has to read AIInsight rows
+by the time they wake up.
+"""
+
+import logging
+
+import pytz
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Local hour at which a user's daily insight is generated
+PREGENERATE_LOCAL_HOUR = 4
+
+# Users whose OpenAI calls are sent together in one run_batch()
+PREGENERATE_BATCH_SIZE = 25
+
+
+def timezones_at_local_hour(hour, now=None):
+    """
+    Stored UserPreferences.timezone values whose local time is in the given hour.
+
+    Legacy values (e.g. US/Eastern) are resolved through TIMEZONE_LEGACY_MAP
+    but returned as stored so they can be used in a queryset filter.
+    """
+    from apps.users.models import UserPreferences
+
+    now = now or timezone.now()
+    stored = UserPreferences.objects.values_list('timezone', flat=True).distinct()
+
+    matching = []
+    for value in stored:
+        name = UserPreferences.TIMEZONE_LEGACY_MAP.get(value or 'UTC', value or 'UTC')
+        try:
+            local_hour = now.astimezone(pytz.timezone(name)).hour
+        except pytz.UnknownTimeZoneError:
+            logger.warning(f"Skipping unknown timezone '{value}' for AI pre-generation")
+            continue
+        if local_hour == hour:
+            matching.append(value)
+    return matching
+
+
+def consenting_users(timezones=None):
+    """Active users with AI enabled and data-processing consent given."""
+    from django.contrib.auth import get_user_model
+
+    users = get_user_model().objects.filter(
+        is_active=True,
+        preferences__ai_enabled=True,
+        preferences__ai_data_consent=True,
+    ).select_related('preferences').order_by('pk')
+
+    if timezones is not None:
+        users = users.filter(preferences__timezone__in=timezones)
+    return users
+
+
+def pregenerate_for_users(users, force_refresh=False, batch_size=PREGENERATE_BATCH_SIZE):
+    """Run pregenerate_insights() over a queryset in batches; returns totals."""
+    from apps.ai.dashboard_ai import pregenerate_insights
+
+    totals = {'users': 0, 'generated': 0, 'failed': 0}
+    batch = []
+    for user in users.iterator(chunk_size=batch_size):
+        batch.append(user)
+        if len(batch) >= batch_size:
+            for key, value in pregenerate_insights(batch, force_refresh).items():
+                totals[key] += value
+            batch = []
+    if batch:
+        for key, value in pregenerate_insights(batch, force_refresh).items():
+            totals[key] += value
+    return totals
+
+
+def pregenerate_ai_insights(now=None):
+    """
+    Pre-generate daily insights and weekly summaries.
+
+    This job runs hourly and only processes users whose local time is
+    PREGENERATE_LOCAL_HOUR.
+    """
+    from apps.ai.services import ai_service
+
+    if not ai_service.is_available:
+        logger.debug("AI pre-generation skipped: OpenAI not configured")
+        return None
+
+    timezones = timezones_at_local_hour(PREGENERATE_LOCAL_HOUR, now)
+    if not timezones:
+        logger.debug("No timezones at the pre-generation hour")
+        return {'users': 0, 'generated': 0, 'failed': 0}
+
+    results = pregenerate_for_users(consenting_users(timezones))
+    logger.info(f"AI insight pre-generation complete for {timezones}: {results}")
+    return results
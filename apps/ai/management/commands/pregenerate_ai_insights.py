@@ -0,0 +1,84 @@
+# ==============================================================================
+# File: pregenerate_ai_insights.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to generate dashboard AI insights ahead of time
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Pre-generate AI Insights Command
+
+Generates the daily insight and weekly summary for consenting users so the
+dashboard reads them from AIInsight instead of calling OpenAI. The hourly
+APScheduler job (apps.ai.jobs:pregenerate_ai_insights) does this
+automatically per timezone; use this command for manual runs.
+
+Usage:
+    python manage.py pregenerate_ai_insights                  # Timezones at the local pre-generation hour
+    python manage.py pregenerate_ai_insights --all            # Every consenting user
+    python manage.py pregenerate_ai_insights --user=a@b.com   # One user
+    python manage.py pregenerate_ai_insights --all --force    # Regenerate even if cached
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.ai.jobs import (
+    PREGENERATE_BATCH_SIZE,
+    PREGENERATE_LOCAL_HOUR,
+    consenting_users,
+    pregenerate_for_users,
+    timezones_at_local_hour,
+)
+from apps.ai.services import ai_service
+from apps.core.management.decorators import notify_on_error
+
+
+class Command(BaseCommand):
+    help = "Generate dashboard AI insights ahead of time for consenting users"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Process every consenting user, not just those at the local pre-generation hour",
+        )
+        parser.add_argument(
+            "--user",
+            help="Email of a single user to process",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate even if a valid insight already exists",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PREGENERATE_BATCH_SIZE,
+            help=f"Users per OpenAI batch (default: {PREGENERATE_BATCH_SIZE})",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        if not ai_service.is_available:
+            raise CommandError("OpenAI is not configured (OPENAI_API_KEY not set)")
+
+        if options["user"]:
+            users = consenting_users().filter(email=options["user"])
+            if not users.exists():
+                raise CommandError(f"No consenting user with email {options['user']}")
+        elif options["all"]:
+            users = consenting_users()
+        else:
+            users = consenting_users(timezones_at_local_hour(PREGENERATE_LOCAL_HOUR))
+
+        results = pregenerate_for_users(
+            users, force_refresh=options["force"], batch_size=options["batch_size"]
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {results['users']} user(s): "
+            f"{results['generated']} insight(s) generated, {results['failed']} failed."
+        ))
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0009_increase_coaching_style_length"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIResponseCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                ("model_used", models.CharField(max_length=50)),
+                ("response", models.TextField()),
+                ("hit_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("last_used_at", models.DateTimeField(db_index=True)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name": "AI Response Cache Entry",
+                "verbose_name_plural": "AI Response Cache",
+            },
+        ),
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="cache_hit",
+            field=models.BooleanField(
+                default=False,
+                help_text="Served from AIResponseCache without calling OpenAI",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="aiusagelog",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Null for calls not made on behalf of a specific user",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ai_usage_logs",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
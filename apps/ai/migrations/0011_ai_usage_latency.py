@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0010_ai_response_cache"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="latency_ms",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Wall time of the OpenAI request in milliseconds"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aiusagelog",
+            index=models.Index(
+                fields=["created_at", "endpoint"], name="ai_aiusagel_created_caf732_idx"
+            ),
+        ),
+    ]
@@ -13,6 +13,7 @@ Caching Strategy (2025-12-31):
 - CoachingStyle: Cached 1 hour, invalidates on save
 - AIPromptConfig: Cached 1 hour, invalidates on save
 - Both also invalidate system_prompt_* cache keys on save
+- AIResponseCache: Persistent prompt/response cache with TTL and LRU eviction
 """
 from django.core.cache import cache
 from django.db import models
@@ -342,18 +343,33 @@ class AIPromptConfig(models.Model):
 class AIUsageLog(models.Model):
     """
     Track AI API usage for monitoring and cost management.
+
+    One row per AI call, written by apps.ai.instrumentation. Calls served
+    from AIResponseCache are recorded with cache_hit=True and no tokens.
     """
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
-        related_name='ai_usage_logs'
+        related_name='ai_usage_logs',
+        null=True,
+        blank=True,
+        help_text="Null for calls not made on behalf of a specific user"
     )
     endpoint = models.CharField(max_length=50)  # e.g., 'journal_reflection', 'daily_insight'
     model_used = models.CharField(max_length=50)  # e.g., 'gpt-4o-mini'
 
+    cache_hit = models.BooleanField(
+        default=False,
+        help_text="Served from AIResponseCache without calling OpenAI"
+    )
+
     prompt_tokens = models.PositiveIntegerField(default=0)
     completion_tokens = models.PositiveIntegerField(default=0)
     total_tokens = models.PositiveIntegerField(default=0)
+    latency_ms = models.PositiveIntegerField(
+        default=0,
+        help_text="Wall time of the OpenAI request in milliseconds"
+    )
 
     # Estimated cost (for monitoring)
     estimated_cost_usd = models.DecimalField(
@@ -371,11 +387,87 @@ class AIUsageLog(models.Model):
         ordering = ['-created_at']
         verbose_name = "AI Usage Log"
         verbose_name_plural = "AI Usage Logs"
+        indexes = [
+            models.Index(fields=['created_at', 'endpoint']),
+        ]
 
     def __str__(self):
         return f"{self.endpoint} - {self.user} - {self.total_tokens} tokens"
 
 
+class AIResponseCache(models.Model):
+    """
+    Persistent prompt/response cache for OpenAI chat completions.
+
+    Keyed by a SHA-256 of (model, system prompt, user prompt, max_tokens),
+    so identical prompts are answered without another API call until the
+    entry expires. When the table grows past AI_RESPONSE_CACHE_MAX_ENTRIES
+    the least recently used entries are evicted.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    model_used = models.CharField(max_length=50)
+    response = models.TextField()
+
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(db_index=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name = "AI Response Cache Entry"
+        verbose_name_plural = "AI Response Cache"
+
+    def __str__(self):
+        return f"{self.model_used} {self.key[:12]} ({self.hit_count} hits)"
+
+    @classmethod
+    def lookup(cls, key):
+        """Return the cached response for key, or None if missing/expired."""
+        from django.utils import timezone
+
+        now = timezone.now()
+        entry = cls.objects.filter(key=key, expires_at__gt=now).only('response').first()
+        if entry is None:
+            return None
+        cls.objects.filter(pk=entry.pk).update(
+            hit_count=models.F('hit_count') + 1,
+            last_used_at=now,
+        )
+        return entry.response
+
+    @classmethod
+    def store(cls, key, model_used, response, ttl):
+        """Cache a response for ttl seconds, evicting LRU entries if full."""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        now = timezone.now()
+        _, created = cls.objects.update_or_create(
+            key=key,
+            defaults={
+                'model_used': model_used,
+                'response': response,
+                'last_used_at': now,
+                'expires_at': now + timedelta(seconds=ttl),
+            },
+        )
+        if created:
+            cls.evict()
+
+    @classmethod
+    def evict(cls, max_entries=None):
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        from django.utils import timezone
+
+        max_entries = max_entries or getattr(settings, 'AI_RESPONSE_CACHE_MAX_ENTRIES', 5000)
+        cls.objects.filter(expires_at__lte=timezone.now()).delete()
+
+        excess = cls.objects.count() - max_entries
+        if excess > 0:
+            stale = cls.objects.order_by('last_used_at').values_list('pk', flat=True)[:excess]
+            cls.objects.filter(pk__in=list(stale)).delete()
+
+
 # =============================================================================
 # DASHBOARD AI PERSONAL ASSISTANT MODELS
 # =============================================================================
@@ -411,7 +411,7 @@ class PersonalAssistant:
         celebration_worthy = []
 
         if self.prefs.ai_enabled and AIService.check_user_consent(self.user):
-            ai_result = self._generate_ai_assessment(state_data)
+            ai_result = self._generate_ai_assessment(state_data, bypass_cache=force_refresh)
             ai_assessment = ai_result.get('assessment', '')
             alignment_gaps = ai_result.get('gaps', [])
             celebration_worthy = ai_result.get('celebrations', [])
@@ -752,9 +752,10 @@ class PersonalAssistant:
     def _get_health_state(self, today, week_ago) -> Dict:
         """Get health-related metrics."""
         from apps.health.models import (
-            WeightEntry, FastingWindow, WorkoutSession,
-            Medicine, MedicineLog
+            WeightEntry, FastingWindow, WorkoutSession
         )
+        from apps.health.services.adherence import build_adherence_report
+        from apps.health.services.medicine import build_dose_plan
 
         data = {}
 
@@ -787,65 +788,30 @@ class PersonalAssistant:
         data['workout_streak'] = self._calculate_workout_streak(today)
 
         # Medicine adherence
-        medicine_logs = MedicineLog.objects.filter(
-            user=self.user,
-            scheduled_date__gte=week_ago,
-            scheduled_date__lte=today
-        )
-        taken = medicine_logs.filter(log_status__in=['taken', 'late']).count()
-        missed = medicine_logs.filter(log_status='missed').count()
-        total = taken + missed
-        data['medicine_adherence'] = round((taken / total) * 100) if total > 0 else None
+        data['medicine_adherence'] = build_adherence_report(
+            self.user, week_ago, today, include_medicines=False
+        ).overall.resolved_rate
+
+        # Today's scheduled doses (shared with the dashboard and medicine home)
+        dose_plan = build_dose_plan(self.user, today)
+        data['medicine_doses_today'] = dose_plan.total
+        data['medicine_doses_pending'] = dose_plan.pending_count
 
         return data
 
     def _calculate_journal_streak(self, today) -> int:
-        """Calculate consecutive days of journaling."""
-        from apps.journal.models import JournalEntry
-
-        entries = JournalEntry.objects.filter(
-            user=self.user
-        ).order_by('-entry_date').values_list('entry_date', flat=True).distinct()[:60]
-
-        if not entries:
-            return 0
-
-        streak = 0
-        expected = today
-
-        for entry_date in entries:
-            if entry_date == expected:
-                streak += 1
-                expected -= timedelta(days=1)
-            elif entry_date < expected:
-                break
+        """Consecutive days of journaling, from the materialised counters."""
+        from apps.core.models import UserActivityCounters
 
-        return streak
+        return UserActivityCounters.for_user(self.user).journal_streak(today)
 
     def _calculate_workout_streak(self, today) -> int:
-        """Calculate consecutive days with workouts."""
-        from apps.health.models import WorkoutSession
+        """Consecutive days with workouts, from the materialised counters."""
+        from apps.core.models import UserActivityCounters
 
-        dates = WorkoutSession.objects.filter(
-            user=self.user
-        ).order_by('-date').values_list('date', flat=True).distinct()[:60]
+        return UserActivityCounters.for_user(self.user).workout_streak(today)
 
-        if not dates:
-            return 0
-
-        streak = 0
-        expected = today
-
-        for workout_date in dates:
-            if workout_date == expected:
-                streak += 1
-                expected -= timedelta(days=1)
-            elif workout_date < expected:
-                break
-
-        return streak
-
-    def _generate_ai_assessment(self, state_data: Dict) -> Dict:
+    def _generate_ai_assessment(self, state_data: Dict, bypass_cache: bool = False) -> Dict:
         """Generate AI assessment of user state - focused on what REMAINS to be done."""
         if not ai_service.is_available:
             return {'assessment': '', 'gaps': [], 'celebrations': []}
@@ -892,6 +858,10 @@ class PersonalAssistant:
         if adherence is not None and adherence < 80:
             context_parts.append(f"Medicine adherence at {adherence}% - needs attention")
 
+        pending_doses = state_data.get('medicine_doses_pending', 0)
+        if pending_doses > 0:
+            context_parts.append(f"{pending_doses} medicine doses still to take today")
+
         # Word of year for context
         if state_data.get('word_of_year'):
             context_parts.append(f"Word of year: {state_data['word_of_year']}")
@@ -912,7 +882,11 @@ class PersonalAssistant:
 What STILL needs the user's attention today? Be direct, actionable, and mindful of time remaining. Use your coaching style ({self.coaching_style})."""
 
         try:
-            response = ai_service._call_api(system_prompt, user_prompt, max_tokens=150)
+            response = ai_service._call_api(
+                system_prompt, user_prompt, max_tokens=150,
+                endpoint='assistant_state', user=self.user,
+                bypass_cache=bypass_cache
+            )
 
             # Identify gaps from data - focus on action items
             gaps = []
@@ -1054,7 +1028,7 @@ What STILL needs the user's attention today? Be direct, actionable, and mindful
             ).values()
 
         # Gather context for priority generation
-        state = self.assess_current_state()
+        state = self.assess_current_state(force_refresh)
         context = self._build_priority_context(state)
 
         priorities = []
@@ -1506,7 +1480,10 @@ User's new message: {message}
 Respond as the Dashboard AI Personal Assistant. Focus on what REMAINS to be done, not what's been accomplished. Use your coaching style ({self.coaching_style}) and be mindful of time remaining today."""
 
         try:
-            return ai_service._call_api(system_prompt, user_prompt, max_tokens=300) or self._get_fallback_response(message)
+            return ai_service._call_api(
+                system_prompt, user_prompt, max_tokens=300,
+                endpoint='assistant_chat', user=self.user
+            ) or self._get_fallback_response(message)
         except Exception as e:
             logger.error(f"Response generation error: {e}")
             return self._get_fallback_response(message)
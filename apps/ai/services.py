@@ -5,7 +5,7 @@
 #              and optimized caching for reduced API calls
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-01-01
-# Last Updated: 2025-12-31 (Added system prompt caching for optimization)
+# Last Updated: 2026-10-16 (Token and latency accounting)
 # ==============================================================================
 """
 AI Services for Whole Life Journey - WITH DATABASE-DRIVEN PROMPTS
@@ -19,17 +19,65 @@ Caching Optimizations (2025-12-31):
 - System prompts cached by user/style combination (1 hour)
 - Coaching style prompts cached (1 hour)
 - AIPromptConfig cached (1 hour)
+
+API Execution (2026-10-16):
+- OpenAI requests run on a bounded shared thread pool (apps/ai/executor.py)
+  with a per-call timeout and a retry budget on the client
+- Identical prompts already in flight share one request
+- run_batch() sends several generate_* calls concurrently, so a page that
+  needs three insights waits for roughly one round trip
+
+Response Cache (2026-10-16):
+- Responses are stored in AIResponseCache keyed by the same hash used for
+  coalescing (model, system prompt, user prompt, max_tokens)
+- Entries expire after AI_RESPONSE_CACHE_TTL seconds; the table is capped at
+  AI_RESPONSE_CACHE_MAX_ENTRIES with least-recently-used eviction
+- Every call records a cache hit or miss in AIUsageLog
+
+Instrumentation (2026-10-16):
+- Each request's tokens, latency and estimated cost are recorded in
+  AIUsageLog via apps/ai/instrumentation.py, on the calling thread
 """
 import hashlib
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
 from datetime import timedelta
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 
+from .executor import ai_executor
+from .instrumentation import record_usage
+
 logger = logging.getLogger(__name__)
 
+
+class Completion:
+    """Result of one OpenAI request, measured on the executor thread."""
+
+    def __init__(self, text: str, response, latency_ms: int):
+        self.text = text
+        self.response = response
+        self.latency_ms = latency_ms
+        self.recorded = False  # coalesced callers share one Completion
+
+
+class PendingCall:
+    """An OpenAI request started by _call_api, not yet cached or recorded."""
+
+    def __init__(self, future: Future, key: str, ttl: int, endpoint: str, user=None):
+        self.started = time.monotonic()
+        self.future = future
+        self.key = key
+        self.ttl = ttl
+        self.endpoint = endpoint
+        self.user = user
+
+
 # Fallback coaching style prompt if database is unavailable
 FALLBACK_COACHING_PROMPT = """
 Your communication style is SUPPORTIVE PARTNER:
@@ -89,6 +137,8 @@ class AIService:
     def __init__(self):
         self.client = None
         self.model = getattr(settings, 'OPENAI_MODEL', 'gpt-4o-mini')
+        self.executor = ai_executor
+        self._local = threading.local()
         self._initialize_client()
 
     @staticmethod
@@ -118,7 +168,13 @@ class AIService:
         if api_key:
             try:
                 from openai import OpenAI
-                self.client = OpenAI(api_key=api_key)
+                self.client = OpenAI(
+                    api_key=api_key,
+                    # Point at a local stub server in development/testing
+                    base_url=getattr(settings, 'OPENAI_BASE_URL', None) or None,
+                    timeout=getattr(settings, 'OPENAI_TIMEOUT', 20),
+                    max_retries=getattr(settings, 'OPENAI_MAX_RETRIES', 1),
+                )
             except ImportError:
                 logger.warning("OpenAI package not installed. Run: pip install openai")
             except Exception as e:
@@ -245,26 +301,140 @@ class AIService:
             return (system, 150)  # Default max tokens
     
     def _call_api(self, system_prompt: str, user_prompt: str, 
-                  max_tokens: int = 300) -> Optional[str]:
-        """Make an API call to OpenAI."""
+                  max_tokens: int = 300, endpoint: str = 'general',
+                  user=None, cache_ttl: Optional[int] = None,
+                  bypass_cache: bool = False) -> Optional[str]:
+        """
+        Make an API call to OpenAI.
+
+        Identical prompts are answered from AIResponseCache while the entry
+        is fresh. Otherwise the request runs on the shared AI executor;
+        inside run_batch() a PendingCall is returned instead of waiting.
+
+        Args:
+            endpoint: Feature name recorded in AIUsageLog
+            user: User the call is made for (optional, for AIUsageLog)
+            cache_ttl: Seconds to cache the response (0 disables caching;
+                defaults to AI_RESPONSE_CACHE_TTL)
+            bypass_cache: Always call OpenAI, replacing any cached response
+                (for explicit refreshes)
+        """
         if not self.is_available:
             logger.warning("AI service not available - no API key configured")
             return None
-        
+
+        key = self._request_key(system_prompt, user_prompt, max_tokens)
+        if cache_ttl is None:
+            cache_ttl = getattr(settings, 'AI_RESPONSE_CACHE_TTL', 3600)
+
+        if cache_ttl and not bypass_cache:
+            started = time.monotonic()
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                record_usage(endpoint, self.model, user=user, cache_hit=True,
+                             latency_ms=(time.monotonic() - started) * 1000)
+                return cached
+
+        future = self.executor.submit(
+            key,
+            lambda: self._create_completion(system_prompt, user_prompt, max_tokens),
+        )
+        pending = PendingCall(future, key, cache_ttl, endpoint, user)
+        if getattr(self._local, 'deferred', False):
+            return pending
+        return self._complete(pending)
+
+    def _complete(self, pending: PendingCall) -> Optional[str]:
+        """Wait for a pending request, then record and cache its response."""
+        completion = self.executor.result(pending.future)
+        if completion is None:
+            error = (str(pending.future.exception()) if pending.future.done()
+                     else 'Timed out')
+            record_usage(pending.endpoint, self.model, user=pending.user,
+                         latency_ms=(time.monotonic() - pending.started) * 1000,
+                         success=False, error=error)
+            return None
+
+        if not completion.recorded:
+            completion.recorded = True
+            record_usage(pending.endpoint, self.model, user=pending.user,
+                         response=completion.response, latency_ms=completion.latency_ms)
+            if completion.text and pending.ttl:
+                try:
+                    from .models import AIResponseCache
+                    AIResponseCache.store(pending.key, self.model, completion.text, pending.ttl)
+                except Exception as e:
+                    logger.warning(f"Could not cache AI response: {e}")
+        return completion.text
+
+    def _cache_lookup(self, key: str) -> Optional[str]:
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
-            return response.choices[0].message.content.strip()
+            from .models import AIResponseCache
+            return AIResponseCache.lookup(key)
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.warning(f"AI response cache unavailable: {e}")
             return None
+
+    def _create_completion(self, system_prompt: str, user_prompt: str,
+                           max_tokens: int) -> Completion:
+        """Blocking OpenAI request; runs on an executor thread."""
+        started = time.monotonic()
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.7,
+        )
+        return Completion(
+            response.choices[0].message.content.strip(),
+            response,
+            int((time.monotonic() - started) * 1000),
+        )
+
+    def _request_key(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Identity of a request, used for coalescing and the response cache."""
+        payload = "\x00".join([self.model, str(max_tokens), system_prompt, user_prompt])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def _deferred(self):
+        self._local.deferred = True
+        try:
+            yield
+        finally:
+            self._local.deferred = False
+
+    def run_batch(self, calls: Dict[str, Callable[[], Optional[str]]]) -> Dict[str, Optional[str]]:
+        """
+        Run several AI calls with their OpenAI requests in flight together.
+
+        Each value is a zero-argument callable that returns the result of
+        _call_api, e.g. ``partial(ai_service.generate_daily_insight, data)``.
+        Prompts are built on this thread one after another; the requests
+        then run concurrently on the executor.
+
+        Args:
+            calls: Mapping of name -> callable
+
+        Returns:
+            Mapping of name -> response text (None on error or timeout)
+        """
+        pending = {}
+        with self._deferred():
+            for name, call in calls.items():
+                try:
+                    pending[name] = call()
+                except Exception as e:
+                    logger.error(f"AI batch call '{name}' failed: {e}")
+                    pending[name] = None
+
+        return {
+            name: self._complete(value) if isinstance(value, PendingCall) else value
+            for name, value in pending.items()
+        }
     
     # =========================================================================
     # JOURNAL INSIGHTS
@@ -291,11 +461,13 @@ class AIService:
 Provide a reflection. Acknowledge what they shared
 and offer encouragement or insight appropriate to your coaching style."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='journal_reflection')
 
     def generate_journal_summary(self, entries: list, period: str = "week",
                                   faith_enabled: bool = False,
-                                  coaching_style: str = 'supportive') -> Optional[str]:
+                                  coaching_style: str = 'supportive',
+                                  bypass_cache: bool = False) -> Optional[str]:
         """Generate a summary of journal entries over a period."""
         if not entries:
             return None
@@ -327,7 +499,8 @@ Provide a warm, insightful summary that:
 
 Match your response to your coaching style."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='journal_summary', bypass_cache=bypass_cache)
     
     # =========================================================================
     # DASHBOARD INSIGHTS
@@ -336,7 +509,8 @@ Match your response to your coaching style."""
     def generate_daily_insight(self, user_data: dict,
                                faith_enabled: bool = False,
                                coaching_style: str = 'supportive',
-                               user_profile: str = None) -> Optional[str]:
+                               user_profile: str = None,
+                               bypass_cache: bool = False) -> Optional[str]:
         """Generate a personalized daily insight for the dashboard.
 
         Args:
@@ -344,6 +518,7 @@ Match your response to your coaching style."""
             faith_enabled: Whether faith context should be included
             coaching_style: The user's preferred coaching style
             user_profile: User's personal AI profile for personalization
+            bypass_cache: Skip the response cache (explicit refresh)
         """
         # Get system prompt and config from database
         system, max_tokens = self._get_prompt_with_config(
@@ -499,7 +674,8 @@ Consider their Word of the Year, goals, and current progress.
 Be specific to their situation. Match your coaching style perfectly.
 Keep it concise but personal - 2-3 sentences max."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='daily_insight', bypass_cache=bypass_cache)
     
     def generate_accountability_nudge(self, gap_data: dict,
                                       faith_enabled: bool = False,
@@ -534,7 +710,8 @@ Keep it concise but personal - 2-3 sentences max."""
 Generate a nudge that acknowledges this gap.
 Match your coaching style exactly—this is important for how you frame it."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='accountability_nudge')
     
     def generate_celebration(self, achievement_data: dict,
                              faith_enabled: bool = False,
@@ -563,7 +740,8 @@ Match your coaching style exactly—this is important for how you frame it."""
 Generate a celebration message.
 Match your coaching style—even Direct Coach should acknowledge wins warmly."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='celebration')
     
     # =========================================================================
     # GOAL & PURPOSE INSIGHTS
@@ -590,7 +768,8 @@ Progress notes: {goal_data.get('progress_notes', 'None yet')[:300]}
 Provide feedback about their goal journey.
 Match your coaching style."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='goal_progress')
     
     # =========================================================================
     # HEALTH INSIGHTS
@@ -627,7 +806,8 @@ Match your coaching style."""
 Provide feedback about their health journey.
 Focus on consistency and self-care. Match your coaching style."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='health_encouragement')
     
     # =========================================================================
     # FAITH INSIGHTS
@@ -658,7 +838,8 @@ Provide encouragement about their prayer journey.
 You may include a short, relevant Scripture reference if it fits naturally.
 Match your coaching style."""
 
-        return self._call_api(system, prompt, max_tokens=max_tokens)
+        return self._call_api(system, prompt, max_tokens=max_tokens,
+                              endpoint='prayer_encouragement')
 
 
 # Singleton instance
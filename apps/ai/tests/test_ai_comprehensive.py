@@ -594,6 +594,31 @@ class DashboardAITest(AITestMixin, TestCase):
         # Should return None since no entries
         self.assertIsNone(result)
 
+    def test_get_insights_batches_uncached_calls(self):
+        """get_insights generates everything uncached in a single batch."""
+        from apps.journal.models import JournalEntry
+
+        JournalEntry.objects.create(user=self.user, title='Today', body='Body')
+        dashboard_ai = DashboardAI(self.user)
+
+        with patch.object(ai_service, 'run_batch') as mock_batch:
+            mock_batch.return_value = {
+                'daily_insight': 'Daily',
+                'weekly_summary': 'Weekly',
+                'nudge_0': 'Nudge',
+            }
+            result = dashboard_ai.get_insights(nudges=[('journal', {'days': 3})])
+
+        mock_batch.assert_called_once()
+        self.assertEqual(
+            set(mock_batch.call_args[0][0]),
+            {'daily_insight', 'weekly_summary', 'nudge_0'}
+        )
+        self.assertEqual(result['daily_insight'], 'Daily')
+        self.assertEqual(result['weekly_summary'], 'Weekly')
+        self.assertEqual(result['nudges'], ['Nudge'])
+        self.assertEqual(AIInsight.objects.filter(user=self.user).count(), 2)
+
     def test_fallback_insight_gentle_style(self):
         """Fallback insight matches gentle coaching style."""
         self.user.preferences.ai_coaching_style = 'gentle'
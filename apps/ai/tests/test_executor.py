@@ -0,0 +1,166 @@
+"""
+AI Execution Engine Tests
+
+Tests for apps.ai.executor.AIExecutor and AIService.run_batch:
+- Identical in-flight calls are coalesced into one request
+- Timeouts return a default instead of blocking the request
+- Batched calls against a local stub OpenAI server run concurrently
+
+Location: apps/ai/tests/test_executor.py
+"""
+
+import json
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.ai.executor import AIExecutor
+from apps.ai.services import AIService
+
+STUB_DELAY = 0.3
+
+
+class StubOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal /chat/completions endpoint that echoes the user prompt."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length))
+        self.server.requests.append(payload)
+        time.sleep(STUB_DELAY)
+
+        body = json.dumps({
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': payload['model'],
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': f"echo: {payload['messages'][-1]['content']}"},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AIExecutorTest(SimpleTestCase):
+    """Tests for the coalescing thread pool."""
+
+    def setUp(self):
+        self.executor = AIExecutor(max_workers=2, timeout=5)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_identical_inflight_calls_share_one_request(self):
+        """A second submit for a running key reuses its Future."""
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return 'done'
+
+        first = self.executor.submit('same', slow)
+        second = self.executor.submit('same', slow)
+        release.set()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.executor.result(second), 'done')
+        self.assertEqual(len(calls), 1)
+
+    def test_completed_key_runs_again(self):
+        """Coalescing only applies while a call is in flight."""
+        first = self.executor.submit('key', lambda: 1)
+        self.executor.result(first)
+        second = self.executor.submit('key', lambda: 2)
+
+        self.assertEqual(self.executor.result(second), 2)
+
+    def test_timeout_returns_default(self):
+        """A call that exceeds the timeout yields the default value."""
+        release = threading.Event()
+        future = self.executor.submit('slow', lambda: release.wait(5))
+
+        self.assertIsNone(self.executor.result(future, timeout=0.05))
+        release.set()
+
+    def test_errors_return_default(self):
+        """Exceptions raised by the call are logged, not propagated."""
+        def boom():
+            raise RuntimeError('boom')
+
+        future = self.executor.submit('boom', boom)
+        self.assertEqual(self.executor.result(future, default='fallback'), 'fallback')
+
+
+class AIServiceBatchTest(TestCase):
+    """AIService.run_batch against a local stub OpenAI server."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubOpenAIHandler)
+        cls.server.requests = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests.clear()
+        base_url = f'http://127.0.0.1:{self.server.server_address[1]}/v1'
+        with override_settings(OPENAI_API_KEY='test-key', OPENAI_BASE_URL=base_url, OPENAI_MAX_RETRIES=0):
+            self.service = AIService()
+        self.service.executor = AIExecutor(max_workers=4, timeout=5)
+
+    def tearDown(self):
+        self.service.executor.shutdown()
+
+    def test_batch_takes_latency_of_one_call(self):
+        """Three calls in a batch complete in about one round trip."""
+        calls = {
+            name: partial(self.service._call_api, 'system', f'prompt {name}', 50)
+            for name in ('daily', 'weekly', 'nudge')
+        }
+
+        started = time.monotonic()
+        results = self.service.run_batch(calls)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(results['daily'], 'echo: prompt daily')
+        self.assertEqual(results['nudge'], 'echo: prompt nudge')
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertLess(elapsed, STUB_DELAY * 2.5)
+
+    def test_identical_prompts_coalesced(self):
+        """Identical prompts in one batch send a single request."""
+        calls = {
+            name: partial(self.service._call_api, 'system', 'same prompt', 50)
+            for name in ('a', 'b')
+        }
+
+        results = self.service.run_batch(calls)
+
+        self.assertEqual(results['a'], results['b'])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_blocking_call_still_returns_text(self):
+        """Outside a batch, _call_api waits and returns the response text."""
+        self.assertEqual(self.service._call_api('system', 'hello', 50), 'echo: hello')
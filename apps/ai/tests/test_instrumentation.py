@@ -0,0 +1,151 @@
+"""
+AI Instrumentation Tests
+
+Tests for apps.ai.instrumentation:
+- Cost estimation and percentile helpers
+- create_completion() records successes and failures
+- AIService records tokens and latency for executor-run calls
+- usage_report() aggregates per feature
+
+Location: apps/ai/tests/test_instrumentation.py
+"""
+
+import time
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from apps.ai.executor import AIExecutor
+from apps.ai.instrumentation import (
+    create_completion,
+    estimate_cost,
+    percentile,
+    usage_report,
+)
+from apps.ai.models import AIUsageLog
+from apps.ai.services import AIService
+
+User = get_user_model()
+
+
+def completion(text, prompt_tokens=120, completion_tokens=30):
+    response = MagicMock()
+    response.choices[0].message.content = text
+    response.usage.prompt_tokens = prompt_tokens
+    response.usage.completion_tokens = completion_tokens
+    return response
+
+
+class InstrumentationHelpersTest(SimpleTestCase):
+
+    def test_estimate_cost(self):
+        self.assertEqual(
+            estimate_cost('gpt-4o-mini', 1_000_000, 1_000_000),
+            Decimal('0.75'),
+        )
+
+    def test_estimate_cost_dated_snapshot(self):
+        self.assertEqual(estimate_cost('gpt-4o-2024-08-06', 1_000_000, 0), Decimal('2.50'))
+
+    def test_estimate_cost_unknown_model(self):
+        self.assertEqual(estimate_cost('other-model', 1000, 1000), 0)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([7], 95), 7)
+        self.assertIsNone(percentile([], 50))
+
+
+class InstrumentationTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='usage@example.com', password='testpass123')
+        self.client_mock = MagicMock()
+
+    def test_create_completion_records_tokens(self):
+        self.client_mock.chat.completions.create.return_value = completion('{}')
+
+        create_completion(self.client_mock, 'scan_vision', user=self.user,
+                          model='gpt-4o', messages=[])
+
+        log = AIUsageLog.objects.get()
+        self.assertEqual(log.endpoint, 'scan_vision')
+        self.assertEqual(log.model_used, 'gpt-4o')
+        self.assertEqual(log.user, self.user)
+        self.assertEqual(log.total_tokens, 150)
+        self.assertGreater(log.estimated_cost_usd, 0)
+        self.assertTrue(log.success)
+
+    def test_create_completion_records_failure_and_reraises(self):
+        self.client_mock.chat.completions.create.side_effect = RuntimeError('down')
+
+        with self.assertRaises(RuntimeError):
+            create_completion(self.client_mock, 'scan_barcode_ai', model='gpt-4o-mini', messages=[])
+
+        log = AIUsageLog.objects.get()
+        self.assertFalse(log.success)
+        self.assertEqual(log.error_message, 'down')
+
+    def test_ai_service_records_usage_on_calling_thread(self):
+        service = AIService()
+        service.client = self.client_mock
+        service.executor = AIExecutor(max_workers=1, timeout=5)
+        self.client_mock.chat.completions.create.return_value = completion('Hello')
+        try:
+            service._call_api('system', 'prompt', 50, endpoint='daily_insight', user=self.user)
+            service._call_api('system', 'prompt', 50, endpoint='daily_insight', user=self.user)
+        finally:
+            service.executor.shutdown()
+
+        miss = AIUsageLog.objects.get(cache_hit=False)
+        self.assertEqual(miss.prompt_tokens, 120)
+        self.assertEqual(miss.completion_tokens, 30)
+        self.assertEqual(miss.model_used, service.model)
+        hit = AIUsageLog.objects.get(cache_hit=True)
+        self.assertEqual(hit.total_tokens, 0)
+
+    def test_ai_service_records_failure_latency(self):
+        service = AIService()
+        service.client = self.client_mock
+        service.executor = AIExecutor(max_workers=1, timeout=5)
+
+        def slow_failure(**kwargs):
+            time.sleep(0.05)
+            raise RuntimeError('down')
+
+        self.client_mock.chat.completions.create.side_effect = slow_failure
+        try:
+            self.assertIsNone(service._call_api('system', 'prompt', 50, endpoint='daily_insight',
+                                                user=self.user, cache_ttl=0))
+        finally:
+            service.executor.shutdown()
+
+        log = AIUsageLog.objects.get()
+        self.assertFalse(log.success)
+        self.assertGreaterEqual(log.latency_ms, 50)
+
+    def test_usage_report_ignores_cache_hits_and_failures_for_latency(self):
+        for latency in (50, 150):
+            AIUsageLog.objects.create(endpoint='journal_reflection', model_used='gpt-4o-mini',
+                                      latency_ms=latency, total_tokens=100,
+                                      estimated_cost_usd=Decimal('0.0001'))
+        AIUsageLog.objects.create(endpoint='journal_reflection', model_used='gpt-4o-mini',
+                                  cache_hit=True)
+        AIUsageLog.objects.create(endpoint='journal_reflection', model_used='gpt-4o-mini',
+                                  latency_ms=30000, success=False, error_message='Timed out')
+        AIUsageLog.objects.create(endpoint='scan_vision', model_used='gpt-4o', latency_ms=900)
+
+        rows = usage_report()
+
+        self.assertEqual([r['endpoint'] for r in rows], ['scan_vision', 'journal_reflection'])
+        journal = rows[1]
+        self.assertEqual(journal['calls'], 4)
+        self.assertEqual(journal['cache_hits'], 1)
+        self.assertEqual(journal['errors'], 1)
+        self.assertEqual(journal['p50_ms'], 50)
+        self.assertEqual(journal['p95_ms'], 150)
+        self.assertEqual(journal['tokens'], 200)
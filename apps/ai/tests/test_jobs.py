@@ -0,0 +1,97 @@
+"""
+AI Jobs Tests
+
+Tests for apps.ai.jobs and the pregenerate_ai_insights command:
+- Timezone selection for the local pre-generation hour
+- Consent filtering
+- Batched pre-generation writes AIInsight rows the dashboard then reads
+
+Location: apps/ai/tests/test_jobs.py
+"""
+
+from datetime import datetime
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytz
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.ai.dashboard_ai import DashboardAI, pregenerate_insights
+from apps.ai.jobs import consenting_users, pregenerate_ai_insights, timezones_at_local_hour
+from apps.ai.models import AIInsight
+from apps.ai.services import ai_service
+
+User = get_user_model()
+
+# 09:00 UTC is 04:00 in New York (EST) and 18:00 in Tokyo
+NOW = datetime(2026, 1, 15, 9, 0, tzinfo=pytz.UTC)
+
+
+def fake_batch(calls):
+    return {name: f'Generated {name}' for name in calls}
+
+
+class AIPregenerationTest(TestCase):
+    """Tests for nightly AI insight pre-generation."""
+
+    def setUp(self):
+        self.new_york = self.create_user('ny@example.com', 'America/New_York')
+        self.tokyo = self.create_user('tokyo@example.com', 'Asia/Tokyo')
+        self.no_consent = self.create_user('nope@example.com', 'America/New_York', consent=False)
+
+        self.original_client = ai_service.client
+        ai_service.client = MagicMock()
+
+    def tearDown(self):
+        ai_service.client = self.original_client
+
+    def create_user(self, email, tz, consent=True):
+        user = User.objects.create_user(email=email, password='testpass123')
+        prefs = user.preferences
+        prefs.timezone = tz
+        prefs.ai_enabled = True
+        prefs.ai_data_consent = consent
+        prefs.save()
+        return user
+
+    def test_timezones_at_local_hour(self):
+        """Only timezones currently at the requested hour are selected."""
+        self.assertEqual(timezones_at_local_hour(4, NOW), ['America/New_York'])
+
+    def test_consenting_users_excludes_non_consenting(self):
+        users = list(consenting_users(['America/New_York']))
+        self.assertEqual(users, [self.new_york])
+
+    @patch.object(ai_service, 'run_batch', side_effect=fake_batch)
+    def test_job_generates_for_users_at_local_hour(self, mock_batch):
+        """The hourly job only processes users whose morning is coming up."""
+        results = pregenerate_ai_insights(now=NOW)
+
+        self.assertEqual(results['users'], 1)
+        self.assertTrue(AIInsight.objects.filter(user=self.new_york, insight_type='daily').exists())
+        self.assertFalse(AIInsight.objects.filter(user=self.tokyo).exists())
+
+    @patch.object(ai_service, 'run_batch', side_effect=fake_batch)
+    def test_batch_shares_one_run_batch_and_dashboard_reads_rows(self, mock_batch):
+        """A batch of users is sent in one run_batch call; later reads hit AIInsight."""
+        stats = pregenerate_insights([self.new_york, self.tokyo])
+
+        mock_batch.assert_called_once()
+        self.assertEqual(stats['users'], 2)
+        self.assertEqual(stats['generated'], 2)
+
+        mock_batch.reset_mock()
+        insight = DashboardAI(self.tokyo).get_daily_insight()
+
+        self.assertEqual(insight, f"Generated {(self.tokyo.pk, 'daily_insight')}")
+        mock_batch.assert_not_called()
+
+    @patch.object(ai_service, 'run_batch', side_effect=fake_batch)
+    def test_command_for_single_user(self, mock_batch):
+        out = StringIO()
+        call_command('pregenerate_ai_insights', user='tokyo@example.com', stdout=out)
+
+        self.assertIn('Processed 1 user(s)', out.getvalue())
+        self.assertTrue(AIInsight.objects.filter(user=self.tokyo, insight_type='daily').exists())
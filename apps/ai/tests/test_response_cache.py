@@ -0,0 +1,122 @@
+"""
+AI Response Cache Tests
+
+Tests for apps.ai.models.AIResponseCache and its use in AIService._call_api:
+- Identical prompts are answered from the cache, unless refreshing
+- Hits and misses are recorded in AIUsageLog
+- Expired entries are ignored and LRU entries evicted past the cap
+
+Location: apps/ai/tests/test_response_cache.py
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.ai.executor import AIExecutor
+from apps.ai.models import AIResponseCache, AIUsageLog
+from apps.ai.services import AIService
+
+User = get_user_model()
+
+
+def completion(text):
+    response = MagicMock()
+    response.choices[0].message.content = text
+    return response
+
+
+class AIResponseCacheTest(TestCase):
+    """Tests for the persistent prompt/response cache."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='cache@example.com', password='testpass123')
+        self.service = AIService()
+        self.service.client = MagicMock()
+        self.service.client.chat.completions.create.return_value = completion('Fresh response')
+        self.service.executor = AIExecutor(max_workers=1, timeout=5)
+
+    def tearDown(self):
+        self.service.executor.shutdown()
+
+    def call(self, prompt='prompt', **kwargs):
+        return self.service._call_api('system', prompt, 50, endpoint='daily_insight',
+                                      user=self.user, **kwargs)
+
+    def test_identical_prompt_served_from_cache(self):
+        self.assertEqual(self.call(), 'Fresh response')
+        self.assertEqual(self.call(), 'Fresh response')
+
+        self.service.client.chat.completions.create.assert_called_once()
+        entry = AIResponseCache.objects.get()
+        self.assertEqual(entry.hit_count, 1)
+
+    def test_different_prompt_misses(self):
+        self.call('one')
+        self.call('two')
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 2)
+        self.assertEqual(AIResponseCache.objects.count(), 2)
+
+    def test_usage_log_records_hits_and_misses(self):
+        self.call()
+        self.call()
+
+        logs = AIUsageLog.objects.filter(user=self.user, endpoint='daily_insight')
+        self.assertEqual(logs.filter(cache_hit=False).count(), 1)
+        self.assertEqual(logs.filter(cache_hit=True).count(), 1)
+
+    def test_zero_ttl_disables_cache(self):
+        self.call(cache_ttl=0)
+        self.call(cache_ttl=0)
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 2)
+        self.assertFalse(AIResponseCache.objects.exists())
+
+    def test_bypass_cache_refreshes_entry(self):
+        """An explicit refresh calls OpenAI and replaces the cached response."""
+        self.call()
+        self.service.client.chat.completions.create.return_value = completion('Regenerated')
+
+        self.assertEqual(self.call(bypass_cache=True), 'Regenerated')
+        self.assertEqual(self.call(), 'Regenerated')
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 2)
+
+    def test_expired_entry_is_ignored(self):
+        self.call()
+        AIResponseCache.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.call()
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 2)
+
+    def test_failed_call_not_cached(self):
+        self.service.client.chat.completions.create.side_effect = RuntimeError('down')
+
+        self.assertIsNone(self.call())
+        self.assertFalse(AIResponseCache.objects.exists())
+
+    def test_batch_responses_are_cached(self):
+        results = self.service.run_batch({'a': lambda: self.call('batched')})
+
+        self.assertEqual(results['a'], 'Fresh response')
+        self.assertEqual(self.call('batched'), 'Fresh response')
+        self.service.client.chat.completions.create.assert_called_once()
+
+    @override_settings(AI_RESPONSE_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_evicted(self):
+        self.call('first')
+        self.call('second')
+        AIResponseCache.objects.filter(response='Fresh response').update(
+            last_used_at=timezone.now() - timedelta(hours=1)
+        )
+        self.call('second')  # hit refreshes last_used_at
+
+        self.call('third')
+
+        self.assertEqual(AIResponseCache.objects.count(), 2)
+        first_key = self.service._request_key('system', 'first', 50)
+        self.assertFalse(AIResponseCache.objects.filter(key=first_key).exists())
@@ -92,7 +92,8 @@ class TrendTracker:
         patterns = self._detect_patterns(week_data, 'week')
 
         # Generate AI summary if available
-        summary = self._generate_ai_summary(week_data, prev_week_data, patterns, 'week')
+        summary = self._generate_ai_summary(week_data, prev_week_data, patterns, 'week',
+                                            bypass_cache=force_refresh)
 
         # Compare to previous
         comparison = self._compare_periods(week_data, prev_week_data)
@@ -147,7 +148,8 @@ class TrendTracker:
         from apps.journal.models import JournalEntry
         from apps.life.models import Task
         from apps.purpose.models import LifeGoal
-        from apps.health.models import WorkoutSession, MedicineLog
+        from apps.health.models import WorkoutSession
+        from apps.health.services.adherence import build_adherence_report
 
         data = {}
 
@@ -197,14 +199,9 @@ class TrendTracker:
             data['workouts'] = workouts.count()
 
             # Medicine adherence
-            logs = MedicineLog.objects.filter(
-                user=self.user,
-                scheduled_date__gte=start_date,
-                scheduled_date__lte=end_date
-            )
-            taken = logs.filter(log_status__in=['taken', 'late']).count()
-            total = logs.filter(log_status__in=['taken', 'late', 'missed']).count()
-            data['medicine_adherence'] = round((taken / total) * 100) if total > 0 else None
+            data['medicine_adherence'] = build_adherence_report(
+                self.user, start_date, end_date, include_medicines=False
+            ).overall.resolved_rate
 
         # Faith metrics
         if self.faith_enabled:
@@ -411,7 +408,8 @@ class TrendTracker:
         else:
             return "Activity levels are similar to last week."
 
-    def _generate_ai_summary(self, data: Dict, prev_data: Dict, patterns: List, period: str) -> str:
+    def _generate_ai_summary(self, data: Dict, prev_data: Dict, patterns: List, period: str,
+                             bypass_cache: bool = False) -> str:
         """Generate AI summary of the period."""
         if not ai_service.is_available or not AIService.check_user_consent(self.user):
             return self._generate_fallback_summary(data, patterns, period)
@@ -442,7 +440,9 @@ Keep your response to 2-3 sentences maximum."""
 Provide a brief, warm summary of this week."""
 
         try:
-            return ai_service._call_api(system_prompt, user_prompt, max_tokens=150) or self._generate_fallback_summary(data, patterns, period)
+            return ai_service._call_api(system_prompt, user_prompt, max_tokens=150,
+                                       endpoint='trend_summary', user=self.user,
+                                       bypass_cache=bypass_cache) or self._generate_fallback_summary(data, patterns, period)
         except Exception as e:
             logger.error(f"AI summary error: {e}")
             return self._generate_fallback_summary(data, patterns, period)
@@ -527,7 +527,8 @@ Provide a brief, warm summary of this week."""
         patterns = self._detect_patterns(month_data, 'month')
 
         # Generate summary
-        summary = self._generate_ai_summary(month_data, prev_month_data, patterns, 'month')
+        summary = self._generate_ai_summary(month_data, prev_month_data, patterns, 'month',
+                                            bypass_cache=force_refresh)
 
         # Compare
         comparison = self._compare_periods(month_data, prev_month_data)
@@ -14,6 +14,7 @@ Registered Models:
     - TagAdmin: User-defined tags for organizing content
     - ReleaseNoteAdmin: What's New entries management
     - UserReleaseNoteViewAdmin: Read-only view of user's seen notes
+    - JobLeaseAdmin/JobRunAdmin: Scheduled job leader and run history
 
 Copyright:
     (c) Whole Life Journey. All rights reserved.
@@ -23,7 +24,7 @@ Copyright:
 
 from django.contrib import admin
 
-from .models import Category, ReleaseNote, Tag, UserReleaseNoteView
+from .models import Category, JobLease, JobRun, ReleaseNote, Tag, UserActivityCounters, UserReleaseNoteView
 
 
 @admin.register(Category)
@@ -97,3 +98,60 @@ class UserReleaseNoteViewAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         return False
+
+
+@admin.register(UserActivityCounters)
+class UserActivityCountersAdmin(admin.ModelAdmin):
+    """
+    Admin for viewing materialised streak counters.
+
+    Read-only - maintained by signals and rebuild_activity_counters.
+    """
+
+    list_display = ["user", "journal_entry_count", "journal_run_end", "workout_count", "workout_run_end", "updated_at"]
+    search_fields = ["user__email"]
+    raw_id_fields = ["user"]
+    readonly_fields = [
+        "user", "journal_entry_count", "journal_run_start", "journal_run_end",
+        "workout_count", "workout_run_start", "workout_run_end", "habit_runs", "updated_at",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(JobLease)
+class JobLeaseAdmin(admin.ModelAdmin):
+    """Admin for viewing which job runner holds the leader lease."""
+
+    list_display = ["name", "holder", "acquired_at", "renewed_at", "expires_at"]
+    readonly_fields = ["name", "holder", "acquired_at", "renewed_at", "expires_at"]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(JobRun)
+class JobRunAdmin(admin.ModelAdmin):
+    """
+    Admin for scheduled job run history.
+
+    Read-only - written by apps.core.job_runner.
+    """
+
+    list_display = ["job_id", "status", "started_at", "duration_ms", "scheduled_for", "holder"]
+    list_filter = ["status", "job_id"]
+    date_hierarchy = "started_at"
+    readonly_fields = [
+        "job_id", "status", "scheduled_for", "started_at", "finished_at",
+        "duration_ms", "result", "error", "holder",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -8,6 +8,7 @@ Purpose: Django app configuration for the core module
 Description:
     Standard Django app configuration class for the core application.
     Registers the app with Django and sets the verbose name for admin.
+    Connects signal handlers that keep UserActivityCounters up to date.
 
 Copyright:
     (c) Whole Life Journey. All rights reserved.
@@ -22,3 +23,7 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     verbose_name = "Core"
+
+    def ready(self):
+        # Import signals when app is ready
+        from . import signals  # noqa: F401
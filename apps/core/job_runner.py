@@ -0,0 +1,392 @@
+# ==============================================================================
+# File: apps/core/job_runner.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Leader-elected scheduled job runner with per-job run history
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Job Runner - Owns every scheduled background job.
+
+JOBS is the single list of scheduled jobs. JobRunner runs them in a
+dedicated worker (``python manage.py run_jobs``) rather than inside the
+web server:
+
+- Leader election: each runner competes for a JobLease row. Only the
+  holder starts APScheduler; standbys keep trying and take over once the
+  leader stops renewing. Any number of worker (or web) processes can run
+  a JobRunner safely.
+- Metrics: every run writes a JobRun with its duration, result and error.
+- Misfires: runs later than their job's misfire_grace_time are recorded
+  as missed, and late runs are coalesced into one. A daily or hourly job
+  whose fire time passed while no leader was running (deploys, failover)
+  is run once as soon as a leader starts, if still within its grace time.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from importlib import import_module
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import JobLease, JobRun
+
+logger = logging.getLogger('scheduler')
+
+LEASE_NAME = 'scheduled-jobs'
+
+# JobRun rows older than this are removed by the prune_job_runs job
+JOB_RUN_RETENTION_DAYS = 30
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    """A scheduled job: what to call, when, and how late it may still run."""
+
+    id: str
+    func: str  # 'module.path:function'
+    trigger: str  # 'cron' or 'interval'
+    schedule: dict
+    description: str
+    misfire_grace_time: int  # Seconds
+    run_on_start: bool = False
+    catch_up: bool = True
+    pass_fire_time: bool = False  # Call with now=<scheduled fire time>
+    kwargs: dict = field(default_factory=dict)
+
+    def build_trigger(self, tz):
+        if self.trigger == 'interval':
+            return IntervalTrigger(timezone=tz, **self.schedule)
+        return CronTrigger(timezone=tz, **self.schedule)
+
+    def resolve(self):
+        module_path, name = self.func.split(':')
+        return getattr(import_module(module_path), name)
+
+
+HOUR = 60 * 60
+
+JOBS = [
+    # SMS: each hourly run schedules the day for users whose local day just started
+    JobDefinition(
+        id='schedule_rolling_sms_reminders',
+        func='apps.sms.jobs:schedule_rolling_reminders',
+        trigger='cron',
+        schedule={'minute': 0},
+        description='SMS: hourly, 00:00 user local time',
+        misfire_grace_time=30 * 60,
+        pass_fire_time=True,
+    ),
+    JobDefinition(
+        id='send_pending_sms',
+        func='apps.sms.jobs:send_pending_sms',
+        trigger='interval',
+        schedule={'minutes': 5},
+        description='SMS: every 5 minutes',
+        misfire_grace_time=2 * 60,
+        run_on_start=True,
+        catch_up=False,
+    ),
+    # Life: 06:00 UTC is 01:00 EST, after the US day has turned over
+    JobDefinition(
+        id='recalculate_task_priorities',
+        func='apps.life.jobs:recalculate_task_priorities',
+        trigger='cron',
+        schedule={'hour': 6, 'minute': 0},
+        description='Life: daily at 06:00 UTC / 01:00 EST',
+        misfire_grace_time=6 * HOUR,
+    ),
+    JobDefinition(
+        id='process_recurring_tasks',
+        func='apps.life.jobs:process_recurring_tasks',
+        trigger='cron',
+        schedule={'hour': 6, 'minute': 5},
+        description='Life: daily at 06:05 UTC / 01:05 EST',
+        misfire_grace_time=6 * HOUR,
+    ),
+    # AI: each hourly run handles the timezones where it is 4:00 AM
+    JobDefinition(
+        id='pregenerate_ai_insights',
+        func='apps.ai.jobs:pregenerate_ai_insights',
+        trigger='cron',
+        schedule={'minute': 10},
+        description='AI: hourly at :10, 04:00 user local time',
+        misfire_grace_time=30 * 60,
+        pass_fire_time=True,
+    ),
+    JobDefinition(
+        id='snapshot_financial_metrics',
+        func='apps.finance.jobs:snapshot_financial_metrics',
+        trigger='cron',
+        schedule={'hour': 7, 'minute': 0},
+        description='Finance: daily at 07:00 UTC / 02:00 EST',
+        misfire_grace_time=6 * HOUR,
+    ),
+    JobDefinition(
+        id='prune_job_runs',
+        func='apps.core.job_runner:prune_job_runs',
+        trigger='cron',
+        schedule={'hour': 3, 'minute': 30},
+        description='Core: daily at 03:30 UTC',
+        misfire_grace_time=6 * HOUR,
+    ),
+]
+
+
+def get_job(job_id):
+    """The JobDefinition with this id, or None."""
+    return next((job for job in JOBS if job.id == job_id), None)
+
+
+def lease_is_stale(max_age=None, lease_name=LEASE_NAME):
+    """
+    True if no job runner has renewed the lease within ``max_age``.
+
+    Used at web startup to warn when scheduled jobs are not running
+    anywhere (no run_jobs worker deployed and RUN_JOBS_IN_WEB turned off).
+    """
+    max_age = max_age or timedelta(seconds=5 * getattr(settings, 'JOBS_LEASE_TTL', 60))
+    lease = JobLease.objects.filter(name=lease_name).first()
+    if lease is None or lease.renewed_at is None:
+        return True
+    return lease.renewed_at < timezone.now() - max_age
+
+
+def prune_job_runs(days=JOB_RUN_RETENTION_DAYS):
+    """Delete JobRun history older than ``days``."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = JobRun.objects.filter(started_at__lt=cutoff).delete()
+    return {'deleted': deleted}
+
+
+def run_job(job, holder='', fire_time=None):
+    """
+    Run a job now and record a JobRun for it.
+
+    Job functions should let exceptions propagate: they are recorded as a
+    failed run and logged, not raised, so one failing job never takes down
+    the scheduler.
+
+    Args:
+        fire_time: The scheduled fire time being run. Passed to jobs with
+            pass_fire_time as ``now``, so a late or caught-up run works on
+            the slice it was scheduled for rather than the wall clock.
+    """
+    close_old_connections()
+    run = JobRun(job_id=job.id, holder=holder, started_at=timezone.now())
+    kwargs = dict(job.kwargs)
+    if job.pass_fire_time and fire_time is not None:
+        kwargs['now'] = fire_time
+    started = time.monotonic()
+    try:
+        run.result = job.resolve()(**kwargs)
+        run.status = JobRun.STATUS_SUCCESS
+    except Exception as e:
+        run.status = JobRun.STATUS_FAILED
+        run.error = traceback.format_exc()[-5000:]
+        logger.exception(f"Job {job.id} failed: {e}")
+
+    run.duration_ms = round((time.monotonic() - started) * 1000, 1)
+    run.finished_at = timezone.now()
+    try:
+        run.save()
+    except Exception as e:
+        logger.exception(f"Could not record run of {job.id}: {e}")
+    finally:
+        close_old_connections()
+
+    logger.info(f"Job {job.id} {run.status} in {run.duration_ms}ms")
+    return run
+
+
+def last_fire_time(job, trigger, now):
+    """The latest fire time at or before ``now`` within the job's grace period."""
+    since = now - timedelta(seconds=job.misfire_grace_time)
+    last = None
+    fire = trigger.get_next_fire_time(None, since)
+    while fire is not None and fire <= now:
+        last = fire
+        fire = trigger.get_next_fire_time(fire, fire + timedelta(microseconds=1))
+    return last
+
+
+def missed_fire_time(job, trigger, now):
+    """
+    The latest fire time within the job's grace period that never ran.
+
+    Returns None if the job ran since then (or has no such fire time).
+    """
+    last = last_fire_time(job, trigger, now)
+    if last is None:
+        return None
+    ran = JobRun.objects.filter(job_id=job.id, started_at__gte=last).exclude(
+        status=JobRun.STATUS_MISSED
+    )
+    return None if ran.exists() else last
+
+
+class JobRunner:
+    """
+    Runs JOBS while holding the job lease.
+
+    Args:
+        jobs: JobDefinitions to run (default JOBS)
+        ttl: Lease lifetime; renewed every ttl / 3 (default JOBS_LEASE_TTL seconds)
+        holder: Identifier for this process in JobLease and JobRun
+    """
+
+    def __init__(self, jobs=None, ttl=None, holder=None, lease_name=LEASE_NAME):
+        self.jobs = JOBS if jobs is None else jobs
+        self.ttl = ttl or timedelta(seconds=getattr(settings, 'JOBS_LEASE_TTL', 60))
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_name = lease_name
+        self.scheduler = None
+        self._valid_until = 0.0
+        self._stop = threading.Event()
+
+    @property
+    def is_leader(self):
+        """True while the last successful renewal has not expired."""
+        return time.monotonic() < self._valid_until
+
+    def tick(self, now=None):
+        """
+        Acquire or renew the lease, and start or stop the scheduler to match.
+
+        Returns:
+            True if this runner is the leader
+        """
+        attempted = time.monotonic()
+        try:
+            close_old_connections()
+            leader = JobLease.acquire(self.lease_name, self.holder, self.ttl)
+        except Exception as e:
+            logger.exception(f"Job lease check failed: {e}")
+            leader = False
+
+        if leader:
+            self._valid_until = attempted + self.ttl.total_seconds()
+            if self.scheduler is None:
+                logger.info(f"Job lease acquired by {self.holder}")
+                self.start_scheduler(now)
+        else:
+            self._valid_until = 0.0
+            if self.scheduler is not None:
+                logger.warning(f"Job lease lost by {self.holder}; stopping scheduler")
+                self.stop_scheduler()
+        return leader
+
+    def run_forever(self):
+        """Hold or wait for the lease until stop() is called."""
+        interval = self.ttl.total_seconds() / 3
+        logger.info(f"Job runner {self.holder} started")
+        try:
+            while not self._stop.is_set():
+                self.tick()
+                self._stop.wait(interval)
+        finally:
+            self.stop_scheduler()
+            try:
+                JobLease.release(self.lease_name, self.holder)
+            except Exception as e:
+                logger.exception(f"Could not release job lease: {e}")
+            logger.info(f"Job runner {self.holder} stopped")
+
+    def start_in_background(self):
+        """Run run_forever() in a daemon thread (for the embedded web mode)."""
+        thread = threading.Thread(target=self.run_forever, name='job-runner', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def start_scheduler(self, now=None):
+        """Start APScheduler with every job, catching up missed fire times."""
+        now = now or timezone.now()
+        scheduler = BackgroundScheduler(
+            timezone=settings.TIME_ZONE,
+            job_defaults={'coalesce': True, 'max_instances': 1},
+        )
+        scheduler.add_listener(self._on_missed, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+
+        for job in self.jobs:
+            trigger = job.build_trigger(settings.TIME_ZONE)
+            options = {}
+            missed = missed_fire_time(job, trigger, now) if job.catch_up else None
+            if missed is not None:
+                logger.warning(f"Job {job.id} missed its {missed:%Y-%m-%d %H:%M} run; running now")
+                self._record_missed(job.id, missed, "No leader was running; caught up on start")
+            if job.run_on_start or missed is not None:
+                options['next_run_time'] = now
+            scheduler.add_job(
+                self._execute,
+                trigger=trigger,
+                args=[job],
+                id=job.id,
+                name=job.description,
+                misfire_grace_time=job.misfire_grace_time,
+                replace_existing=True,
+                **options,
+            )
+
+        scheduler.start()
+        self.scheduler = scheduler
+        logger.info(f"APScheduler started with {len(self.jobs)} jobs:")
+        for job in self.jobs:
+            logger.info(f"  - {job.id} ({job.description})")
+
+    def stop_scheduler(self):
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+    def _execute(self, job):
+        # A leader that missed renewals may not know it was replaced yet
+        if not self.is_leader:
+            logger.warning(f"Skipping {job.id}: job lease not held")
+            return None
+        fire_time = None
+        if job.pass_fire_time:
+            # Late and caught-up runs start after their fire time; APScheduler
+            # does not pass it in, so recover it from the trigger
+            fire_time = last_fire_time(job, job.build_trigger(settings.TIME_ZONE), timezone.now())
+        return run_job(job, self.holder, fire_time)
+
+    def _on_missed(self, event):
+        if event.code == EVENT_JOB_MISSED:
+            reason = "Run was later than its misfire grace time"
+        else:
+            reason = "Previous run still in progress"
+        logger.warning(f"Job {event.job_id} missed its {event.scheduled_run_time} run: {reason}")
+        try:
+            self._record_missed(event.job_id, event.scheduled_run_time, reason)
+        finally:
+            close_old_connections()
+
+    def _record_missed(self, job_id, scheduled_for, reason):
+        try:
+            JobRun.objects.create(
+                job_id=job_id,
+                status=JobRun.STATUS_MISSED,
+                scheduled_for=scheduled_for,
+                finished_at=timezone.now(),
+                error=reason,
+                holder=self.holder,
+            )
+        except Exception as e:
+            logger.exception(f"Could not record missed run of {job_id}: {e}")
@@ -0,0 +1,56 @@
+# ==============================================================================
+# File: rebuild_activity_counters.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to rebuild materialised streak counters
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Rebuild Activity Counters Command
+
+Recomputes UserActivityCounters (journal, workout and habit streaks) from
+history. Counters are normally maintained by signals; run this after bulk
+imports, raw SQL changes, or when first deploying the counters table.
+
+Usage:
+    python manage.py rebuild_activity_counters                  # All users
+    python manage.py rebuild_activity_counters --user=a@b.com   # One user
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.management.decorators import notify_on_error
+from apps.core.models import UserActivityCounters
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialised journal, workout and habit streak counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Email of a single user to rebuild (default: all users)",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = User.objects.all().order_by("pk")
+
+        if options["user"]:
+            users = users.filter(email=options["user"])
+            if not users.exists():
+                raise CommandError(f"No user with email {options['user']}")
+
+        rebuilt = 0
+        for user in users.iterator():
+            counters, _ = UserActivityCounters.objects.get_or_create(user=user)
+            counters.rebuild()
+            rebuilt += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt activity counters for {rebuilt} user(s).")
+        )
@@ -0,0 +1,119 @@
+# ==============================================================================
+# File: run_jobs.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to run the scheduled job worker
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Run Jobs Command
+
+Runs every scheduled background job (SMS, Life, AI, Finance) in a worker
+process, so web workers carry no scheduler. Several workers may run at
+once: they elect a leader through the JobLease table and the others wait
+as standbys (see apps/core/job_runner.py).
+
+Usage:
+    python manage.py run_jobs                                  # Worker mode
+    python manage.py run_jobs --list                           # Show jobs
+    python manage.py run_jobs --status --hours=24              # Per-job metrics
+    python manage.py run_jobs --run=send_pending_sms           # Run one job now
+"""
+
+import signal
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Avg, Count, Max, Q
+from django.utils import timezone
+
+from apps.core.job_runner import JOBS, JobRunner, get_job, run_job
+from apps.core.management.decorators import notify_on_error
+from apps.core.models import JobRun
+
+
+class Command(BaseCommand):
+    help = "Run the scheduled job worker (leader elected through a DB lease)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="List the scheduled jobs and exit",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Show run counts and durations per job and exit",
+        )
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Window for --status in hours (default: 24)",
+        )
+        parser.add_argument(
+            "--run",
+            metavar="JOB_ID",
+            help="Run a single job now (recorded in JobRun) and exit",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        if options["list"]:
+            for job in JOBS:
+                self.stdout.write(f"{job.id:32} {job.description}")
+            return
+
+        if options["status"]:
+            self.show_status(options["hours"])
+            return
+
+        if options["run"]:
+            job = get_job(options["run"])
+            if job is None:
+                raise CommandError(f"Unknown job: {options['run']}")
+            run = run_job(job)
+            style = self.style.SUCCESS if run.status == JobRun.STATUS_SUCCESS else self.style.ERROR
+            self.stdout.write(style(f"{job.id}: {run.status} in {run.duration_ms}ms"))
+            return
+
+        runner = JobRunner()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: runner.stop())
+
+        self.stdout.write(self.style.SUCCESS(f"Job worker {runner.holder} starting..."))
+        runner.run_forever()
+        self.stdout.write(self.style.SUCCESS("Job worker stopped."))
+
+    def show_status(self, hours):
+        """Print runs, failures, misses and durations per job."""
+        since = timezone.now() - timedelta(hours=hours)
+        stats = {
+            row["job_id"]: row
+            for row in JobRun.objects.filter(started_at__gte=since)
+            .values("job_id")
+            .annotate(
+                runs=Count("id", filter=~Q(status=JobRun.STATUS_MISSED)),
+                failed=Count("id", filter=Q(status=JobRun.STATUS_FAILED)),
+                missed=Count("id", filter=Q(status=JobRun.STATUS_MISSED)),
+                avg_ms=Avg("duration_ms", filter=~Q(status=JobRun.STATUS_MISSED)),
+                max_ms=Max("duration_ms"),
+                last_run=Max("started_at"),
+            )
+            .order_by()
+        }
+
+        self.stdout.write(f"Job runs in the last {hours} hour(s):")
+        for job in JOBS:
+            row = stats.get(job.id)
+            if row is None:
+                self.stdout.write(f"  {job.id:32} no runs")
+                continue
+            self.stdout.write(
+                f"  {job.id:32} runs={row['runs']} failed={row['failed']} missed={row['missed']} "
+                f"avg={row['avg_ms'] or 0:.0f}ms max={row['max_ms'] or 0:.0f}ms "
+                f"last={row['last_run']:%Y-%m-%d %H:%M}"
+            )
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0035_merge_bible_reading_plans"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserActivityCounters",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("journal_entry_count", models.PositiveIntegerField(default=0)),
+                ("journal_run_start", models.DateField(blank=True, null=True)),
+                (
+                    "journal_run_end",
+                    models.DateField(
+                        blank=True,
+                        help_text="Most recent journal entry date",
+                        null=True,
+                    ),
+                ),
+                ("workout_count", models.PositiveIntegerField(default=0)),
+                ("workout_run_start", models.DateField(blank=True, null=True)),
+                (
+                    "workout_run_end",
+                    models.DateField(
+                        blank=True, help_text="Most recent workout date", null=True
+                    ),
+                ),
+                (
+                    "habit_runs",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Latest completed run per habit goal: {goal_id: [start, end]}",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_counters",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Activity Counters",
+                "verbose_name_plural": "User Activity Counters",
+            },
+        ),
+    ]
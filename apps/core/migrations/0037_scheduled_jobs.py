@@ -0,0 +1,101 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:13
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0036_user_activity_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobLease",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+                (
+                    "holder",
+                    models.CharField(
+                        blank=True,
+                        help_text="host:pid:token of the current leader",
+                        max_length=200,
+                    ),
+                ),
+                ("acquired_at", models.DateTimeField(blank=True, null=True)),
+                ("renewed_at", models.DateTimeField(blank=True, null=True)),
+                ("expires_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Job Lease",
+                "verbose_name_plural": "Job Leases",
+            },
+        ),
+        migrations.CreateModel(
+            name="JobRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("job_id", models.CharField(max_length=100)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("success", "Success"),
+                            ("failed", "Failed"),
+                            ("missed", "Missed"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "scheduled_for",
+                    models.DateTimeField(
+                        blank=True, help_text="Fire time of a missed run", null=True
+                    ),
+                ),
+                ("started_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("duration_ms", models.FloatField(default=0)),
+                (
+                    "result",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                    ),
+                ),
+                ("error", models.TextField(blank=True)),
+                ("holder", models.CharField(blank=True, max_length=200)),
+            ],
+            options={
+                "verbose_name": "Job Run",
+                "verbose_name_plural": "Job Runs",
+                "ordering": ["-started_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["job_id", "-started_at"],
+                        name="core_jobrun_job_id_27c94d_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:05
+
+from django.db import migrations, models
+
+
+def drop_counters(apps, schema_editor):
+    # Existing runs may extend into future-dated entries; each row is
+    # rebuilt from history on its user's next read
+    apps.get_model("core", "UserActivityCounters").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0037_scheduled_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useractivitycounters",
+            name="future_dates",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Earliest activity date after today per kind or habit goal id",
+            ),
+        ),
+        migrations.RunPython(drop_counters, migrations.RunPython.noop),
+    ]
@@ -20,6 +20,8 @@ Key Responsibilities:
     - TestRun/TestRunDetail: Test execution history tracking
     - CameraScan: Raw camera input for AI processing
     - ReleaseNote: What's New feature content
+    - UserActivityCounters: Materialised streaks for journal, workouts, habits
+    - JobLease/JobRun: Leader lease and execution history for scheduled jobs
 
 Design Patterns:
     - Soft Delete: Records are marked deleted rather than removed, with 30-day
@@ -39,7 +41,10 @@ Copyright:
     without explicit permission.
 """
 
+from datetime import date, timedelta
+
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 
@@ -1212,3 +1217,411 @@ class UserReleaseNoteView(models.Model):
             defaults={'last_viewed_at': timezone.now()}
         )
         return obj
+
+
+# =============================================================================
+# USER ACTIVITY COUNTERS
+# =============================================================================
+
+
+def _latest_run(dates):
+    """
+    Return (start, end) of the most recent run of consecutive dates.
+
+    ``dates`` must be distinct and in descending order. Iteration stops at
+    the first gap, so only the latest run is ever read.
+    """
+    start = end = None
+    for d in dates:
+        if end is None:
+            start = end = d
+        elif d == start - timedelta(days=1):
+            start = d
+        else:
+            break
+    return start, end
+
+
+def _streak_from_run(start, end, anchor):
+    """Length of the run ending at ``anchor``, or 0 if the run doesn't cover it."""
+    if start is None or not (start <= anchor <= end):
+        return 0
+    return (anchor - start).days + 1
+
+
+class UserActivityCounters(models.Model):
+    """
+    Materialised per-user streak and activity counters.
+
+    Instead of scanning history on every request, each activity keeps the
+    start and end of its most recent run of consecutive days. A streak "as
+    of today" is then (today - run_start) + 1 when today falls inside the run.
+
+    Runs only cover dates up to the user's today. Activity dated after today
+    is noted in future_dates and folded into the run (by a rebuild of that
+    activity) on the first read once its date arrives.
+
+    Rows are maintained incrementally by signals in apps/core/signals.py on
+    JournalEntry, WorkoutSession and HabitEntry, and can be rebuilt with the
+    ``rebuild_activity_counters`` management command.
+    """
+
+    KIND_JOURNAL = 'journal'
+    KIND_WORKOUT = 'workout'
+    KINDS = (KIND_JOURNAL, KIND_WORKOUT)
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='activity_counters',
+    )
+
+    journal_entry_count = models.PositiveIntegerField(default=0)
+    journal_run_start = models.DateField(null=True, blank=True)
+    journal_run_end = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Most recent journal entry date",
+    )
+
+    workout_count = models.PositiveIntegerField(default=0)
+    workout_run_start = models.DateField(null=True, blank=True)
+    workout_run_end = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Most recent workout date",
+    )
+
+    habit_runs = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Latest completed run per habit goal: {goal_id: [start, end]}",
+    )
+    future_dates = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Earliest activity date after today per kind or habit goal id",
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Activity Counters"
+        verbose_name_plural = "User Activity Counters"
+
+    def __str__(self):
+        return f"Activity counters for {self.user}"
+
+    @classmethod
+    def for_user(cls, user):
+        """Get the counters row for a user, building it from history if missing."""
+        counters = cls.objects.filter(user=user).first()
+        if counters is None:
+            counters = cls(user=user)
+            counters.rebuild(save=False)
+            counters.save()
+        return counters
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def journal_streak(self, today):
+        """Consecutive days of journaling ending today."""
+        self._apply_arrived(self.KIND_JOURNAL, today)
+        return _streak_from_run(self.journal_run_start, self.journal_run_end, today)
+
+    def workout_streak(self, today):
+        """Consecutive days with workouts ending today."""
+        self._apply_arrived(self.KIND_WORKOUT, today)
+        return _streak_from_run(self.workout_run_start, self.workout_run_end, today)
+
+    def habit_streak(self, goal, today):
+        """Current completion streak for a habit goal."""
+        self._apply_arrived(str(goal.pk), today)
+        run = self.habit_runs.get(str(goal.pk))
+        if not run:
+            return 0
+        start, end = (date.fromisoformat(d) for d in run)
+        # Completions logged before the goal started don't count
+        start = max(start, goal.start_date)
+        return _streak_from_run(start, end, min(today, goal.end_date))
+
+    # -------------------------------------------------------------------------
+    # Incremental updates
+    # -------------------------------------------------------------------------
+
+    def record_activity(self, kind, activity_date, today=None):
+        """
+        Apply a newly created activity on ``activity_date``.
+
+        Returns False when the date cannot be applied without reading
+        history (it joins the current run from below); the caller should
+        then rebuild that kind.
+        """
+        count_field = self._count_field(kind)
+        if self._defer_future(kind, activity_date, today):
+            setattr(self, count_field, getattr(self, count_field) + 1)
+            return True
+
+        start = getattr(self, f'{kind}_run_start')
+        end = getattr(self, f'{kind}_run_end')
+        one_day = timedelta(days=1)
+
+        if start is None or activity_date > end + one_day:
+            start = end = activity_date
+        elif activity_date == end + one_day:
+            end = activity_date
+        elif activity_date == start - one_day:
+            return False
+        # Otherwise the date is inside the run or older than it: no change.
+
+        setattr(self, f'{kind}_run_start', start)
+        setattr(self, f'{kind}_run_end', end)
+        setattr(self, count_field, getattr(self, count_field) + 1)
+        return True
+
+    def record_habit(self, goal_id, activity_date, today=None):
+        """Apply a newly completed habit day; returns False if a rebuild is needed."""
+        key = str(goal_id)
+        if self._defer_future(key, activity_date, today):
+            return True
+
+        run = self.habit_runs.get(key)
+        one_day = timedelta(days=1)
+
+        if not run:
+            self.habit_runs[key] = [activity_date.isoformat()] * 2
+            return True
+
+        start, end = (date.fromisoformat(d) for d in run)
+        if activity_date > end + one_day:
+            start = end = activity_date
+        elif activity_date == end + one_day:
+            end = activity_date
+        elif activity_date == start - one_day:
+            return False
+        self.habit_runs[key] = [start.isoformat(), end.isoformat()]
+        return True
+
+    # -------------------------------------------------------------------------
+    # Rebuilding
+    # -------------------------------------------------------------------------
+
+    def rebuild(self, kinds=None, save=True):
+        """Recompute counters from history for the given kinds (default: all)."""
+        today = self._today()
+        for kind in kinds or self.KINDS:
+            queryset, date_field = self._activity_source(kind)
+            queryset = queryset.filter(user_id=self.user_id)
+            dates = queryset.filter(**{f'{date_field}__lte': today}).order_by(
+                f'-{date_field}'
+            ).values_list(date_field, flat=True).distinct()
+            start, end = _latest_run(dates.iterator())
+            setattr(self, f'{kind}_run_start', start)
+            setattr(self, f'{kind}_run_end', end)
+            setattr(self, self._count_field(kind), queryset.count())
+
+            self.future_dates.pop(kind, None)
+            upcoming = queryset.filter(**{f'{date_field}__gt': today}).order_by(
+                date_field
+            ).values_list(date_field, flat=True).first()
+            if upcoming is not None:
+                self.future_dates[kind] = upcoming.isoformat()
+
+        if kinds is None:
+            self.habit_runs = {}
+            self.rebuild_habits(save=False)
+
+        if save:
+            self.save()
+
+    def rebuild_habits(self, goal_ids=None, save=True):
+        """Recompute habit runs for the given goals (default: all of the user's goals)."""
+        from apps.purpose.models import HabitEntry
+
+        today = self._today()
+        entries = HabitEntry.objects.filter(
+            goal__user_id=self.user_id,
+            completed=True,
+        )
+        if goal_ids is not None:
+            entries = entries.filter(goal_id__in=goal_ids)
+            for goal_id in goal_ids:
+                self.habit_runs.pop(str(goal_id), None)
+                self.future_dates.pop(str(goal_id), None)
+        else:
+            self.future_dates = {
+                key: value for key, value in self.future_dates.items() if key in self.KINDS
+            }
+
+        for goal_id, upcoming in entries.filter(date__gt=today).order_by('goal_id', 'date').values_list(
+            'goal_id', 'date'
+        ):
+            self.future_dates.setdefault(str(goal_id), upcoming.isoformat())
+
+        current_goal = None
+        dates = []
+        rows = entries.filter(date__lte=today).order_by('goal_id', '-date').values_list('goal_id', 'date')
+        for goal_id, entry_date in list(rows) + [(None, None)]:
+            if goal_id != current_goal:
+                if current_goal is not None:
+                    start, end = _latest_run(dates)
+                    self.habit_runs[str(current_goal)] = [start.isoformat(), end.isoformat()]
+                current_goal = goal_id
+                dates = []
+            dates.append(entry_date)
+
+        if save:
+            self.save(update_fields=['habit_runs', 'future_dates', 'updated_at'])
+
+    def _today(self):
+        from apps.core.utils import get_user_today
+
+        return get_user_today(self.user)
+
+    def _defer_future(self, key, activity_date, today=None):
+        """Note an activity dated after today instead of applying it; True if deferred."""
+        if activity_date <= (today or self._today()):
+            return False
+        pending = self.future_dates.get(key)
+        if pending is None or activity_date < date.fromisoformat(pending):
+            self.future_dates[key] = activity_date.isoformat()
+        return True
+
+    def _apply_arrived(self, key, today):
+        """Rebuild an activity whose earliest future-dated entry is no longer in the future."""
+        pending = self.future_dates.get(key)
+        if pending is None or date.fromisoformat(pending) > today:
+            return
+        if key in self.KINDS:
+            self.rebuild(kinds=[key])
+        else:
+            self.rebuild_habits(goal_ids=[key])
+
+    @classmethod
+    def _activity_source(cls, kind):
+        """Return (queryset, date field) for an activity kind."""
+        if kind == cls.KIND_JOURNAL:
+            from apps.journal.models import JournalEntry
+            return JournalEntry.objects.all(), 'entry_date'
+        if kind == cls.KIND_WORKOUT:
+            from apps.health.models import WorkoutSession
+            return WorkoutSession.objects.all(), 'date'
+        raise ValueError(f"Unknown activity kind: {kind}")
+
+    @classmethod
+    def _count_field(cls, kind):
+        return 'journal_entry_count' if kind == cls.KIND_JOURNAL else 'workout_count'
+
+
+# =============================================================================
+# SCHEDULED JOB MODELS
+# =============================================================================
+
+
+class JobLease(models.Model):
+    """
+    Leader lease for the scheduled job runner.
+
+    Every run_jobs process competes for the same row; the holder runs the
+    jobs and renews the lease well before it expires. A process that dies
+    simply stops renewing, and another takes over once expires_at passes.
+    Times are compared against the database clock so hosts with drifting
+    clocks agree on who holds the lease.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    holder = models.CharField(max_length=200, blank=True, help_text="host:pid:token of the current leader")
+    acquired_at = models.DateTimeField(null=True, blank=True)
+    renewed_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Job Lease"
+        verbose_name_plural = "Job Leases"
+
+    def __str__(self):
+        return f"{self.name} held by {self.holder or 'nobody'}"
+
+    @classmethod
+    def acquire(cls, name, holder, ttl):
+        """
+        Take or renew the lease; returns True if ``holder`` now holds it.
+
+        Args:
+            name: Lease name
+            holder: Identifier of the competing process
+            ttl: timedelta the lease stays valid without renewal
+        """
+        from django.db import IntegrityError, transaction
+        from django.db.models import DateTimeField, ExpressionWrapper, Q
+        from django.db.models.functions import Now
+
+        expires = ExpressionWrapper(Now() + ttl, output_field=DateTimeField())
+
+        # Renew our own unexpired lease
+        if cls.objects.filter(name=name, holder=holder, expires_at__gt=Now()).update(
+            renewed_at=Now(), expires_at=expires
+        ):
+            return True
+
+        # Take over a lease that expired, or was released
+        takeover = Q(expires_at__isnull=True) | Q(expires_at__lte=Now()) | Q(holder=holder)
+        if cls.objects.filter(takeover, name=name).update(
+            holder=holder, acquired_at=Now(), renewed_at=Now(), expires_at=expires
+        ):
+            return True
+
+        if cls.objects.filter(name=name).exists():
+            return False
+        try:
+            with transaction.atomic():
+                cls.objects.create(name=name)
+        except IntegrityError:
+            pass
+        return cls.acquire(name, holder, ttl)
+
+    @classmethod
+    def release(cls, name, holder):
+        """Give up the lease so a standby can take it straight away."""
+        return cls.objects.filter(name=name, holder=holder).update(expires_at=None) > 0
+
+
+class JobRun(models.Model):
+    """
+    One execution (or missed execution) of a scheduled job.
+
+    Written by apps.core.job_runner for every run, so durations, failures
+    and misfires can be read per job without trawling logs.
+    """
+
+    STATUS_SUCCESS = 'success'
+    STATUS_FAILED = 'failed'
+    STATUS_MISSED = 'missed'
+    STATUS_CHOICES = [
+        (STATUS_SUCCESS, 'Success'),
+        (STATUS_FAILED, 'Failed'),
+        (STATUS_MISSED, 'Missed'),
+    ]
+
+    job_id = models.CharField(max_length=100)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    scheduled_for = models.DateTimeField(null=True, blank=True, help_text="Fire time of a missed run")
+    started_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.FloatField(default=0)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    holder = models.CharField(max_length=200, blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        verbose_name = "Job Run"
+        verbose_name_plural = "Job Runs"
+        indexes = [
+            models.Index(fields=['job_id', '-started_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.status} at {self.started_at:%Y-%m-%d %H:%M}"
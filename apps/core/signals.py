@@ -0,0 +1,151 @@
+# ==============================================================================
+# File: apps/core/signals.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Keep UserActivityCounters in sync with activity records
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Core Signals - Incremental maintenance of UserActivityCounters.
+
+New JournalEntry / WorkoutSession / HabitEntry rows extend the user's
+current run in O(1). Edits that can move a date or change status (soft
+delete, archive, restore) and hard deletes inside the current run fall
+back to rebuilding just that activity from history.
+"""
+
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+# Fields whose change can affect a streak
+STREAK_FIELDS = {'entry_date', 'date', 'status', 'completed'}
+
+
+def _as_date(instance, field_name):
+    """Normalize a DateField attribute (defaults may still be datetimes)."""
+    field = instance._meta.get_field(field_name)
+    return field.to_python(getattr(instance, field_name))
+
+
+def _touches_streak(update_fields):
+    return update_fields is None or bool(STREAK_FIELDS & set(update_fields))
+
+
+def _is_user_cascade(origin):
+    """True when the delete was triggered by deleting the user account."""
+    return isinstance(origin, get_user_model())
+
+
+def _locked_counters(user_id):
+    from apps.core.models import UserActivityCounters
+
+    return UserActivityCounters.objects.select_for_update().filter(user_id=user_id).first()
+
+
+def _activity_saved(kind, date_field, instance, created, update_fields):
+    from apps.core.models import UserActivityCounters
+
+    if not created and not _touches_streak(update_fields):
+        return
+
+    try:
+        with transaction.atomic():
+            counters = _locked_counters(instance.user_id)
+            if counters is None:
+                # Built from history on first read
+                UserActivityCounters.for_user(instance.user)
+                return
+
+            if created and instance.status == 'active':
+                applied = counters.record_activity(kind, _as_date(instance, date_field))
+                if applied:
+                    counters.save()
+                    return
+            counters.rebuild(kinds=[kind])
+    except Exception as e:
+        logger.error(f"Failed to update {kind} activity counters for user {instance.user_id}: {e}")
+
+
+def _activity_deleted(kind, instance, origin):
+    if _is_user_cascade(origin):
+        return
+
+    try:
+        with transaction.atomic():
+            counters = _locked_counters(instance.user_id)
+            if counters is not None:
+                counters.rebuild(kinds=[kind])
+    except Exception as e:
+        logger.error(f"Failed to update {kind} activity counters for user {instance.user_id}: {e}")
+
+
+@receiver(post_save, sender='journal.JournalEntry')
+def journal_entry_saved(sender, instance, created, update_fields=None, **kwargs):
+    from apps.core.models import UserActivityCounters
+
+    _activity_saved(UserActivityCounters.KIND_JOURNAL, 'entry_date', instance, created, update_fields)
+
+
+@receiver(post_delete, sender='journal.JournalEntry')
+def journal_entry_deleted(sender, instance, origin=None, **kwargs):
+    from apps.core.models import UserActivityCounters
+
+    _activity_deleted(UserActivityCounters.KIND_JOURNAL, instance, origin)
+
+
+@receiver(post_save, sender='health.WorkoutSession')
+def workout_session_saved(sender, instance, created, update_fields=None, **kwargs):
+    from apps.core.models import UserActivityCounters
+
+    _activity_saved(UserActivityCounters.KIND_WORKOUT, 'date', instance, created, update_fields)
+
+
+@receiver(post_delete, sender='health.WorkoutSession')
+def workout_session_deleted(sender, instance, origin=None, **kwargs):
+    from apps.core.models import UserActivityCounters
+
+    _activity_deleted(UserActivityCounters.KIND_WORKOUT, instance, origin)
+
+
+@receiver(post_save, sender='purpose.HabitEntry')
+def habit_entry_saved(sender, instance, created, update_fields=None, **kwargs):
+    from apps.core.models import UserActivityCounters
+
+    if not created and not _touches_streak(update_fields):
+        return
+
+    goal = instance.goal
+    try:
+        with transaction.atomic():
+            counters = _locked_counters(goal.user_id)
+            if counters is None:
+                UserActivityCounters.for_user(goal.user)
+                return
+
+            if created and instance.completed and counters.record_habit(goal.pk, instance.date):
+                counters.save(update_fields=['habit_runs', 'future_dates', 'updated_at'])
+                return
+            counters.rebuild_habits(goal_ids=[goal.pk])
+    except Exception as e:
+        logger.error(f"Failed to update habit counters for goal {goal.pk}: {e}")
+
+
+@receiver(post_delete, sender='purpose.HabitEntry')
+def habit_entry_deleted(sender, instance, origin=None, **kwargs):
+    if _is_user_cascade(origin):
+        return
+
+    try:
+        with transaction.atomic():
+            counters = _locked_counters(instance.goal.user_id)
+            if counters is not None:
+                counters.rebuild_habits(goal_ids=[instance.goal_id])
+    except Exception as e:
+        logger.error(f"Failed to update habit counters for goal {instance.goal_id}: {e}")
@@ -0,0 +1,199 @@
+"""
+Core Module - UserActivityCounters Tests
+
+This test file covers:
+1. Incremental streak maintenance from JournalEntry/WorkoutSession signals
+2. Rebuild fallbacks (backfilled dates, soft delete, hard delete)
+3. Habit goal streaks
+4. The rebuild_activity_counters management command
+
+Location: apps/core/tests/test_activity_counters.py
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.models import UserActivityCounters
+from apps.health.models import WorkoutSession
+from apps.journal.models import JournalEntry
+
+User = get_user_model()
+
+
+class ActivityCountersTestMixin:
+    """Common helpers for activity counter tests."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='streaks@example.com',
+            password='testpass123'
+        )
+        self.today = timezone.now().date()
+
+    def add_entry(self, days_ago):
+        return JournalEntry.objects.create(
+            user=self.user,
+            title=f'Entry {days_ago}',
+            body='Body',
+            entry_date=self.today - timedelta(days=days_ago),
+        )
+
+    def counters(self):
+        return UserActivityCounters.objects.get(user=self.user)
+
+
+class JournalStreakCountersTest(ActivityCountersTestMixin, TestCase):
+    """Journal streaks are maintained incrementally."""
+
+    def test_first_read_builds_from_history(self):
+        """A missing row is built from existing entries."""
+        self.add_entry(0)
+        UserActivityCounters.objects.filter(user=self.user).delete()
+
+        counters = UserActivityCounters.for_user(self.user)
+
+        self.assertEqual(counters.journal_streak(self.today), 1)
+        self.assertEqual(counters.journal_entry_count, 1)
+
+    def test_consecutive_entries_extend_streak(self):
+        """Entries on consecutive days extend the current run."""
+        for days_ago in (2, 1, 0):
+            self.add_entry(days_ago)
+
+        counters = self.counters()
+        self.assertEqual(counters.journal_streak(self.today), 3)
+        self.assertEqual(counters.journal_entry_count, 3)
+
+    def test_backfilled_entry_joins_runs(self):
+        """Filling a gap below the current run rebuilds and joins both runs."""
+        for days_ago in (3, 1, 0):
+            self.add_entry(days_ago)
+        self.assertEqual(self.counters().journal_streak(self.today), 2)
+
+        self.add_entry(2)
+
+        self.assertEqual(self.counters().journal_streak(self.today), 4)
+
+    def test_no_entry_today_means_no_streak(self):
+        """A run that ended yesterday is not a current streak."""
+        self.add_entry(1)
+        self.assertEqual(self.counters().journal_streak(self.today), 0)
+
+    def test_soft_delete_breaks_streak(self):
+        """Soft-deleting today's entry removes it from the streak."""
+        self.add_entry(1)
+        entry = self.add_entry(0)
+
+        entry.soft_delete()
+
+        counters = self.counters()
+        self.assertEqual(counters.journal_streak(self.today), 0)
+        self.assertEqual(counters.journal_entry_count, 1)
+
+    def test_future_dated_entry_does_not_break_streak(self):
+        """An entry dated after today is left out until its day arrives."""
+        for days_ago in (1, 0):
+            self.add_entry(days_ago)
+
+        self.add_entry(-3)
+
+        counters = self.counters()
+        self.assertEqual(counters.journal_streak(self.today), 2)
+        self.assertEqual(counters.journal_entry_count, 3)
+
+        counters.rebuild()
+        self.assertEqual(counters.journal_streak(self.today), 2)
+
+        # Three days later the entry counts, but the days between were missed
+        later = self.today + timedelta(days=3)
+        with mock.patch('apps.core.utils.get_user_today', return_value=later):
+            self.assertEqual(self.counters().journal_streak(later), 1)
+
+    def test_streak_not_capped_at_sixty_days(self):
+        """Long streaks are counted in full."""
+        for days_ago in range(90):
+            self.add_entry(days_ago)
+
+        self.assertEqual(self.counters().journal_streak(self.today), 90)
+
+
+class WorkoutStreakCountersTest(ActivityCountersTestMixin, TestCase):
+    """Workout streaks use the same counters row."""
+
+    def test_workout_streak_and_hard_delete(self):
+        """Hard-deleting a workout inside the run rebuilds the streak."""
+        WorkoutSession.objects.create(user=self.user, date=self.today - timedelta(days=1))
+        today_session = WorkoutSession.objects.create(user=self.user, date=self.today)
+        self.assertEqual(self.counters().workout_streak(self.today), 2)
+
+        today_session.delete()
+
+        counters = self.counters()
+        self.assertEqual(counters.workout_streak(self.today), 0)
+        self.assertEqual(counters.workout_count, 1)
+
+
+class HabitStreakCountersTest(ActivityCountersTestMixin, TestCase):
+    """Habit goal streaks are stored per goal."""
+
+    def test_habit_goal_current_streak(self):
+        """HabitGoal.current_streak reads the materialised run."""
+        from apps.purpose.models import HabitEntry, HabitGoal
+
+        goal = HabitGoal.objects.create(
+            user=self.user,
+            name='Walk',
+            purpose='Health',
+            start_date=self.today - timedelta(days=10),
+            end_date=self.today + timedelta(days=10),
+        )
+        for days_ago in (2, 1, 0):
+            HabitEntry.objects.create(goal=goal, date=self.today - timedelta(days=days_ago))
+
+        self.assertEqual(goal.current_streak, 3)
+
+        HabitEntry.objects.get(goal=goal, date=self.today - timedelta(days=1)).delete()
+
+        self.assertEqual(goal.current_streak, 1)
+
+    def test_habit_streak_starts_at_goal_start(self):
+        """Completions before the goal's start date are not part of its streak."""
+        from apps.purpose.models import HabitEntry, HabitGoal
+
+        goal = HabitGoal.objects.create(
+            user=self.user,
+            name='Stretch',
+            purpose='Health',
+            start_date=self.today - timedelta(days=1),
+            end_date=self.today + timedelta(days=10),
+        )
+        for days_ago in (4, 3, 2, 1, 0):
+            HabitEntry.objects.create(goal=goal, date=self.today - timedelta(days=days_ago))
+
+        self.assertEqual(goal.current_streak, 2)
+
+
+class RebuildActivityCountersCommandTest(ActivityCountersTestMixin, TestCase):
+    """Tests for the rebuild_activity_counters command."""
+
+    def test_rebuild_restores_counters(self):
+        """The command recomputes counters from history."""
+        self.add_entry(1)
+        self.add_entry(0)
+        UserActivityCounters.objects.filter(user=self.user).update(
+            journal_run_start=None, journal_run_end=None, journal_entry_count=0
+        )
+
+        out = StringIO()
+        call_command('rebuild_activity_counters', user=self.user.email, stdout=out)
+
+        counters = self.counters()
+        self.assertEqual(counters.journal_streak(self.today), 2)
+        self.assertEqual(counters.journal_entry_count, 2)
+        self.assertIn('1 user', out.getvalue())
@@ -0,0 +1,273 @@
+"""
+Core Module - Scheduled Job Runner Tests
+
+This test file covers:
+1. JobLease leader election (exclusive, expiry takeover, release)
+2. JobRun metrics for successful and failing jobs
+3. Misfire recording and catch-up of fire times missed without a leader
+4. The run_jobs management command
+
+Location: apps/core/tests/test_job_runner.py
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from apscheduler.events import EVENT_JOB_MISSED
+from apscheduler.schedulers.background import BackgroundScheduler
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.job_runner import (
+    JOBS, JobDefinition, JobRunner, lease_is_stale, missed_fire_time, prune_job_runs,
+    run_job,
+)
+from apps.core.models import JobLease, JobRun
+
+CALLS = []
+
+
+def record_call(value=None):
+    CALLS.append(value)
+    return {'value': value}
+
+
+def record_now(now=None):
+    CALLS.append(now)
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+def daily_job(**overrides):
+    options = dict(
+        id='daily_test_job',
+        func='apps.core.tests.test_job_runner:record_call',
+        trigger='cron',
+        schedule={'hour': 6, 'minute': 0},
+        description='Test: daily at 06:00',
+        misfire_grace_time=6 * 60 * 60,
+    )
+    options.update(overrides)
+    return JobDefinition(**options)
+
+
+class JobLeaseTests(TestCase):
+    """Tests for JobLease.acquire and release."""
+
+    TTL = timedelta(seconds=60)
+
+    def test_only_one_holder(self):
+        """A second runner cannot take an unexpired lease."""
+        self.assertTrue(JobLease.acquire('jobs', 'a', self.TTL))
+        self.assertFalse(JobLease.acquire('jobs', 'b', self.TTL))
+        self.assertTrue(JobLease.acquire('jobs', 'a', self.TTL))
+        self.assertEqual(JobLease.objects.get(name='jobs').holder, 'a')
+
+    def test_expired_lease_taken_over(self):
+        """A leader that stops renewing is replaced once the lease expires."""
+        JobLease.acquire('jobs', 'a', self.TTL)
+        JobLease.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertTrue(JobLease.acquire('jobs', 'b', self.TTL))
+        self.assertFalse(JobLease.acquire('jobs', 'a', self.TTL))
+
+    def test_lease_is_stale(self):
+        """The web startup check reports a missing or unrenewed lease."""
+        self.assertTrue(lease_is_stale())
+
+        JobLease.acquire('scheduled-jobs', 'worker', self.TTL)
+        self.assertFalse(lease_is_stale())
+
+        JobLease.objects.update(renewed_at=timezone.now() - timedelta(hours=1))
+        self.assertTrue(lease_is_stale())
+
+    def test_release_hands_over(self):
+        """A released lease can be taken straight away."""
+        JobLease.acquire('jobs', 'a', self.TTL)
+
+        self.assertTrue(JobLease.release('jobs', 'a'))
+        self.assertTrue(JobLease.acquire('jobs', 'b', self.TTL))
+
+    def test_runner_starts_scheduler_only_when_leader(self):
+        """The standby runner never starts a scheduler."""
+        leader = JobRunner(jobs=[], holder='leader')
+        standby = JobRunner(jobs=[], holder='standby')
+        try:
+            self.assertTrue(leader.tick())
+            self.assertFalse(standby.tick())
+            self.assertIsNotNone(leader.scheduler)
+            self.assertIsNone(standby.scheduler)
+            self.assertTrue(leader.is_leader)
+            self.assertFalse(standby.is_leader)
+        finally:
+            leader.stop_scheduler()
+
+    def test_runner_stops_scheduler_when_lease_lost(self):
+        """A leader whose lease was taken stops its scheduler."""
+        runner = JobRunner(jobs=[], holder='leader')
+        runner.tick()
+        JobLease.objects.update(holder='other', expires_at=timezone.now() + timedelta(minutes=5))
+
+        self.assertFalse(runner.tick())
+        self.assertIsNone(runner.scheduler)
+
+
+class JobRunTests(TestCase):
+    """Tests for run_job metrics and misfire handling."""
+
+    def setUp(self):
+        CALLS.clear()
+
+    def test_success_recorded(self):
+        """A run records its status, result and duration."""
+        run = run_job(daily_job(kwargs={'value': 3}), holder='worker')
+
+        self.assertEqual(CALLS, [3])
+        run.refresh_from_db()
+        self.assertEqual(run.status, JobRun.STATUS_SUCCESS)
+        self.assertEqual(run.result, {'value': 3})
+        self.assertEqual(run.holder, 'worker')
+        self.assertIsNotNone(run.finished_at)
+        self.assertGreaterEqual(run.duration_ms, 0)
+
+    def test_failure_recorded_not_raised(self):
+        """A failing job is recorded with its traceback."""
+        run = run_job(daily_job(func='apps.core.tests.test_job_runner:fail'))
+
+        self.assertEqual(run.status, JobRun.STATUS_FAILED)
+        self.assertIn('RuntimeError: boom', run.error)
+
+    def test_real_job_failure_recorded(self):
+        """A scheduled job that errors is stored as failed, not success."""
+        job = next(job for job in JOBS if job.id == 'snapshot_financial_metrics')
+
+        with mock.patch(
+            'apps.finance.services.metrics_service.snapshot_users',
+            side_effect=RuntimeError('database unavailable'),
+        ):
+            run = run_job(job)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, JobRun.STATUS_FAILED)
+        self.assertIn('database unavailable', run.error)
+
+    def test_late_run_gets_fire_time(self):
+        """A job run after its fire time is called with the fire time as now."""
+        job = daily_job(
+            id='hourly_test_job',
+            func='apps.core.tests.test_job_runner:record_now',
+            schedule={'minute': 0},
+            misfire_grace_time=30 * 60,
+            pass_fire_time=True,
+        )
+        runner = JobRunner(jobs=[job], holder='leader')
+        runner._valid_until = float('inf')
+        late = datetime(2030, 1, 15, 0, 40, tzinfo=dt_timezone.utc)
+
+        with mock.patch('apps.core.job_runner.timezone.now', return_value=late):
+            runner._execute(job)
+
+        self.assertEqual(CALLS, [datetime(2030, 1, 15, 0, 0, tzinfo=dt_timezone.utc)])
+
+    def test_skipped_when_not_leader(self):
+        """A runner that lost the lease does not run jobs."""
+        runner = JobRunner(jobs=[], holder='stale')
+
+        self.assertIsNone(runner._execute(daily_job()))
+        self.assertEqual(CALLS, [])
+
+    def test_misfire_event_recorded(self):
+        """APScheduler misfires are stored as missed runs."""
+        runner = JobRunner(jobs=[], holder='worker')
+        scheduled = timezone.now() - timedelta(minutes=10)
+
+        runner._on_missed(SimpleNamespace(
+            code=EVENT_JOB_MISSED, job_id='send_pending_sms', scheduled_run_time=scheduled
+        ))
+
+        missed = JobRun.objects.get()
+        self.assertEqual(missed.status, JobRun.STATUS_MISSED)
+        self.assertEqual(missed.scheduled_for, scheduled)
+
+    def test_missed_fire_time(self):
+        """A fire time inside the grace period with no run is reported."""
+        job = daily_job()
+        trigger = job.build_trigger('UTC')
+        now = datetime(2030, 1, 15, 8, 30, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(missed_fire_time(job, trigger, now), datetime(2030, 1, 15, 6, 0, tzinfo=dt_timezone.utc))
+
+        JobRun.objects.create(job_id=job.id, status=JobRun.STATUS_SUCCESS, started_at=now - timedelta(hours=2))
+        self.assertIsNone(missed_fire_time(job, trigger, now))
+
+        # Outside the grace period the run is left for tomorrow
+        late = datetime(2030, 1, 16, 13, 0, tzinfo=dt_timezone.utc)
+        self.assertIsNone(missed_fire_time(job, trigger, late))
+
+    def test_leader_catches_up_missed_run(self):
+        """A new leader runs a job whose fire time passed without a leader."""
+        job = daily_job()
+        now = datetime(2030, 1, 15, 8, 30, tzinfo=dt_timezone.utc)
+        runner = JobRunner(jobs=[job], holder='leader')
+
+        # Keep the jobs pending instead of running them in scheduler threads
+        with mock.patch.object(BackgroundScheduler, 'start'):
+            runner.start_scheduler(now)
+
+        self.assertEqual(runner.scheduler.get_job(job.id).next_run_time, now)
+        missed = JobRun.objects.get(job_id=job.id)
+        self.assertEqual(missed.status, JobRun.STATUS_MISSED)
+        self.assertEqual(missed.scheduled_for, datetime(2030, 1, 15, 6, 0, tzinfo=dt_timezone.utc))
+
+    def test_prune_job_runs(self):
+        """Old run history is deleted."""
+        JobRun.objects.create(job_id='a', status=JobRun.STATUS_SUCCESS, started_at=timezone.now() - timedelta(days=40))
+        JobRun.objects.create(job_id='a', status=JobRun.STATUS_SUCCESS)
+
+        self.assertEqual(prune_job_runs(), {'deleted': 1})
+
+
+class RunJobsCommandTests(TestCase):
+    """Tests for the run_jobs management command."""
+
+    def test_list(self):
+        out = StringIO()
+        call_command('run_jobs', '--list', stdout=out)
+
+        for job in JOBS:
+            self.assertIn(job.id, out.getvalue())
+
+    def test_run_single_job(self):
+        out = StringIO()
+        call_command('run_jobs', '--run=prune_job_runs', stdout=out)
+
+        self.assertIn('prune_job_runs: success', out.getvalue())
+        self.assertEqual(JobRun.objects.get().job_id, 'prune_job_runs')
+
+    def test_run_sms_scheduler_delegates_to_run_jobs(self):
+        """The old SMS scheduler command starts the leased runner, not its own."""
+        with mock.patch.object(JobRunner, 'run_forever') as run_forever, \
+                mock.patch('apps.core.management.commands.run_jobs.signal.signal'):
+            call_command('run_sms_scheduler', stdout=StringIO())
+
+        run_forever.assert_called_once()
+
+    def test_unknown_job(self):
+        with self.assertRaises(CommandError):
+            call_command('run_jobs', '--run=nope', stdout=StringIO())
+
+    def test_status(self):
+        JobRun.objects.create(job_id='send_pending_sms', status=JobRun.STATUS_SUCCESS, duration_ms=120)
+        JobRun.objects.create(job_id='send_pending_sms', status=JobRun.STATUS_MISSED)
+        out = StringIO()
+
+        call_command('run_jobs', '--status', stdout=out)
+
+        self.assertIn('send_pending_sms', out.getvalue())
+        self.assertIn('runs=1 failed=0 missed=1', out.getvalue())
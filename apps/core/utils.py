@@ -11,8 +11,10 @@ Description:
     for safe URL redirects.
 
 Key Functions:
+    - get_user_timezone: Get the user's configured timezone (memoized per request)
     - get_user_today: Get today's date in user's configured timezone
     - get_user_now: Get current datetime in user's timezone
+    - get_utc_offset_minutes: Current UTC offset of a timezone in minutes
     - is_safe_redirect_url: Validate URLs to prevent open redirect attacks
     - get_safe_redirect_url: Extract safe redirect URL from request
 
@@ -36,6 +38,26 @@ from django.utils import timezone
 from django.utils.http import url_has_allowed_host_and_scheme
 
 
+def get_user_timezone(user):
+    """
+    Get the user's configured timezone as a pytz timezone.
+
+    Reuses the request-scoped context installed by UserContextMiddleware
+    when available, so the timezone is resolved once per request.
+
+    Args:
+        user: The User object (must have preferences.timezone_iana)
+
+    Returns:
+        tzinfo: The user's timezone
+    """
+    context = getattr(user, "_request_context", None)
+    if context is not None:
+        return context.tzinfo
+    # Use timezone_iana to handle legacy US/Eastern format
+    return pytz.timezone(user.preferences.timezone_iana)
+
+
 def get_user_today(user):
     """
     Get today's date in the user's configured timezone.
@@ -50,10 +72,10 @@ def get_user_today(user):
     Returns:
         date: Today's date in the user's timezone
     """
-    # Use timezone_iana to handle legacy US/Eastern format
-    user_tz = pytz.timezone(user.preferences.timezone_iana)
-    user_now = timezone.now().astimezone(user_tz)
-    return user_now.date()
+    context = getattr(user, "_request_context", None)
+    if context is not None:
+        return context.today
+    return get_user_now(user).date()
 
 
 def get_user_now(user):
@@ -66,9 +88,28 @@ def get_user_now(user):
     Returns:
         datetime: Current datetime in the user's timezone (timezone-aware)
     """
-    # Use timezone_iana to handle legacy US/Eastern format
-    user_tz = pytz.timezone(user.preferences.timezone_iana)
-    return timezone.now().astimezone(user_tz)
+    return timezone.now().astimezone(get_user_timezone(user))
+
+
+def get_utc_offset_minutes(tz_name, now=None):
+    """
+    Get a timezone's UTC offset in minutes at a moment (default now).
+
+    Unknown names are treated as UTC.
+
+    Args:
+        tz_name: IANA timezone name (e.g. 'America/New_York')
+        now: Aware datetime to measure the offset at (DST aware)
+
+    Returns:
+        int: Minutes east of UTC (e.g. -300 for EST, 330 for IST)
+    """
+    try:
+        tz = pytz.timezone(tz_name or "UTC")
+    except pytz.UnknownTimeZoneError:
+        return 0
+    offset = (now or timezone.now()).astimezone(tz).utcoffset()
+    return int(offset.total_seconds() // 60)
 
 
 def is_safe_redirect_url(url, request):
@@ -8,6 +8,7 @@ Purpose: Django app configuration for the dashboard module
 Description:
     Standard Django app configuration class for the dashboard application.
     Registers the app with Django and sets the verbose name for admin.
+    Connects the fragment cache invalidation signals on ready().
 
 Copyright:
     (c) Whole Life Journey. All rights reserved.
@@ -22,3 +23,6 @@ class DashboardConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.dashboard"
     verbose_name = "Dashboard"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,160 @@
+# ==============================================================================
+# File: apps/dashboard/fragments.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Per-user dashboard fragment cache with signal-driven invalidation
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Dashboard Fragment Cache
+
+Caches the data behind each dashboard section (journal, faith, health, life,
+purpose, scan) and the HTMX tiles per user, so repeat dashboard renders are
+served from the shared cache without touching the ORM.
+
+Keys are namespaced per user and per section with a generation token:
+
+    dashboard:v1:<user_id>:<section>:gen                      -> token
+    dashboard:v1:<user_id>:<section>:<token>:<name>:<date>    -> data
+
+Saving or deleting any model listed in SECTION_MODELS replaces the token
+for the owning user's affected sections (see apps/dashboard/signals.py),
+which orphans the old fragments. Fragments also include the user's local
+date and expire after FRAGMENT_TIMEOUT, which bounds staleness from
+queryset.update() calls that bypass signals and from time-relative
+counters such as "due soon".
+
+Usage:
+    from apps.dashboard.fragments import cached_fragment
+
+    data = cached_fragment(user.pk, "journal", builder, day=today)
+"""
+
+import time
+
+from django.core.cache import cache
+
+# Bump when the shape of cached section data changes
+FRAGMENT_SCHEMA_VERSION = 1
+
+FRAGMENT_TIMEOUT = 60 * 10  # 10 minutes
+GENERATION_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+ENCOURAGEMENT_TIMEOUT = 60 * 60  # 1 hour
+
+# Models whose changes invalidate each section, with the path to the owning
+# user's id on the instance.
+SECTION_MODELS = {
+    "journal.JournalEntry": (("journal", "scan"), "user_id"),
+    "faith.PrayerRequest": (("faith",), "user_id"),
+    "faith.SavedVerse": (("faith",), "user_id"),
+    "faith.FaithMilestone": (("faith",), "user_id"),
+    "health.WeightEntry": (("health",), "user_id"),
+    "health.FastingWindow": (("health",), "user_id"),
+    "health.GlucoseEntry": (("health",), "user_id"),
+    "health.Medicine": (("health", "scan"), "user_id"),
+    "health.MedicineSchedule": (("health",), "medicine.user_id"),
+    "health.MedicineLog": (("health",), "user_id"),
+    "health.WorkoutSession": (("health", "scan"), "user_id"),
+    "health.PersonalRecord": (("health",), "user_id"),
+    "health.FoodEntry": (("health",), "user_id"),
+    "health.DailyNutritionSummary": (("health",), "user_id"),
+    "users.UserPreferences": (("health",), "user_id"),
+    "life.Project": (("life",), "user_id"),
+    "life.Task": (("life",), "user_id"),
+    "life.LifeEvent": (("life",), "user_id"),
+    "life.SignificantEvent": (("life",), "user_id"),
+    "purpose.AnnualDirection": (("purpose",), "user_id"),
+    "purpose.LifeGoal": (("purpose",), "user_id"),
+    "purpose.ChangeIntention": (("purpose",), "user_id"),
+    "scan.ScanLog": (("scan",), "user_id"),
+}
+
+SECTIONS = ("journal", "faith", "health", "life", "purpose", "scan")
+
+
+def _prefix(user_id, section):
+    return f"dashboard:v{FRAGMENT_SCHEMA_VERSION}:{user_id}:{section}"
+
+
+def _generation(user_id, section):
+    """Current generation token for a user's section, created on first use."""
+    key = f"{_prefix(user_id, section)}:gen"
+    token = cache.get(key)
+    if token is None:
+        # A fresh token (rather than 0) means an evicted generation key can
+        # never resurrect fragments built before the eviction.
+        token = time.time_ns()
+        if not cache.add(key, token, GENERATION_TIMEOUT):
+            token = cache.get(key, token)
+    return token
+
+
+def cached_fragment(user_id, section, builder, name="data", day=None):
+    """
+    Return cached data for a user's dashboard section, building it on a miss.
+
+    Args:
+        user_id: Owner of the data
+        section: One of SECTIONS; determines which model changes invalidate it
+        builder: Zero-argument callable returning picklable data
+        name: Distinguishes several fragments in one section (e.g. "tile")
+        day: User's local date, for data that is relative to today
+
+    Returns:
+        The cached or freshly built data
+    """
+    token = _generation(user_id, section)
+    key = f"{_prefix(user_id, section)}:{token}:{name}:{day or ''}"
+
+    data = cache.get(key)
+    if data is None:
+        data = builder()
+        cache.set(key, data, FRAGMENT_TIMEOUT)
+    return data
+
+
+def invalidate_sections(user_id, sections=SECTIONS):
+    """Drop every cached fragment in the given sections for a user."""
+    token = time.time_ns()
+    cache.set_many(
+        {f"{_prefix(user_id, section)}:gen": token for section in sections},
+        GENERATION_TIMEOUT,
+    )
+
+
+def owner_id(instance, path):
+    """Follow a dotted attribute path (e.g. "medicine.user_id") on an instance."""
+    value = instance
+    for attr in path.split("."):
+        value = getattr(value, attr, None)
+        if value is None:
+            return None
+    return value
+
+
+# =============================================================================
+# Encouragements (shared by every user)
+# =============================================================================
+
+def _encouragement_key(faith_enabled):
+    return f"dashboard:v{FRAGMENT_SCHEMA_VERSION}:encouragements:{int(bool(faith_enabled))}"
+
+
+def active_encouragements(faith_enabled):
+    """Active DailyEncouragement rows visible to a user, cached for everyone."""
+    from .models import DailyEncouragement
+
+    key = _encouragement_key(faith_enabled)
+    encouragements = cache.get(key)
+    if encouragements is None:
+        queryset = DailyEncouragement.objects.filter(is_active=True)
+        if not faith_enabled:
+            queryset = queryset.filter(is_faith_specific=False)
+        encouragements = list(queryset)
+        cache.set(key, encouragements, ENCOURAGEMENT_TIMEOUT)
+    return encouragements
+
+
+def invalidate_encouragements():
+    cache.delete_many([_encouragement_key(True), _encouragement_key(False)])
@@ -0,0 +1,475 @@
+# ==============================================================================
+# File: apps/dashboard/services.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Aggregated data layer for the dashboard home page
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Dashboard Aggregation Service
+
+Builds the per-module numbers shown on the dashboard. Each module's
+counters are computed with one conditional-aggregate query per model
+(``Count(filter=Q(...))``) and any rows that are displayed are
+materialised once and reused for their counts, instead of issuing a
+separate ``.count()`` / ``.exists()`` per statistic.
+
+gather() serves each section from the per-user fragment cache
+(apps/dashboard/fragments.py), so repeat renders skip these queries
+until one of the section's models changes.
+
+Usage:
+    from apps.dashboard.services import DashboardAggregator
+
+    data = DashboardAggregator(user, prefs).gather()
+"""
+
+from datetime import timedelta
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from apps.core.models import UserActivityCounters
+from apps.core.utils import get_user_now
+
+from .fragments import cached_fragment
+
+
+class DashboardAggregator:
+    """
+    Collects dashboard data for a single user.
+
+    The dictionary returned by gather() keeps the keys the dashboard
+    template and the celebration/nudge logic already rely on.
+    """
+
+    def __init__(self, user, prefs=None):
+        self.user = user
+        self.prefs = prefs or user.preferences
+        self.now = get_user_now(user)
+        self.today = self.now.date()
+        self.week_ago = self.now - timedelta(days=7)
+        self.month_ago = self.now - timedelta(days=30)
+        self._activity_counters = None
+
+    @property
+    def activity_counters(self):
+        """The user's UserActivityCounters row, loaded once."""
+        if self._activity_counters is None:
+            self._activity_counters = UserActivityCounters.for_user(self.user)
+        return self._activity_counters
+
+    def gather(self):
+        """Gather data for every module the user has enabled."""
+        prefs = self.prefs
+        data = {
+            "today": self.today,
+            "week_ago": self.week_ago,
+        }
+
+        if prefs.journal_enabled:
+            data.update(self.cached("journal", self.journal_data))
+
+        if prefs.faith_enabled:
+            data.update(self.cached("faith", self.faith_data))
+
+        if prefs.health_enabled:
+            data.update(self.cached("health", self.health_data))
+
+        if prefs.life_enabled:
+            data.update(self.cached("life", self.life_data))
+
+        if prefs.purpose_enabled:
+            data.update(self.cached("purpose", self.purpose_data))
+
+        # Scan requires AI
+        if prefs.ai_enabled:
+            data.update(self.cached("scan", self.scan_data))
+
+        return data
+
+    def cached(self, section, builder):
+        """Section data from the per-user fragment cache, built on a miss."""
+        return cached_fragment(self.user.pk, section, builder, day=self.today)
+
+    # =========================================================================
+    # Journal
+    # =========================================================================
+
+    def journal_data(self):
+        """Journal totals, streak, mood and recent entries."""
+        from apps.journal.models import JournalEntry
+
+        entries = JournalEntry.objects.filter(user=self.user)
+
+        stats = entries.aggregate(
+            total=Count("id"),
+            this_week=Count("id", filter=Q(created_at__gte=self.week_ago)),
+            this_month=Count("id", filter=Q(created_at__gte=self.month_ago)),
+            last_entry_date=Max("entry_date"),
+        )
+
+        last_entry_date = stats["last_entry_date"]
+        days_since_journal = None
+        if last_entry_date:
+            days_since_journal = (self.today - last_entry_date).days
+
+        # Mood distribution this week
+        moods = list(
+            entries.filter(created_at__gte=self.week_ago)
+            .exclude(mood="")
+            .values("mood")
+            .annotate(count=Count("mood"))
+            .order_by("-count")[:1]
+        )
+        top_mood = moods[0]["mood"] if moods else None
+
+        recent_entries = list(
+            entries.order_by("-entry_date")[:5].values(
+                "title", "entry_date", "mood", "body"
+            )
+        )
+
+        return {
+            "journal_total": stats["total"],
+            "journal_this_week": stats["this_week"],
+            "journal_this_month": stats["this_month"],
+            "last_journal_date": last_entry_date,
+            "days_since_journal": days_since_journal,
+            "journal_streak": self.journal_streak() if stats["total"] else 0,
+            "top_mood_this_week": top_mood,
+            "recent_entries": recent_entries,
+        }
+
+    def journal_streak(self):
+        """Consecutive days of journaling, from the materialised counters."""
+        return self.activity_counters.journal_streak(self.today)
+
+    # =========================================================================
+    # Faith
+    # =========================================================================
+
+    def faith_data(self):
+        """Prayer, milestone and memory verse data."""
+        from apps.faith.models import FaithMilestone, PrayerRequest, SavedVerse
+
+        prayers = PrayerRequest.objects.filter(user=self.user)
+        prayer_stats = prayers.aggregate(
+            active=Count("id", filter=Q(is_answered=False)),
+            answered=Count("id", filter=Q(is_answered=True)),
+        )
+
+        recent_answered = None
+        if prayer_stats["answered"]:
+            recent_answered = prayers.filter(
+                is_answered=True
+            ).order_by("-answered_at").first()
+
+        memory_verse = SavedVerse.objects.filter(
+            user=self.user,
+            is_memory_verse=True
+        ).first()
+
+        return {
+            "active_prayers": prayer_stats["active"],
+            "answered_prayers": prayer_stats["answered"],
+            "total_milestones": FaithMilestone.objects.filter(user=self.user).count(),
+            "recent_answered_prayer": recent_answered,
+            "memory_verse": memory_verse,
+        }
+
+    # =========================================================================
+    # Health
+    # =========================================================================
+
+    def health_data(self):
+        """Weight, fasting, glucose, medicine and workout data."""
+        data = {}
+        data.update(self._weight_data())
+        data.update(self._fasting_data())
+        data.update(self._medicine_data())
+        data.update(self._workout_data())
+
+        from apps.health.models import GlucoseEntry
+        data["latest_glucose"] = GlucoseEntry.objects.filter(
+            user=self.user
+        ).order_by("-recorded_at").first()
+
+        # Weight and Nutrition Goal Progress
+        prefs = self.prefs
+        data.update({
+            "weight_progress": prefs.get_weight_progress(),
+            "nutrition_progress": prefs.get_nutrition_progress(self.today),
+            "has_weight_goal": prefs.has_weight_goal,
+            "has_nutrition_goals": prefs.has_nutrition_goals,
+        })
+        return data
+
+    def _weight_data(self):
+        from apps.health.models import WeightEntry
+
+        weights = WeightEntry.objects.filter(user=self.user)
+        stats = weights.aggregate(
+            total=Count("id"),
+            this_month=Count("id", filter=Q(recorded_at__gte=self.month_ago)),
+        )
+
+        latest_weight = None
+        weight_change = None
+        weight_trend = None
+        if stats["total"]:
+            latest_weight = weights.order_by("-recorded_at").first()
+
+        if latest_weight and stats["total"] >= 2:
+            now = timezone.now()
+            month_ago_weight = weights.filter(
+                recorded_at__lte=now - timedelta(days=25),
+                recorded_at__gte=now - timedelta(days=35)
+            ).order_by("-recorded_at").first()
+            if month_ago_weight:
+                weight_change = round(latest_weight.value_in_lb - month_ago_weight.value_in_lb, 1)
+                weight_trend = "down" if weight_change < 0 else "up" if weight_change > 0 else "stable"
+
+        return {
+            "latest_weight": latest_weight,
+            "weight_change": weight_change,
+            "weight_trend": weight_trend,
+            "weight_entries_month": stats["this_month"],
+        }
+
+    def _fasting_data(self):
+        from apps.health.models import FastingWindow
+
+        fasting = FastingWindow.objects.filter(user=self.user)
+        stats = fasting.aggregate(
+            active=Count("id", filter=Q(ended_at__isnull=True)),
+            completed_month=Count(
+                "id",
+                filter=Q(ended_at__isnull=False, started_at__gte=self.month_ago),
+            ),
+        )
+
+        active_fast = None
+        if stats["active"]:
+            active_fast = fasting.filter(ended_at__isnull=True).first()
+
+        return {
+            "active_fast": active_fast,
+            "fasting_active": active_fast is not None,
+            "completed_fasts_month": stats["completed_month"],
+        }
+
+    def _medicine_data(self):
+        from apps.health.services.adherence import build_adherence_report
+        from apps.health.services.medicine import build_dose_plan
+
+        today = self.today
+
+        # Active medicines, schedules and today's logs in a fixed number of
+        # queries; refill lists are derived from the same rows in memory.
+        plan = build_dose_plan(self.user, today)
+        active_medicines = plan.medicines
+        needs_refill = [m for m in active_medicines if m.needs_refill]
+        refill_requested = [m for m in active_medicines if m.refill_requested]
+        todays_schedules = plan.doses
+
+        # Medicine adherence for the week
+        adherence_rate = build_adherence_report(
+            self.user, today - timedelta(days=7), today, include_medicines=False
+        ).overall.resolved_rate
+
+        return {
+            "active_medicines": len(active_medicines),
+            "todays_medicine_schedule": todays_schedules,
+            "medicine_doses_today": len(todays_schedules),
+            "medicine_doses_taken_today": plan.taken_count,
+            "medicine_adherence_rate": adherence_rate,
+            "medicines_need_refill": needs_refill,
+            "medicines_need_refill_count": len(needs_refill),
+            "medicines_refill_requested": refill_requested,
+            "medicines_refill_requested_count": len(refill_requested),
+        }
+
+    def _workout_data(self):
+        from apps.health.models import PersonalRecord, WorkoutSession
+
+        today = self.today
+        workouts = WorkoutSession.objects.filter(user=self.user)
+
+        # The three most recent sessions also give us the last workout.
+        recent_workouts = list(workouts.order_by("-date")[:3])
+        last_workout = recent_workouts[0] if recent_workouts else None
+
+        workouts_this_week = 0
+        workout_streak = 0
+        days_since_workout = None
+        recent_prs = []
+        if last_workout:
+            days_since_workout = (today - last_workout.date).days
+            workouts_this_week = workouts.filter(
+                date__gte=today - timedelta(days=7),
+                date__lte=today
+            ).count()
+            workout_streak = self.workout_streak()
+            recent_prs = list(PersonalRecord.objects.filter(
+                user=self.user,
+                achieved_date__gte=today - timedelta(days=30)
+            ).select_related("exercise").order_by("-achieved_date")[:3])
+
+        return {
+            "workouts_this_week": workouts_this_week,
+            "recent_workouts": recent_workouts,
+            "recent_prs": recent_prs,
+            "workout_streak": workout_streak,
+            "days_since_workout": days_since_workout,
+            "last_workout": last_workout,
+        }
+
+    def workout_streak(self):
+        """Consecutive days with workouts, from the materialised counters."""
+        return self.activity_counters.workout_streak(self.today)
+
+    # =========================================================================
+    # Life
+    # =========================================================================
+
+    def life_data(self):
+        """Project, task and event data."""
+        from apps.life.models import LifeEvent, Project, SignificantEvent, Task
+
+        today = self.today
+        week_ahead = today + timedelta(days=7)
+
+        active_projects = Project.objects.filter(user=self.user, status="active").count()
+
+        task_stats = Task.objects.filter(user=self.user).aggregate(
+            incomplete=Count("id", filter=Q(is_completed=False)),
+            overdue=Count("id", filter=Q(is_completed=False, due_date__lt=today)),
+            due_soon=Count(
+                "id",
+                filter=Q(is_completed=False, due_date__gte=today, due_date__lte=week_ahead),
+            ),
+            completed_today=Count(
+                "id",
+                filter=Q(is_completed=True, completed_at__date=today),
+            ),
+        )
+
+        upcoming_events = list(LifeEvent.objects.filter(
+            user=self.user,
+            start_date__gte=today,
+            start_date__lte=week_ahead
+        ).order_by("start_date")[:5])
+
+        # Significant events (birthdays, anniversaries, etc.) - next 30 days
+        upcoming_significant = []
+        for event in SignificantEvent.objects.filter(user=self.user, status="active"):
+            next_date = event.get_next_occurrence(today)
+            days_until = (next_date - today).days
+            if days_until <= 30:
+                event.next_occurrence = next_date
+                event.days_until = days_until
+                event.years_display = event.get_years_display()
+                upcoming_significant.append(event)
+
+        upcoming_significant.sort(key=lambda e: e.days_until)
+        upcoming_significant = upcoming_significant[:5]
+
+        return {
+            "active_projects": active_projects,
+            "incomplete_tasks": task_stats["incomplete"],
+            "overdue_tasks": task_stats["overdue"],
+            "tasks_due_soon": task_stats["due_soon"],
+            "completed_tasks_today": task_stats["completed_today"],
+            "upcoming_events": upcoming_events,
+            "upcoming_events_count": len(upcoming_events),
+            "upcoming_significant_events": upcoming_significant,
+            "upcoming_significant_count": len(upcoming_significant),
+        }
+
+    # =========================================================================
+    # Purpose
+    # =========================================================================
+
+    def purpose_data(self):
+        """Annual direction, goal and intention data."""
+        from apps.purpose.models import AnnualDirection, ChangeIntention, LifeGoal
+
+        current_year = timezone.now().year
+
+        # Look for direction for current year or next year (if planning ahead)
+        direction = AnnualDirection.objects.filter(
+            user=self.user, year__in=[current_year, current_year + 1]
+        ).order_by("-year").first()
+
+        goal_stats = LifeGoal.objects.filter(user=self.user).aggregate(
+            active=Count("id", filter=Q(status="active")),
+            completed=Count("id", filter=Q(status="completed")),
+        )
+
+        return {
+            "word_of_year": direction.word_of_year if direction else None,
+            "annual_direction": direction,
+            "active_goals": goal_stats["active"],
+            "completed_goals": goal_stats["completed"],
+            "active_intentions": ChangeIntention.objects.filter(
+                user=self.user, status="active"
+            ).count(),
+        }
+
+    # =========================================================================
+    # Scan
+    # =========================================================================
+
+    def scan_data(self):
+        """Scan/camera activity data."""
+        from apps.health.models import Medicine, WorkoutSession
+        from apps.journal.models import JournalEntry
+        from apps.scan.models import ScanLog
+
+        week_ago = self.week_ago
+
+        # Category breakdown for successful scans this week, grouped in SQL
+        rows = ScanLog.objects.filter(
+            user=self.user,
+            created_at__gte=week_ago,
+            status=ScanLog.STATUS_SUCCESS
+        ).values("category").annotate(count=Count("id")).order_by()
+
+        scans_this_week = 0
+        category_counts = {}
+        for row in rows:
+            scans_this_week += row["count"]
+            if row["category"]:
+                category_counts[row["category"]] = row["count"]
+
+        top_category = None
+        if category_counts:
+            top_category = max(category_counts, key=category_counts.get)
+
+        recent_scans = list(ScanLog.objects.filter(
+            user=self.user,
+            status=ScanLog.STATUS_SUCCESS
+        ).exclude(action_taken="").order_by("-created_at")[:5])
+
+        # Items logged via the AI camera this week
+        camera_filter = {
+            "user": self.user,
+            "created_via": "ai_camera",
+            "created_at__gte": week_ago,
+        }
+        ai_camera_entries = JournalEntry.objects.filter(**camera_filter).count()
+        ai_camera_medicines = Medicine.objects.filter(**camera_filter).count()
+        ai_camera_workouts = WorkoutSession.objects.filter(**camera_filter).count()
+
+        return {
+            "scans_this_week": scans_this_week,
+            "scan_category_counts": category_counts,
+            "top_scan_category": top_category,
+            "recent_scans_with_action": recent_scans,
+            "items_from_scan_week": ai_camera_entries + ai_camera_medicines + ai_camera_workouts,
+            "ai_camera_entries": ai_camera_entries,
+            "ai_camera_medicines": ai_camera_medicines,
+            "ai_camera_workouts": ai_camera_workouts,
+        }
@@ -0,0 +1,61 @@
+# ==============================================================================
+# File: apps/dashboard/signals.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Invalidate cached dashboard fragments when their source data changes
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Dashboard Signals - Fragment cache invalidation.
+
+Connects post_save/post_delete for every model in
+fragments.SECTION_MODELS and replaces the owning user's generation token
+for the affected sections once the transaction commits, so a concurrent
+request cannot re-cache pre-commit data under the new token.
+"""
+
+import logging
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .fragments import SECTION_MODELS, invalidate_encouragements, invalidate_sections, owner_id
+
+logger = logging.getLogger(__name__)
+
+
+def _invalidate(sections, path, instance, **kwargs):
+    user_id = owner_id(instance, path)
+    if user_id is None:
+        return
+
+    def _run():
+        try:
+            invalidate_sections(user_id, sections)
+        except Exception as e:
+            logger.error(f"Failed to invalidate dashboard cache for user {user_id}: {e}")
+
+    transaction.on_commit(_run)
+
+
+def connect_fragment_invalidation():
+    """Register invalidation receivers for every tracked model."""
+    for label, (sections, path) in SECTION_MODELS.items():
+        handler = partial(_invalidate, sections, path)
+        # weak=False: the partial has no other reference keeping it alive
+        post_save.connect(handler, sender=label, weak=False,
+                          dispatch_uid=f"dashboard_fragments_save_{label}")
+        post_delete.connect(handler, sender=label, weak=False,
+                            dispatch_uid=f"dashboard_fragments_delete_{label}")
+
+
+@receiver(post_save, sender='dashboard.DailyEncouragement')
+@receiver(post_delete, sender='dashboard.DailyEncouragement')
+def encouragement_changed(sender, **kwargs):
+    transaction.on_commit(invalidate_encouragements)
+
+
+connect_fragment_invalidation()
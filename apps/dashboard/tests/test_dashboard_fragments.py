@@ -0,0 +1,141 @@
+"""
+Dashboard Fragment Cache Tests
+
+Tests for apps.dashboard.fragments:
+- Repeat dashboard gathers are served from the cache without queries
+- Model signals invalidate only the affected user's sections
+- Encouragements are cached and refreshed when edited
+
+Location: apps/dashboard/tests/test_dashboard_fragments.py
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.dashboard.fragments import active_encouragements, cached_fragment
+from apps.dashboard.models import DailyEncouragement
+from apps.dashboard.services import DashboardAggregator
+
+User = get_user_model()
+
+LOCMEM_CACHE = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'dashboard-fragment-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class DashboardFragmentCacheTest(TestCase):
+    """Tests for per-user dashboard fragment caching."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='fragments@example.com',
+            password='testpass123'
+        )
+        prefs = self.user.preferences
+        for module in ('journal', 'health', 'life', 'purpose', 'faith'):
+            setattr(prefs, f'{module}_enabled', True)
+        prefs.save()
+        self.prefs = prefs
+
+    def gather(self):
+        return DashboardAggregator(self.user, self.prefs).gather()
+
+    def add_entry(self, title):
+        from apps.journal.models import JournalEntry
+
+        with self.captureOnCommitCallbacks(execute=True):
+            JournalEntry.objects.create(user=self.user, title=title, body='Body')
+
+    def test_repeat_gather_skips_orm(self):
+        """A second gather is served entirely from the cache."""
+        first = self.gather()
+
+        aggregator = DashboardAggregator(self.user, self.prefs)
+        with self.assertNumQueries(0):
+            second = aggregator.gather()
+
+        self.assertEqual(first['journal_total'], second['journal_total'])
+        self.assertEqual(first['incomplete_tasks'], second['incomplete_tasks'])
+
+    def test_save_invalidates_affected_section(self):
+        """Creating a journal entry refreshes the journal section."""
+        self.assertEqual(self.gather()['journal_total'], 0)
+
+        self.add_entry('New')
+
+        self.assertEqual(self.gather()['journal_total'], 1)
+
+    def test_unrelated_sections_stay_cached(self):
+        """A journal change leaves the life section's fragment in place."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {'value': len(calls)}
+
+        cached_fragment(self.user.pk, 'life', build)
+        self.add_entry('New')
+        cached_fragment(self.user.pk, 'life', build)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_other_users_unaffected(self):
+        """Invalidation is scoped to the owner of the changed row."""
+        other = User.objects.create_user(email='other@example.com', password='testpass123')
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {}
+
+        cached_fragment(other.pk, 'journal', build)
+        self.add_entry('Mine')
+        cached_fragment(other.pk, 'journal', build)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_fragments_keyed_by_day(self):
+        """Date-relative data is rebuilt when the user's day changes."""
+        from datetime import date
+
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {}
+
+        cached_fragment(self.user.pk, 'life', build, day=date(2026, 1, 1))
+        cached_fragment(self.user.pk, 'life', build, day=date(2026, 1, 2))
+
+        self.assertEqual(len(calls), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class EncouragementCacheTest(TestCase):
+    """Tests for the shared encouragement cache."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_and_invalidated_on_save(self):
+        """Encouragements are read once and refreshed after an edit."""
+        DailyEncouragement.objects.create(message='General')
+        faith = DailyEncouragement.objects.create(message='Faith', is_faith_specific=True)
+
+        self.assertEqual(len(active_encouragements(faith_enabled=False)), 1)
+        self.assertEqual(len(active_encouragements(faith_enabled=True)), 2)
+        with self.assertNumQueries(0):
+            active_encouragements(faith_enabled=False)
+            active_encouragements(faith_enabled=True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            faith.is_faith_specific = False
+            faith.save()
+
+        self.assertEqual(len(active_encouragements(faith_enabled=False)), 2)
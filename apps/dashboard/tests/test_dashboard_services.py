@@ -0,0 +1,114 @@
+"""
+Dashboard Aggregation Service Tests
+
+Tests for apps.dashboard.services.DashboardAggregator:
+- Module data keys and values match what the dashboard expects
+- Counters come from conditional aggregates rather than per-stat queries
+
+Location: apps/dashboard/tests/test_dashboard_services.py
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.dashboard.services import DashboardAggregator
+
+User = get_user_model()
+
+
+class DashboardAggregatorTest(TestCase):
+    """Tests for the dashboard aggregation service."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='agg@example.com',
+            password='testpass123'
+        )
+        prefs = self.user.preferences
+        for module in ('journal', 'health', 'life', 'purpose', 'faith'):
+            setattr(prefs, f'{module}_enabled', True)
+        prefs.save()
+        self.aggregator = DashboardAggregator(self.user)
+        self.today = self.aggregator.today
+
+    def test_journal_counts_and_streak(self):
+        """Journal totals, last date and streak are computed together."""
+        from apps.journal.models import JournalEntry
+
+        for days_ago in range(3):
+            JournalEntry.objects.create(
+                user=self.user,
+                title=f'Entry {days_ago}',
+                body='Body',
+                entry_date=self.today - timedelta(days=days_ago),
+                mood='grateful',
+            )
+
+        data = self.aggregator.journal_data()
+
+        self.assertEqual(data['journal_total'], 3)
+        self.assertEqual(data['journal_this_week'], 3)
+        self.assertEqual(data['last_journal_date'], self.today)
+        self.assertEqual(data['days_since_journal'], 0)
+        self.assertEqual(data['journal_streak'], 3)
+        self.assertEqual(data['top_mood_this_week'], 'grateful')
+        self.assertEqual(len(data['recent_entries']), 3)
+
+    def test_life_task_counters(self):
+        """Task counters are derived from a single conditional aggregate."""
+        from apps.life.models import LifeEvent, Task
+
+        Task.objects.create(user=self.user, title='Overdue', due_date=self.today - timedelta(days=2))
+        Task.objects.create(user=self.user, title='Soon', due_date=self.today + timedelta(days=2))
+        Task.objects.create(user=self.user, title='Someday')
+        LifeEvent.objects.create(user=self.user, title='Event', start_date=self.today + timedelta(days=1))
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.aggregator.life_data()
+
+        self.assertEqual(data['incomplete_tasks'], 3)
+        self.assertEqual(data['overdue_tasks'], 1)
+        self.assertEqual(data['tasks_due_soon'], 1)
+        self.assertEqual(data['completed_tasks_today'], 0)
+        self.assertEqual(data['upcoming_events_count'], 1)
+        task_queries = [q for q in ctx.captured_queries if 'life_task' in q['sql']]
+        self.assertEqual(len(task_queries), 1)
+
+    def test_refill_lists_derived_from_active_medicines(self):
+        """Refill counts match the materialised medicine lists."""
+        from apps.health.models import Medicine
+
+        Medicine.objects.create(
+            user=self.user, name='Low', dose='10mg', frequency='daily',
+            start_date=self.today, current_supply=2, refill_threshold=7,
+        )
+        Medicine.objects.create(
+            user=self.user, name='Requested', dose='10mg', frequency='daily',
+            start_date=self.today, current_supply=1, refill_requested=True,
+        )
+        Medicine.objects.create(
+            user=self.user, name='Plenty', dose='10mg', frequency='daily',
+            start_date=self.today, current_supply=60,
+        )
+
+        data = self.aggregator.health_data()
+
+        self.assertEqual(data['active_medicines'], 3)
+        self.assertEqual([m.name for m in data['medicines_need_refill']], ['Low'])
+        self.assertEqual(data['medicines_need_refill_count'], 1)
+        self.assertEqual(data['medicines_refill_requested_count'], 1)
+
+    def test_gather_skips_disabled_modules(self):
+        """Disabled modules contribute no keys."""
+        prefs = self.user.preferences
+        prefs.life_enabled = False
+        prefs.save()
+
+        data = DashboardAggregator(self.user, prefs).gather()
+
+        self.assertIn('journal_total', data)
+        self.assertNotIn('incomplete_tasks', data)
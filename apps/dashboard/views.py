@@ -41,15 +41,13 @@ Copyright:
 import json
 import random
 from datetime import timedelta
-from django.db import models
-from django.db.models import Count, Avg
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.utils import timezone
 from django.views.generic import TemplateView, View
 from django.http import HttpResponse, JsonResponse
 from django.conf import settings
 
-from .models import DailyEncouragement
+from .fragments import active_encouragements, cached_fragment
 from apps.help.mixins import HelpContextMixin
 
 
@@ -104,11 +102,9 @@ class DashboardView(HelpContextMixin, LoginRequiredMixin, TemplateView):
     
     def _get_greeting(self):
         """Get time-appropriate greeting in user's timezone."""
-        import pytz
-        # Use timezone_iana to handle legacy US/Eastern format
-        user_tz = pytz.timezone(self.request.user.preferences.timezone_iana)
-        user_time = timezone.now().astimezone(user_tz)
-        hour = user_time.hour
+        from apps.core.utils import get_user_now
+
+        hour = get_user_now(self.request.user).hour
         if hour < 12:
             return "Good morning"
         elif hour < 17:
@@ -119,495 +115,38 @@ class DashboardView(HelpContextMixin, LoginRequiredMixin, TemplateView):
     def _get_daily_encouragement(self, faith_enabled):
         """Get daily encouragement message."""
         today = timezone.now()
-        queryset = DailyEncouragement.objects.filter(is_active=True)
-        
-        if not faith_enabled:
-            queryset = queryset.filter(is_faith_specific=False)
-        
-        # Try to match day of week or month
-        targeted = queryset.filter(
-            models.Q(day_of_week=today.weekday()) |
-            models.Q(month=today.month)
-        )
-        
-        if targeted.exists():
-            return random.choice(list(targeted))
-        
-        if queryset.exists():
-            return random.choice(list(queryset))
-        
-        return None
-    
-    def _gather_comprehensive_data(self, user, prefs):
-        """Gather all user data for AI analysis."""
-        from apps.core.utils import get_user_today, get_user_now
-
-        now = get_user_now(user)
-        today = get_user_today(user)
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
-
-        data = {
-            "today": today,
-            "week_ago": week_ago,
-        }
-
-        # Journal data
-        if prefs.journal_enabled:
-            data.update(self._get_journal_data(user, today, week_ago, month_ago))
-
-        # Faith data
-        if prefs.faith_enabled:
-            data.update(self._get_faith_data(user))
-
-        # Health data
-        if prefs.health_enabled:
-            data.update(self._get_health_data(user, today, month_ago))
-
-        # Life data
-        if prefs.life_enabled:
-            data.update(self._get_life_data(user, today))
-
-        # Purpose data
-        if prefs.purpose_enabled:
-            data.update(self._get_purpose_data(user))
-
-        # Scan data (if AI enabled - scan requires AI)
-        if prefs.ai_enabled:
-            data.update(self._get_scan_data(user, today, week_ago))
-
-        return data
-    
-    def _get_journal_data(self, user, today, week_ago, month_ago):
-        """Get journal-related data."""
-        from apps.journal.models import JournalEntry
-        
-        entries = JournalEntry.objects.filter(user=user)
-        entries_week = entries.filter(created_at__gte=week_ago)
-        
-        last_entry = entries.order_by('-entry_date').first()
-        days_since_journal = None
-        if last_entry:
-            days_since_journal = (today - last_entry.entry_date).days
-        
-        # Calculate streak
-        streak = self._calculate_journal_streak(user, today)
-        
-        # Get mood distribution this week
-        moods = entries_week.exclude(mood='').values('mood').annotate(
-            count=Count('mood')
-        ).order_by('-count')
-        top_mood = moods[0]['mood'] if moods else None
-        
-        # Recent entries for context
-        recent_entries = list(entries.order_by('-entry_date')[:5].values(
-            'title', 'entry_date', 'mood', 'body'
-        ))
-        
-        return {
-            "journal_total": entries.count(),
-            "journal_this_week": entries_week.count(),
-            "journal_this_month": entries.filter(created_at__gte=month_ago).count(),
-            "last_journal_date": last_entry.entry_date if last_entry else None,
-            "days_since_journal": days_since_journal,
-            "journal_streak": streak,
-            "top_mood_this_week": top_mood,
-            "recent_entries": recent_entries,
-        }
-    
-    def _calculate_journal_streak(self, user, today):
-        """Calculate consecutive days of journaling."""
-        from apps.journal.models import JournalEntry
-        
-        entries = JournalEntry.objects.filter(
-            user=user
-        ).order_by('-entry_date').values_list('entry_date', flat=True).distinct()[:60]
-        
-        if not entries:
-            return 0
-        
-        streak = 0
-        expected_date = today
-        
-        for entry_date in entries:
-            if entry_date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            elif entry_date < expected_date:
-                break
-        
-        return streak
-    
-    def _get_faith_data(self, user):
-        """Get faith-related data."""
-        from apps.faith.models import PrayerRequest, FaithMilestone, SavedVerse
-
-        prayers = PrayerRequest.objects.filter(user=user)
-        active_prayers = prayers.filter(is_answered=False)
-        answered_prayers = prayers.filter(is_answered=True)
-
-        # Recent answered prayers
-        recent_answered = answered_prayers.order_by('-answered_at').first()
-
-        # Get the user's memory verse (if any)
-        memory_verse = SavedVerse.objects.filter(
-            user=user,
-            is_memory_verse=True
-        ).first()
-
-        return {
-            "active_prayers": active_prayers.count(),
-            "answered_prayers": answered_prayers.count(),
-            "total_milestones": FaithMilestone.objects.filter(user=user).count(),
-            "recent_answered_prayer": recent_answered,
-            "memory_verse": memory_verse,
-        }
-    
-    def _get_health_data(self, user, today, month_ago):
-        """Get health-related data."""
-        from apps.health.models import (
-            WeightEntry, FastingWindow, GlucoseEntry,
-            Medicine, MedicineLog, MedicineSchedule,
-            WorkoutSession, PersonalRecord
-        )
-        from datetime import datetime, timedelta as dt_timedelta
-
-        # Weight
-        weights = WeightEntry.objects.filter(user=user)
-        latest_weight = weights.order_by('-recorded_at').first()
-
-        weight_change = None
-        weight_trend = None
-        if latest_weight and weights.count() >= 2:
-            month_ago_weight = weights.filter(
-                recorded_at__lte=timezone.now() - timedelta(days=25),
-                recorded_at__gte=timezone.now() - timedelta(days=35)
-            ).order_by('-recorded_at').first()
-            if month_ago_weight:
-                weight_change = round(latest_weight.value_in_lb - month_ago_weight.value_in_lb, 1)
-                weight_trend = 'down' if weight_change < 0 else 'up' if weight_change > 0 else 'stable'
-
-        # Fasting
-        fasting = FastingWindow.objects.filter(user=user)
-        active_fast = fasting.filter(ended_at__isnull=True).first()
-        completed_fasts_month = fasting.filter(
-            ended_at__isnull=False,
-            started_at__gte=month_ago
-        ).count()
-
-        # Glucose
-        glucose = GlucoseEntry.objects.filter(user=user)
-        latest_glucose = glucose.order_by('-recorded_at').first()
-
-        # =====================
-        # Medicine Tracking
-        # =====================
-        active_medicines = Medicine.objects.filter(
-            user=user,
-            medicine_status=Medicine.STATUS_ACTIVE
-        )
-
-        # Today's medicine schedule
-        today_weekday = today.weekday()
-        todays_schedules = []
-        for medicine in active_medicines.filter(is_prn=False):
-            for schedule in medicine.schedules.filter(is_active=True):
-                if schedule.applies_to_day(today_weekday):
-                    # Check if this dose was taken today
-                    log = MedicineLog.objects.filter(
-                        medicine=medicine,
-                        schedule=schedule,
-                        scheduled_date=today
-                    ).first()
-                    todays_schedules.append({
-                        'medicine': medicine,
-                        'schedule': schedule,
-                        'log': log,
-                        'taken': log is not None and log.log_status in ['taken', 'late'],
-                        'missed': log is not None and log.log_status == 'missed',
-                        'skipped': log is not None and log.log_status == 'skipped',
-                    })
-
-        # Sort by scheduled time
-        todays_schedules.sort(key=lambda x: x['schedule'].scheduled_time)
-
-        # Medicine adherence for the week
-        week_ago_date = today - timedelta(days=7)
-        medicine_logs_week = MedicineLog.objects.filter(
-            user=user,
-            scheduled_date__gte=week_ago_date,
-            scheduled_date__lte=today
-        )
-        taken_count = medicine_logs_week.filter(log_status__in=['taken', 'late']).count()
-        missed_count = medicine_logs_week.filter(log_status='missed').count()
-        total_scheduled = taken_count + missed_count
-        adherence_rate = round((taken_count / total_scheduled) * 100) if total_scheduled > 0 else None
-
-        # Medicines needing refill (exclude those with refill already requested)
-        needs_refill = active_medicines.filter(
-            current_supply__isnull=False,
-            current_supply__lte=models.F('refill_threshold'),
-            refill_requested=False
-        )
-
-        # Medicines with refill requested
-        refill_requested = active_medicines.filter(refill_requested=True)
-
-        # =====================
-        # Workout Tracking
-        # =====================
-        week_ago_date = today - timedelta(days=7)
-
-        # Workouts this week
-        workouts_week = WorkoutSession.objects.filter(
-            user=user,
-            date__gte=week_ago_date,
-            date__lte=today
-        )
-
-        # Recent workouts (last 3)
-        recent_workouts = WorkoutSession.objects.filter(
-            user=user
-        ).order_by('-date')[:3]
-
-        # Recent PRs (last 30 days)
-        recent_prs = PersonalRecord.objects.filter(
-            user=user,
-            achieved_date__gte=today - timedelta(days=30)
-        ).order_by('-achieved_date')[:3]
-
-        # Workout streak (consecutive days with workouts)
-        workout_streak = self._calculate_workout_streak(user, today)
-
-        # Last workout date
-        last_workout = WorkoutSession.objects.filter(user=user).order_by('-date').first()
-        days_since_workout = None
-        if last_workout:
-            days_since_workout = (today - last_workout.date).days
-
-        # Weight and Nutrition Goal Progress
-        weight_progress = user.preferences.get_weight_progress()
-        nutrition_progress = user.preferences.get_nutrition_progress(today)
-
-        return {
-            "latest_weight": latest_weight,
-            "weight_change": weight_change,
-            "weight_trend": weight_trend,
-            "weight_entries_month": weights.filter(recorded_at__gte=month_ago).count(),
-            "active_fast": active_fast,
-            "fasting_active": active_fast is not None,
-            "completed_fasts_month": completed_fasts_month,
-            "latest_glucose": latest_glucose,
-            # Medicine data
-            "active_medicines": active_medicines.count(),
-            "todays_medicine_schedule": todays_schedules,
-            "medicine_doses_today": len(todays_schedules),
-            "medicine_doses_taken_today": sum(1 for s in todays_schedules if s['taken']),
-            "medicine_adherence_rate": adherence_rate,
-            "medicines_need_refill": list(needs_refill),
-            "medicines_need_refill_count": needs_refill.count(),
-            "medicines_refill_requested": list(refill_requested),
-            "medicines_refill_requested_count": refill_requested.count(),
-            # Workout data
-            "workouts_this_week": workouts_week.count(),
-            "recent_workouts": list(recent_workouts),
-            "recent_prs": list(recent_prs),
-            "workout_streak": workout_streak,
-            "days_since_workout": days_since_workout,
-            "last_workout": last_workout,
-            # Weight & Nutrition Goal Progress
-            "weight_progress": weight_progress,
-            "nutrition_progress": nutrition_progress,
-            "has_weight_goal": user.preferences.has_weight_goal,
-            "has_nutrition_goals": user.preferences.has_nutrition_goals,
-        }
-
-    def _calculate_workout_streak(self, user, today):
-        """Calculate consecutive days with workouts."""
-        from apps.health.models import WorkoutSession
-
-        workout_dates = WorkoutSession.objects.filter(
-            user=user
-        ).order_by('-date').values_list('date', flat=True).distinct()[:60]
-
-        if not workout_dates:
-            return 0
-
-        streak = 0
-        expected_date = today
-
-        for workout_date in workout_dates:
-            if workout_date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            elif workout_date < expected_date:
-                break
-
-        return streak
-
-    def _get_scan_data(self, user, today, week_ago):
-        """Get scan/camera activity data."""
-        from apps.scan.models import ScanLog
-
-        # Scans this week
-        scans_week = ScanLog.objects.filter(
-            user=user,
-            created_at__gte=week_ago,
-            status=ScanLog.STATUS_SUCCESS
-        )
-
-        # Category breakdown
-        category_counts = {}
-        for scan in scans_week:
-            if scan.category:
-                category_counts[scan.category] = category_counts.get(scan.category, 0) + 1
-
-        # Most scanned category
-        top_category = None
-        if category_counts:
-            top_category = max(category_counts, key=category_counts.get)
-
-        # Recent scans with actions taken
-        recent_scans = ScanLog.objects.filter(
-            user=user,
-            status=ScanLog.STATUS_SUCCESS
-        ).exclude(action_taken='').order_by('-created_at')[:5]
-
-        # Items logged via scan (entries created via AI camera this week)
-        from apps.core.models import UserOwnedModel
-        from apps.journal.models import JournalEntry
-        from apps.health.models import Medicine, WorkoutSession
-
-        ai_camera_entries = JournalEntry.objects.filter(
-            user=user,
-            created_via='ai_camera',
-            created_at__gte=week_ago
-        ).count()
+        encouragements = active_encouragements(faith_enabled)
 
-        ai_camera_medicines = Medicine.objects.filter(
-            user=user,
-            created_via='ai_camera',
-            created_at__gte=week_ago
-        ).count()
-
-        ai_camera_workouts = WorkoutSession.objects.filter(
-            user=user,
-            created_via='ai_camera',
-            created_at__gte=week_ago
-        ).count()
-
-        total_items_from_scan = ai_camera_entries + ai_camera_medicines + ai_camera_workouts
-
-        return {
-            "scans_this_week": scans_week.count(),
-            "scan_category_counts": category_counts,
-            "top_scan_category": top_category,
-            "recent_scans_with_action": list(recent_scans),
-            "items_from_scan_week": total_items_from_scan,
-            "ai_camera_entries": ai_camera_entries,
-            "ai_camera_medicines": ai_camera_medicines,
-            "ai_camera_workouts": ai_camera_workouts,
-        }
-
-    def _get_life_data(self, user, today):
-        """Get life-related data."""
-        from apps.life.models import Project, Task, LifeEvent, SignificantEvent
-
-        week_ahead = today + timedelta(days=7)
-        month_ahead = today + timedelta(days=30)
-
-        # Projects
-        projects = Project.objects.filter(user=user)
-        active_projects = projects.filter(status='active')
+        # Try to match day of week or month
+        targeted = [
+            e for e in encouragements
+            if e.day_of_week == today.weekday() or e.month == today.month
+        ]
 
-        # Tasks
-        tasks = Task.objects.filter(user=user, is_completed=False)
-        overdue_tasks = tasks.filter(due_date__lt=today)
-        due_soon = tasks.filter(due_date__gte=today, due_date__lte=week_ahead)
+        if targeted:
+            return random.choice(targeted)
 
-        # Tasks completed today
-        completed_today = Task.objects.filter(
-            user=user,
-            is_completed=True,
-            completed_at__date=today
-        ).count()
-
-        # Upcoming events
-        upcoming_events = LifeEvent.objects.filter(
-            user=user,
-            start_date__gte=today,
-            start_date__lte=week_ahead
-        ).order_by('start_date')[:5]
-
-        # Significant events (birthdays, anniversaries, etc.) - next 30 days
-        significant_events = SignificantEvent.objects.filter(
-            user=user,
-            status='active'
-        )
-
-        # Calculate next occurrence for each and filter to upcoming
-        upcoming_significant = []
-        for event in significant_events:
-            next_date = event.get_next_occurrence(today)
-            days_until = (next_date - today).days
-            if days_until <= 30:
-                event.next_occurrence = next_date
-                event.days_until = days_until
-                event.years_display = event.get_years_display()
-                upcoming_significant.append(event)
-
-        # Sort by days until
-        upcoming_significant.sort(key=lambda e: e.days_until)
-        upcoming_significant = upcoming_significant[:5]  # Limit to 5
+        if encouragements:
+            return random.choice(encouragements)
 
-        return {
-            "active_projects": active_projects.count(),
-            "incomplete_tasks": tasks.count(),
-            "overdue_tasks": overdue_tasks.count(),
-            "tasks_due_soon": due_soon.count(),
-            "completed_tasks_today": completed_today,
-            "upcoming_events": list(upcoming_events),
-            "upcoming_events_count": upcoming_events.count(),
-            "upcoming_significant_events": upcoming_significant,
-            "upcoming_significant_count": len(upcoming_significant),
-        }
+        return None
     
-    def _get_purpose_data(self, user):
-        """Get purpose-related data."""
-        from apps.purpose.models import AnnualDirection, LifeGoal, ChangeIntention
-
-        current_year = timezone.now().year
+    def _gather_comprehensive_data(self, user, prefs):
+        """Gather all user data for AI analysis."""
+        from .services import DashboardAggregator
 
-        # Look for direction for current year or next year (if planning ahead)
-        direction = AnnualDirection.objects.filter(
-            user=user, year__in=[current_year, current_year + 1]
-        ).order_by('-year').first()
-        
-        goals = LifeGoal.objects.filter(user=user)
-        active_goals = goals.filter(status='active')
-        
-        intentions = ChangeIntention.objects.filter(user=user, status='active')
-        
-        return {
-            "word_of_year": direction.word_of_year if direction else None,
-            "annual_direction": direction,
-            "active_goals": active_goals.count(),
-            "completed_goals": goals.filter(status='completed').count(),
-            "active_intentions": intentions.count(),
-        }
+        return DashboardAggregator(user, prefs).gather()
     
     def _get_ai_insights(self, user, prefs, user_data):
         """Get AI-generated insights."""
         try:
             from apps.ai.dashboard_ai import DashboardAI
             
-            dashboard_ai = DashboardAI(user)
-            
-            # Get or generate daily insight
-            daily_insight = dashboard_ai.get_daily_insight()
-            
-            # Get weekly summary if it's been generated
-            weekly_summary = dashboard_ai.get_weekly_summary()
+            # Daily insight and weekly summary, generated concurrently
+            # when neither is cached
+            insights = DashboardAI(user).get_insights()
+            daily_insight = insights["daily_insight"]
+            weekly_summary = insights["weekly_summary"]
             
             # Check for things to celebrate
             celebrations = self._check_for_celebrations(user_data)
@@ -1097,11 +636,15 @@ class JournalSummaryTileView(LoginRequiredMixin, TemplateView):
         from apps.journal.models import JournalEntry
         
         user = self.request.user
-        entries = JournalEntry.objects.filter(user=user)
-        
-        context["recent_entries"] = entries.order_by("-entry_date")[:3]
-        context["total_count"] = entries.count()
-        
+
+        def build():
+            entries = JournalEntry.objects.filter(user=user)
+            return {
+                "recent_entries": list(entries.order_by("-entry_date")[:3]),
+                "total_count": entries.count(),
+            }
+
+        context.update(cached_fragment(user.pk, "journal", build, name="tile"))
         return context
 
 
@@ -1112,13 +655,10 @@ class EncouragementTileView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         faith_enabled = self.request.user.preferences.faith_enabled
-        
-        queryset = DailyEncouragement.objects.filter(is_active=True)
-        if not faith_enabled:
-            queryset = queryset.filter(is_faith_specific=False)
-        
-        if queryset.exists():
-            context["encouragement"] = random.choice(list(queryset))
+
+        encouragements = active_encouragements(faith_enabled)
+        if encouragements:
+            context["encouragement"] = random.choice(encouragements)
         else:
             context["encouragement"] = {
                 "message": "Take a moment to breathe. You're exactly where you need to be.",
@@ -4,9 +4,10 @@
 # Description: Finance module Django admin configuration
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-02
-# Last Updated: 2026-01-02
+# Last Updated: 2026-10-16 (Budget changelist computes spend in one query)
 # ==============================================================================
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 
 from .models import (
@@ -126,6 +127,16 @@ class TransactionAdmin(admin.ModelAdmin):
     formatted_amount.admin_order_field = 'amount'
 
 
+class BudgetChangeList(ChangeList):
+    """Attaches spend to the page of budgets with one grouped query."""
+
+    def get_results(self, request):
+        from .services.budget_service import evaluate_budgets
+
+        super().get_results(request)
+        self.result_list = evaluate_budgets(self.result_list)
+
+
 @admin.register(Budget)
 class BudgetAdmin(admin.ModelAdmin):
     list_display = [
@@ -137,6 +148,9 @@ class BudgetAdmin(admin.ModelAdmin):
     ordering = ['-month', 'category__name']
     date_hierarchy = 'month'
 
+    def get_changelist(self, request, **kwargs):
+        return BudgetChangeList
+
     def spent_display(self, obj):
         return f'${obj.spent_amount:,.2f}'
     spent_display.short_description = 'Spent'
@@ -4,7 +4,7 @@
 # Description: Finance app configuration
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-02
-# Last Updated: 2026-01-02
+# Last Updated: 2026-10-16 (connect cash flow ledger signals)
 # ==============================================================================
 from django.apps import AppConfig
 
@@ -13,3 +13,6 @@ class FinanceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.finance'
     verbose_name = 'Finance'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -4,7 +4,7 @@
 # Description: Service for parsing and importing transaction files (CSV, OFX, QFX)
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-03
-# Last Updated: 2026-01-03
+# Last Updated: 2026-10-16 (Rebuild cash flow ledger after bulk insert)
 # ==============================================================================
 """
 Transaction Import Service
@@ -16,6 +16,10 @@ Handles parsing of various transaction file formats:
 
 The service attempts to auto-detect column mappings for CSV files
 and provides a standardized interface for all formats.
+
+Parsed rows are saved in bulk: duplicates are found with one fingerprint
+query per import and new rows are inserted in chunks, so large multi-year
+histories import without a query per row.
 """
 
 import csv
@@ -26,6 +30,8 @@ from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 
+from django.db import DatabaseError
+from django.db import transaction as db_transaction
 from django.utils import timezone
 
 
@@ -92,6 +98,15 @@ class TransactionImportService:
         '%Y%m%d',        # 20240115
     ]
 
+    # Rows per bulk_create when saving an import
+    IMPORT_BATCH_SIZE = 500
+
+    # Transaction.amount has two decimal places
+    AMOUNT_QUANTUM = Decimal('0.01')
+
+    # Relations are set by the service itself; skip their per-row lookups
+    UNVALIDATED_FIELDS = ['user', 'account', 'import_record', 'category', 'transfer_pair']
+
     def __init__(self, user, account):
         """
         Initialize the import service.
@@ -540,65 +555,113 @@ class TransactionImportService:
         except InvalidOperation:
             return None
 
-    def create_transactions(self, parsed_transactions: list, import_record) -> dict:
+    def create_transactions(self, parsed_transactions: list, import_record,
+                            batch_size: int = None) -> dict:
         """
         Create Transaction objects from parsed transactions.
 
+        Duplicates are detected against a single query of existing
+        (date, amount, description) fingerprints for the account over the
+        file's date range, plus rows earlier in the same file. New rows are
+        validated individually and inserted with bulk_create in chunks
+        inside one database transaction. If a chunk is rejected by the
+        database, that chunk is retried row by row so errors are still
+        reported per row.
+
         Args:
             parsed_transactions: List of ParsedTransaction objects
             import_record: TransactionImport record to link to
+            batch_size: Rows per bulk insert (default IMPORT_BATCH_SIZE)
 
         Returns:
             Dict with counts: {'imported': int, 'skipped': int, 'failed': int}
         """
-        from .models import Transaction
+        from .models import MonthlyCashFlow, Transaction
 
-        imported = 0
+        batch_size = batch_size or self.IMPORT_BATCH_SIZE
         skipped = 0
         failed = 0
         errors = []
 
+        def record_error(idx, parsed, error):
+            errors.append({
+                'index': idx,
+                'error': str(error),
+                'data': {
+                    'date': str(parsed.date),
+                    'amount': str(parsed.amount),
+                    'description': parsed.description
+                }
+            })
+
+        # Build unsaved rows, validating each one without touching the database
+        candidates = []
         for idx, parsed in enumerate(parsed_transactions):
             try:
-                # Check for duplicates
-                exists = Transaction.objects.filter(
+                date = parsed.date.date() if isinstance(parsed.date, datetime) else parsed.date
+                transaction = Transaction(
                     user=self.user,
                     account=self.account,
-                    date=parsed.date.date() if isinstance(parsed.date, datetime) else parsed.date,
-                    amount=parsed.amount,
-                    description=parsed.description,
-                    status='active'
-                ).exists()
-
-                if exists:
-                    skipped += 1
-                    continue
-
-                # Create the transaction
-                Transaction.objects.create(
-                    user=self.user,
-                    account=self.account,
-                    date=parsed.date.date() if isinstance(parsed.date, datetime) else parsed.date,
-                    amount=parsed.amount,
+                    date=date,
+                    amount=Decimal(parsed.amount).quantize(self.AMOUNT_QUANTUM),
                     description=parsed.description,
                     payee=parsed.payee or '',
                     reference=parsed.reference or '',
                     notes=parsed.memo or '',
                     import_record=import_record
                 )
-                imported += 1
-
+                transaction.clean_fields(exclude=self.UNVALIDATED_FIELDS)
+                candidates.append((idx, parsed, transaction))
             except Exception as e:
                 failed += 1
-                errors.append({
-                    'index': idx,
-                    'error': str(e),
-                    'data': {
-                        'date': str(parsed.date),
-                        'amount': str(parsed.amount),
-                        'description': parsed.description
-                    }
-                })
+                record_error(idx, parsed, e)
+
+        if not candidates:
+            return {'imported': 0, 'skipped': skipped, 'failed': failed, 'errors': errors}
+
+        # One query for every existing fingerprint in the file's date range
+        dates = [t.date for _, _, t in candidates]
+        seen = set(
+            Transaction.objects.filter(
+                user=self.user,
+                account=self.account,
+                date__range=(min(dates), max(dates)),
+                status='active'
+            ).order_by().values_list('date', 'amount', 'description')
+        )
+
+        new_rows = []
+        for idx, parsed, transaction in candidates:
+            fingerprint = (transaction.date, transaction.amount, transaction.description)
+            if fingerprint in seen:
+                skipped += 1
+                continue
+            seen.add(fingerprint)
+            new_rows.append((idx, parsed, transaction))
+
+        imported = 0
+        with db_transaction.atomic():
+            for start in range(0, len(new_rows), batch_size):
+                chunk = new_rows[start:start + batch_size]
+                try:
+                    with db_transaction.atomic():
+                        Transaction.objects.bulk_create([t for _, _, t in chunk])
+                    imported += len(chunk)
+                except DatabaseError:
+                    # Find the offending rows one at a time
+                    for idx, parsed, transaction in chunk:
+                        try:
+                            with db_transaction.atomic():
+                                transaction.pk = None
+                                transaction.save(force_insert=True)
+                            imported += 1
+                        except Exception as e:
+                            failed += 1
+                            record_error(idx, parsed, e)
+
+            # bulk_create skips the ledger signals
+            if imported:
+                MonthlyCashFlow.rebuild(self.user.pk, min(dates), max(dates))
 
         return {
             'imported': imported,
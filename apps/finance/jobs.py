@@ -0,0 +1,33 @@
+# ==============================================================================
+# File: apps/finance/jobs.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Finance scheduler job functions (must be importable by APScheduler)
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Finance Jobs - Background job functions for APScheduler.
+
+These functions are called by APScheduler using textual references
+(e.g., 'apps.finance.jobs:snapshot_financial_metrics'). They must be
+importable and cannot be nested/local functions.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_financial_metrics():
+    """
+    Persist today's FinancialMetricSnapshot for every user with active accounts.
+
+    The metrics dashboard reads these rows for its history and trend chart
+    instead of writing a snapshot on every page view.
+    """
+    from apps.finance.services.metrics_service import snapshot_users
+
+    results = snapshot_users()
+    logger.info(f"Financial metric snapshots complete: {results}")
+    return results
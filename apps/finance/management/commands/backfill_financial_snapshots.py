@@ -0,0 +1,95 @@
+# ==============================================================================
+# File: backfill_financial_snapshots.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to rebuild historical financial snapshots
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Backfill Financial Snapshots Command
+
+Rebuilds FinancialMetricSnapshot rows for a date range, and the
+MonthlyCashFlow ledger for the months it covers, with one grouped
+transaction query per user.
+
+Usage:
+    python manage.py backfill_financial_snapshots --start=2026-01-01
+    python manage.py backfill_financial_snapshots --start=2026-01-01 --end=2026-06-30
+    python manage.py backfill_financial_snapshots --days=90 --user=a@b.com
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.core.management.decorators import notify_on_error
+from apps.core.utils import get_user_today
+from apps.finance.services.metrics_service import backfill_snapshots
+
+
+class Command(BaseCommand):
+    help = "Rebuild historical financial metric snapshots"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="First snapshot date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--end",
+            help="Last snapshot date (YYYY-MM-DD, default: each user's today)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Days back from each user's today when --start is not given (default: 30)",
+        )
+        parser.add_argument(
+            "--user",
+            help="Email of a single user to backfill",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        from apps.finance.models import FinancialAccount
+        from apps.users.models import User
+
+        start = self._parse(options["start"], "--start")
+        end = self._parse(options["end"], "--end")
+        if start and end and start > end:
+            raise CommandError("--start must be on or before --end")
+
+        users = User.objects.filter(
+            pk__in=FinancialAccount.objects.values("user_id")
+        ).select_related("preferences").order_by("pk")
+        if options["user"]:
+            users = users.filter(email=options["user"])
+            if not users.exists():
+                raise CommandError(f"No user with accounts and email {options['user']}")
+
+        total = 0
+        user_count = 0
+        for user in users.iterator():
+            user_end = end or get_user_today(user)
+            user_start = start or user_end - timedelta(days=options["days"] - 1)
+            written = backfill_snapshots(user, user_start, user_end)
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"  {user.email}: {written} snapshot(s)")
+            total += written
+            user_count += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfilled {total} snapshot(s) for {user_count} user(s)"
+        ))
+
+    def _parse(self, value, option):
+        if not value:
+            return None
+        parsed = parse_date(value)
+        if parsed is None:
+            raise CommandError(f"{option} must be a date in YYYY-MM-DD format")
+        return parsed
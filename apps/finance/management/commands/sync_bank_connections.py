@@ -0,0 +1,66 @@
+# ==============================================================================
+# File: sync_bank_connections.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to sync all active bank connections
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Sync Bank Connections Command
+
+Syncs every active BankConnection from Plaid using SyncOrchestrator:
+downloads run concurrently (bounded per institution) and connections
+synced within FINANCE_SYNC_MIN_INTERVAL_MINUTES are skipped.
+
+Usage:
+    python manage.py sync_bank_connections                 # Due connections
+    python manage.py sync_bank_connections --force         # Ignore the watermark
+    python manage.py sync_bank_connections --user=a@b.com  # One user's connections
+    python manage.py sync_bank_connections --workers=8
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.management.decorators import notify_on_error
+from apps.finance.services.sync_orchestrator import SyncOrchestrator
+
+
+class Command(BaseCommand):
+    help = "Sync all active bank connections from Plaid"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Sync even connections synced recently",
+        )
+        parser.add_argument(
+            "--user",
+            help="Email of a single user whose connections to sync",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Concurrent downloads (default: FINANCE_SYNC_MAX_WORKERS)",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        from apps.users.models import User
+
+        user = None
+        if options["user"]:
+            user = User.objects.filter(email=options["user"]).first()
+            if user is None:
+                raise CommandError(f"No user with email {options['user']}")
+
+        stats = SyncOrchestrator(max_workers=options["workers"]).run(
+            user=user, force=options["force"]
+        )
+
+        for connection_id, error in stats.failures.items():
+            self.stderr.write(f"Connection {connection_id}: {error}")
+
+        self.stdout.write(self.style.SUCCESS(f"Bank sync complete: {stats}"))
@@ -5,7 +5,7 @@
 #              imports with audit tracking
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-02
-# Last Updated: 2026-01-03
+# Last Updated: 2026-10-16 (Budget spend attached by budget_service)
 # ==============================================================================
 """
 Finance Module Models
@@ -21,6 +21,7 @@ Key Models:
     - Budget: Monthly spending plans by category
     - FinancialGoal: Savings, debt payoff, giving, and purchase goals
     - FinancialMetricSnapshot: Point-in-time financial health metrics
+    - MonthlyCashFlow: Running per-user, per-month income/expense ledger
 
 Security:
     - All models extend UserOwnedModel for ownership and soft delete
@@ -608,26 +609,26 @@ class Budget(UserOwnedModel):
 
     @property
     def spent_amount(self):
-        """Calculate amount spent in this category for this month."""
-        from django.db.models import Sum
+        """
+        Amount spent in this category for this month.
 
-        # Get the month's date range
-        next_month = self.month.replace(day=28) + timezone.timedelta(days=4)
-        end_of_month = next_month.replace(day=1) - timezone.timedelta(days=1)
+        Uses the value attached by services.budget_service.evaluate_budgets()
+        when present; otherwise runs its own aggregate on every access.
+        """
+        attached = getattr(self, '_spent_amount', None)
+        if attached is not None:
+            return attached
 
-        # Sum all expense transactions in this category
-        spent = Transaction.objects.filter(
-            user=self.user,
-            category=self.category,
-            date__gte=self.month,
-            date__lte=end_of_month,
-            status='active',
-            amount__lt=0  # Expenses are negative
-        ).aggregate(
-            total=Sum('amount')
-        )['total'] or Decimal('0.00')
+        from apps.finance.services.budget_service import spent_by_budget
+        return spent_by_budget([self])[self.spend_key()]
 
-        return abs(spent)
+    def set_spent_amount(self, amount):
+        """Attach a precomputed spent amount (see evaluate_budgets)."""
+        self._spent_amount = amount
+
+    def spend_key(self):
+        """(user_id, category_id, month) key used by spent_by_budget()."""
+        return (self.user_id, self.category_id, self.month)
 
     @property
     def remaining_amount(self):
@@ -641,6 +642,13 @@ class Budget(UserOwnedModel):
             return 0
         return min(100, (self.spent_amount / self.total_budget) * 100)
 
+    @property
+    def percentage_used(self):
+        """Percentage of budget spent, uncapped and rounded (for AI budget alerts)."""
+        if self.total_budget == 0:
+            return 0
+        return round((self.spent_amount / self.total_budget) * 100, 1)
+
     @property
     def health_status(self):
         """
@@ -882,6 +890,133 @@ class FinancialGoal(UserOwnedModel):
             self.save(update_fields=['current_amount', 'updated_at'])
 
 
+# =============================================================================
+# Monthly Cash Flow Ledger
+# =============================================================================
+
+class MonthlyCashFlow(models.Model):
+    """
+    Running income/expense totals for one user and calendar month.
+
+    Maintained incrementally by the Transaction signals in signals.py so
+    snapshots can read a month's cash flow without aggregating its
+    transactions. Bulk writes (file import, Plaid sync) bypass signals and
+    call rebuild() for the dates they touched instead.
+
+    Only active transactions count; opening balances and transfers are
+    excluded, matching the cash flow shown elsewhere in the module.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_cash_flows',
+    )
+    month = models.DateField(
+        help_text="First day of the month"
+    )
+    income = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+    )
+    expenses = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text="Total spending, stored as a positive amount"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-month']
+        verbose_name = "Monthly Cash Flow"
+        verbose_name_plural = "Monthly Cash Flows"
+        unique_together = ['user', 'month']
+
+    def __str__(self):
+        return f"{self.month:%Y-%m}: +{self.income} / -{self.expenses}"
+
+    @staticmethod
+    def counted():
+        """Q filter for transactions that count toward cash flow."""
+        return models.Q(status='active', is_opening_balance=False, transfer_pair__isnull=True)
+
+    @classmethod
+    def apply_delta(cls, user_id, month, income, expenses):
+        """
+        Add to a month's totals.
+
+        Returns False if the month has no ledger row yet; the caller should
+        rebuild() it from the transactions instead.
+        """
+        return cls.objects.filter(user_id=user_id, month=month).update(
+            income=models.F('income') + income,
+            expenses=models.F('expenses') + expenses,
+            updated_at=timezone.now(),
+        ) > 0
+
+    @classmethod
+    def rebuild(cls, user_id, start, end=None):
+        """
+        Recompute every month from start to end (inclusive) with one grouped
+        query. Months without transactions are stored as zero.
+        """
+        from django.db.models import Sum
+        from django.db.models.functions import TruncMonth
+
+        first = start.replace(day=1)
+        last = (end or start).replace(day=1)
+        next_month = (last + timezone.timedelta(days=32)).replace(day=1)
+
+        totals = {
+            row['month']: row
+            for row in Transaction.all_objects.filter(
+                cls.counted(), user_id=user_id, date__gte=first, date__lt=next_month,
+            ).annotate(month=TruncMonth('date')).order_by().values('month').annotate(
+                income=Sum('amount', filter=models.Q(amount__gt=0)),
+                expenses=Sum('amount', filter=models.Q(amount__lt=0)),
+            )
+        }
+
+        rows = []
+        month = first
+        while month <= last:
+            row = totals.get(month, {})
+            rows.append(cls(
+                user_id=user_id,
+                month=month,
+                income=row.get('income') or Decimal('0.00'),
+                expenses=abs(row.get('expenses') or Decimal('0.00')),
+            ))
+            month = (month + timezone.timedelta(days=32)).replace(day=1)
+
+        cls.save_months(rows)
+        return rows
+
+    @classmethod
+    def save_months(cls, rows):
+        """Insert or overwrite ledger rows."""
+        now = timezone.now()
+        for row in rows:
+            row.updated_at = now
+        cls.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['user', 'month'],
+            update_fields=['income', 'expenses', 'updated_at'],
+        )
+
+    @classmethod
+    def totals_for(cls, user, month):
+        """(income, expenses) for a month, rebuilding the row if missing."""
+        row = cls.objects.filter(user=user, month=month).values_list('income', 'expenses').first()
+        if row is None:
+            row = cls.rebuild(user.pk, month)[0]
+            return row.income, row.expenses
+        return row
+
+
 # =============================================================================
 # Financial Metric Snapshot
 # =============================================================================
@@ -981,66 +1116,45 @@ class FinancialMetricSnapshot(UserOwnedModel):
     def __str__(self):
         return f"Snapshot {self.snapshot_date}: NW ${self.net_worth:,.2f}"
 
-    @classmethod
-    def create_snapshot(cls, user, snapshot_date=None):
-        """
-        Create a new financial snapshot for a user.
+    METRIC_FIELDS = [
+        'total_assets', 'total_liabilities', 'net_worth', 'monthly_income',
+        'monthly_expenses', 'monthly_cash_flow', 'savings_rate',
+        'liquid_assets', 'emergency_fund_months',
+    ]
 
-        Calculates all metrics based on current account balances
-        and transaction history.
-        """
-        from django.db.models import Sum
+    LIQUID_TYPES = [
+        FinancialAccount.TYPE_CHECKING,
+        FinancialAccount.TYPE_SAVINGS,
+        FinancialAccount.TYPE_CASH,
+    ]
 
-        if snapshot_date is None:
-            snapshot_date = get_user_today(user)
+    # Largest values savings_rate and emergency_fund_months can store;
+    # a few days into a month tiny totals can produce far larger ratios
+    MAX_SAVINGS_RATE = Decimal('999.99')
+    MAX_EMERGENCY_MONTHS = Decimal('999.9')
 
-        # Calculate asset and liability totals
-        accounts = FinancialAccount.objects.filter(
-            user=user,
-            status='active',
-            include_in_net_worth=True
-        )
+    @classmethod
+    def calculate_metrics(cls, balances, monthly_income, monthly_expenses):
+        """
+        Metric field values from account balances and a month's cash flow.
 
+        Args:
+            balances: Iterable of (account_type, balance) for accounts
+                included in net worth
+            monthly_income: Income for the month
+            monthly_expenses: Expenses for the month, as a positive amount
+        """
         total_assets = Decimal('0.00')
         total_liabilities = Decimal('0.00')
         liquid_assets = Decimal('0.00')
 
-        for account in accounts:
-            if account.is_asset:
-                total_assets += account.current_balance
-                if account.account_type in [FinancialAccount.TYPE_CHECKING,
-                                            FinancialAccount.TYPE_SAVINGS,
-                                            FinancialAccount.TYPE_CASH]:
-                    liquid_assets += account.current_balance
+        for account_type, balance in balances:
+            if account_type in FinancialAccount.ASSET_TYPES:
+                total_assets += balance
+                if account_type in cls.LIQUID_TYPES:
+                    liquid_assets += balance
             else:
-                total_liabilities += abs(account.current_balance)
-
-        net_worth = total_assets - total_liabilities
-
-        # Calculate monthly income/expenses
-        month_start = snapshot_date.replace(day=1)
-
-        monthly_income = Transaction.objects.filter(
-            user=user,
-            date__gte=month_start,
-            date__lte=snapshot_date,
-            status='active',
-            amount__gt=0,
-            is_opening_balance=False
-        ).exclude(
-            transfer_pair__isnull=False
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
-
-        monthly_expenses = abs(Transaction.objects.filter(
-            user=user,
-            date__gte=month_start,
-            date__lte=snapshot_date,
-            status='active',
-            amount__lt=0,
-            is_opening_balance=False
-        ).exclude(
-            transfer_pair__isnull=False
-        ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00'))
+                total_liabilities += abs(balance)
 
         monthly_cash_flow = monthly_income - monthly_expenses
 
@@ -1048,27 +1162,67 @@ class FinancialMetricSnapshot(UserOwnedModel):
         savings_rate = Decimal('0.00')
         if monthly_income > 0:
             savings_rate = (monthly_cash_flow / monthly_income) * 100
+            savings_rate = max(min(savings_rate, cls.MAX_SAVINGS_RATE), -cls.MAX_SAVINGS_RATE)
 
         # Calculate emergency fund months
         emergency_fund_months = None
         if monthly_expenses > 0:
-            emergency_fund_months = liquid_assets / monthly_expenses
+            emergency_fund_months = min(liquid_assets / monthly_expenses, cls.MAX_EMERGENCY_MONTHS)
+
+        return {
+            'total_assets': total_assets,
+            'total_liabilities': total_liabilities,
+            'net_worth': total_assets - total_liabilities,
+            'monthly_income': monthly_income,
+            'monthly_expenses': monthly_expenses,
+            'monthly_cash_flow': monthly_cash_flow,
+            'savings_rate': savings_rate,
+            'liquid_assets': liquid_assets,
+            'emergency_fund_months': emergency_fund_months,
+        }
 
-        # Create or update snapshot
-        snapshot, created = cls.objects.update_or_create(
+    @classmethod
+    def build_snapshot(cls, user, snapshot_date=None):
+        """
+        Calculate a snapshot without saving it.
+
+        Reads current account balances and the month's totals from the
+        MonthlyCashFlow ledger, so it costs two small queries regardless of
+        how many transactions the user has. Cash flow covers the whole
+        calendar month containing snapshot_date.
+        """
+        if snapshot_date is None:
+            snapshot_date = get_user_today(user)
+
+        balances = FinancialAccount.objects.filter(
+            user=user,
+            status='active',
+            include_in_net_worth=True
+        ).values_list('account_type', 'current_balance')
+
+        monthly_income, monthly_expenses = MonthlyCashFlow.totals_for(
+            user, snapshot_date.replace(day=1)
+        )
+
+        return cls(
             user=user,
             snapshot_date=snapshot_date,
-            defaults={
-                'total_assets': total_assets,
-                'total_liabilities': total_liabilities,
-                'net_worth': net_worth,
-                'monthly_income': monthly_income,
-                'monthly_expenses': monthly_expenses,
-                'monthly_cash_flow': monthly_cash_flow,
-                'savings_rate': savings_rate,
-                'liquid_assets': liquid_assets,
-                'emergency_fund_months': emergency_fund_months,
-            }
+            **cls.calculate_metrics(balances, monthly_income, monthly_expenses)
+        )
+
+    @classmethod
+    def create_snapshot(cls, user, snapshot_date=None):
+        """
+        Create or update the stored snapshot for a user and date.
+
+        Used by the daily snapshot job and the metrics refresh button.
+        """
+        built = cls.build_snapshot(user, snapshot_date)
+
+        snapshot, created = cls.objects.update_or_create(
+            user=user,
+            snapshot_date=built.snapshot_date,
+            defaults={field: getattr(built, field) for field in cls.METRIC_FIELDS}
         )
 
         return snapshot
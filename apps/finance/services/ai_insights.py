@@ -4,7 +4,7 @@
 # Description: AI-powered spending insights and financial coaching
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-03
-# Last Updated: 2026-01-03
+# Last Updated: 2026-10-16
 # ==============================================================================
 """
 Finance AI Insights Service
@@ -33,7 +33,7 @@ from django.core.cache import cache
 from django.db.models import Sum, Count, Avg, Q
 from django.utils import timezone
 
-from apps.ai.services import AIService
+from apps.ai.services import ai_service
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +63,7 @@ class FinanceAIService:
         """
         self.user = user
         self.prefs = user.preferences
-        self.ai_service = AIService()
+        self.ai_service = ai_service
 
     # =========================================================================
     # CONSENT AND CONFIGURATION
@@ -109,6 +109,7 @@ class FinanceAIService:
             dict: Aggregated spending data safe for AI processing
         """
         from apps.finance.models import Transaction, Budget, FinancialGoal
+        from apps.finance.services.budget_service import evaluate_budgets
         from apps.core.utils import get_user_today
 
         today = get_user_today(self.user)
@@ -158,7 +159,7 @@ class FinanceAIService:
         ).select_related('category')
 
         budget_summary = []
-        for budget in budgets[:5]:
+        for budget in evaluate_budgets(budgets[:5]):
             budget_summary.append({
                 'category': budget.category.name if budget.category else 'Unknown',
                 'budgeted': float(budget.budgeted_amount),
@@ -412,7 +413,9 @@ class FinanceAIService:
         insight_text = self.ai_service._call_api(
             system_prompt,
             user_prompt,
-            max_tokens=250
+            max_tokens=250,
+            endpoint='finance_spending_insight',
+            user=self.user
         )
 
         if not insight_text:
@@ -467,7 +470,9 @@ Use observation language ("It looks like...", "Your data shows...") not advice l
         return self.ai_service._call_api(
             system_prompt,
             user_prompt,
-            max_tokens=100
+            max_tokens=100,
+            endpoint='finance_budget_alert',
+            user=self.user
         )
 
     def generate_goal_encouragement(self, goal) -> Optional[str]:
@@ -503,7 +508,9 @@ Use observation language, not advice."""
         return self.ai_service._call_api(
             system_prompt,
             user_prompt,
-            max_tokens=100
+            max_tokens=100,
+            endpoint='finance_goal_encouragement',
+            user=self.user
         )
 
     def generate_subscription_review(self) -> Optional[Dict[str, Any]]:
@@ -542,7 +549,9 @@ Use neutral, observational language."""
         insight = self.ai_service._call_api(
             system_prompt,
             user_prompt,
-            max_tokens=150
+            max_tokens=150,
+            endpoint='finance_subscription_review',
+            user=self.user
         )
 
         if not insight:
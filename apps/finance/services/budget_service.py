@@ -0,0 +1,114 @@
+# ==============================================================================
+# File: apps/finance/services/budget_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Set-based budget spend evaluation for lists, dashboards and AI alerts
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Budget Evaluation Service
+
+Budget.spent_amount on its own runs an aggregate per budget, and
+remaining_amount, spent_percentage and health_status each read it.
+evaluate_budgets() computes spend for a whole list of budgets with one
+grouped query and attaches it to each instance, so those properties read
+the attached value instead of querying.
+
+Usage:
+    budgets = evaluate_budgets(
+        Budget.objects.filter(user=user, month=month_start).select_related('category')
+    )
+    summary = summarize_budgets(budgets)
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+
+def spent_by_budget(budgets) -> dict:
+    """
+    Spending for a list of budgets from one grouped query.
+
+    Budgets may belong to several users and months; spend is grouped by
+    (user, category, month) over the covered date range.
+
+    Returns:
+        defaultdict of (user_id, category_id, month) -> spent amount
+        (positive Decimal, zero when nothing was spent)
+    """
+    from apps.finance.models import Transaction
+
+    spent = defaultdict(lambda: Decimal('0.00'))
+    if not budgets:
+        return spent
+
+    first_month = min(b.month for b in budgets)
+    last_month = max(b.month for b in budgets)
+    next_month = (last_month.replace(day=28) + timezone.timedelta(days=4)).replace(day=1)
+
+    rows = Transaction.objects.filter(
+        user_id__in={b.user_id for b in budgets},
+        category_id__in={b.category_id for b in budgets},
+        date__gte=first_month,
+        date__lt=next_month,
+        status='active',
+        amount__lt=0  # Expenses are negative
+    ).annotate(
+        month=TruncMonth('date')
+    ).order_by().values('user_id', 'category_id', 'month').annotate(
+        total=Sum('amount')
+    )
+
+    for row in rows:
+        spent[(row['user_id'], row['category_id'], row['month'])] += abs(row['total'])
+    return spent
+
+
+def evaluate_budgets(budgets) -> list:
+    """
+    Attach spent amounts to budgets so their health properties stop querying.
+
+    Args:
+        budgets: Iterable or queryset of Budget instances
+
+    Returns:
+        List of the same Budget instances with spend attached
+    """
+    budgets = list(budgets)
+    spent = spent_by_budget(budgets)
+    for budget in budgets:
+        budget.set_spent_amount(spent[budget.spend_key()])
+    return budgets
+
+
+def summarize_budgets(budgets) -> dict:
+    """
+    Totals and health counts for evaluated budgets.
+
+    Returns:
+        dict with total_budgeted, total_spent, total_remaining,
+        on_track_count, warning_count, over_count and over (list of
+        over-budget budgets)
+    """
+    summary = {
+        'total_budgeted': Decimal('0.00'),
+        'total_spent': Decimal('0.00'),
+        'total_remaining': Decimal('0.00'),
+        'on_track_count': 0,
+        'warning_count': 0,
+        'over_count': 0,
+        'over': [],
+    }
+    for budget in budgets:
+        summary['total_budgeted'] += budget.budgeted_amount
+        summary['total_spent'] += budget.spent_amount
+        summary['total_remaining'] += budget.remaining_amount
+        summary[f'{budget.health_status}_count'] += 1
+        if budget.health_status == 'over':
+            summary['over'].append(budget)
+    return summary
@@ -0,0 +1,175 @@
+# ==============================================================================
+# File: apps/finance/services/metrics_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Daily and historical FinancialMetricSnapshot generation
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Financial Metrics Service
+
+Snapshots are written ahead of time so the metrics dashboard only reads:
+
+- snapshot_users() persists today's snapshot for every user with active
+  accounts (run daily by apps.finance.jobs)
+- backfill_snapshots() rebuilds a date range of snapshots, and the
+  MonthlyCashFlow ledger for the months it covers, from one grouped
+  transaction query per user
+
+Historical balances are reconstructed by walking back from each account's
+current balance, so accounts that have since been closed are not included.
+Backfilled cash flow is month-to-date as of each snapshot date.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Q, Sum
+
+from apps.core.utils import get_user_today
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal('0.00')
+
+
+def snapshot_users(users=None) -> dict:
+    """
+    Persist today's snapshot (in each user's timezone) for users with
+    active accounts.
+
+    Returns:
+        dict with 'users' and 'failed' counts
+    """
+    from django.contrib.auth import get_user_model
+
+    from apps.finance.models import FinancialAccount, FinancialMetricSnapshot
+
+    if users is None:
+        users = get_user_model().objects.filter(
+            is_active=True,
+            pk__in=FinancialAccount.objects.filter(status='active').values('user_id'),
+        ).select_related('preferences').order_by('pk')
+
+    results = {'users': 0, 'failed': 0}
+    for user in users.iterator():
+        try:
+            FinancialMetricSnapshot.create_snapshot(user)
+            results['users'] += 1
+        except Exception as e:
+            logger.error(f"Failed to snapshot financial metrics for user {user.pk}: {e}")
+            results['failed'] += 1
+    return results
+
+
+def backfill_snapshots(user, start, end=None) -> int:
+    """
+    Write a FinancialMetricSnapshot for every day from start to end.
+
+    Existing snapshots for those dates are overwritten. The
+    MonthlyCashFlow rows for every month in the range are rebuilt from the
+    same query.
+
+    Args:
+        user: Owner of the snapshots
+        start: First snapshot date
+        end: Last snapshot date (default: the user's today)
+
+    Returns:
+        Number of snapshots written
+    """
+    from apps.finance.models import (
+        FinancialAccount,
+        FinancialMetricSnapshot,
+        MonthlyCashFlow,
+        Transaction,
+    )
+
+    end = end or get_user_today(user)
+    if start > end:
+        return 0
+    month_start = start.replace(day=1)
+
+    accounts = {
+        pk: (account_type, balance)
+        for pk, account_type, balance in FinancialAccount.objects.filter(
+            user=user, status='active', include_in_net_worth=True
+        ).values_list('pk', 'account_type', 'current_balance')
+    }
+
+    # Net change per account per day (for balances) and counted cash flow
+    # per day, from the first month in range onward
+    counted = MonthlyCashFlow.counted()
+    rows = Transaction.objects.filter(
+        user=user, status='active', date__gte=month_start
+    ).order_by().values('account_id', 'date').annotate(
+        change=Sum('amount'),
+        income=Sum('amount', filter=counted & Q(amount__gt=0)),
+        expenses=Sum('amount', filter=counted & Q(amount__lt=0)),
+    )
+
+    changes = defaultdict(lambda: defaultdict(Decimal))
+    cash_flow = defaultdict(lambda: [ZERO, ZERO])
+    for row in rows:
+        if row['account_id'] in accounts:
+            changes[row['date']][row['account_id']] += row['change']
+        day = cash_flow[row['date']]
+        day[0] += row['income'] or ZERO
+        day[1] += abs(row['expenses'] or ZERO)
+
+    # Rebuild ledger months covered by the range
+    months = defaultdict(lambda: [ZERO, ZERO])
+    for day, (income, expenses) in cash_flow.items():
+        months[day.replace(day=1)][0] += income
+        months[day.replace(day=1)][1] += expenses
+    ledger = []
+    month = month_start
+    while month <= end:
+        income, expenses = months.get(month, (ZERO, ZERO))
+        ledger.append(MonthlyCashFlow(user=user, month=month, income=income, expenses=expenses))
+        month = (month + timedelta(days=32)).replace(day=1)
+    MonthlyCashFlow.save_months(ledger)
+
+    # Balances at the end of `start`: current balance less everything after it
+    balances = {pk: balance for pk, (_, balance) in accounts.items()}
+    for day, per_account in changes.items():
+        if day > start:
+            for pk, change in per_account.items():
+                balances[pk] -= change
+
+    # Month-to-date cash flow before `start`
+    income = sum((v[0] for d, v in cash_flow.items() if d < start), ZERO)
+    expenses = sum((v[1] for d, v in cash_flow.items() if d < start), ZERO)
+
+    snapshots = []
+    day = start
+    while day <= end:
+        if day.day == 1:
+            income = expenses = ZERO
+        if day > start:
+            for pk, change in changes.get(day, {}).items():
+                balances[pk] += change
+        day_income, day_expenses = cash_flow.get(day, (ZERO, ZERO))
+        income += day_income
+        expenses += day_expenses
+
+        metrics = FinancialMetricSnapshot.calculate_metrics(
+            ((accounts[pk][0], balance) for pk, balance in balances.items()),
+            income,
+            expenses,
+        )
+        snapshots.append(FinancialMetricSnapshot(user=user, snapshot_date=day, **metrics))
+        day += timedelta(days=1)
+
+    FinancialMetricSnapshot.objects.bulk_create(
+        snapshots,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['user', 'snapshot_date'],
+        update_fields=FinancialMetricSnapshot.METRIC_FIELDS + ['updated_at'],
+    )
+    logger.info(f"Backfilled {len(snapshots)} financial snapshot(s) for user {user.pk}")
+    return len(snapshots)
@@ -0,0 +1,247 @@
+# ==============================================================================
+# File: apps/finance/services/sync_orchestrator.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Concurrent sync of all bank connections with rate limits and retries
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Bank Sync Orchestrator
+
+Syncs many BankConnections at once. A sync is almost all network wait on
+Plaid, so the Plaid calls (TransactionSyncService.fetch) run on a bounded
+thread pool while the database writes (TransactionSyncService.apply) stay
+on the calling thread as each download finishes. Worker threads never
+open database connections.
+
+- Connections synced within FINANCE_SYNC_MIN_INTERVAL_MINUTES are skipped
+  (last_sync_at watermark) unless force=True
+- At most FINANCE_SYNC_PER_INSTITUTION downloads run against one
+  institution at a time
+- Failed downloads are retried with jittered exponential backoff, except
+  auth errors which need the user to reconnect
+- run() returns a SyncStats report of throughput and failures
+
+Settings:
+    FINANCE_SYNC_MAX_WORKERS: Pool size (default 4)
+    FINANCE_SYNC_PER_INSTITUTION: Concurrent downloads per institution (default 2)
+    FINANCE_SYNC_MIN_INTERVAL_MINUTES: Watermark age to skip (default 360)
+    FINANCE_SYNC_MAX_ATTEMPTS: Download attempts per connection (default 3)
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.finance.services.sync_service import TransactionSyncService
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStats:
+    """Outcome of one orchestrator run."""
+
+    def __init__(self):
+        self.connections = 0
+        self.synced = 0
+        self.failed = 0
+        self.skipped = 0
+        self.retries = 0
+        self.transactions = 0
+        self.elapsed = 0.0
+        self.results = {}
+        self.failures = {}
+        self._started = time.monotonic()
+
+    def add(self, connection, result: dict, attempts: int = 1):
+        self.results[connection.id] = result
+        self.retries += attempts - 1
+        if 'error' in result:
+            self.failed += 1
+            self.failures[connection.id] = result['error']
+        else:
+            self.synced += 1
+            self.transactions += result['added'] + result['modified'] + result['removed']
+
+    def finish(self):
+        self.elapsed = time.monotonic() - self._started
+        return self
+
+    @property
+    def throughput(self) -> float:
+        """Transactions written per second."""
+        return self.transactions / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'connections': self.connections,
+            'synced': self.synced,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'retries': self.retries,
+            'transactions': self.transactions,
+            'elapsed_seconds': round(self.elapsed, 2),
+            'transactions_per_second': round(self.throughput, 1),
+            'failures': self.failures,
+        }
+
+    def __str__(self):
+        return (
+            f"{self.synced}/{self.connections} connection(s) synced, {self.failed} failed, "
+            f"{self.skipped} skipped, {self.retries} retried; {self.transactions} transaction(s) "
+            f"in {self.elapsed:.1f}s ({self.throughput:.1f}/s)"
+        )
+
+
+class InstitutionLimiter:
+    """Caps how many Plaid downloads run against one institution at once."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._slots = {}
+
+    @contextmanager
+    def slot(self, institution_id: str):
+        with self._lock:
+            semaphore = self._slots.get(institution_id)
+            if semaphore is None:
+                semaphore = self._slots[institution_id] = threading.BoundedSemaphore(self.limit)
+        with semaphore:
+            yield
+
+
+class SyncOrchestrator:
+    """
+    Runs TransactionSyncService for many connections concurrently.
+
+    Usage:
+        stats = SyncOrchestrator().run()
+        logger.info(f"Bank sync: {stats}")
+    """
+
+    BACKOFF_SECONDS = 2.0
+
+    def __init__(self, plaid=None, max_workers=None, per_institution=None,
+                 min_interval=None, max_attempts=None, sleep=time.sleep):
+        """
+        Args:
+            plaid: PlaidService-like client (defaults to get_plaid_service())
+            max_workers: Concurrent downloads overall
+            per_institution: Concurrent downloads per institution
+            min_interval: timedelta; connections synced more recently are skipped
+            max_attempts: Download attempts before a connection is marked failed
+            sleep: Used for backoff waits (injectable for tests)
+        """
+        self.plaid = plaid
+        self.max_workers = max_workers or getattr(settings, 'FINANCE_SYNC_MAX_WORKERS', 4)
+        self.limiter = InstitutionLimiter(
+            per_institution or getattr(settings, 'FINANCE_SYNC_PER_INSTITUTION', 2)
+        )
+        if min_interval is None:
+            min_interval = timedelta(
+                minutes=getattr(settings, 'FINANCE_SYNC_MIN_INTERVAL_MINUTES', 360)
+            )
+        self.min_interval = min_interval
+        self.max_attempts = max_attempts or getattr(settings, 'FINANCE_SYNC_MAX_ATTEMPTS', 3)
+        self.sleep = sleep
+
+    def eligible_connections(self, user=None, force=False):
+        """
+        Active connections due for a sync.
+
+        Returns:
+            (list of BankConnection, number skipped by the watermark)
+        """
+        from apps.finance.models import BankConnection
+
+        active = BankConnection.objects.filter(
+            connection_status=BankConnection.STATUS_ACTIVE
+        ).select_related('user')
+        if user:
+            active = active.filter(user=user)
+
+        if force or not self.min_interval:
+            due = list(active)
+            return due, 0
+
+        cutoff = timezone.now() - self.min_interval
+        due = list(active.filter(Q(last_sync_at__isnull=True) | Q(last_sync_at__lt=cutoff)))
+        return due, active.count() - len(due)
+
+    def run(self, user=None, force=False) -> SyncStats:
+        """Sync every due connection and return a SyncStats report."""
+        from apps.finance.services.plaid_service import get_plaid_service
+
+        stats = SyncStats()
+        connections, stats.skipped = self.eligible_connections(user, force)
+        stats.connections = len(connections)
+        if not connections:
+            return stats.finish()
+
+        plaid = self.plaid or get_plaid_service()
+        jobs = {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(connections)),
+            thread_name_prefix='wlj-bank-sync',
+        ) as pool:
+            for connection in connections:
+                service = TransactionSyncService(connection)
+                access_token = connection.get_access_token()
+                if not access_token:
+                    logger.error(f"No access token for connection {connection.id}")
+                    stats.add(connection, {'error': 'No access token available'})
+                    continue
+                jobs[pool.submit(self._fetch, service, plaid, access_token)] = service
+
+            # Apply each download on this thread as soon as it is ready
+            for future in as_completed(jobs):
+                service = jobs[future]
+                fetched, error, attempts = future.result()
+                if error is not None:
+                    result = service.record_failure(error, service.empty_result())
+                else:
+                    result = service.apply(fetched)
+                stats.add(service.bank_connection, result, attempts)
+
+        stats.finish()
+        logger.info(f"Bank sync finished: {stats}")
+        return stats
+
+    def _fetch(self, service, plaid, access_token):
+        """
+        Download one connection with retries; runs on a worker thread.
+
+        Returns:
+            (fetched dict or None, exception or None, attempts made)
+        """
+        connection = service.bank_connection
+        attempt = 1
+        while True:
+            try:
+                with self.limiter.slot(connection.institution_id):
+                    return service.fetch(plaid, access_token), None, attempt
+            except Exception as e:
+                if attempt >= self.max_attempts or service.is_auth_error(e):
+                    return None, e, attempt
+                delay = self.backoff(attempt)
+                logger.warning(
+                    f"Sync download failed for connection {connection.id} "
+                    f"(attempt {attempt}/{self.max_attempts}): {e}; retrying in {delay:.1f}s"
+                )
+                self.sleep(delay)
+                attempt += 1
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with +/-50% jitter so retries don't align."""
+        return self.BACKOFF_SECONDS * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
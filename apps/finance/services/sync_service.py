@@ -4,7 +4,7 @@
 # Description: Transaction sync service for bank integrations
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-03
-# Last Updated: 2026-01-03
+# Last Updated: 2026-10-16 (Rebuild cash flow ledger after each page)
 # ==============================================================================
 """
 Transaction Sync Service
@@ -14,6 +14,8 @@ Handles syncing transactions from Plaid to WLJ:
 - Incremental sync using cursor-based pagination
 - Account creation and balance updates
 - Transaction mapping and categorization
+- Each sync page is applied in bulk (one lookup query, bulk create/update,
+  one soft-delete UPDATE) rather than row by row
 
 See docs/wlj_bank_integration_architecture.md for architecture details.
 """
@@ -25,6 +27,7 @@ from typing import Optional
 
 from django.db import transaction
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +58,9 @@ class TransactionSyncService:
         ('investment', 'mutual fund'): 'investment',
     }
 
+    # Rows per INSERT/UPDATE statement when applying a sync page
+    BULK_BATCH_SIZE = 500
+
     def __init__(self, bank_connection):
         """
         Initialize sync service.
@@ -64,63 +70,79 @@ class TransactionSyncService:
         """
         self.bank_connection = bank_connection
         self.user = bank_connection.user
+        self._accounts = None
 
-    def sync(self) -> dict:
+    def sync(self, plaid=None) -> dict:
         """
         Perform a full transaction sync.
 
+        Args:
+            plaid: PlaidService-like client (defaults to get_plaid_service())
+
         Returns:
             dict with 'added', 'modified', 'removed', 'accounts_synced'
         """
         from apps.finance.services.plaid_service import get_plaid_service
 
-        plaid = get_plaid_service()
+        plaid = plaid or get_plaid_service()
         access_token = self.bank_connection.get_access_token()
 
         if not access_token:
             logger.error(f"No access token for connection {self.bank_connection.id}")
             return {'error': 'No access token available'}
 
-        result = {
-            'added': 0,
-            'modified': 0,
-            'removed': 0,
-            'accounts_synced': 0,
-        }
-
         try:
-            # First, sync accounts
-            accounts_data = plaid.get_accounts(access_token)
-            result['accounts_synced'] = self._sync_accounts(accounts_data)
+            fetched = self.fetch(plaid, access_token)
+        except Exception as e:
+            return self.record_failure(e, self.empty_result())
+
+        return self.apply(fetched)
+
+    def fetch(self, plaid, access_token: str) -> dict:
+        """
+        Download accounts and every transaction page since the saved cursor.
+
+        Only talks to Plaid - no database access - so it can run on a
+        worker thread (see sync_orchestrator). Raises on API errors.
+
+        Returns:
+            dict with 'accounts', 'pages' and the final 'cursor'
+        """
+        accounts_data = plaid.get_accounts(access_token)
 
-            # Then sync transactions with cursor
-            cursor = self.bank_connection.last_sync_cursor
-            has_more = True
+        cursor = self.bank_connection.last_sync_cursor
+        pages = []
+        has_more = True
 
-            while has_more:
-                sync_result = plaid.sync_transactions(access_token, cursor)
+        while has_more:
+            sync_result = plaid.sync_transactions(access_token, cursor)
+            pages.append(sync_result)
+            cursor = sync_result['next_cursor']
+            has_more = sync_result['has_more']
 
-                # Process added transactions
-                for txn_data in sync_result['added']:
-                    if self._create_or_update_transaction(txn_data):
-                        result['added'] += 1
+        return {'accounts': accounts_data, 'pages': pages, 'cursor': cursor}
 
-                # Process modified transactions
-                for txn_data in sync_result['modified']:
-                    if self._create_or_update_transaction(txn_data, is_update=True):
-                        result['modified'] += 1
+    def apply(self, fetched: dict) -> dict:
+        """
+        Write the result of fetch() to the database and advance the cursor.
 
-                # Process removed transactions
-                for txn_id in sync_result['removed']:
-                    if self._remove_transaction(txn_id):
-                        result['removed'] += 1
+        Returns:
+            dict with 'added', 'modified', 'removed', 'accounts_synced'
+        """
+        result = self.empty_result()
 
-                cursor = sync_result['next_cursor']
-                has_more = sync_result['has_more']
+        try:
+            # First, sync accounts
+            result['accounts_synced'] = self._sync_accounts(fetched['accounts'])
+
+            # Then apply transaction pages in order
+            for sync_result in fetched['pages']:
+                for key, count in self._apply_page(sync_result).items():
+                    result[key] += count
 
             # Update sync cursor
             self.bank_connection.update_sync_cursor(
-                cursor,
+                fetched['cursor'],
                 transactions_added=result['added']
             )
 
@@ -137,20 +159,39 @@ class TransactionSyncService:
             )
 
         except Exception as e:
-            logger.error(f"Sync failed for {self.bank_connection}: {e}")
-            self._log_sync_event(False, {'error': str(e)})
+            self.record_failure(e, result)
 
-            # Check if it's an auth error
-            error_str = str(e).lower()
-            if 'item_login_required' in error_str or 'invalid_access_token' in error_str:
-                self.bank_connection.mark_reauth_required()
-            else:
-                self.bank_connection.mark_error('SYNC_ERROR', str(e))
+        return result
+
+    def record_failure(self, error: Exception, result: dict) -> dict:
+        """Log a failed sync and flag the connection for attention."""
+        logger.error(f"Sync failed for {self.bank_connection}: {error}")
+        self._log_sync_event(False, {'error': str(error)})
 
-            result['error'] = str(e)
+        # Check if it's an auth error
+        if self.is_auth_error(error):
+            self.bank_connection.mark_reauth_required()
+        else:
+            self.bank_connection.mark_error('SYNC_ERROR', str(error))
 
+        result['error'] = str(error)
         return result
 
+    @staticmethod
+    def is_auth_error(error: Exception) -> bool:
+        """True for Plaid errors that need the user to reconnect (no retry)."""
+        error_str = str(error).lower()
+        return 'item_login_required' in error_str or 'invalid_access_token' in error_str
+
+    @staticmethod
+    def empty_result() -> dict:
+        return {
+            'added': 0,
+            'modified': 0,
+            'removed': 0,
+            'accounts_synced': 0,
+        }
+
     def _sync_accounts(self, accounts_data: list) -> int:
         """
         Sync accounts from Plaid to WLJ.
@@ -163,30 +204,37 @@ class TransactionSyncService:
         Returns:
             Number of accounts synced
         """
-        from apps.finance.models import FinancialAccount
-
         synced = 0
+        accounts = self._load_accounts()
 
         for acct_data in accounts_data:
             plaid_account_id = acct_data['id']
 
-            # Try to find existing account
-            account = FinancialAccount.objects.filter(
-                user=self.user,
-                plaid_account_id=plaid_account_id
-            ).first()
-
+            account = accounts.get(plaid_account_id)
             if account:
                 # Update existing account
                 self._update_account(account, acct_data)
             else:
                 # Create new account
-                account = self._create_account(acct_data)
+                accounts[plaid_account_id] = self._create_account(acct_data)
 
             synced += 1
 
         return synced
 
+    def _load_accounts(self) -> dict:
+        """Map of plaid_account_id -> FinancialAccount, loaded once per sync."""
+        from apps.finance.models import FinancialAccount
+
+        if self._accounts is None:
+            self._accounts = {
+                account.plaid_account_id: account
+                for account in FinancialAccount.objects.filter(
+                    user=self.user
+                ).exclude(plaid_account_id='')
+            }
+        return self._accounts
+
     def _create_account(self, acct_data: dict):
         """Create a new FinancialAccount from Plaid data."""
         from apps.finance.models import FinancialAccount
@@ -239,94 +287,104 @@ class TransactionSyncService:
 
         logger.debug(f"Updated account balance: {account.name} = {balance}")
 
-    def _create_or_update_transaction(self, txn_data: dict, is_update: bool = False) -> bool:
+    def _apply_page(self, sync_result: dict) -> dict:
         """
-        Create or update a transaction from Plaid data.
+        Apply one page of /transactions/sync results as a batch.
+
+        Existing transactions for every ID on the page are fetched with one
+        query, then new rows are bulk-created, changed rows bulk-updated and
+        removed rows soft-deleted with a single UPDATE.
 
         Args:
-            txn_data: Transaction data dict from Plaid
-            is_update: Whether this is an update to existing transaction
+            sync_result: Page dict from PlaidService.sync_transactions
 
         Returns:
-            True if transaction was created/updated
+            dict with 'added', 'modified', 'removed' counts
         """
-        from apps.finance.models import FinancialAccount, Transaction
-
-        plaid_txn_id = txn_data['transaction_id']
-        plaid_account_id = txn_data['account_id']
-
-        # Find the WLJ account
-        account = FinancialAccount.objects.filter(
-            user=self.user,
-            plaid_account_id=plaid_account_id
-        ).first()
-
-        if not account:
-            logger.warning(f"No account found for Plaid account {plaid_account_id}")
-            return False
-
-        # Check if transaction exists
-        existing = Transaction.objects.filter(
-            user=self.user,
-            plaid_transaction_id=plaid_txn_id
-        ).first()
-
-        # Plaid amounts: positive = money out, negative = money in
-        # WLJ amounts: positive = money in, negative = money out
-        plaid_amount = txn_data['amount']
-        wlj_amount = Decimal(str(-plaid_amount))  # Invert for WLJ convention
-
-        # Build description
-        description = txn_data.get('merchant_name') or txn_data.get('name', 'Unknown')
-
-        if existing:
-            # Update existing transaction
-            existing.amount = wlj_amount
-            existing.description = description
-            existing.date = txn_data['date']
-            existing.plaid_pending = txn_data.get('pending', False)
-            existing.save(update_fields=[
-                'amount', 'description', 'date', 'plaid_pending', 'updated_at'
-            ])
-            return True
-        else:
-            # Create new transaction
-            Transaction.objects.create(
+        from apps.finance.models import MonthlyCashFlow, Transaction
+
+        added = sync_result.get('added', [])
+        modified = sync_result.get('modified', [])
+        removed = sync_result.get('removed', [])
+        counts = {'added': 0, 'modified': 0, 'removed': 0}
+
+        accounts = self._load_accounts()
+        page_ids = {t['transaction_id'] for t in added} | {t['transaction_id'] for t in modified}
+        existing = {
+            txn.plaid_transaction_id: txn
+            for txn in Transaction.objects.filter(
                 user=self.user,
-                account=account,
-                date=txn_data['date'],
-                amount=wlj_amount,
-                description=description,
-                payee=txn_data.get('merchant_name', ''),
-                plaid_transaction_id=plaid_txn_id,
-                plaid_pending=txn_data.get('pending', False),
-                is_cleared=not txn_data.get('pending', False),
+                plaid_transaction_id__in=page_ids
             )
-            return True
-
-    def _remove_transaction(self, plaid_txn_id: str) -> bool:
-        """
-        Soft-delete a transaction that was removed from Plaid.
-
-        Args:
-            plaid_txn_id: Plaid transaction ID
-
-        Returns:
-            True if transaction was removed
-        """
-        from apps.finance.models import Transaction
-
-        txn = Transaction.objects.filter(
-            user=self.user,
-            plaid_transaction_id=plaid_txn_id
-        ).first()
-
-        if txn:
-            txn.soft_delete()
-            logger.debug(f"Soft-deleted transaction: {plaid_txn_id}")
-            return True
-
-        return False
+        } if page_ids else {}
+
+        to_create = {}
+        to_update = {}
+        touched_dates = set()
+        now = timezone.now()
+
+        for key, rows in (('added', added), ('modified', modified)):
+            for txn_data in rows:
+                plaid_txn_id = txn_data['transaction_id']
+                account = accounts.get(txn_data['account_id'])
+                if not account:
+                    logger.warning(f"No account found for Plaid account {txn_data['account_id']}")
+                    continue
+
+                # Plaid amounts: positive = money out, negative = money in
+                # WLJ amounts: positive = money in, negative = money out
+                wlj_amount = Decimal(str(-txn_data['amount']))
+                description = txn_data.get('merchant_name') or txn_data.get('name', 'Unknown')
+                pending = txn_data.get('pending', False)
+
+                touched_dates.add(parse_date(str(txn_data['date'])))
+                txn = existing.get(plaid_txn_id) or to_create.get(plaid_txn_id)
+                if txn is not None:
+                    touched_dates.add(parse_date(str(txn.date)))
+                    txn.amount = wlj_amount
+                    txn.description = description
+                    txn.date = txn_data['date']
+                    txn.plaid_pending = pending
+                    txn.updated_at = now
+                    if txn.pk:
+                        to_update[plaid_txn_id] = txn
+                else:
+                    to_create[plaid_txn_id] = Transaction(
+                        user=self.user,
+                        account=account,
+                        date=txn_data['date'],
+                        amount=wlj_amount,
+                        description=description,
+                        payee=txn_data.get('merchant_name', '') or '',
+                        plaid_transaction_id=plaid_txn_id,
+                        plaid_pending=pending,
+                        is_cleared=not pending,
+                    )
+                counts[key] += 1
+
+        with transaction.atomic():
+            if to_create:
+                Transaction.objects.bulk_create(to_create.values(), batch_size=self.BULK_BATCH_SIZE)
+            if to_update:
+                Transaction.objects.bulk_update(
+                    to_update.values(),
+                    ['amount', 'description', 'date', 'plaid_pending', 'updated_at'],
+                    batch_size=self.BULK_BATCH_SIZE,
+                )
+            if removed:
+                removed_qs = Transaction.objects.filter(
+                    user=self.user,
+                    plaid_transaction_id__in=removed
+                )
+                touched_dates.update(removed_qs.order_by().values_list('date', flat=True))
+                counts['removed'] = removed_qs.update(status='deleted', deleted_at=now, updated_at=now)
+
+            # Bulk writes skip the ledger signals
+            touched_dates.discard(None)
+            if touched_dates:
+                MonthlyCashFlow.rebuild(self.user.pk, min(touched_dates), max(touched_dates))
+
+        return counts
 
     def _log_sync_event(self, success: bool, details: dict):
         """Log sync event for audit trail."""
@@ -341,29 +399,20 @@ class TransactionSyncService:
         )
 
 
-def sync_all_connections(user=None):
+def sync_all_connections(user=None, force=False):
     """
     Sync all active bank connections.
 
+    Connections are synced concurrently by SyncOrchestrator; those synced
+    recently are skipped unless force=True.
+
     Args:
         user: Optional user to limit sync to
+        force: Ignore the last-synced watermark
 
     Returns:
         dict with results per connection
     """
-    from apps.finance.models import BankConnection
-
-    queryset = BankConnection.objects.filter(
-        connection_status=BankConnection.STATUS_ACTIVE
-    )
-
-    if user:
-        queryset = queryset.filter(user=user)
-
-    results = {}
-
-    for connection in queryset:
-        service = TransactionSyncService(connection)
-        results[connection.id] = service.sync()
+    from apps.finance.services.sync_orchestrator import SyncOrchestrator
 
-    return results
+    return SyncOrchestrator().run(user=user, force=force).results
@@ -0,0 +1,128 @@
+# ==============================================================================
+# File: apps/finance/signals.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Keep the MonthlyCashFlow ledger in step with transaction changes
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Finance Signals - Incremental cash flow ledger.
+
+Every Transaction save or delete applies the difference between its old
+and new contribution to the owning user's MonthlyCashFlow rows, inside
+the same database transaction as the write. A month with no ledger row
+yet is rebuilt from its transactions instead, so the ledger needs no
+separate migration of existing data.
+
+Bulk operations (bulk_create, bulk_update, queryset.update) do not send
+these signals; callers using them must call MonthlyCashFlow.rebuild().
+The one bulk update Django makes itself, nulling a deleted transfer's
+partner through on_delete=SET_NULL, is handled in the delete receivers.
+"""
+
+import datetime
+from decimal import Decimal
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils.dateparse import parse_date
+
+from .models import MonthlyCashFlow, Transaction
+
+ZERO = Decimal('0.00')
+
+
+def contribution(user_id, date, amount, status, is_opening_balance, transfer_pair_id):
+    """
+    (user_id, month, income, expenses) a transaction adds to the ledger,
+    or None if it does not count toward cash flow.
+    """
+    if status != 'active' or is_opening_balance or transfer_pair_id is not None:
+        return None
+    if isinstance(date, str):
+        date = parse_date(date)
+    if isinstance(date, datetime.datetime):
+        date = date.date()
+    amount = Decimal(str(amount))
+    return (
+        user_id,
+        date.replace(day=1),
+        amount if amount > 0 else ZERO,
+        -amount if amount < 0 else ZERO,
+    )
+
+
+def instance_contribution(instance):
+    return contribution(
+        instance.user_id, instance.date, instance.amount, instance.status,
+        instance.is_opening_balance, instance.transfer_pair_id,
+    )
+
+
+def apply_contribution(entry, sign, rebuild_missing=True):
+    """Add (sign=1) or remove (sign=-1) a contribution from the ledger."""
+    if entry is None:
+        return
+    user_id, month, income, expenses = entry
+    if not MonthlyCashFlow.apply_delta(user_id, month, sign * income, sign * expenses):
+        if rebuild_missing:
+            # The database already reflects this write
+            MonthlyCashFlow.rebuild(user_id, month)
+
+
+@receiver(pre_save, sender=Transaction)
+def remember_ledger_contribution(sender, instance, raw=False, **kwargs):
+    """Load what the stored row currently contributes before it changes."""
+    instance._ledger_previous = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    stored = Transaction.all_objects.filter(pk=instance.pk).values_list(
+        'user_id', 'date', 'amount', 'status', 'is_opening_balance', 'transfer_pair_id'
+    ).first()
+    if stored is not None:
+        instance._ledger_previous = contribution(*stored)
+
+
+@receiver(post_save, sender=Transaction)
+def update_ledger_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_ledger_previous', None)
+    current = instance_contribution(instance)
+    if previous == current:
+        return
+
+    if previous is not None and current is not None and previous[:2] == current[:2]:
+        # Same month: apply the difference as one delta
+        user_id, month, income, expenses = current
+        apply_contribution((user_id, month, income - previous[2], expenses - previous[3]), 1)
+    else:
+        apply_contribution(previous, -1)
+        apply_contribution(current, 1)
+
+
+@receiver(pre_delete, sender=Transaction)
+def remember_transfer_partners(sender, instance, **kwargs):
+    """Note partners whose transfer_pair the delete is about to set to NULL."""
+    instance._ledger_partners = list(
+        Transaction.all_objects.filter(transfer_pair_id=instance.pk).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Transaction)
+def update_ledger_on_delete(sender, instance, **kwargs):
+    # Never create rows here: on a cascading user delete the ledger row
+    # may already be gone and the user is about to be removed
+    apply_contribution(instance_contribution(instance), -1, rebuild_missing=False)
+
+    # Partners that survive the delete are no longer transfers and now
+    # count toward cash flow. A surviving partner means its user is not
+    # being deleted, so rebuilding a missing month is safe here.
+    partners = getattr(instance, '_ledger_partners', None)
+    if partners:
+        rows = Transaction.all_objects.filter(pk__in=partners).values_list(
+            'user_id', 'date', 'amount', 'status', 'is_opening_balance', 'transfer_pair_id'
+        )
+        for row in rows:
+            apply_contribution(contribution(*row), 1)
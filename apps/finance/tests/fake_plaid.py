@@ -0,0 +1,86 @@
+# ==============================================================================
+# File: fake_plaid.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: In-memory stand-in for PlaidService used by finance tests
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Fake Plaid client.
+
+Implements the two PlaidService methods the sync code calls
+(get_accounts and sync_transactions) from canned data keyed by access
+token, with optional latency and injected failures. It records the peak
+number of concurrent calls overall and per institution so tests can
+check the orchestrator's limits.
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+
+class FakePlaidService:
+    """Thread-safe in-memory Plaid stand-in."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.accounts = {}
+        self.pages = {}
+        self.institutions = {}
+        self.failures = defaultdict(list)
+        self.calls = defaultdict(int)
+        self.peak_inflight = 0
+        self.peak_by_institution = defaultdict(int)
+        self._inflight = 0
+        self._inflight_by_institution = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add_item(self, access_token, institution_id, accounts, pages):
+        """Register canned accounts and sync pages for an access token."""
+        self.institutions[access_token] = institution_id
+        self.accounts[access_token] = accounts
+        self.pages[access_token] = pages
+
+    def fail(self, access_token, *errors):
+        """Raise these errors (in order) on the next calls for a token."""
+        self.failures[access_token].extend(errors)
+
+    def get_accounts(self, access_token):
+        self._call(access_token)
+        return list(self.accounts[access_token])
+
+    def sync_transactions(self, access_token, cursor=''):
+        self._call(access_token)
+        pages = self.pages[access_token]
+        index = int(cursor.rsplit('-', 1)[-1]) + 1 if cursor else 0
+        page = pages[index] if index < len(pages) else {'added': [], 'modified': [], 'removed': []}
+        return dict(
+            page,
+            next_cursor=f'{access_token}-{index}',
+            has_more=index < len(pages) - 1,
+        )
+
+    def _call(self, access_token):
+        institution = self.institutions.get(access_token)
+        with self._lock:
+            self.calls[access_token] += 1
+            self._inflight += 1
+            self._inflight_by_institution[institution] += 1
+            self.peak_inflight = max(self.peak_inflight, self._inflight)
+            self.peak_by_institution[institution] = max(
+                self.peak_by_institution[institution],
+                self._inflight_by_institution[institution],
+            )
+            error = self.failures[access_token].pop(0) if self.failures[access_token] else None
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if error is not None:
+                raise error
+        finally:
+            with self._lock:
+                self._inflight -= 1
+                self._inflight_by_institution[institution] -= 1
@@ -0,0 +1,147 @@
+# ==============================================================================
+# File: test_budget_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for set-based budget spend evaluation
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for the budget evaluation service.
+
+Tests cover:
+- Spend for many budgets from one grouped query
+- Health properties read the attached spend
+- Budget list query count and finance dashboard alerts
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.core.utils import get_user_today
+from apps.finance.models import Budget, FinancialAccount, Transaction, TransactionCategory
+from apps.finance.services.budget_service import evaluate_budgets, summarize_budgets
+from apps.finance.tests.test_finance_comprehensive import FinanceTestMixin
+
+
+class BudgetServiceTests(FinanceTestMixin, TestCase):
+    """Tests for evaluate_budgets and summarize_budgets."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.account = FinancialAccount.objects.create(
+            user=self.user,
+            name='Checking',
+            account_type='checking',
+        )
+        self.month = date(2026, 3, 1)
+        self.budgets = []
+        for i, amount in enumerate(['100.00', '200.00', '300.00']):
+            category = TransactionCategory.objects.create(
+                user=self.user,
+                name=f'Category {i}',
+                category_type='expense',
+            )
+            self.budgets.append(Budget.objects.create(
+                user=self.user,
+                category=category,
+                budgeted_amount=Decimal(amount),
+                month=self.month,
+            ))
+
+    def spend(self, budget, amount, day):
+        Transaction.objects.create(
+            user=self.user,
+            account=self.account,
+            category=budget.category,
+            amount=Decimal(amount),
+            description='Spend',
+            date=day,
+        )
+
+    def test_spend_attached_with_one_query(self):
+        self.spend(self.budgets[0], '-50.00', date(2026, 3, 2))
+        self.spend(self.budgets[0], '-40.00', date(2026, 3, 31))
+        self.spend(self.budgets[1], '-250.00', date(2026, 3, 15))
+        self.spend(self.budgets[1], '25.00', date(2026, 3, 16))  # Refund, not spend
+        self.spend(self.budgets[2], '-999.00', date(2026, 4, 1))  # Next month
+
+        with CaptureQueriesContext(connection) as queries:
+            budgets = evaluate_budgets(Budget.objects.filter(user=self.user).order_by('pk'))
+            statuses = [b.health_status for b in budgets]
+            remaining = [b.remaining_amount for b in budgets]
+
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertEqual([b.spent_amount for b in budgets],
+                         [Decimal('90.00'), Decimal('250.00'), Decimal('0.00')])
+        self.assertEqual(statuses, ['warning', 'over', 'on_track'])
+        self.assertEqual(remaining[1], Decimal('-50.00'))
+        self.assertEqual(budgets[1].percentage_used, Decimal('125.0'))
+
+    def test_budgets_across_months(self):
+        april = Budget.objects.create(
+            user=self.user,
+            category=self.budgets[2].category,
+            budgeted_amount=Decimal('1000.00'),
+            month=date(2026, 4, 1),
+        )
+        self.spend(self.budgets[2], '-999.00', date(2026, 4, 1))
+
+        evaluate_budgets([self.budgets[2], april])
+
+        self.assertEqual(self.budgets[2].spent_amount, Decimal('0.00'))
+        self.assertEqual(april.spent_amount, Decimal('999.00'))
+
+    def test_summary(self):
+        self.spend(self.budgets[1], '-250.00', date(2026, 3, 15))
+
+        summary = summarize_budgets(evaluate_budgets(self.budgets))
+
+        self.assertEqual(summary['total_budgeted'], Decimal('600.00'))
+        self.assertEqual(summary['total_spent'], Decimal('250.00'))
+        self.assertEqual(summary['total_remaining'], Decimal('350.00'))
+        self.assertEqual((summary['on_track_count'], summary['over_count']), (2, 1))
+        self.assertEqual(summary['over'], [self.budgets[1]])
+
+    def test_budget_list_queries_do_not_grow_with_budgets(self):
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+        url = reverse('finance:budget_list') + '?month=2026-03'
+        client.get(url)  # Warm up session and per-user lookups
+
+        with CaptureQueriesContext(connection) as few:
+            client.get(url)
+
+        for i in range(3, 10):
+            category = TransactionCategory.objects.create(
+                user=self.user, name=f'Category {i}', category_type='expense'
+            )
+            Budget.objects.create(
+                user=self.user, category=category,
+                budgeted_amount=Decimal('10.00'), month=self.month,
+            )
+
+        with CaptureQueriesContext(connection) as many:
+            response = client.get(url)
+
+        self.assertEqual(response.context['over_count'], 0)
+        self.assertEqual(len(response.context['budgets']), 10)
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+    def test_dashboard_budget_alerts(self):
+        month = get_user_today(self.user).replace(day=1)
+        Budget.objects.filter(user=self.user).update(month=month)
+        self.spend(self.budgets[0], '-150.00', month)
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+
+        response = client.get(reverse('finance:dashboard'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([b.pk for b in response.context['budgets_over']], [self.budgets[0].pk])
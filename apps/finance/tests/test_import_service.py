@@ -0,0 +1,128 @@
+# ==============================================================================
+# File: test_import_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for bulk transaction file import
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for TransactionImportService.create_transactions.
+
+Tests cover:
+- Duplicate detection against existing transactions and within the file
+- Per-row error reporting
+- Bulk insert query count
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.finance.import_service import ParsedTransaction, TransactionImportService
+from apps.finance.models import FinancialAccount, Transaction, TransactionImport
+from apps.finance.tests.test_finance_comprehensive import FinanceTestMixin
+
+
+class TransactionImportServiceTests(FinanceTestMixin, TestCase):
+    """Tests for saving parsed import rows."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.account = FinancialAccount.objects.create(
+            user=self.user,
+            name='Checking',
+            account_type='checking',
+        )
+        self.import_record = TransactionImport.objects.create(
+            user=self.user,
+            account=self.account,
+            original_filename='history.csv',
+            file_type='csv',
+            file_size=1024,
+        )
+        self.service = TransactionImportService(self.user, self.account)
+
+    def parsed(self, day, amount, description):
+        return ParsedTransaction(
+            date=datetime(2025, 1, day),
+            amount=Decimal(amount),
+            description=description,
+        )
+
+    def test_creates_transactions(self):
+        results = self.service.create_transactions(
+            [self.parsed(1, '-12.50', 'Coffee'), self.parsed(2, '1500', 'Payroll')],
+            self.import_record,
+        )
+
+        self.assertEqual(results['imported'], 2)
+        self.assertEqual(results['skipped'], 0)
+        transaction = Transaction.objects.get(description='Coffee')
+        self.assertEqual(transaction.date, date(2025, 1, 1))
+        self.assertEqual(transaction.import_record, self.import_record)
+
+    def test_skips_existing_and_repeated_rows(self):
+        Transaction.objects.create(
+            user=self.user,
+            account=self.account,
+            date=date(2025, 1, 1),
+            amount=Decimal('-12.50'),
+            description='Coffee',
+        )
+
+        results = self.service.create_transactions(
+            [
+                self.parsed(1, '-12.5', 'Coffee'),
+                self.parsed(3, '-40.00', 'Groceries'),
+                self.parsed(3, '-40.00', 'Groceries'),
+            ],
+            self.import_record,
+        )
+
+        self.assertEqual(results['imported'], 1)
+        self.assertEqual(results['skipped'], 2)
+        self.assertEqual(Transaction.objects.filter(description='Groceries').count(), 1)
+
+    def test_deleted_transactions_are_not_duplicates(self):
+        existing = Transaction.objects.create(
+            user=self.user,
+            account=self.account,
+            date=date(2025, 1, 1),
+            amount=Decimal('-12.50'),
+            description='Coffee',
+        )
+        existing.soft_delete()
+
+        results = self.service.create_transactions(
+            [self.parsed(1, '-12.50', 'Coffee')], self.import_record
+        )
+
+        self.assertEqual(results['imported'], 1)
+
+    def test_invalid_row_reported_without_blocking_others(self):
+        results = self.service.create_transactions(
+            [self.parsed(1, '-5.00', 'x' * 301), self.parsed(2, '-6.00', 'Lunch')],
+            self.import_record,
+        )
+
+        self.assertEqual(results['imported'], 1)
+        self.assertEqual(results['failed'], 1)
+        self.assertEqual(results['errors'][0]['index'], 0)
+        self.assertEqual(results['errors'][0]['data']['amount'], '-5.00')
+
+    def test_bulk_insert_uses_constant_queries(self):
+        rows = [self.parsed(1 + i % 28, f'-{i}.00', f'Row {i}') for i in range(1, 301)]
+
+        with CaptureQueriesContext(connection) as queries:
+            results = self.service.create_transactions(rows, self.import_record, batch_size=100)
+
+        self.assertEqual(results['imported'], 300)
+        # Fingerprint lookup and the cash flow ledger rebuild
+        selects = [q for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 2)
+        self.assertLess(len(queries.captured_queries), 30)
@@ -0,0 +1,223 @@
+# ==============================================================================
+# File: test_metrics_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for the cash flow ledger and financial snapshot generation
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for incremental financial metrics.
+
+Tests cover:
+- Transaction signals keep MonthlyCashFlow in step with saves and deletes,
+  including the partner left behind when one side of a transfer is deleted
+- Snapshots built from the ledger and account balances
+- Historical backfill and its management command
+- The metrics dashboard does not write snapshots
+"""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.finance.jobs import snapshot_financial_metrics
+from apps.finance.models import (
+    FinancialAccount,
+    FinancialMetricSnapshot,
+    MonthlyCashFlow,
+    Transaction,
+)
+from apps.finance.services.metrics_service import backfill_snapshots
+from apps.finance.tests.test_finance_comprehensive import FinanceTestMixin
+
+JAN = date(2026, 1, 1)
+FEB = date(2026, 2, 1)
+
+
+class MetricsTestMixin(FinanceTestMixin):
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.checking = FinancialAccount.objects.create(
+            user=self.user,
+            name='Checking',
+            account_type='checking',
+            current_balance=Decimal('1000.00'),
+        )
+
+    def add(self, day, amount, **kwargs):
+        return Transaction.objects.create(
+            user=self.user,
+            account=kwargs.pop('account', self.checking),
+            date=day,
+            amount=Decimal(amount),
+            description=kwargs.pop('description', 'Test'),
+            **kwargs
+        )
+
+    def ledger(self, month):
+        return MonthlyCashFlow.objects.filter(user=self.user, month=month).values_list(
+            'income', 'expenses'
+        ).first()
+
+
+class MonthlyCashFlowSignalTests(MetricsTestMixin, TestCase):
+    """Tests for incremental ledger maintenance."""
+
+    def test_create_and_update_apply_deltas(self):
+        self.add(date(2026, 1, 5), '2000.00')
+        expense = self.add(date(2026, 1, 6), '-50.00')
+        self.assertEqual(self.ledger(JAN), (Decimal('2000.00'), Decimal('50.00')))
+
+        expense.amount = Decimal('-80.00')
+        expense.save()
+        self.assertEqual(self.ledger(JAN), (Decimal('2000.00'), Decimal('80.00')))
+
+    def test_moving_to_another_month(self):
+        expense = self.add(date(2026, 1, 6), '-50.00')
+
+        expense.date = date(2026, 2, 3)
+        expense.save()
+
+        self.assertEqual(self.ledger(JAN), (Decimal('0.00'), Decimal('0.00')))
+        self.assertEqual(self.ledger(FEB), (Decimal('0.00'), Decimal('50.00')))
+
+    def test_soft_delete_restore_and_delete(self):
+        expense = self.add(date(2026, 1, 6), '-50.00')
+
+        expense.soft_delete()
+        self.assertEqual(self.ledger(JAN)[1], Decimal('0.00'))
+
+        expense.restore()
+        self.assertEqual(self.ledger(JAN)[1], Decimal('50.00'))
+
+        expense.delete()
+        self.assertEqual(self.ledger(JAN)[1], Decimal('0.00'))
+
+    def test_transfers_and_opening_balances_excluded(self):
+        self.add(date(2026, 1, 1), '500.00', is_opening_balance=True)
+        outgoing = self.add(date(2026, 1, 7), '-100.00')
+        incoming = self.add(date(2026, 1, 7), '100.00')
+        outgoing.transfer_pair = incoming
+        outgoing.save(update_fields=['transfer_pair'])
+        incoming.transfer_pair = outgoing
+        incoming.save(update_fields=['transfer_pair'])
+
+        self.assertEqual(self.ledger(JAN), (Decimal('0.00'), Decimal('0.00')))
+
+    def test_deleting_one_side_of_transfer_counts_partner(self):
+        outgoing = self.add(date(2026, 1, 7), '-100.00')
+        incoming = self.add(date(2026, 2, 2), '100.00')
+        outgoing.transfer_pair = incoming
+        outgoing.save(update_fields=['transfer_pair'])
+        incoming.transfer_pair = outgoing
+        incoming.save(update_fields=['transfer_pair'])
+
+        outgoing.delete()
+
+        incoming.refresh_from_db()
+        self.assertIsNone(incoming.transfer_pair_id)
+        self.assertEqual(self.ledger(JAN), (Decimal('0.00'), Decimal('0.00')))
+        self.assertEqual(self.ledger(FEB), (Decimal('100.00'), Decimal('0.00')))
+        MonthlyCashFlow.rebuild(self.user.pk, JAN, FEB)
+        self.assertEqual(self.ledger(FEB), (Decimal('100.00'), Decimal('0.00')))
+
+    def test_missing_month_rebuilt_from_transactions(self):
+        self.add(date(2026, 1, 5), '-20.00')
+        MonthlyCashFlow.objects.all().delete()
+
+        self.add(date(2026, 1, 6), '-30.00')
+
+        self.assertEqual(self.ledger(JAN), (Decimal('0.00'), Decimal('50.00')))
+
+
+class FinancialSnapshotTests(MetricsTestMixin, TestCase):
+    """Tests for building and backfilling snapshots."""
+
+    def test_build_snapshot_reads_ledger(self):
+        self.add(date(2026, 1, 5), '2000.00')
+        self.add(date(2026, 1, 6), '-500.00')
+
+        with CaptureQueriesContext(connection) as queries:
+            snapshot = FinancialMetricSnapshot.build_snapshot(self.user, date(2026, 1, 20))
+
+        self.assertEqual(len(queries.captured_queries), 2)
+        self.assertIsNone(snapshot.pk)
+        self.assertEqual(snapshot.monthly_income, Decimal('2000.00'))
+        self.assertEqual(snapshot.monthly_expenses, Decimal('500.00'))
+        self.assertEqual(snapshot.monthly_cash_flow, Decimal('1500.00'))
+        self.assertEqual(snapshot.savings_rate, Decimal('75'))
+        self.assertEqual(snapshot.emergency_fund_months, Decimal('2'))
+
+    def test_ratios_are_capped(self):
+        metrics = FinancialMetricSnapshot.calculate_metrics(
+            [('checking', Decimal('100000.00'))], Decimal('1.00'), Decimal('50.00')
+        )
+
+        self.assertEqual(metrics['savings_rate'], Decimal('-999.99'))
+        self.assertEqual(metrics['emergency_fund_months'], Decimal('999.9'))
+
+    def test_backfill_reconstructs_history(self):
+        # Current balance 1000 includes both January transactions below
+        self.add(date(2026, 1, 10), '300.00')
+        self.add(date(2026, 1, 20), '-100.00')
+        MonthlyCashFlow.objects.all().delete()
+
+        written = backfill_snapshots(self.user, date(2026, 1, 9), date(2026, 1, 21))
+
+        self.assertEqual(written, 13)
+        snapshots = {
+            s.snapshot_date: s for s in FinancialMetricSnapshot.objects.filter(user=self.user)
+        }
+        self.assertEqual(snapshots[date(2026, 1, 9)].net_worth, Decimal('800.00'))
+        self.assertEqual(snapshots[date(2026, 1, 9)].monthly_income, Decimal('0.00'))
+        self.assertEqual(snapshots[date(2026, 1, 10)].net_worth, Decimal('1100.00'))
+        self.assertEqual(snapshots[date(2026, 1, 10)].monthly_income, Decimal('300.00'))
+        self.assertEqual(snapshots[date(2026, 1, 21)].net_worth, Decimal('1000.00'))
+        self.assertEqual(snapshots[date(2026, 1, 21)].monthly_expenses, Decimal('100.00'))
+        self.assertEqual(self.ledger(JAN), (Decimal('300.00'), Decimal('100.00')))
+
+    def test_backfill_overwrites_and_uses_one_grouped_query(self):
+        self.add(date(2026, 1, 10), '300.00')
+        backfill_snapshots(self.user, date(2026, 1, 1), date(2026, 1, 31))
+
+        with CaptureQueriesContext(connection) as queries:
+            backfill_snapshots(self.user, date(2026, 1, 1), date(2026, 1, 31))
+
+        transaction_queries = [
+            q for q in queries.captured_queries if 'FROM "finance_transaction"' in q['sql']
+        ]
+        self.assertEqual(len(transaction_queries), 1)
+        self.assertEqual(FinancialMetricSnapshot.objects.filter(user=self.user).count(), 31)
+
+    def test_backfill_command(self):
+        out = StringIO()
+        call_command(
+            'backfill_financial_snapshots', '--start=2026-01-01', '--end=2026-01-07', stdout=out
+        )
+
+        self.assertIn('Backfilled 7 snapshot(s) for 1 user(s)', out.getvalue())
+
+    def test_daily_job_persists_snapshot(self):
+        results = snapshot_financial_metrics()
+
+        self.assertEqual(results, {'users': 1, 'failed': 0})
+        self.assertEqual(FinancialMetricSnapshot.objects.filter(user=self.user).count(), 1)
+
+    def test_dashboard_does_not_write_snapshots(self):
+        client = Client()
+        client.login(email='test@example.com', password='testpass123')
+
+        response = client.get(reverse('finance:metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['current_snapshot'].net_worth, Decimal('1000.00'))
+        self.assertFalse(FinancialMetricSnapshot.objects.exists())
@@ -0,0 +1,167 @@
+# ==============================================================================
+# File: test_sync_orchestrator.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for concurrent multi-connection bank sync
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for SyncOrchestrator.
+
+Tests cover:
+- Downloads run concurrently within per-institution limits
+- last_sync_at watermark skipping
+- Retries with backoff, and no retry for auth errors
+- Stats report and the sync_bank_connections command
+"""
+
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.finance.models import BankConnection, FinancialAccount, Transaction
+from apps.finance.services.sync_orchestrator import SyncOrchestrator
+from apps.finance.tests.fake_plaid import FakePlaidService
+from apps.finance.tests.test_finance_comprehensive import FinanceTestMixin
+
+
+def fake_token(connection):
+    return f'token-{connection.item_id}'
+
+
+@patch.object(BankConnection, 'get_access_token', fake_token)
+class SyncOrchestratorTests(FinanceTestMixin, TestCase):
+    """Tests for syncing many bank connections at once."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.plaid = FakePlaidService(latency=0.05)
+        self.sleeps = []
+
+    def add_connection(self, item_id, institution_id='ins_1', last_sync_at=None, transactions=2):
+        connection = BankConnection.objects.create(
+            user=self.user,
+            item_id=item_id,
+            access_token_encrypted='encrypted',
+            institution_id=institution_id,
+            institution_name=f'Bank {institution_id}',
+            connection_status=BankConnection.STATUS_ACTIVE,
+            last_sync_at=last_sync_at,
+        )
+        account_id = f'acc-{item_id}'
+        self.plaid.add_item(
+            f'token-{item_id}',
+            institution_id,
+            accounts=[{'id': account_id, 'name': 'Checking', 'type': 'depository',
+                       'subtype': 'checking', 'balance_current': 100.0}],
+            pages=[{
+                'added': [
+                    {'transaction_id': f'{item_id}-t{i}', 'account_id': account_id,
+                     'amount': 10 + i, 'date': '2026-01-05', 'name': f'Store {i}'}
+                    for i in range(transactions)
+                ],
+                'modified': [],
+                'removed': [],
+            }],
+        )
+        return connection
+
+    def orchestrator(self, **kwargs):
+        kwargs.setdefault('max_workers', 4)
+        kwargs.setdefault('per_institution', 2)
+        return SyncOrchestrator(plaid=self.plaid, sleep=self.sleeps.append, **kwargs)
+
+    def test_syncs_connections_concurrently(self):
+        self.plaid.latency = 0.1
+        for i in range(4):
+            self.add_connection(f'item-{i}', institution_id=f'ins_{i}')
+
+        started = time.monotonic()
+        stats = self.orchestrator().run()
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(stats.synced, 4)
+        self.assertEqual(stats.transactions, 8)
+        self.assertEqual(Transaction.objects.count(), 8)
+        self.assertEqual(FinancialAccount.objects.filter(is_synced=True).count(), 4)
+        self.assertGreater(self.plaid.peak_inflight, 1)
+        # 4 connections x 2 calls x 100ms serially would take 800ms
+        self.assertLess(elapsed, 0.5)
+
+    def test_per_institution_limit(self):
+        for i in range(4):
+            self.add_connection(f'item-{i}', institution_id='ins_shared')
+
+        stats = self.orchestrator(per_institution=1).run()
+
+        self.assertEqual(stats.synced, 4)
+        self.assertEqual(self.plaid.peak_by_institution['ins_shared'], 1)
+
+    def test_recently_synced_connections_skipped(self):
+        self.add_connection('fresh', last_sync_at=timezone.now() - timedelta(minutes=5))
+        self.add_connection('stale', last_sync_at=timezone.now() - timedelta(days=1))
+        self.add_connection('never')
+
+        stats = self.orchestrator(min_interval=timedelta(hours=6)).run()
+
+        self.assertEqual(stats.skipped, 1)
+        self.assertEqual(stats.synced, 2)
+        self.assertEqual(self.plaid.calls['token-fresh'], 0)
+
+        forced = self.orchestrator(min_interval=timedelta(hours=6)).run(force=True)
+        self.assertEqual(forced.synced, 3)
+
+    def test_transient_error_retried_with_backoff(self):
+        connection = self.add_connection('flaky')
+        self.plaid.fail('token-flaky', Exception('RATE_LIMIT_EXCEEDED'))
+
+        stats = self.orchestrator().run()
+
+        self.assertEqual(stats.synced, 1)
+        self.assertEqual(stats.retries, 1)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertTrue(1.0 <= self.sleeps[0] <= 3.0)
+        connection.refresh_from_db()
+        self.assertEqual(connection.connection_status, BankConnection.STATUS_ACTIVE)
+
+    def test_auth_error_not_retried(self):
+        connection = self.add_connection('expired')
+        self.plaid.fail('token-expired', Exception('ITEM_LOGIN_REQUIRED'))
+
+        stats = self.orchestrator().run()
+
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(self.sleeps, [])
+        connection.refresh_from_db()
+        self.assertEqual(connection.connection_status, BankConnection.STATUS_REAUTH_REQUIRED)
+
+    def test_gives_up_after_max_attempts(self):
+        connection = self.add_connection('down')
+        self.add_connection('healthy')
+        self.plaid.fail('token-down', *[Exception('INTERNAL_SERVER_ERROR')] * 3)
+
+        stats = self.orchestrator(max_attempts=3).run()
+
+        self.assertEqual(stats.synced, 1)
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(stats.retries, 2)
+        self.assertIn(connection.id, stats.failures)
+        self.assertEqual(stats.as_dict()['failed'], 1)
+        connection.refresh_from_db()
+        self.assertEqual(connection.connection_status, BankConnection.STATUS_ERROR)
+
+    def test_command_reports_stats(self):
+        self.add_connection('item-1')
+        out = StringIO()
+
+        with patch('apps.finance.services.plaid_service.get_plaid_service', return_value=self.plaid):
+            call_command('sync_bank_connections', '--force', stdout=out)
+
+        self.assertIn('1/1 connection(s) synced', out.getvalue())
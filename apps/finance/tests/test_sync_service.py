@@ -0,0 +1,138 @@
+# ==============================================================================
+# File: test_sync_service.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for Plaid transaction sync
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for TransactionSyncService.
+
+Tests cover:
+- Added, modified and removed transactions applied per page
+- Unknown Plaid accounts are skipped
+- Page processing uses a constant number of queries
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.finance.models import BankConnection, FinancialAccount, Transaction
+from apps.finance.services.sync_service import TransactionSyncService
+from apps.finance.tests.test_finance_comprehensive import FinanceTestMixin
+
+
+def plaid_txn(txn_id, amount, name='Coffee Shop', day='2026-01-05', account_id='acc-1', pending=False):
+    return {
+        'transaction_id': txn_id,
+        'account_id': account_id,
+        'amount': amount,
+        'date': day,
+        'name': name,
+        'merchant_name': name,
+        'pending': pending,
+    }
+
+
+class TransactionSyncServiceTests(FinanceTestMixin, TestCase):
+    """Tests for applying Plaid sync pages."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.connection = BankConnection.objects.create(
+            user=self.user,
+            item_id='item-1',
+            access_token_encrypted='encrypted',
+            institution_id='ins_1',
+            institution_name='Test Bank',
+            connection_status=BankConnection.STATUS_ACTIVE,
+        )
+        self.connection.get_access_token = lambda: 'access-token'
+        self.account = FinancialAccount.objects.create(
+            user=self.user,
+            name='Checking',
+            account_type='checking',
+            plaid_account_id='acc-1',
+            bank_connection=self.connection,
+        )
+        self.plaid = MagicMock()
+        self.plaid.get_accounts.return_value = [
+            {'id': 'acc-1', 'name': 'Checking', 'type': 'depository',
+             'subtype': 'checking', 'balance_current': 250.0},
+        ]
+
+    def sync(self, *pages):
+        self.plaid.sync_transactions.side_effect = [
+            dict(page, next_cursor=f'cursor-{i}', has_more=i < len(pages) - 1)
+            for i, page in enumerate(pages)
+        ]
+        with patch('apps.finance.services.plaid_service.get_plaid_service', return_value=self.plaid):
+            return TransactionSyncService(self.connection).sync()
+
+    def test_added_transactions_created(self):
+        result = self.sync({'added': [plaid_txn('t1', 4.50), plaid_txn('t2', -1000, 'Payroll')],
+                            'modified': [], 'removed': []})
+
+        self.assertEqual(result['added'], 2)
+        coffee = Transaction.objects.get(plaid_transaction_id='t1')
+        self.assertEqual(coffee.amount, Decimal('-4.50'))
+        self.assertEqual(coffee.account, self.account)
+        self.assertTrue(coffee.is_cleared)
+        self.connection.refresh_from_db()
+        self.assertEqual(self.connection.last_sync_cursor, 'cursor-0')
+        self.assertEqual(self.connection.transactions_synced, 2)
+
+    def test_modified_and_removed_across_pages(self):
+        self.sync({'added': [plaid_txn('t1', 4.50, pending=True), plaid_txn('t2', 9.00)],
+                   'modified': [], 'removed': []})
+
+        result = self.sync(
+            {'added': [], 'modified': [plaid_txn('t1', 5.25, day='2026-01-06')], 'removed': []},
+            {'added': [], 'modified': [], 'removed': ['t2', 'missing']},
+        )
+
+        self.assertEqual(result['modified'], 1)
+        self.assertEqual(result['removed'], 1)
+        t1 = Transaction.objects.get(plaid_transaction_id='t1')
+        self.assertEqual(t1.amount, Decimal('-5.25'))
+        self.assertFalse(t1.plaid_pending)
+        self.assertEqual(str(t1.date), '2026-01-06')
+        t2 = Transaction.all_objects.get(plaid_transaction_id='t2')
+        self.assertEqual(t2.status, 'deleted')
+        self.assertIsNotNone(t2.deleted_at)
+
+    def test_added_then_modified_on_same_page(self):
+        result = self.sync({'added': [plaid_txn('t1', 4.50)],
+                            'modified': [plaid_txn('t1', 6.00)],
+                            'removed': []})
+
+        self.assertEqual(result['added'], 1)
+        self.assertEqual(Transaction.objects.filter(plaid_transaction_id='t1').count(), 1)
+        self.assertEqual(Transaction.objects.get(plaid_transaction_id='t1').amount, Decimal('-6.00'))
+
+    def test_unknown_account_skipped(self):
+        result = self.sync({'added': [plaid_txn('t1', 4.50, account_id='other')],
+                            'modified': [], 'removed': []})
+
+        self.assertEqual(result['added'], 0)
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_page_queries_do_not_grow_with_rows(self):
+        service = TransactionSyncService(self.connection)
+        service._load_accounts()
+        page = {'added': [plaid_txn(f't{i}', i) for i in range(200)], 'modified': [], 'removed': []}
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = service._apply_page(page)
+
+        self.assertEqual(counts['added'], 200)
+        # Existing-row lookup and the cash flow ledger rebuild
+        selects = [q for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 2)
+        self.assertLess(len(queries.captured_queries), 12)
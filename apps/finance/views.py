@@ -5,7 +5,7 @@
 #              and file imports
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2026-01-02
-# Last Updated: 2026-01-03
+# Last Updated: 2026-10-16 (Budget spend computed per list with one grouped query)
 # ==============================================================================
 from decimal import Decimal
 
@@ -41,6 +41,7 @@ from .models import (
     BankConnection,
     BankIntegrationLog,
 )
+from .services.budget_service import evaluate_budgets, summarize_budgets
 from .forms import (
     FinancialAccountForm,
     TransactionForm,
@@ -177,11 +178,11 @@ class FinanceDashboardView(LoginRequiredMixin, TemplateView):
         context['monthly_cash_flow'] = monthly_income - monthly_expenses
 
         # Budget summary
-        budgets = Budget.objects.filter(
+        budgets = evaluate_budgets(Budget.objects.filter(
             user=user, status='active', month=month_start
-        ).select_related('category')
+        ).select_related('category'))
         context['budgets'] = budgets
-        context['budgets_over'] = [b for b in budgets if b.health_status == 'over']
+        context['budgets_over'] = summarize_budgets(budgets)['over']
 
         # Active goals
         context['active_goals'] = FinancialGoal.objects.filter(
@@ -471,16 +472,13 @@ class BudgetListView(FinanceUserMixin, ListView):
         context = super().get_context_data(**kwargs)
         context['current_month'] = self.current_month
 
-        # Calculate totals
-        budgets = context['budgets']
-        context['total_budgeted'] = sum(b.budgeted_amount for b in budgets)
-        context['total_spent'] = sum(b.spent_amount for b in budgets)
-        context['total_remaining'] = sum(b.remaining_amount for b in budgets)
-
-        # Count by health status
-        context['on_track_count'] = sum(1 for b in budgets if b.health_status == 'on_track')
-        context['warning_count'] = sum(1 for b in budgets if b.health_status == 'warning')
-        context['over_count'] = sum(1 for b in budgets if b.health_status == 'over')
+        # Spend for every budget in one query, then totals and health counts
+        budgets = evaluate_budgets(context['budgets'])
+        context['budgets'] = context['object_list'] = budgets
+        summary = summarize_budgets(budgets)
+        for key in ('total_budgeted', 'total_spent', 'total_remaining',
+                    'on_track_count', 'warning_count', 'over_count'):
+            context[key] = summary[key]
 
         return context
 
@@ -660,9 +658,9 @@ class MetricsDashboardView(LoginRequiredMixin, TemplateView):
         user = self.request.user
         today = get_user_today(user)
 
-        # Get or create today's snapshot
-        snapshot = FinancialMetricSnapshot.create_snapshot(user, today)
-        context['current_snapshot'] = snapshot
+        # Today's figures from balances and the cash flow ledger; stored
+        # snapshots are written by the daily job, not by page views
+        context['current_snapshot'] = FinancialMetricSnapshot.build_snapshot(user, today)
 
         # Get historical snapshots for trend
         context['snapshots'] = FinancialMetricSnapshot.objects.filter(
@@ -1377,6 +1375,7 @@ def api_budget_alert(request, pk):
     from apps.finance.services.ai_insights import get_finance_ai_service
 
     budget = get_object_or_404(Budget, pk=pk, user=request.user, status='active')
+    evaluate_budgets([budget])
 
     try:
         service = get_finance_ai_service(request.user)
@@ -9,3 +9,6 @@ class HealthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.health"
     verbose_name = "Health"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,52 @@
+# ==============================================================================
+# File: rebuild_personal_bests.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Management command to recompute exercise bests and PR flags
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Rebuild Personal Bests Command
+
+Recomputes every ExerciseBest row and ExerciseSet.is_pr flag from the
+logged sets in one chronological pass. Run it after bulk imports or data
+fixes that bypass the workout views.
+
+Usage:
+    python manage.py rebuild_personal_bests
+    python manage.py rebuild_personal_bests --user=a@b.com
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.management.decorators import notify_on_error
+from apps.health.services.records import rebuild_personal_bests
+
+
+class Command(BaseCommand):
+    help = "Recompute exercise bests and personal record flags from logged sets"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Email of a single user to rebuild",
+        )
+
+    @notify_on_error
+    def handle(self, *args, **options):
+        from apps.users.models import User
+
+        user = None
+        if options["user"]:
+            user = User.objects.filter(email=options["user"]).first()
+            if user is None:
+                raise CommandError(f"No user with email {options['user']}")
+
+        written = rebuild_personal_bests(user)
+
+        scope = user.email if user else "all users"
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {written} exercise best(s) for {scope}"
+        ))
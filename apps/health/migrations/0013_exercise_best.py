@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("health", "0012_dexcom_cgm_integration"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseBest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "max_weight",
+                    models.DecimalField(
+                        decimal_places=1,
+                        help_text="Heaviest weight lifted, in pounds",
+                        max_digits=6,
+                    ),
+                ),
+                (
+                    "max_weight_reps",
+                    models.PositiveIntegerField(
+                        help_text="Most reps done at max_weight"
+                    ),
+                ),
+                (
+                    "best_1rm",
+                    models.DecimalField(
+                        decimal_places=1,
+                        help_text="Highest estimated 1 rep max (Brzycki), in pounds",
+                        max_digits=7,
+                    ),
+                ),
+                (
+                    "best_volume",
+                    models.DecimalField(
+                        decimal_places=1,
+                        help_text="Highest single-set volume (weight x reps)",
+                        max_digits=9,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "best_1rm_set",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="health.exerciseset",
+                    ),
+                ),
+                (
+                    "best_volume_set",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="health.exerciseset",
+                    ),
+                ),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bests",
+                        to="health.exercise",
+                    ),
+                ),
+                (
+                    "max_weight_set",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="health.exerciseset",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_bests",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "exercise best",
+                "verbose_name_plural": "exercise bests",
+                "unique_together": {("user", "exercise")},
+            },
+        ),
+    ]
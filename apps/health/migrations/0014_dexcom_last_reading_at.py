@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("health", "0013_exercise_best"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dexcomcredential",
+            name="last_reading_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="System time of the newest synced reading; incremental syncs start here",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# ==============================================================================
+# File: apps/health/migrations/0015_backfill_exercise_best.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Data migration to fill ExerciseBest from existing workout history
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Data migration to backfill ExerciseBest from existing ExerciseSet rows.
+
+Personal record detection compares each new set against the user's
+ExerciseBest row. Without this backfill the first set saved after deploy
+would become the baseline instead of the lifter's real history, and every
+small increase after it would be flagged as a record.
+
+This is the same chronological pass as rebuild_personal_bests(), written
+against the historical models. is_pr flags on existing sets are left as
+they are.
+"""
+
+from decimal import Decimal
+
+from django.db import migrations
+
+
+def estimated_1rm(weight, reps):
+    """Brzycki estimate, matching apps.health.services.records."""
+    weight = Decimal(weight)
+    if 1 < reps < 37:
+        weight = weight * 36 / (37 - reps)
+    return weight.quantize(Decimal("0.1"))
+
+
+def backfill_exercise_bests(apps, schema_editor):
+    ExerciseBest = apps.get_model("health", "ExerciseBest")
+    ExerciseSet = apps.get_model("health", "ExerciseSet")
+
+    rows = ExerciseSet.objects.filter(
+        workout_exercise__session__status="active",
+        weight__gt=0,
+        reps__gt=0,
+        is_warmup=False,
+    ).order_by(
+        "workout_exercise__session__date",
+        "workout_exercise__session_id",
+        "workout_exercise__order",
+        "set_number",
+        "pk",
+    ).values_list(
+        "pk", "workout_exercise__session__user_id", "workout_exercise__exercise_id", "weight", "reps"
+    )
+
+    bests = {}
+    for set_id, user_id, exercise_id, weight, reps in rows.iterator(chunk_size=2000):
+        best = bests.get((user_id, exercise_id))
+        if best is None:
+            bests[(user_id, exercise_id)] = ExerciseBest(
+                user_id=user_id,
+                exercise_id=exercise_id,
+                max_weight=weight,
+                max_weight_reps=reps,
+                max_weight_set_id=set_id,
+                best_1rm=estimated_1rm(weight, reps),
+                best_1rm_set_id=set_id,
+                best_volume=weight * reps,
+                best_volume_set_id=set_id,
+            )
+            continue
+        if (weight, reps) > (best.max_weight, best.max_weight_reps):
+            best.max_weight = weight
+            best.max_weight_reps = reps
+            best.max_weight_set_id = set_id
+        if estimated_1rm(weight, reps) > best.best_1rm:
+            best.best_1rm = estimated_1rm(weight, reps)
+            best.best_1rm_set_id = set_id
+        if weight * reps > best.best_volume:
+            best.best_volume = weight * reps
+            best.best_volume_set_id = set_id
+
+    # Sets saved while only 0013 was applied already have rows
+    existing = set(ExerciseBest.objects.values_list("user_id", "exercise_id"))
+    ExerciseBest.objects.bulk_create(
+        [best for key, best in bests.items() if key not in existing],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("health", "0014_dexcom_last_reading_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_exercise_bests, migrations.RunPython.noop),
+    ]
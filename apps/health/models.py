@@ -647,12 +647,15 @@ class WorkoutSession(UserOwnedModel):
     @property
     def total_volume(self):
         """Total volume (weight x reps) for resistance exercises."""
-        total = 0
-        for workout_ex in self.workout_exercises.filter(exercise__category="resistance"):
-            for s in workout_ex.sets.all():
-                if s.weight and s.reps:
-                    total += float(s.weight) * s.reps
-        return total
+        total = ExerciseSet.objects.filter(
+            workout_exercise__session=self,
+            workout_exercise__exercise__category="resistance",
+            weight__gt=0,
+            reps__gt=0,
+        ).aggregate(
+            volume=models.Sum(models.F("weight") * models.F("reps"), output_field=models.FloatField())
+        )["volume"]
+        return float(total or 0)
 
 
 class WorkoutExercise(models.Model):
@@ -828,6 +831,79 @@ class PersonalRecord(UserOwnedModel):
         return float(self.weight) * (36 / (37 - self.reps))
 
 
+class ExerciseBest(models.Model):
+    """
+    Current best working set per user and exercise.
+
+    One compact row per (user, exercise) so a newly saved set is compared
+    against the bests without scanning history. Maintained by
+    services/records.py as sets are saved; rebuild_personal_bests (and the
+    command of the same name) recomputes every row from ExerciseSet.
+
+    Each best remembers the set that holds it, so lowering or deleting
+    that set triggers a recompute for the exercise.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="exercise_bests",
+    )
+    exercise = models.ForeignKey(
+        Exercise,
+        on_delete=models.CASCADE,
+        related_name="bests",
+    )
+    max_weight = models.DecimalField(
+        max_digits=6,
+        decimal_places=1,
+        help_text="Heaviest weight lifted, in pounds",
+    )
+    max_weight_reps = models.PositiveIntegerField(
+        help_text="Most reps done at max_weight",
+    )
+    max_weight_set = models.ForeignKey(
+        ExerciseSet,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    best_1rm = models.DecimalField(
+        max_digits=7,
+        decimal_places=1,
+        help_text="Highest estimated 1 rep max (Brzycki), in pounds",
+    )
+    best_1rm_set = models.ForeignKey(
+        ExerciseSet,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    best_volume = models.DecimalField(
+        max_digits=9,
+        decimal_places=1,
+        help_text="Highest single-set volume (weight x reps)",
+    )
+    best_volume_set = models.ForeignKey(
+        ExerciseSet,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "exercise best"
+        verbose_name_plural = "exercise bests"
+        unique_together = ["user", "exercise"]
+
+    def __str__(self):
+        return f"{self.exercise.name}: {self.max_weight}lbs x {self.max_weight_reps}"
+
+
 class WorkoutTemplate(UserOwnedModel):
     """
     Saved workout routines for quick reuse.
@@ -2246,6 +2322,11 @@ class DexcomCredential(models.Model):
     last_sync_status = models.CharField(max_length=50, blank=True)
     last_sync_message = models.TextField(blank=True)
     last_sync_count = models.PositiveIntegerField(default=0)
+    last_reading_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="System time of the newest synced reading; incremental syncs start here"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
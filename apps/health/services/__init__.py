@@ -4,9 +4,22 @@
 # Description: Health services package initialization
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16
 # ==============================================================================
 
+from .adherence import AdherenceReport, build_adherence_report
 from .dexcom import DexcomService, DexcomSyncService
+from .glucose import glucose_report
+from .medicine import DosePlan, build_dose_plan
+from .nutrition import daily_series, nutrition_series, rollup
+from .records import rebuild_personal_bests, record_session, record_set
+from .workouts import exercise_progress, invalidate_workout_analytics, volume_series, workout_stats
 
-__all__ = ['DexcomService', 'DexcomSyncService']
+__all__ = [
+    'AdherenceReport', 'build_adherence_report',
+    'DexcomService', 'DexcomSyncService', 'DosePlan', 'build_dose_plan',
+    'glucose_report',
+    'daily_series', 'nutrition_series', 'rollup',
+    'rebuild_personal_bests', 'record_session', 'record_set',
+    'exercise_progress', 'invalidate_workout_analytics', 'volume_series', 'workout_stats',
+]
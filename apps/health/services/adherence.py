@@ -0,0 +1,151 @@
+# ==============================================================================
+# File: apps/health/services/adherence.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Medicine adherence analytics from one grouped query
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Medicine Adherence Analytics
+
+build_adherence_report() counts a user's scheduled doses (PRN doses are
+excluded) with a single conditional-count query grouped by
+(medicine, scheduled_date). Overall, per-medicine, per-day and per-week
+figures are all derived from those rows in memory, so the query count
+does not depend on the window length or the number of medicines.
+
+Two rates are provided because callers have always meant different things:
+
+- rate: taken (including late) out of every scheduled dose logged; shown
+  on the adherence page
+- resolved_rate: taken out of taken + missed, ignoring skipped doses;
+  used by the dashboard, weekly trends and the personal assistant
+
+Used by MedicineAdherenceView, DashboardView, TrendTracker and
+PersonalAssistant.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Count, Q
+
+TAKEN_STATUSES = ("taken", "late")
+
+
+class AdherenceCounts:
+    """Dose counts for one slice of a report (overall, a medicine, a day)."""
+
+    __slots__ = ("total", "taken", "missed", "skipped", "late")
+
+    def __init__(self, total=0, taken=0, missed=0, skipped=0, late=0):
+        self.total = total
+        self.taken = taken
+        self.missed = missed
+        self.skipped = skipped
+        self.late = late
+
+    def add(self, other):
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    @property
+    def rate(self):
+        """Percent of logged doses taken, or None with no doses."""
+        return round(self.taken / self.total * 100) if self.total else None
+
+    @property
+    def resolved_rate(self):
+        """Percent of taken + missed doses taken, or None with neither."""
+        resolved = self.taken + self.missed
+        return round(self.taken / resolved * 100) if resolved else None
+
+    def as_dict(self):
+        data = {field: getattr(self, field) for field in self.__slots__}
+        data["rate"] = self.rate
+        return data
+
+
+class AdherenceReport:
+    """
+    Adherence for one user over an inclusive date range.
+
+    Attributes:
+        start, end: The window
+        overall: AdherenceCounts for every scheduled dose
+        by_medicine: List of (Medicine, AdherenceCounts), lowest rate first
+        by_day: Dict of date -> AdherenceCounts for days with logs
+    """
+
+    def __init__(self, start, end, overall, by_medicine, by_day):
+        self.start = start
+        self.end = end
+        self.overall = overall
+        self.by_medicine = by_medicine
+        self.by_day = by_day
+
+    def daily(self):
+        """One AdherenceCounts per day of the window, oldest first."""
+        days = []
+        current = self.start
+        while current <= self.end:
+            days.append((current, self.by_day.get(current) or AdherenceCounts()))
+            current += timedelta(days=1)
+        return days
+
+    def weekly(self):
+        """Daily counts summed into 7-day buckets from the start of the window."""
+        weeks = []
+        for i, (day, counts) in enumerate(self.daily()):
+            if i % 7 == 0:
+                weeks.append((day, AdherenceCounts()))
+            weeks[-1][1].add(counts)
+        return weeks
+
+
+def build_adherence_report(user, start, end, include_medicines=True) -> AdherenceReport:
+    """
+    Build an AdherenceReport from one grouped query.
+
+    Args:
+        user: Owner of the logs
+        start, end: Inclusive scheduled_date range
+        include_medicines: Load Medicine objects for by_medicine (one more
+            query); callers that only need totals can skip it
+    """
+    from apps.health.models import Medicine, MedicineLog
+
+    rows = MedicineLog.objects.filter(
+        user=user,
+        scheduled_date__gte=start,
+        scheduled_date__lte=end,
+        is_prn_dose=False,  # Only count scheduled doses
+    ).order_by().values("medicine_id", "scheduled_date").annotate(
+        total=Count("id"),
+        taken=Count("id", filter=Q(log_status__in=TAKEN_STATUSES)),
+        missed=Count("id", filter=Q(log_status=MedicineLog.STATUS_MISSED)),
+        skipped=Count("id", filter=Q(log_status=MedicineLog.STATUS_SKIPPED)),
+        late=Count("id", filter=Q(log_status=MedicineLog.STATUS_LATE)),
+    )
+
+    overall = AdherenceCounts()
+    per_medicine = {}
+    by_day = {}
+    for row in rows:
+        counts = AdherenceCounts(
+            row["total"], row["taken"], row["missed"], row["skipped"], row["late"]
+        )
+        overall.add(counts)
+        per_medicine.setdefault(row["medicine_id"], AdherenceCounts()).add(counts)
+        by_day.setdefault(row["scheduled_date"], AdherenceCounts()).add(counts)
+
+    by_medicine = []
+    if include_medicines and per_medicine:
+        medicines = Medicine.objects.filter(user=user, pk__in=per_medicine)
+        by_medicine = sorted(
+            ((medicine, per_medicine[medicine.pk]) for medicine in medicines),
+            key=lambda item: item[1].rate,
+        )
+
+    return AdherenceReport(start, end, overall, by_medicine, by_day)
@@ -4,18 +4,24 @@
 # Description: Dexcom CGM OAuth and data sync service
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2026-01-01
+# Last Updated: 2026-10-16 - Windowed fetch, bulk upsert and sync watermark
 # ==============================================================================
 """
 Dexcom CGM Integration Service
 
 Handles OAuth 2.0 authentication and glucose data sync with Dexcom API.
 Follows patterns from Google Calendar integration in apps/life/services/.
+
+Syncs fetch the range as sequential windows of SYNC_WINDOW_DAYS. Each window
+is written with a preload of existing record IDs followed by
+bulk_create/bulk_update in its own transaction. DexcomCredential.last_reading_at
+is a watermark, so repeat syncs only request readings after the newest one
+already stored.
 """
 
 import logging
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
 from typing import Optional
 from urllib.parse import urlencode
@@ -46,6 +52,9 @@ class DexcomService:
     # Data endpoints (v3)
     EGV_PATH = "/v3/users/self/egvs"
 
+    # Longest range requested in one EGV call (about 2,000 readings)
+    SYNC_WINDOW_DAYS = 7
+
     def __init__(self):
         self.client_id = getattr(settings, 'DEXCOM_CLIENT_ID', '')
         self.client_secret = getattr(settings, 'DEXCOM_CLIENT_SECRET', '')
@@ -245,12 +254,44 @@ class DexcomService:
             logger.error(f"Dexcom glucose fetch failed: {e}")
             raise ValueError(f"Failed to fetch glucose readings: {e}")
 
+    def iter_glucose_readings(
+        self,
+        access_token: str,
+        start_date: datetime,
+        end_date: datetime,
+        window_days: int = SYNC_WINDOW_DAYS
+    ):
+        """
+        Fetch a long date range as sequential windowed requests.
+
+        Yields one list of EGV records per window, oldest first, so each
+        window can be stored before the next one is requested.
+
+        Raises:
+            ValueError: If a window fails to fetch
+        """
+        window = timedelta(days=window_days)
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(window_start + window, end_date)
+            yield self.get_glucose_readings(access_token, window_start, window_end)
+            window_start = window_end
+
 
 class DexcomSyncService:
     """
     Service for syncing Dexcom glucose data to GlucoseEntry models.
     """
 
+    # Rows per bulk_create/bulk_update statement and per existing-ID lookup
+    BATCH_SIZE = 500
+
+    # Fields refreshed on readings that were already synced
+    UPDATE_FIELDS = [
+        'value', 'unit', 'context', 'recorded_at', 'source',
+        'trend', 'trend_rate', 'display_device', 'updated_at',
+    ]
+
     def __init__(self, user):
         self.user = user
         self.dexcom_service = DexcomService()
@@ -337,17 +378,22 @@ class DexcomSyncService:
             'display_device': record.get('displayDevice', ''),
         }
 
-    def sync_from_dexcom(self, days: int = 7) -> tuple:
+    def sync_from_dexcom(self, days: int = 7, full: bool = False) -> tuple:
         """
         Sync glucose readings from Dexcom.
 
+        Starts at the watermark (last_reading_at) when it falls inside the
+        range, so repeat syncs only request new readings.
+
         Args:
             days: Number of days of history to sync
+            full: Ignore the watermark and re-sync the whole range
 
         Returns:
             tuple: (created_count, updated_count, error_message)
         """
-        from apps.health.models import GlucoseEntry
+        from apps.dashboard.fragments import invalidate_sections
+        from apps.health.services.glucose import invalidate_glucose_analytics
 
         credential = self.get_credential()
         if not credential:
@@ -359,49 +405,39 @@ class DexcomSyncService:
         # Calculate date range
         end_date = timezone.now()
         start_date = end_date - timedelta(days=days)
-
-        try:
-            records = self.dexcom_service.get_glucose_readings(
-                credential.access_token,
-                start_date,
-                end_date
-            )
-        except ValueError as e:
-            credential.record_sync(success=False, message=str(e))
-            return 0, 0, str(e)
+        watermark = credential.last_reading_at
+        if not full and watermark and watermark > start_date:
+            start_date = watermark
 
         created_count = 0
         updated_count = 0
+        error = None
 
-        with transaction.atomic():
-            for record in records:
-                entry_data = self.dexcom_record_to_glucose_entry(record)
-                record_id = entry_data.pop('dexcom_record_id')
+        windows = self.dexcom_service.iter_glucose_readings(
+            credential.access_token,
+            start_date,
+            end_date
+        )
+        try:
+            for records in windows:
+                created, updated = self.save_readings(credential, records)
+                created_count += created
+                updated_count += updated
+        except ValueError as e:
+            error = str(e)
 
-                if not record_id:
-                    continue
+        # Bulk writes skip the signals that refresh the dashboard and reports
+        if created_count or updated_count:
+            invalidate_sections(self.user.pk, ("health",))
+            invalidate_glucose_analytics(self.user.pk)
 
-                # Check if record already exists
-                existing = GlucoseEntry.objects.filter(
-                    user=self.user,
-                    dexcom_record_id=record_id
-                ).first()
-
-                if existing:
-                    # Update existing record
-                    for key, value in entry_data.items():
-                        setattr(existing, key, value)
-                    existing.dexcom_record_id = record_id
-                    existing.save()
-                    updated_count += 1
-                else:
-                    # Create new record
-                    GlucoseEntry.objects.create(
-                        user=self.user,
-                        dexcom_record_id=record_id,
-                        **entry_data
-                    )
-                    created_count += 1
+        if error:
+            credential.record_sync(
+                success=False,
+                message=error,
+                count=created_count + updated_count
+            )
+            return created_count, updated_count, error
 
         # Record sync result
         credential.record_sync(
@@ -412,6 +448,83 @@ class DexcomSyncService:
 
         return created_count, updated_count, None
 
+    def save_readings(self, credential, records: list) -> tuple:
+        """
+        Upsert one window of EGV records and advance the watermark.
+
+        Existing record IDs are preloaded (including soft-deleted readings,
+        which stay deleted), then new readings are bulk created and known
+        ones bulk updated in one transaction.
+
+        Returns:
+            tuple: (created_count, updated_count)
+        """
+        from apps.health.models import GlucoseEntry
+
+        entries = {}
+        newest = None
+        for record in records:
+            entry_data = self.dexcom_record_to_glucose_entry(record)
+            record_id = entry_data.pop('dexcom_record_id')
+
+            if not record_id:
+                continue
+
+            entries[record_id] = entry_data
+            system_time = self.parse_system_time(record) or entry_data['recorded_at']
+            if newest is None or system_time > newest:
+                newest = system_time
+
+        if not entries:
+            return 0, 0
+
+        record_ids = list(entries)
+        now = timezone.now()
+
+        with transaction.atomic():
+            existing = {}
+            for i in range(0, len(record_ids), self.BATCH_SIZE):
+                existing.update(GlucoseEntry.all_objects.filter(
+                    user=self.user,
+                    dexcom_record_id__in=record_ids[i:i + self.BATCH_SIZE]
+                ).values_list('dexcom_record_id', 'pk'))
+
+            to_create = []
+            to_update = []
+            for record_id, entry_data in entries.items():
+                if record_id in existing:
+                    to_update.append(GlucoseEntry(
+                        pk=existing[record_id], updated_at=now, **entry_data
+                    ))
+                else:
+                    to_create.append(GlucoseEntry(
+                        user=self.user, dexcom_record_id=record_id, **entry_data
+                    ))
+
+            GlucoseEntry.objects.bulk_create(to_create, batch_size=self.BATCH_SIZE)
+            GlucoseEntry.objects.bulk_update(
+                to_update, self.UPDATE_FIELDS, batch_size=self.BATCH_SIZE
+            )
+
+            if credential.last_reading_at is None or newest > credential.last_reading_at:
+                credential.last_reading_at = newest
+                credential.save(update_fields=['last_reading_at', 'updated_at'])
+
+        return len(to_create), len(to_update)
+
+    def parse_system_time(self, record: dict) -> Optional[datetime]:
+        """Parse a record's systemTime (UTC), or None if missing or invalid."""
+        system_time = record.get('systemTime', '')
+        if not system_time:
+            return None
+        try:
+            parsed = datetime.fromisoformat(system_time.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if timezone.is_naive(parsed):
+            parsed = parsed.replace(tzinfo=dt_timezone.utc)
+        return parsed
+
     def get_latest_readings(self, hours: int = 3) -> list:
         """
         Get latest glucose readings from Dexcom (for real-time display).
@@ -0,0 +1,229 @@
+# ==============================================================================
+# File: apps/health/services/glucose.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Glucose analytics (time in range, GMI, CV, AGP percentiles)
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Glucose Analytics Service
+
+glucose_report() loads a window of readings with one query into compact
+arrays (epoch seconds, mg/dL values, local hour of day) and computes
+everything from them:
+
+- count, mean, min, max, standard deviation and coefficient of variation
+- GMI (glucose management indicator): 3.31 + 0.02392 x mean mg/dL
+- time in range buckets using the consensus CGM thresholds
+  (<54, 54-69, 70-180, 181-250, >250 mg/dL)
+- AGP: 5th/25th/50th/75th/95th percentile per local hour of day
+- the last 24 hours as chart points
+
+mmol/L readings are converted to mg/dL. A 90-day window is about 26,000
+CGM readings, so everything is one pass plus a sort per hour.
+
+Reports are cached per user. The cache is dropped when readings change:
+by the GlucoseEntry signals for single saves and deletes, and by
+DexcomSyncService after each bulk sync.
+
+Used by GlucoseDashboardView.
+"""
+
+import math
+import time
+from array import array
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.utils import timezone
+
+MG_DL_PER_MMOL_L = 18.0182
+
+# Consensus time-in-range thresholds (mg/dL)
+VERY_LOW = 54
+LOW = 70
+HIGH = 180
+VERY_HIGH = 250
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Report windows offered on the dashboard (days)
+REPORT_DAYS = (7, 14, 30, 90)
+MAX_REPORT_DAYS = 90
+
+CACHE_TIMEOUT = 15 * 60  # Bounds how far the window end lags behind now
+
+
+def _version_key(user_id):
+    return f'glucose_report_version_{user_id}'
+
+
+def invalidate_glucose_analytics(user_id):
+    """Drop cached glucose reports for a user."""
+    cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+class GlucoseSeries:
+    """Readings for one window as parallel compact arrays, oldest first."""
+
+    __slots__ = ('times', 'values', 'hours', 'trends')
+
+    def __init__(self):
+        self.times = array('d')   # Epoch seconds
+        self.values = array('d')  # mg/dL
+        self.hours = array('b')   # Local hour of day
+        self.trends = []          # Dexcom trend codes
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def load(cls, user, start, end, tz):
+        """Load readings recorded in [start, end] with one query."""
+        from apps.health.models import GlucoseEntry
+
+        series = cls()
+        rows = GlucoseEntry.objects.filter(
+            user=user, recorded_at__gte=start, recorded_at__lte=end
+        ).order_by('recorded_at').values_list('recorded_at', 'value', 'unit', 'trend')
+
+        for recorded_at, value, unit, trend in rows.iterator(chunk_size=5000):
+            value = float(value)
+            if unit == 'mmol/L':
+                value *= MG_DL_PER_MMOL_L
+            series.times.append(recorded_at.timestamp())
+            series.values.append(value)
+            series.hours.append(recorded_at.astimezone(tz).hour)
+            series.trends.append(trend)
+        return series
+
+
+def percentile(ordered, p):
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * p / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(series, since=None) -> dict:
+    """
+    Statistics for a GlucoseSeries in one pass.
+
+    Args:
+        since: Epoch seconds; readings from then on are also returned as
+            chart points (used for the last 24 hours)
+    """
+    buckets = {'very_low': 0, 'low': 0, 'in_range': 0, 'high': 0, 'very_high': 0}
+    by_hour = [[] for _ in range(24)]
+    chart = []
+    total = 0.0
+    total_sq = 0.0
+    minimum = maximum = None
+
+    for i, value in enumerate(series.values):
+        total += value
+        total_sq += value * value
+        if minimum is None or value < minimum:
+            minimum = value
+        if maximum is None or value > maximum:
+            maximum = value
+
+        if value < VERY_LOW:
+            buckets['very_low'] += 1
+        elif value < LOW:
+            buckets['low'] += 1
+        elif value <= HIGH:
+            buckets['in_range'] += 1
+        elif value <= VERY_HIGH:
+            buckets['high'] += 1
+        else:
+            buckets['very_high'] += 1
+
+        by_hour[series.hours[i]].append(value)
+        if since is not None and series.times[i] >= since:
+            chart.append({
+                'time': series.times[i],
+                'value': round(value, 1),
+                'trend': series.trends[i],
+            })
+
+    count = len(series)
+    report = {
+        'count': count,
+        'mean': None,
+        'min': None,
+        'max': None,
+        'sd': None,
+        'cv': None,
+        'gmi': None,
+        'low_count': buckets['very_low'] + buckets['low'],
+        'high_count': buckets['high'] + buckets['very_high'],
+        'buckets': buckets,
+        'time_in_range': {key: 0.0 for key in buckets},
+        'agp': [],
+        'chart': chart,
+    }
+    if not count:
+        return report
+
+    mean = total / count
+    sd = math.sqrt(max(total_sq / count - mean * mean, 0.0))
+    report.update({
+        'mean': round(mean, 1),
+        'min': round(minimum, 1),
+        'max': round(maximum, 1),
+        'sd': round(sd, 1),
+        'cv': round(sd / mean * 100, 1),
+        'gmi': round(3.31 + 0.02392 * mean, 1),
+        'time_in_range': {key: round(n / count * 100, 1) for key, n in buckets.items()},
+    })
+
+    for hour, values in enumerate(by_hour):
+        values.sort()
+        row = {'hour': hour, 'count': len(values)}
+        for p in PERCENTILES:
+            value = percentile(values, p)
+            row[f'p{p}'] = round(value, 1) if value is not None else None
+        report['agp'].append(row)
+    return report
+
+
+def glucose_report(user, days=7, now=None, tz=None) -> dict:
+    """
+    Glucose statistics for the last `days` days (capped at MAX_REPORT_DAYS).
+
+    Cached per user until readings change or CACHE_TIMEOUT passes.
+
+    Returns:
+        dict from summarize() plus days, start and end; chart holds the
+        last 24 hours with ISO timestamps
+    """
+    from apps.core.utils import get_user_timezone
+    from apps.health.models import GlucoseEntry
+
+    days = max(1, min(int(days), MAX_REPORT_DAYS))
+    version = cache.get_or_set(_version_key(user.pk), time.time_ns, None)
+    key = f'glucose_report_{user.pk}_{version}_{days}'
+    if now is None:
+        report = cache.get(key)
+        if report is not None:
+            return report
+
+    end = now or timezone.now()
+    start = end - timedelta(days=days)
+    tz = tz or get_user_timezone(user)
+    series = GlucoseSeries.load(user, start, end, tz)
+    report = summarize(series, since=(end - timedelta(hours=24)).timestamp())
+
+    for point in report['chart']:
+        point['time'] = datetime.fromtimestamp(point['time'], tz=dt_timezone.utc).isoformat()
+        point['trend_arrow'] = GlucoseEntry.TREND_ARROWS.get(point['trend'], '')
+    report.update({'days': days, 'start': start, 'end': end})
+
+    if now is None:
+        cache.set(key, report, CACHE_TIMEOUT)
+    return report
@@ -0,0 +1,120 @@
+# ==============================================================================
+# File: apps/health/services/medicine.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Today's dose plan shared by medicine views, dashboard and SMS
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Medicine Dose Plan Service
+
+Builds the list of scheduled doses for one user on one date using a fixed
+number of queries: active medicines with their active schedules prefetched,
+plus one query for that day's logs, indexed by (medicine_id, schedule_id).
+
+Used by MedicineHomeView, DashboardView, PersonalAssistant and the SMS
+scheduler so they all agree on what "today's doses" means.
+"""
+
+from django.db.models import Prefetch
+
+
+TAKEN_STATUSES = ("taken", "late")
+
+
+class DosePlan:
+    """
+    Scheduled doses for a user on a given date.
+
+    Attributes:
+        date: The date the plan was built for
+        medicines: Active medicines (including PRN), ordered by name
+        doses: List of dicts sorted by scheduled time, each with
+            medicine, schedule, log, taken, missed and skipped keys
+    """
+
+    def __init__(self, date, medicines, doses):
+        self.date = date
+        self.medicines = medicines
+        self.doses = doses
+
+    def __iter__(self):
+        return iter(self.doses)
+
+    def __len__(self):
+        return len(self.doses)
+
+    @property
+    def total(self):
+        return len(self.doses)
+
+    @property
+    def taken_count(self):
+        return sum(1 for dose in self.doses if dose["taken"])
+
+    @property
+    def pending_count(self):
+        return self.total - self.taken_count
+
+
+def build_dose_plan(user, date, with_logs=True):
+    """
+    Build the dose plan for a user on a date.
+
+    Args:
+        user: User whose medicines to plan
+        date: Date to build the plan for (user's local date)
+        with_logs: Also load that day's MedicineLog rows. Callers that only
+            need the schedule (e.g. SMS reminders) can skip this query.
+
+    Returns:
+        DosePlan
+    """
+    from apps.health.models import Medicine, MedicineLog, MedicineSchedule
+
+    medicines = list(
+        Medicine.objects.filter(
+            user=user,
+            medicine_status=Medicine.STATUS_ACTIVE,
+        ).prefetch_related(
+            Prefetch(
+                "schedules",
+                queryset=MedicineSchedule.objects.filter(is_active=True),
+                to_attr="active_schedules",
+            )
+        )
+    )
+
+    logs = {}
+    if with_logs and medicines:
+        day_logs = MedicineLog.objects.filter(
+            user=user,
+            scheduled_date=date,
+            schedule__isnull=False,
+        )
+        for log in day_logs:
+            # Keep the first log per dose, matching the old .first() lookup
+            logs.setdefault((log.medicine_id, log.schedule_id), log)
+
+    weekday = date.weekday()
+    doses = []
+    for medicine in medicines:
+        if medicine.is_prn:
+            continue
+        for schedule in medicine.active_schedules:
+            if not schedule.applies_to_day(weekday):
+                continue
+            log = logs.get((medicine.pk, schedule.pk))
+            status = log.log_status if log is not None else None
+            doses.append({
+                "medicine": medicine,
+                "schedule": schedule,
+                "log": log,
+                "taken": status in TAKEN_STATUSES,
+                "missed": status == "missed",
+                "skipped": status == "skipped",
+            })
+
+    doses.sort(key=lambda dose: dose["schedule"].scheduled_time)
+    return DosePlan(date, medicines, doses)
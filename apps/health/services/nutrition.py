@@ -0,0 +1,187 @@
+# ==============================================================================
+# File: apps/health/services/nutrition.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Daily, weekly and monthly nutrition totals from a fixed number of queries
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Nutrition Series Service
+
+Builds a per-day nutrition series for a user over a date window using two
+queries however long the window is:
+
+1. DailyNutritionSummary rows in the window
+2. One grouped FoodEntry aggregate (values('logged_date').annotate(...))
+   over the days that have no fresh summary
+
+A summary is fresh when it was recalculated after every FoodEntry for its
+day was last changed (soft deletes update updated_at, so they count as
+changes). Days with a fresh summary are read from it; all other days are
+aggregated from FoodEntry.
+
+Windows are capped at MAX_SERIES_DAYS. rollup() groups a daily series into
+weeks (starting Monday), calendar months or a single period total.
+
+Used by NutritionStatsView and UserPreferences.get_nutrition_progress (the
+dashboard nutrition tile).
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery, Sum
+
+# Longest window a series can cover
+MAX_SERIES_DAYS = 366
+
+NUTRIENTS = ('calories', 'protein', 'carbs', 'fat', 'fiber', 'sugar')
+
+# Series key -> (FoodEntry field, DailyNutritionSummary field)
+NUTRIENT_FIELDS = {
+    'calories': ('total_calories', 'total_calories'),
+    'protein': ('total_protein_g', 'total_protein_g'),
+    'carbs': ('total_carbohydrates_g', 'total_carbohydrates_g'),
+    'fat': ('total_fat_g', 'total_fat_g'),
+    'fiber': ('total_fiber_g', 'total_fiber_g'),
+    'sugar': ('total_sugar_g', 'total_sugar_g'),
+}
+
+# 'period' rolls the whole series into a single row
+PERIODS = ('day', 'week', 'month', 'period')
+
+
+def clamp_window(start, end, max_days=MAX_SERIES_DAYS):
+    """Return (start, end) with start moved forward so the window fits max_days."""
+    if start > end:
+        start = end
+    earliest = end - timedelta(days=max_days - 1)
+    return max(start, earliest), end
+
+
+def empty_day(day):
+    row = {'date': day, 'entry_count': 0}
+    row.update({key: Decimal('0') for key in NUTRIENTS})
+    return row
+
+
+def daily_series(user, start, end) -> list:
+    """
+    Nutrition totals for every day from start to end (inclusive).
+
+    Days without entries are included with zero totals and entry_count 0.
+
+    Returns:
+        List of dicts with date, entry_count and the NUTRIENTS totals
+    """
+    from apps.health.models import DailyNutritionSummary, FoodEntry
+
+    start, end = clamp_window(start, end)
+
+    summaries = DailyNutritionSummary.objects.filter(
+        user=user, status='active', summary_date__range=(start, end)
+    )
+
+    # A day is stale when it has no summary, or any entry (including
+    # soft-deleted ones) changed after the summary was recalculated
+    summary_stamp = summaries.filter(summary_date=OuterRef('logged_date')).values('last_recalculated')[:1]
+    changed_since_summary = FoodEntry.all_objects.filter(
+        user=user, logged_date=OuterRef('logged_date')
+    ).annotate(
+        stamp=Subquery(summary_stamp)
+    ).filter(Q(stamp__isnull=True) | Q(updated_at__gt=F('stamp')))
+
+    # Deleted entries are grouped too so a stale day whose entries were all
+    # deleted comes back as zero rather than falling through to its summary
+    active = Q(status='active')
+    rows = FoodEntry.all_objects.filter(
+        user=user, logged_date__range=(start, end)
+    ).filter(
+        Exists(changed_since_summary)
+    ).order_by().values('logged_date').annotate(
+        entry_count=Count('id', filter=active),
+        **{key: Sum(entry_field, filter=active) for key, (entry_field, _) in NUTRIENT_FIELDS.items()}
+    )
+
+    days = {}
+    for row in rows:
+        day = empty_day(row.pop('logged_date'))
+        day.update({key: value for key, value in row.items() if value is not None})
+        days[day['date']] = day
+
+    for summary in summaries:
+        if summary.summary_date in days:
+            continue  # Stale; aggregated above
+        day = empty_day(summary.summary_date)
+        day['entry_count'] = summary.total_entry_count
+        for key, (_, summary_field) in NUTRIENT_FIELDS.items():
+            day[key] = getattr(summary, summary_field)
+        days[summary.summary_date] = day
+
+    series = []
+    current = start
+    while current <= end:
+        series.append(days.get(current) or empty_day(current))
+        current += timedelta(days=1)
+    return series
+
+
+def day_totals(user, date) -> dict:
+    """Nutrition totals for a single day (see daily_series)."""
+    return daily_series(user, date, date)[0]
+
+
+def period_start(day, period):
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    if period == 'period':
+        return None
+    return day
+
+
+def rollup(series, period='day') -> list:
+    """
+    Group a daily series into weeks, months or one row for the whole period.
+
+    Each row has start and end (first and last day of the bucket inside the
+    series), days, days_logged, entry_count, the NUTRIENTS totals and
+    avg_<nutrient> per logged day.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown nutrition period '{period}'")
+
+    buckets = {}
+    for day in series:
+        key = period_start(day['date'], period)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = {
+                'start': day['date'], 'end': day['date'], 'days': 0, 'days_logged': 0, 'entry_count': 0,
+            }
+            bucket.update({nutrient: Decimal('0') for nutrient in NUTRIENTS})
+        bucket['end'] = day['date']
+        bucket['days'] += 1
+        bucket['entry_count'] += day['entry_count']
+        if day['entry_count']:
+            bucket['days_logged'] += 1
+        for nutrient in NUTRIENTS:
+            bucket[nutrient] += day[nutrient]
+
+    rows = list(buckets.values())
+    for row in rows:
+        for nutrient in NUTRIENTS:
+            row[f'avg_{nutrient}'] = (
+                row[nutrient] / row['days_logged'] if row['days_logged'] else Decimal('0')
+            )
+    return rows
+
+
+def nutrition_series(user, start, end, period='day') -> list:
+    """Daily series, or its weekly/monthly rollup when period is 'week' or 'month'."""
+    series = daily_series(user, start, end)
+    if period == 'day':
+        return series
+    return rollup(series, period)
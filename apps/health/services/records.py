@@ -0,0 +1,305 @@
+# ==============================================================================
+# File: apps/health/services/records.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Incremental personal record detection against per-exercise bests
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Personal Record Engine
+
+Keeps one ExerciseBest row per user and exercise (heaviest weight and the
+reps done at it, best estimated 1RM, best single-set volume). A newly saved
+set is compared against that row only, so detecting a PR does not scan
+the user's history.
+
+- record_set(): called by save_set_ajax for each saved set
+- record_session(): called when a workout is completed or logged through
+  the form; evaluates its sets and writes one PersonalRecord per exercise
+  that set a record in the session
+- refresh_bests(): recomputes bests for a few exercises after sets are
+  edited down or deleted
+- rebuild_personal_bests(): recomputes every best and is_pr flag from
+  ExerciseSet in one ordered pass (rebuild_personal_bests command)
+
+Only working sets count: weight and reps set, not a warmup, in an active
+session. The first working set of an exercise is the baseline, not a
+record. A set is a record when it beats any of the three bests.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+
+METRICS = ("weight", "1rm", "volume")
+
+# Sets updated per query when flags are rewritten
+FLAG_BATCH_SIZE = 500
+
+
+def estimated_1rm(weight, reps) -> Decimal:
+    """Brzycki estimate, matching PersonalRecord.estimated_1rm."""
+    weight = Decimal(weight)
+    if 1 < reps < 37:
+        weight = weight * 36 / (37 - reps)
+    return weight.quantize(Decimal("0.1"))
+
+
+def is_working_set(exercise_set) -> bool:
+    return bool(exercise_set.weight and exercise_set.reps and not exercise_set.is_warmup)
+
+
+def _new_best(user_id, exercise_id, set_id, weight, reps):
+    from apps.health.models import ExerciseBest
+
+    best = ExerciseBest(user_id=user_id, exercise_id=exercise_id)
+    _take(best, METRICS, set_id, weight, reps)
+    return best
+
+
+def _beats(best, weight, reps) -> list:
+    """Metrics a set of weight x reps would improve on."""
+    improved = []
+    if (weight, reps) > (best.max_weight, best.max_weight_reps):
+        improved.append("weight")
+    if estimated_1rm(weight, reps) > best.best_1rm:
+        improved.append("1rm")
+    if weight * reps > best.best_volume:
+        improved.append("volume")
+    return improved
+
+
+def _take(best, improved, set_id, weight, reps):
+    if "weight" in improved:
+        best.max_weight = weight
+        best.max_weight_reps = reps
+        best.max_weight_set_id = set_id
+    if "1rm" in improved:
+        best.best_1rm = estimated_1rm(weight, reps)
+        best.best_1rm_set_id = set_id
+    if "volume" in improved:
+        best.best_volume = weight * reps
+        best.best_volume_set_id = set_id
+
+
+def _holds(best, set_id) -> bool:
+    return set_id in (best.max_weight_set_id, best.best_1rm_set_id, best.best_volume_set_id)
+
+
+def _working_sets():
+    from apps.health.models import ExerciseSet
+
+    return ExerciseSet.objects.filter(
+        workout_exercise__session__status="active",
+        weight__gt=0,
+        reps__gt=0,
+        is_warmup=False,
+    )
+
+
+def _scan(sets):
+    """
+    One chronological pass over working sets.
+
+    Returns:
+        (bests, pr_set_ids): dict of (user_id, exercise_id) -> unsaved
+        ExerciseBest, and the ids of sets that beat the bests of their time
+    """
+    rows = sets.order_by(
+        "workout_exercise__session__date",
+        "workout_exercise__session_id",
+        "workout_exercise__order",
+        "set_number",
+        "pk",
+    ).values_list(
+        "pk", "workout_exercise__session__user_id", "workout_exercise__exercise_id", "weight", "reps"
+    )
+
+    bests = {}
+    pr_set_ids = []
+    for set_id, user_id, exercise_id, weight, reps in rows.iterator(chunk_size=2000):
+        best = bests.get((user_id, exercise_id))
+        if best is None:
+            bests[(user_id, exercise_id)] = _new_best(user_id, exercise_id, set_id, weight, reps)
+            continue
+        improved = _beats(best, weight, reps)
+        if improved:
+            _take(best, improved, set_id, weight, reps)
+            pr_set_ids.append(set_id)
+    return bests, pr_set_ids
+
+
+def refresh_bests(user, exercise_ids):
+    """Recompute bests for some of a user's exercises (user or user id) from their sets."""
+    from apps.health.models import ExerciseBest
+
+    exercise_ids = set(exercise_ids)
+    if not exercise_ids:
+        return
+    bests, _ = _scan(_working_sets().filter(
+        workout_exercise__session__user=user,
+        workout_exercise__exercise_id__in=exercise_ids,
+    ))
+    with transaction.atomic():
+        ExerciseBest.objects.filter(user=user, exercise_id__in=exercise_ids).delete()
+        ExerciseBest.objects.bulk_create(bests.values())
+
+
+def record_set(exercise_set) -> list:
+    """
+    Compare one saved set with the user's bests for its exercise.
+
+    Updates the ExerciseBest row and the set's is_pr flag. If the set held
+    a best and was edited, the exercise is recomputed instead.
+
+    Returns:
+        List of improved METRICS (empty when the set is not a record)
+    """
+    from apps.health.models import ExerciseBest
+
+    workout_exercise = exercise_set.workout_exercise
+    user_id = workout_exercise.session.user_id
+    exercise_id = workout_exercise.exercise_id
+    working = is_working_set(exercise_set)
+
+    improved = []
+    with transaction.atomic():
+        best = ExerciseBest.objects.select_for_update().filter(
+            user_id=user_id, exercise_id=exercise_id
+        ).first()
+        if best is not None and _holds(best, exercise_set.pk):
+            # It may have been edited down, so the old best no longer stands
+            refresh_bests(user_id, [exercise_id])
+            return []
+        if not working:
+            return []
+        if best is None:
+            _new_best(user_id, exercise_id, exercise_set.pk,
+                      exercise_set.weight, exercise_set.reps).save()
+            return []
+
+        improved = _beats(best, exercise_set.weight, exercise_set.reps)
+        if improved:
+            _take(best, improved, exercise_set.pk, exercise_set.weight, exercise_set.reps)
+            best.save()
+
+    if improved and not exercise_set.is_pr:
+        exercise_set.is_pr = True
+        exercise_set.save(update_fields=["is_pr"])
+    return improved
+
+
+def record_session(session) -> list:
+    """
+    Evaluate a session's sets and write PersonalRecord rows for its records.
+
+    Sets already recorded by record_set are not records twice, but their
+    is_pr flag still produces the session's PersonalRecord. One
+    PersonalRecord per exercise per session (the record set with the best
+    estimated 1RM) is created or updated.
+
+    Returns:
+        List of PersonalRecord for the session
+    """
+    from apps.health.models import ExerciseBest, ExerciseSet, PersonalRecord
+
+    sets = list(ExerciseSet.objects.filter(
+        workout_exercise__session=session
+    ).select_related("workout_exercise").order_by("workout_exercise__order", "set_number", "pk"))
+    working = [s for s in sets if is_working_set(s)]
+    if not working:
+        return []
+
+    exercise_ids = {s.workout_exercise.exercise_id for s in working}
+    with transaction.atomic():
+        bests = {
+            best.exercise_id: best
+            for best in ExerciseBest.objects.select_for_update().filter(
+                user_id=session.user_id, exercise_id__in=exercise_ids
+            )
+        }
+        created, changed, flagged = [], set(), []
+        for exercise_set in working:
+            exercise_id = exercise_set.workout_exercise.exercise_id
+            best = bests.get(exercise_id)
+            if best is None:
+                best = bests[exercise_id] = _new_best(
+                    session.user_id, exercise_id, exercise_set.pk, exercise_set.weight, exercise_set.reps
+                )
+                created.append(best)
+                continue
+            improved = _beats(best, exercise_set.weight, exercise_set.reps)
+            if improved:
+                _take(best, improved, exercise_set.pk, exercise_set.weight, exercise_set.reps)
+                changed.add(exercise_id)
+                if not exercise_set.is_pr:
+                    exercise_set.is_pr = True
+                    flagged.append(exercise_set.pk)
+
+        ExerciseBest.objects.bulk_create(created)
+        for exercise_id in changed:
+            if bests[exercise_id].pk:
+                bests[exercise_id].save()
+        if flagged:
+            ExerciseSet.objects.filter(pk__in=flagged).update(is_pr=True)
+
+        top_sets = {}
+        for exercise_set in working:
+            if not exercise_set.is_pr:
+                continue
+            exercise_id = exercise_set.workout_exercise.exercise_id
+            current = top_sets.get(exercise_id)
+            if current is None or (
+                estimated_1rm(exercise_set.weight, exercise_set.reps)
+                > estimated_1rm(current.weight, current.reps)
+            ):
+                top_sets[exercise_id] = exercise_set
+
+        records = []
+        for exercise_id, exercise_set in top_sets.items():
+            record, _ = PersonalRecord.objects.update_or_create(
+                user_id=session.user_id,
+                exercise_id=exercise_id,
+                workout_session=session,
+                defaults={
+                    "weight": exercise_set.weight,
+                    "reps": exercise_set.reps,
+                    "achieved_date": session.date,
+                },
+            )
+            records.append(record)
+    return records
+
+
+def rebuild_personal_bests(user=None) -> int:
+    """
+    Recompute bests and is_pr flags from ExerciseSet in one ordered pass.
+
+    PersonalRecord rows are left as they are.
+
+    Args:
+        user: Limit the rebuild to one user (default: everyone)
+
+    Returns:
+        Number of ExerciseBest rows written
+    """
+    from apps.health.models import ExerciseBest, ExerciseSet
+
+    sets = _working_sets()
+    all_sets = ExerciseSet.objects.all()
+    existing = ExerciseBest.objects.all()
+    if user is not None:
+        sets = sets.filter(workout_exercise__session__user=user)
+        all_sets = all_sets.filter(workout_exercise__session__user=user)
+        existing = existing.filter(user=user)
+
+    bests, pr_set_ids = _scan(sets)
+
+    with transaction.atomic():
+        existing.delete()
+        ExerciseBest.objects.bulk_create(bests.values(), batch_size=500)
+        all_sets.filter(is_pr=True).update(is_pr=False)
+        for i in range(0, len(pr_set_ids), FLAG_BATCH_SIZE):
+            ExerciseSet.objects.filter(pk__in=pr_set_ids[i:i + FLAG_BATCH_SIZE]).update(is_pr=True)
+    return len(bests)
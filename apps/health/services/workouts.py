@@ -0,0 +1,190 @@
+# ==============================================================================
+# File: apps/health/services/workouts.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Workout volume and exercise progress computed in the database
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Workout Analytics Service
+
+Volume, best sets and estimated one-rep maxes are aggregated by the
+database with one annotated query each, instead of walking every session,
+exercise and set in Python:
+
+- workout_stats(): session count and total resistance volume for a window
+- volume_series(): volume and set count per session
+- exercise_progress(): per-session best set, estimated 1RM and volume for
+  one exercise
+
+Only working sets with both weight and reps count. Results are cached per
+user; invalidate_workout_analytics() is called whenever sets or sessions
+change (save_set_ajax, complete_workout_ajax and the workout form views).
+
+Used by ProgressView.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db.models import Case, Count, F, FloatField, Max, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Cast
+
+CACHE_TIMEOUT = 60 * 60  # 1 hour; changes invalidate explicitly
+
+# weight x reps for one set
+SET_VOLUME = F('weight') * F('reps')
+
+# Brzycki estimate, matching PersonalRecord.estimated_1rm. Above 36 reps the
+# formula breaks down, so the weight itself is used.
+ESTIMATED_1RM = Case(
+    When(reps__gt=1, reps__lt=37, then=(
+        Cast('weight', FloatField()) * Value(36.0) / Cast(Value(37) - F('reps'), FloatField())
+    )),
+    default=Cast('weight', FloatField()),
+    output_field=FloatField(),
+)
+
+
+def _version_key(user_id):
+    return f'workout_analytics_version_{user_id}'
+
+
+def _cache_key(user_id, name):
+    # The version changes on every invalidation, so old entries are never read
+    version = cache.get_or_set(_version_key(user_id), time.time_ns, None)
+    return f'workout_analytics_{user_id}_{version}_{name}'
+
+
+def invalidate_workout_analytics(user):
+    """Drop every cached workout figure for a user."""
+    cache.set(_version_key(user.pk), time.time_ns(), None)
+
+
+def _cached(user, name, compute):
+    key = _cache_key(user.pk, name)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, CACHE_TIMEOUT)
+    return result
+
+
+def working_sets(user):
+    """Sets with weight and reps from the user's active sessions."""
+    from apps.health.models import ExerciseSet
+
+    return ExerciseSet.objects.filter(
+        workout_exercise__session__user=user,
+        workout_exercise__session__status='active',
+        weight__gt=0,
+        reps__gt=0,
+    )
+
+
+def workout_stats(user, start, end) -> dict:
+    """
+    Session count and resistance volume for a date window (one query, cached).
+
+    Returns:
+        dict with workouts and total_volume
+    """
+    from apps.health.models import WorkoutSession
+
+    def compute():
+        in_volume = Q(
+            workout_exercises__exercise__category='resistance',
+            workout_exercises__sets__weight__gt=0,
+            workout_exercises__sets__reps__gt=0,
+        )
+        totals = WorkoutSession.objects.filter(
+            user=user, date__gte=start, date__lte=end
+        ).aggregate(
+            workouts=Count('id', distinct=True),
+            total_volume=Sum(
+                F('workout_exercises__sets__weight') * F('workout_exercises__sets__reps'),
+                filter=in_volume,
+                output_field=FloatField(),
+            ),
+        )
+        return {
+            'workouts': totals['workouts'],
+            'total_volume': float(totals['total_volume'] or 0),
+        }
+
+    return _cached(user, f'stats_{start}_{end}', compute)
+
+
+def volume_series(user, start, end) -> list:
+    """
+    Resistance volume per session in a date window, oldest first (one query, cached).
+
+    Returns:
+        List of dicts with date, session_id, volume and sets
+    """
+    def compute():
+        rows = working_sets(user).filter(
+            workout_exercise__exercise__category='resistance',
+            workout_exercise__session__date__gte=start,
+            workout_exercise__session__date__lte=end,
+        ).order_by().values(
+            'workout_exercise__session_id', 'workout_exercise__session__date'
+        ).annotate(
+            volume=Sum(SET_VOLUME, output_field=FloatField()),
+            sets=Count('id'),
+        ).order_by('workout_exercise__session__date', 'workout_exercise__session_id')
+
+        return [
+            {
+                'date': row['workout_exercise__session__date'],
+                'session_id': row['workout_exercise__session_id'],
+                'volume': float(row['volume']),
+                'sets': row['sets'],
+            }
+            for row in rows
+        ]
+
+    return _cached(user, f'volume_{start}_{end}', compute)
+
+
+def exercise_progress(user, exercise) -> list:
+    """
+    Best set, estimated 1RM and volume for each session of one exercise.
+
+    The best set is the heaviest, then most reps. One query, cached.
+
+    Returns:
+        List of dicts with date (ISO string), weight, reps, estimated_1rm,
+        volume and sets, newest first
+    """
+    def compute():
+        best_reps = working_sets(user).filter(
+            workout_exercise_id=OuterRef('workout_exercise_id'),
+        ).order_by('-weight', '-reps').values('reps')[:1]
+
+        rows = working_sets(user).filter(
+            workout_exercise__exercise=exercise,
+        ).order_by().values(
+            'workout_exercise_id', 'workout_exercise__session__date'
+        ).annotate(
+            best_weight=Max('weight'),
+            best_reps=Subquery(best_reps),
+            estimated_1rm=Max(ESTIMATED_1RM),
+            volume=Sum(SET_VOLUME, output_field=FloatField()),
+            sets=Count('id'),
+        ).order_by('-workout_exercise__session__date', '-workout_exercise_id')
+
+        return [
+            {
+                'date': row['workout_exercise__session__date'].isoformat(),
+                'weight': float(row['best_weight']),
+                'reps': row['best_reps'],
+                'estimated_1rm': round(row['estimated_1rm'], 1),
+                'volume': float(row['volume']),
+                'sets': row['sets'],
+            }
+            for row in rows
+        ]
+
+    return _cached(user, f'progress_{exercise.pk}', compute)
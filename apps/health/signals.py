@@ -0,0 +1,26 @@
+# ==============================================================================
+# File: apps/health/signals.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Drop cached glucose reports when readings change
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Health Signals - Glucose report cache invalidation.
+
+Saving or deleting a GlucoseEntry drops the owner's cached glucose
+reports. Dexcom bulk sync bypasses signals and invalidates explicitly.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import GlucoseEntry
+from .services.glucose import invalidate_glucose_analytics
+
+
+@receiver(post_save, sender=GlucoseEntry)
+@receiver(post_delete, sender=GlucoseEntry)
+def glucose_entry_changed(sender, instance, **kwargs):
+    invalidate_glucose_analytics(instance.user_id)
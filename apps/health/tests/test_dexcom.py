@@ -0,0 +1,130 @@
+# ==============================================================================
+# File: test_dexcom.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for Dexcom glucose sync (windowed fetch, bulk upsert, watermark)
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for DexcomSyncService.
+
+Tests cover:
+- Readings are created and updated in bulk with a bounded query count
+- Long ranges are requested as sequential windows
+- Repeat syncs start at the last synced reading
+- A failed window keeps the windows already stored
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.health.models import DexcomCredential, GlucoseEntry
+from apps.health.services.dexcom import DexcomService, DexcomSyncService
+
+User = get_user_model()
+
+
+def egv(n, start, value=120):
+    """A Dexcom EGV record n readings (5 minutes apart) after start."""
+    at = start + timedelta(minutes=5 * n)
+    return {
+        'recordId': f'rec-{n}',
+        'systemTime': at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'displayTime': at.isoformat(),
+        'value': value,
+        'trend': 'flat',
+        'trendRate': 0.5,
+        'displayDevice': 'iOS',
+    }
+
+
+class DexcomSyncTest(TestCase):
+    """Tests for DexcomSyncService.sync_from_dexcom."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='test@example.com', password='testpass123')
+        self.credential = DexcomCredential.objects.create(
+            user=self.user,
+            access_token='token',
+            token_expiry=timezone.now() + timedelta(hours=1),
+        )
+        self.service = DexcomSyncService(self.user)
+        self.start = timezone.now().replace(microsecond=0) - timedelta(days=7)
+
+    def sync(self, side_effect, **kwargs):
+        with patch.object(DexcomService, 'get_glucose_readings', side_effect=side_effect) as fetch:
+            result = self.service.sync_from_dexcom(**kwargs)
+        return result, fetch
+
+    def test_bulk_create_then_update(self):
+        """A week of readings is written with a bounded number of queries."""
+        records = [egv(n, self.start) for n in range(2000)]
+
+        with CaptureQueriesContext(connection) as queries:
+            (created, updated, error), _ = self.sync([records], days=7)
+
+        self.assertEqual((created, updated, error), (2000, 0, None))
+        # Was two queries per reading; SQLite caps rows per INSERT, so allow a few dozen
+        self.assertLess(len(queries.captured_queries), 60)
+        self.assertEqual(GlucoseEntry.objects.filter(user=self.user, source='dexcom').count(), 2000)
+
+        changed = [egv(n, self.start, value=140) for n in range(2000)]
+        (created, updated, error), _ = self.sync([changed], days=7, full=True)
+
+        self.assertEqual((created, updated), (0, 2000))
+        self.assertFalse(GlucoseEntry.objects.exclude(value=140).exists())
+
+    def test_long_range_fetched_in_windows(self):
+        """A 20-day sync makes three sequential requests covering the range."""
+        (_, _, error), fetch = self.sync(lambda token, start, end: [], days=20)
+
+        self.assertIsNone(error)
+        windows = [call.args[1:] for call in fetch.call_args_list]
+        self.assertEqual([end - start for start, end in windows],
+                         [timedelta(days=7), timedelta(days=7), timedelta(days=6)])
+        self.assertEqual(windows[0][1], windows[1][0])
+
+    def test_watermark_limits_repeat_syncs(self):
+        """The next sync starts at the newest stored reading."""
+        records = [egv(n, self.start) for n in range(10)]
+        self.sync([records], days=7)
+
+        self.credential.refresh_from_db()
+        self.assertEqual(self.credential.last_reading_at, self.start + timedelta(minutes=45))
+
+        (_, _, _), fetch = self.sync([[records[-1], egv(10, self.start)]], days=7)
+
+        self.assertEqual(fetch.call_args.args[1], self.start + timedelta(minutes=45))
+        self.assertEqual(GlucoseEntry.objects.filter(user=self.user).count(), 11)
+
+    def test_failed_window_keeps_earlier_windows(self):
+        """Readings from completed windows are kept when a later one fails."""
+        first = [egv(n, self.start) for n in range(3)]
+
+        (created, _, error), _ = self.sync([first, ValueError('Dexcom down')], days=14)
+
+        self.assertEqual(created, 3)
+        self.assertEqual(error, 'Dexcom down')
+        self.credential.refresh_from_db()
+        self.assertEqual(self.credential.last_sync_status, 'error')
+        self.assertIsNotNone(self.credential.last_reading_at)
+
+    def test_deleted_readings_not_recreated(self):
+        """A reading the user deleted is updated in place, not duplicated."""
+        records = [egv(0, self.start)]
+        self.sync([records], days=7)
+        GlucoseEntry.objects.get(dexcom_record_id='rec-0').soft_delete()
+
+        (created, updated, _), _ = self.sync([records], days=7, full=True)
+
+        self.assertEqual((created, updated), (0, 1))
+        self.assertEqual(GlucoseEntry.all_objects.filter(dexcom_record_id='rec-0').count(), 1)
+        self.assertFalse(GlucoseEntry.objects.filter(dexcom_record_id='rec-0').exists())
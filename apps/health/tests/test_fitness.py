@@ -4,7 +4,7 @@
 # Description: Comprehensive tests for fitness CRUD functionality (workouts & templates)
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-29
-# Last Updated: 2025-12-29
+# Last Updated: 2026-10-16 - Added workout analytics and PR engine tests
 # ==============================================================================
 
 """
@@ -24,13 +24,19 @@ Location: apps/health/tests/test_fitness.py
 
 from datetime import date, timedelta
 from decimal import Decimal
-from django.test import TestCase, Client
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from apps.health.models import (
     Exercise,
+    ExerciseBest,
     WorkoutSession,
     WorkoutExercise,
     ExerciseSet,
@@ -1067,3 +1073,279 @@ class LiveWorkoutAjaxTest(FitnessTestMixin, TestCase):
                     content_type='application/json'
                 )
             self.assertEqual(response.status_code, 401, f"{url_name} should require auth")
+
+
+# =============================================================================
+# 12. WORKOUT ANALYTICS
+# =============================================================================
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class WorkoutAnalyticsTest(FitnessTestMixin, TestCase):
+    """Tests for database-side volume and progress series."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = self.create_user()
+        self.login_user()
+        self.bench = self.create_exercise()
+        self.today = date.today()
+
+    def log_sets(self, exercise, days_ago, sets):
+        workout = self.create_workout(self.user, workout_date=self.today - timedelta(days=days_ago))
+        workout_exercise = WorkoutExercise.objects.create(session=workout, exercise=exercise)
+        for number, (weight, reps) in enumerate(sets, start=1):
+            ExerciseSet.objects.create(
+                workout_exercise=workout_exercise,
+                set_number=number,
+                weight=Decimal(weight) if weight is not None else None,
+                reps=reps,
+            )
+        return workout
+
+    def test_workout_stats_and_volume_series(self):
+        """Count and volume come from single aggregate queries."""
+        from apps.health.services.workouts import volume_series, workout_stats
+
+        run = self.create_exercise(name='Run', category='cardio')
+        first = self.log_sets(self.bench, 2, [('100', 10), ('100', 8), (None, 12)])
+        self.log_sets(self.bench, 1, [('135', 5)])
+        self.log_sets(run, 1, [])
+        self.log_sets(self.bench, 40, [('95', 10)])  # Outside the window
+        self.log_sets(self.bench, 0, [('500', 1)]).soft_delete()
+
+        start = self.today - timedelta(days=30)
+        with self.assertNumQueries(1):
+            stats = workout_stats(self.user, start, self.today)
+        with self.assertNumQueries(1):
+            series = volume_series(self.user, start, self.today)
+
+        self.assertEqual(stats, {'workouts': 3, 'total_volume': 2475.0})
+        self.assertEqual([(row['session_id'], row['volume'], row['sets']) for row in series][0],
+                         (first.pk, 1800.0, 2))
+        self.assertEqual([row['volume'] for row in series], [1800.0, 675.0])
+        self.assertEqual(first.total_volume, 1800.0)
+
+    def test_exercise_progress_best_set_and_1rm(self):
+        """Each session reports its heaviest set, estimated 1RM and volume."""
+        from apps.health.services.workouts import exercise_progress
+
+        self.log_sets(self.bench, 7, [('100', 10), ('135', 5), ('135', 3)])
+        self.log_sets(self.bench, 0, [('185', 1), ('155', 8)])
+
+        with self.assertNumQueries(1):
+            progress = exercise_progress(self.user, self.bench)
+
+        latest, earlier = progress
+        self.assertEqual((latest['weight'], latest['reps'], latest['sets']), (185.0, 1, 2))
+        self.assertEqual(latest['estimated_1rm'], 192.4)  # 155 x 8 beats a 185 single
+        self.assertEqual(latest['volume'], 1425.0)
+        self.assertEqual((earlier['weight'], earlier['reps']), (135.0, 5))
+        self.assertEqual(earlier['estimated_1rm'], 151.9)
+        self.assertEqual(earlier['date'], (self.today - timedelta(days=7)).isoformat())
+
+    def test_progress_page_queries_do_not_grow_with_history(self):
+        """Years of sessions cost the same queries as one."""
+        url = reverse('health:fitness_progress') + f'?exercise={self.bench.pk}'
+        self.log_sets(self.bench, 0, [('100', 10)])
+        self.client.get(url)  # Warm up session and per-user lookups
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for days_ago in range(1, 200, 3):
+            self.log_sets(self.bench, days_ago, [('100', 10), ('105', 8), ('110', 6)])
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+        self.assertEqual(len(response.context['progress_data']), 68)
+        self.assertEqual(response.context['workouts_30d'], 11)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_results_cached_until_sets_change(self):
+        """save_set_ajax and complete_workout_ajax invalidate cached figures."""
+        from apps.health.services.workouts import exercise_progress
+
+        cache.clear()
+        workout = self.log_sets(self.bench, 0, [('100', 10)])
+        self.assertEqual(exercise_progress(self.user, self.bench)[0]['weight'], 100.0)
+
+        ExerciseSet.objects.filter(workout_exercise__session=workout).update(weight=Decimal('120'))
+        with self.assertNumQueries(0):
+            self.assertEqual(exercise_progress(self.user, self.bench)[0]['weight'], 100.0)
+
+        self.client.post(
+            reverse('health:save_set_ajax'),
+            data=json.dumps({
+                'workout_id': workout.pk, 'exercise_id': self.bench.pk,
+                'set_number': 2, 'weight': 130, 'reps': 5,
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(exercise_progress(self.user, self.bench)[0]['weight'], 130.0)
+
+        ExerciseSet.objects.filter(set_number=2).update(weight=Decimal('140'))
+        self.client.post(
+            reverse('health:complete_workout_ajax'),
+            data=json.dumps({'workout_id': workout.pk}),
+            content_type='application/json',
+        )
+        self.assertEqual(exercise_progress(self.user, self.bench)[0]['weight'], 140.0)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_start_workout_invalidates_cached_stats(self):
+        """A workout started live is counted straight away."""
+        from apps.health.services.workouts import workout_stats
+
+        cache.clear()
+        start = self.today - timedelta(days=30)
+        self.assertEqual(workout_stats(self.user, start, self.today)['workouts'], 0)
+
+        self.client.post(
+            reverse('health:start_workout_ajax'),
+            data=json.dumps({}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(workout_stats(self.user, start, self.today)['workouts'], 1)
+
+
+# =============================================================================
+# 13. PERSONAL RECORD ENGINE
+# =============================================================================
+
+class PersonalRecordEngineTest(FitnessTestMixin, TestCase):
+    """Tests for incremental PR detection against ExerciseBest."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = self.create_user()
+        self.login_user()
+        self.bench = self.create_exercise()
+        self.workout = self.create_workout(self.user, started_at=timezone.now())
+
+    def save_set(self, set_number, weight, reps, workout=None):
+        response = self.client.post(
+            reverse('health:save_set_ajax'),
+            data=json.dumps({
+                'workout_id': (workout or self.workout).pk, 'exercise_id': self.bench.pk,
+                'set_number': set_number, 'weight': weight, 'reps': reps,
+            }),
+            content_type='application/json',
+        )
+        return response.json()
+
+    def best(self):
+        return ExerciseBest.objects.get(user=self.user, exercise=self.bench)
+
+    def test_first_set_is_baseline_and_later_sets_compare(self):
+        """Sets are compared against the stored bests as they are saved."""
+        self.assertFalse(self.save_set(1, 100, 10)['is_pr'])
+        self.assertEqual(self.save_set(2, 100, 8)['records'], [])
+        self.assertEqual(self.save_set(3, 100, 12)['records'], ['weight', '1rm', 'volume'])
+        self.assertEqual(self.save_set(4, 150, 1)['records'], ['weight', '1rm'])
+
+        best = self.best()
+        self.assertEqual((best.max_weight, best.max_weight_reps), (Decimal('150.0'), 1))
+        self.assertEqual(best.best_1rm, Decimal('150.0'))
+        self.assertEqual(best.best_volume, Decimal('1200.0'))
+        self.assertEqual(
+            list(ExerciseSet.objects.filter(is_pr=True).values_list('set_number', flat=True)),
+            [3, 4],
+        )
+
+    def test_new_set_compared_without_scanning_history(self):
+        """Query count for saving a set does not depend on history."""
+        for days_ago in range(1, 40):
+            workout = self.create_workout(self.user, workout_date=date.today() - timedelta(days=days_ago))
+            self.save_set(1, 100 + days_ago, 5, workout=workout)
+        self.save_set(1, 90, 5)
+
+        from apps.health.services.records import record_set
+        exercise_set = ExerciseSet.objects.select_related(
+            'workout_exercise__session'
+        ).get(workout_exercise__session=self.workout, set_number=1)
+        exercise_set.weight = Decimal('95')
+        exercise_set.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(record_set(exercise_set), [])
+
+        selects = [q for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+
+    def test_editing_best_set_down_recomputes(self):
+        """Lowering the set that holds a best restores the previous best."""
+        self.save_set(1, 100, 5)
+        self.save_set(2, 200, 5)
+        self.save_set(2, 120, 5)
+
+        self.assertEqual(self.best().max_weight, Decimal('120.0'))
+
+    def test_complete_workout_writes_personal_record(self):
+        """Completing a workout records one PersonalRecord per exercise."""
+        earlier = self.create_workout(self.user, workout_date=date.today() - timedelta(days=7))
+        self.save_set(1, 100, 5, workout=earlier)
+        self.save_set(1, 110, 5)
+        self.save_set(2, 105, 8)
+
+        response = self.client.post(
+            reverse('health:complete_workout_ajax'),
+            data=json.dumps({'workout_id': self.workout.pk}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.json()['personal_records'], 1)
+        record = PersonalRecord.objects.get(user=self.user, workout_session=self.workout)
+        self.assertEqual((record.weight, record.reps), (Decimal('105.0'), 8))
+
+    def test_form_logged_workout_records(self):
+        """Workouts logged through the form are evaluated in one pass."""
+        self.save_set(1, 100, 5)
+
+        self.client.post(reverse('health:workout_create'), {
+            'date': date.today().isoformat(),
+            'exercise_id': [self.bench.pk],
+            f'exercise_{self.bench.pk}_set_1_weight': '90',
+            f'exercise_{self.bench.pk}_set_1_reps': '5',
+            f'exercise_{self.bench.pk}_set_2_weight': '120',
+            f'exercise_{self.bench.pk}_set_2_reps': '3',
+        })
+
+        self.assertEqual(self.best().max_weight, Decimal('120.0'))
+        self.assertEqual(PersonalRecord.objects.filter(user=self.user).count(), 1)
+
+    def test_deleting_workout_refreshes_bests(self):
+        """Soft-deleting the workout that holds a best drops it."""
+        earlier = self.create_workout(self.user, workout_date=date.today() - timedelta(days=7))
+        self.save_set(1, 100, 5, workout=earlier)
+        self.save_set(1, 150, 5)
+
+        self.client.post(reverse('health:workout_delete', kwargs={'pk': self.workout.pk}))
+
+        self.assertEqual(self.best().max_weight, Decimal('100.0'))
+
+    def test_rebuild_matches_incremental_and_command(self):
+        """The rebuild command recomputes bests and flags in one pass."""
+        earlier = self.create_workout(self.user, workout_date=date.today() - timedelta(days=7))
+        self.save_set(1, 100, 5, workout=earlier)
+        self.save_set(1, 110, 5)
+        self.save_set(2, 50, 5)
+        ExerciseSet.objects.filter(set_number=2).update(is_warmup=True)
+        before = self.best()
+        ExerciseBest.objects.all().delete()
+        ExerciseSet.objects.update(is_pr=False)
+
+        out = StringIO()
+        call_command('rebuild_personal_bests', '--user=test@example.com', stdout=out)
+
+        self.assertIn('Rebuilt 1 exercise best(s)', out.getvalue())
+        after = self.best()
+        self.assertEqual(
+            (after.max_weight, after.best_1rm, after.best_volume, after.max_weight_set_id),
+            (before.max_weight, before.best_1rm, before.best_volume, before.max_weight_set_id),
+        )
+        self.assertEqual(ExerciseSet.objects.filter(is_pr=True).count(), 1)
@@ -0,0 +1,126 @@
+# ==============================================================================
+# File: test_glucose.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for glucose analytics (time in range, GMI, CV, AGP)
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+
+"""
+Tests for the glucose analytics service and dashboard.
+
+Tests cover:
+- Time in range buckets, mean, GMI and CV
+- Hourly AGP percentile bands
+- One query per report, cached until readings change
+- Dashboard window selection
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.health.models import GlucoseEntry
+from apps.health.services.glucose import glucose_report, percentile
+
+User = get_user_model()
+
+UTC = dt_timezone.utc
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class GlucoseReportTest(TestCase):
+    """Tests for glucose_report."""
+
+    def setUp(self):
+        from apps.users.models import TermsAcceptance
+
+        self.user = User.objects.create_user(email='test@example.com', password='testpass123')
+        TermsAcceptance.objects.create(user=self.user, terms_version='1.0')
+        self.user.preferences.has_completed_onboarding = True
+        self.user.preferences.save()
+
+    def add(self, value, at, unit='mg/dL'):
+        return GlucoseEntry.objects.create(
+            user=self.user, value=Decimal(str(value)), unit=unit, recorded_at=at, context='cgm'
+        )
+
+    def test_statistics_and_time_in_range(self):
+        """Buckets, mean, GMI and CV come from one query."""
+        for i, value in enumerate([50, 60, 100, 150, 200, 300]):
+            self.add(value, NOW - timedelta(hours=i + 1))
+        self.add(Decimal('5.5'), NOW - timedelta(hours=8), unit='mmol/L')  # 99.1 mg/dL
+        self.add(400, NOW - timedelta(days=8))  # Outside the window
+
+        with self.assertNumQueries(1):
+            report = glucose_report(self.user, days=7, now=NOW, tz=UTC)
+
+        self.assertEqual(report['count'], 7)
+        self.assertEqual(report['buckets'],
+                         {'very_low': 1, 'low': 1, 'in_range': 3, 'high': 1, 'very_high': 1})
+        self.assertEqual(report['time_in_range']['in_range'], 42.9)
+        self.assertEqual((report['low_count'], report['high_count']), (2, 2))
+        self.assertEqual(report['mean'], 137.0)
+        self.assertEqual(report['gmi'], round(3.31 + 0.02392 * 137.0, 1))
+        self.assertEqual((report['min'], report['max']), (50.0, 300.0))
+        self.assertAlmostEqual(report['cv'], 59.8, delta=0.1)
+        self.assertEqual(len(report['chart']), 7)
+
+    def test_agp_percentiles_by_hour(self):
+        """Each hour of day gets 5/25/50/75/95th percentile bands."""
+        for day in range(5):
+            self.add(100 + day * 10, NOW - timedelta(days=day, hours=4))  # 08:00 UTC
+
+        report = glucose_report(self.user, days=7, now=NOW, tz=UTC)
+
+        eight = report['agp'][8]
+        self.assertEqual(eight['count'], 5)
+        self.assertEqual((eight['p5'], eight['p50'], eight['p95']), (102.0, 120.0, 138.0))
+        self.assertEqual((eight['p25'], eight['p75']), (110.0, 130.0))
+        self.assertIsNone(report['agp'][9]['p50'])
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+
+    def test_empty_report(self):
+        report = glucose_report(self.user, days=7, now=NOW, tz=UTC)
+
+        self.assertEqual(report['count'], 0)
+        self.assertIsNone(report['gmi'])
+        self.assertEqual(report['agp'], [])
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_cached_until_readings_change(self):
+        """A saved reading drops the cached report."""
+        cache.clear()
+        self.add(100, timezone.now() - timedelta(hours=1))
+        glucose_report(self.user, days=7)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(glucose_report(self.user, days=7)['count'], 1)
+
+        self.add(120, timezone.now() - timedelta(minutes=5))
+        self.assertEqual(glucose_report(self.user, days=7)['count'], 2)
+
+    def test_dashboard_window(self):
+        """The dashboard reports the selected window; unknown windows fall back to 7 days."""
+        self.add(100, timezone.now() - timedelta(days=20))
+        self.add(150, timezone.now() - timedelta(hours=1))
+        client = Client()
+        client.force_login(self.user)
+
+        response = client.get(reverse('health:glucose_dashboard') + '?days=30')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['report']['count'], 2)
+        self.assertEqual(response.context['glucose_count'], 2)
+        self.assertEqual(response.context['avg_glucose'], 125.0)
+
+        response = client.get(reverse('health:glucose_dashboard') + '?days=1000')
+        self.assertEqual(response.context['report_days'], 7)
+        self.assertEqual(response.context['glucose_count'], 1)
+        self.assertEqual(response.context['latest_reading'].value, Decimal('150.0'))
@@ -16,7 +16,9 @@ Location: apps/health/tests/test_medicine.py
 
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -1445,3 +1447,148 @@ class MedicineLogEditTest(MedicineTestMixin, TestCase):
 
         response = self.client.get(reverse('health:medicine_home'))
         self.assertContains(response, f'/health/medicine/log/{log.pk}/edit/')
+
+
+# =============================================================================
+# DOSE PLAN SERVICE TESTS
+# =============================================================================
+
+class DosePlanServiceTest(MedicineTestMixin, TestCase):
+    """Tests for the shared today's-dose-plan service."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.today = timezone.now().date()
+
+    def test_plan_matches_logs_to_doses(self):
+        """Each scheduled dose is paired with its log for the day."""
+        from apps.health.services.medicine import build_dose_plan
+
+        medicine = self.create_medicine(self.user, name='Morning Med')
+        morning = self.create_schedule(medicine, scheduled_time=time(8, 0))
+        self.create_schedule(medicine, scheduled_time=time(20, 0))
+        self.create_log(self.user, medicine, morning)
+
+        plan = build_dose_plan(self.user, self.today)
+
+        self.assertEqual(plan.total, 2)
+        self.assertEqual(plan.taken_count, 1)
+        self.assertEqual(plan.pending_count, 1)
+        self.assertTrue(plan.doses[0]['taken'])
+        self.assertIsNone(plan.doses[1]['log'])
+
+    def test_plan_skips_prn_inactive_and_other_days(self):
+        """PRN medicines, inactive schedules and other weekdays are excluded."""
+        from apps.health.services.medicine import build_dose_plan
+
+        prn = self.create_medicine(self.user, name='As Needed', is_prn=True)
+        self.create_schedule(prn)
+        medicine = self.create_medicine(self.user, name='Daily')
+        self.create_schedule(medicine, is_active=False)
+        other_day = str((self.today.weekday() + 1) % 7)
+        self.create_schedule(medicine, days_of_week=other_day)
+
+        plan = build_dose_plan(self.user, self.today)
+
+        self.assertEqual(plan.total, 0)
+        self.assertEqual(len(plan.medicines), 2)
+
+    def test_plan_query_count_is_constant(self):
+        """Query count does not grow with the number of medicines."""
+        from apps.health.services.medicine import build_dose_plan
+
+        for i in range(10):
+            medicine = self.create_medicine(self.user, name=f'Med {i}')
+            self.create_schedule(medicine, scheduled_time=time(8, 0))
+            self.create_schedule(medicine, scheduled_time=time(20, 0))
+
+        with self.assertNumQueries(3):
+            plan = build_dose_plan(self.user, self.today)
+
+        self.assertEqual(plan.total, 20)
+
+
+# =============================================================================
+# ADHERENCE REPORT SERVICE TESTS
+# =============================================================================
+
+class AdherenceReportServiceTest(MedicineTestMixin, TestCase):
+    """Tests for the grouped adherence analytics service."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = self.create_user()
+        self.login_user()
+        self.today = timezone.now().date()
+
+    def log(self, medicine, days_ago, status, **kwargs):
+        return MedicineLog.objects.create(
+            user=self.user,
+            medicine=medicine,
+            scheduled_date=self.today - timedelta(days=days_ago),
+            scheduled_time=time(8, 0),
+            log_status=status,
+            **kwargs
+        )
+
+    def test_report_counts(self):
+        """Overall, per-medicine and per-day counts come from the same rows."""
+        from apps.health.services.adherence import build_adherence_report
+
+        good = self.create_medicine(self.user, name='Good')
+        poor = self.create_medicine(self.user, name='Poor')
+        self.log(good, 0, MedicineLog.STATUS_TAKEN)
+        self.log(good, 1, MedicineLog.STATUS_LATE)
+        self.log(poor, 0, MedicineLog.STATUS_MISSED)
+        self.log(poor, 1, MedicineLog.STATUS_SKIPPED)
+        self.log(poor, 1, MedicineLog.STATUS_TAKEN, is_prn_dose=True)  # Not counted
+        self.log(good, 30, MedicineLog.STATUS_MISSED)  # Outside the window
+
+        with self.assertNumQueries(2):
+            report = build_adherence_report(self.user, self.today - timedelta(days=7), self.today)
+
+        overall = report.overall
+        self.assertEqual((overall.total, overall.taken, overall.missed, overall.skipped, overall.late),
+                         (4, 2, 1, 1, 1))
+        self.assertEqual(overall.rate, 50)
+        self.assertEqual(overall.resolved_rate, 67)
+        self.assertEqual([(m.name, c.rate) for m, c in report.by_medicine], [('Poor', 0), ('Good', 100)])
+
+        daily = report.daily()
+        self.assertEqual(len(daily), 8)
+        self.assertEqual(daily[-1][0], self.today)
+        self.assertEqual((daily[-1][1].total, daily[-1][1].taken), (2, 1))
+        self.assertEqual(daily[0][1].total, 0)
+        self.assertEqual(sum(counts.total for _, counts in report.weekly()), 4)
+
+    def test_empty_report(self):
+        """No logs gives zero counts and no rates."""
+        from apps.health.services.adherence import build_adherence_report
+
+        with self.assertNumQueries(1):
+            report = build_adherence_report(self.user, self.today, self.today)
+
+        self.assertIsNone(report.overall.rate)
+        self.assertIsNone(report.overall.resolved_rate)
+        self.assertEqual(report.by_medicine, [])
+
+    def test_adherence_page_queries_do_not_grow_with_window(self):
+        """A year of adherence costs the same queries as a week."""
+        medicines = [self.create_medicine(self.user, name=f'Med {i}') for i in range(3)]
+        for days_ago in range(0, 365, 5):
+            for medicine in medicines:
+                self.log(medicine, days_ago, MedicineLog.STATUS_TAKEN)
+        url = reverse('health:medicine_adherence')
+        self.client.get(url)  # Warm up session and per-user lookups
+
+        with CaptureQueriesContext(connection) as week:
+            self.client.get(url + '?period=week')
+        with CaptureQueriesContext(connection) as year:
+            response = self.client.get(url + '?period=year')
+
+        self.assertEqual(len(year.captured_queries), len(week.captured_queries))
+        self.assertEqual(response.context['period'], 'year')
+        self.assertEqual(response.context['total_scheduled'], 3 * 73)
+        self.assertEqual(response.context['adherence_rate'], 100)
+        self.assertEqual(len(response.context['medicine_stats']), 3)
+        self.assertEqual(len(response.context['daily_data']), 53)  # Weekly buckets
@@ -1019,6 +1019,117 @@ class NutritionStatsTest(NutritionTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+    def test_period_is_capped(self):
+        """An oversized period is capped and queries do not grow with it."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.health.services.nutrition import MAX_SERIES_DAYS
+
+        self.client.get(reverse('health:nutrition_stats') + '?period=7')
+        with CaptureQueriesContext(connection) as week:
+            self.client.get(reverse('health:nutrition_stats') + '?period=7')
+        with CaptureQueriesContext(connection) as decade:
+            response = self.client.get(reverse('health:nutrition_stats') + '?period=3650')
+
+        self.assertEqual(response.context['period'], MAX_SERIES_DAYS)
+        self.assertEqual(len(response.context['daily_stats']), MAX_SERIES_DAYS)
+        self.assertEqual(len(decade.captured_queries), len(week.captured_queries))
+
+    def test_averages_per_logged_day(self):
+        """Averages divide by days with entries, not days in the period."""
+        today = timezone.now().date()
+        self.create_food_entry(self.user, logged_date=today, total_calories=Decimal('1500'))
+        self.create_food_entry(self.user, logged_date=today - timedelta(days=2),
+                               total_calories=Decimal('2500'))
+
+        response = self.client.get(reverse('health:nutrition_stats'))
+
+        self.assertEqual(response.context['avg_daily_calories'], 2000)
+
+
+class NutritionSeriesTest(NutritionTestMixin, TestCase):
+    """Tests for the nutrition series service."""
+
+    def setUp(self):
+        self.user = self.create_user()
+        self.start = date(2026, 3, 2)  # A Monday
+
+    def test_daily_series_groups_and_zero_fills(self):
+        from apps.health.services.nutrition import daily_series
+
+        self.create_food_entry(self.user, logged_date=self.start, total_calories=Decimal('500'),
+                               total_protein_g=Decimal('20'))
+        self.create_food_entry(self.user, logged_date=self.start, total_calories=Decimal('300'))
+        deleted = self.create_food_entry(self.user, logged_date=self.start,
+                                         total_calories=Decimal('999'))
+        deleted.soft_delete()
+
+        with self.assertNumQueries(2):
+            series = daily_series(self.user, self.start, self.start + timedelta(days=2))
+
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series[0]['calories'], Decimal('800'))
+        self.assertEqual(series[0]['protein'], Decimal('20'))
+        self.assertEqual(series[0]['entry_count'], 2)
+        self.assertEqual(series[1]['entry_count'], 0)
+        self.assertEqual(series[1]['calories'], Decimal('0'))
+
+    def test_fresh_summary_is_read(self):
+        from apps.health.services.nutrition import day_totals
+
+        self.create_food_entry(self.user, logged_date=self.start, total_calories=Decimal('500'))
+        summary = DailyNutritionSummary.objects.create(user=self.user, summary_date=self.start)
+        summary.recalculate()
+        # Fresh: the series reads the summary row, not the entries
+        DailyNutritionSummary.objects.filter(pk=summary.pk).update(total_calories=Decimal('501'))
+
+        self.assertEqual(day_totals(self.user, self.start)['calories'], Decimal('501'))
+
+    def test_stale_summary_is_ignored(self):
+        from apps.health.services.nutrition import day_totals
+
+        entry = self.create_food_entry(self.user, logged_date=self.start,
+                                       total_calories=Decimal('500'))
+        summary = DailyNutritionSummary.objects.create(user=self.user, summary_date=self.start)
+        summary.recalculate()
+
+        entry.total_calories = Decimal('700')
+        entry.save()
+
+        self.assertEqual(day_totals(self.user, self.start)['calories'], Decimal('700'))
+
+        entry.soft_delete()
+        self.assertEqual(day_totals(self.user, self.start)['entry_count'], 0)
+
+    def test_week_and_month_rollups(self):
+        from apps.health.services.nutrition import nutrition_series
+
+        self.create_food_entry(self.user, logged_date=self.start, total_calories=Decimal('1000'))
+        self.create_food_entry(self.user, logged_date=self.start + timedelta(days=1),
+                               total_calories=Decimal('2000'))
+        self.create_food_entry(self.user, logged_date=self.start + timedelta(days=7),
+                               total_calories=Decimal('1800'))
+
+        weeks = nutrition_series(self.user, self.start, self.start + timedelta(days=13), 'week')
+        months = nutrition_series(self.user, self.start, self.start + timedelta(days=40), 'month')
+
+        self.assertEqual(len(weeks), 2)
+        self.assertEqual(weeks[0]['calories'], Decimal('3000'))
+        self.assertEqual(weeks[0]['days_logged'], 2)
+        self.assertEqual(weeks[0]['avg_calories'], Decimal('1500'))
+        self.assertEqual(weeks[1]['start'], self.start + timedelta(days=7))
+        self.assertEqual([m['start'] for m in months], [self.start, date(2026, 4, 1)])
+        self.assertEqual(months[0]['calories'], Decimal('4800'))
+
+    def test_window_is_capped(self):
+        from apps.health.services.nutrition import MAX_SERIES_DAYS, daily_series
+
+        series = daily_series(self.user, date(2000, 1, 1), self.start)
+
+        self.assertEqual(len(series), MAX_SERIES_DAYS)
+        self.assertEqual(series[-1]['date'], self.start)
+
+
 # =============================================================================
 # 13. FOOD HISTORY VIEW TESTS
 # =============================================================================
@@ -23,7 +23,7 @@ from django.views.generic import (
 from django.http import JsonResponse
 from django.template.loader import render_to_string
 
-from apps.core.utils import get_user_today
+from apps.core.utils import get_user_timezone, get_user_today
 from apps.help.mixins import HelpContextMixin
 
 from django.shortcuts import render
@@ -67,6 +67,9 @@ from .models import (
     WorkoutSession,
     WorkoutTemplate,
 )
+from .services.medicine import build_dose_plan
+from .services.records import record_session, record_set, refresh_bests
+from .services.workouts import exercise_progress, invalidate_workout_analytics, workout_stats
 
 
 class HealthHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
@@ -194,7 +197,7 @@ class HealthHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
 
                             # Get user's timezone (use timezone_iana for legacy format support)
                             try:
-                                user_tz = pytz.timezone(user.preferences.timezone_iana)
+                                user_tz = get_user_timezone(user)
                             except (AttributeError, pytz.UnknownTimeZoneError):
                                 user_tz = pytz.UTC
 
@@ -922,6 +925,8 @@ class WorkoutCreateView(LoginRequiredMixin, TemplateView):
             except Exercise.DoesNotExist:
                 continue
 
+        record_session(workout)
+        invalidate_workout_analytics(user)
         messages.success(request, "Workout logged!")
         return redirect("health:workout_detail", pk=workout.pk)
 
@@ -973,6 +978,9 @@ class WorkoutUpdateView(LoginRequiredMixin, TemplateView):
         workout.save()
 
         # Clear existing exercises and recreate
+        touched_exercise_ids = set(
+            workout.workout_exercises.values_list("exercise_id", flat=True)
+        )
         workout.workout_exercises.all().delete()
 
         # Process exercises (same as create)
@@ -1024,6 +1032,12 @@ class WorkoutUpdateView(LoginRequiredMixin, TemplateView):
             except Exercise.DoesNotExist:
                 continue
 
+        # Edits can lower a best as well as raise it
+        touched_exercise_ids.update(
+            workout.workout_exercises.values_list("exercise_id", flat=True)
+        )
+        refresh_bests(user, touched_exercise_ids)
+        invalidate_workout_analytics(user)
         messages.success(request, "Workout updated!")
         return redirect("health:workout_detail", pk=workout.pk)
 
@@ -1039,6 +1053,10 @@ class WorkoutDeleteView(LoginRequiredMixin, View):
             pk=pk,
         )
         workout.soft_delete()
+        refresh_bests(
+            request.user, workout.workout_exercises.values_list("exercise_id", flat=True)
+        )
+        invalidate_workout_analytics(request.user)
         messages.success(request, "Workout deleted.")
         return redirect("health:fitness_home")
 
@@ -1271,20 +1289,10 @@ class ProgressView(LoginRequiredMixin, TemplateView):
         user = self.request.user
         today = get_user_today(user)
 
-        # Workout frequency
-        last_30_days = today - timedelta(days=30)
-        context["workouts_30d"] = WorkoutSession.objects.filter(
-            user=user,
-            date__gte=last_30_days,
-        ).count()
-
-        # Total volume last 30 days
-        workouts = WorkoutSession.objects.filter(
-            user=user,
-            date__gte=last_30_days,
-        )
-        total_volume = sum(w.total_volume for w in workouts)
-        context["total_volume_30d"] = round(total_volume)
+        # Workout frequency and total volume last 30 days
+        stats = workout_stats(user, today - timedelta(days=30), today)
+        context["workouts_30d"] = stats["workouts"]
+        context["total_volume_30d"] = round(stats["total_volume"])
 
         # Get unique exercises the user has done
         exercise_ids = (
@@ -1303,26 +1311,8 @@ class ProgressView(LoginRequiredMixin, TemplateView):
                 exercise = Exercise.objects.get(pk=exercise_id)
                 context["selected_exercise"] = exercise
 
-                # Get all sets for this exercise
-                workout_exercises = WorkoutExercise.objects.filter(
-                    session__user=user,
-                    exercise=exercise,
-                ).select_related("session")
-
-                progress_data = []
-                for we in workout_exercises:
-                    for s in we.sets.all():
-                        if s.weight and s.reps:
-                            progress_data.append(
-                                {
-                                    "date": we.session.date.isoformat(),
-                                    "weight": float(s.weight),
-                                    "reps": s.reps,
-                                    "volume": s.volume,
-                                }
-                            )
-
-                context["progress_data"] = progress_data
+                # Best set, estimated 1RM and volume per session
+                context["progress_data"] = exercise_progress(user, exercise)
 
             except Exercise.DoesNotExist:
                 pass
@@ -1458,6 +1448,7 @@ def start_workout_ajax(request):
         name=data.get("name") or template_name,
         started_at=timezone.now(),
     )
+    invalidate_workout_analytics(user)
 
     return JsonResponse({
         "workout_id": workout.pk,
@@ -1520,12 +1511,16 @@ def save_set_ajax(request):
             "reps": int(reps) if reps else None,
         },
     )
+    records = record_set(exercise_set)
+    invalidate_workout_analytics(user)
 
     return JsonResponse({
         "success": True,
         "set_id": exercise_set.pk,
         "workout_exercise_id": workout_exercise.pk,
         "created": set_created,
+        "is_pr": bool(records),
+        "records": records,
         "message": f"Set {set_number} saved",
     })
 
@@ -1633,10 +1628,13 @@ def complete_workout_ajax(request):
         workout.duration_minutes = int(duration.total_seconds() / 60)
 
     workout.save()
+    records = record_session(workout)
+    invalidate_workout_analytics(user)
 
     return JsonResponse({
         "success": True,
         "message": "Workout completed!",
+        "personal_records": len(records),
         "redirect_url": f"/health/fitness/workout/{workout.pk}/",
     })
 
@@ -1705,39 +1703,23 @@ class MedicineHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         today = get_user_today(user)
         now = timezone.now()
 
-        # Get active medicines
-        active_medicines = Medicine.objects.filter(
-            user=user,
-            medicine_status=Medicine.STATUS_ACTIVE,
-        )
+        # Active medicines, schedules and today's logs in a fixed number of queries
+        plan = build_dose_plan(user, today)
+        active_medicines = plan.medicines
         context["active_medicines"] = active_medicines
-        context["active_count"] = active_medicines.count()
+        context["active_count"] = len(active_medicines)
 
         # Get today's scheduled doses
         today_schedules = []
-        for medicine in active_medicines.filter(is_prn=False):
-            for schedule in medicine.schedules.filter(is_active=True):
-                if schedule.applies_to_day(today.weekday()):
-                    # Check if there's already a log for this dose today
-                    log = MedicineLog.objects.filter(
-                        medicine=medicine,
-                        schedule=schedule,
-                        scheduled_date=today,
-                    ).first()
-
-                    today_schedules.append({
-                        "medicine": medicine,
-                        "schedule": schedule,
-                        "log": log,
-                        "is_taken": log and log.log_status in [
-                            MedicineLog.STATUS_TAKEN,
-                            MedicineLog.STATUS_LATE,
-                        ],
-                        "is_overdue": self._is_overdue(schedule, log, now, today, medicine),
-                    })
+        for dose in plan:
+            today_schedules.append({
+                **dose,
+                "is_taken": dose["taken"],
+                "is_overdue": self._is_overdue(
+                    dose["schedule"], dose["log"], now, today, dose["medicine"]
+                ),
+            })
 
-        # Sort by time
-        today_schedules.sort(key=lambda x: x["schedule"].scheduled_time)
         context["today_schedules"] = today_schedules
 
         # Calculate today's stats
@@ -1788,7 +1770,7 @@ class MedicineHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         # Get user's timezone (use timezone_iana for legacy format support)
         user = self.request.user
         try:
-            user_tz = pytz.timezone(user.preferences.timezone_iana)
+            user_tz = get_user_timezone(user)
         except (AttributeError, pytz.UnknownTimeZoneError):
             user_tz = pytz.UTC
 
@@ -2384,84 +2366,59 @@ class MedicineAdherenceView(LoginRequiredMixin, TemplateView):
 
     template_name = "health/medicine/adherence.html"
 
+    # Period -> days back from today
+    PERIOD_DAYS = {"week": 7, "month": 30, "quarter": 90, "year": 365}
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
         today = get_user_today(user)
 
+        from apps.health.services.adherence import build_adherence_report
+
         # Date range
         period = self.request.GET.get("period", "week")
-        if period == "week":
-            start_date = today - timedelta(days=7)
-        elif period == "month":
-            start_date = today - timedelta(days=30)
-        else:
-            start_date = today - timedelta(days=7)
+        if period not in self.PERIOD_DAYS:
+            period = "week"
+        start_date = today - timedelta(days=self.PERIOD_DAYS[period])
 
         context["period"] = period
         context["start_date"] = start_date
         context["end_date"] = today
 
-        # Get all logs in the period
-        logs = MedicineLog.objects.filter(
-            user=user,
-            scheduled_date__gte=start_date,
-            scheduled_date__lte=today,
-            is_prn_dose=False,  # Only count scheduled doses
-        )
-
-        total = logs.count()
-        taken = logs.filter(
-            log_status__in=[MedicineLog.STATUS_TAKEN, MedicineLog.STATUS_LATE]
-        ).count()
-        missed = logs.filter(log_status=MedicineLog.STATUS_MISSED).count()
-        skipped = logs.filter(log_status=MedicineLog.STATUS_SKIPPED).count()
-        late = logs.filter(log_status=MedicineLog.STATUS_LATE).count()
+        # Overall, per-medicine and per-day counts from one grouped query
+        report = build_adherence_report(user, start_date, today)
+        overall = report.overall
 
-        context["total_scheduled"] = total
-        context["taken_count"] = taken
-        context["missed_count"] = missed
-        context["skipped_count"] = skipped
-        context["late_count"] = late
-        context["adherence_rate"] = round(taken / total * 100) if total > 0 else 0
+        context["total_scheduled"] = overall.total
+        context["taken_count"] = overall.taken
+        context["missed_count"] = overall.missed
+        context["skipped_count"] = overall.skipped
+        context["late_count"] = overall.late
+        context["adherence_rate"] = overall.rate or 0
 
         # Per-medicine breakdown
-        medicines = Medicine.objects.filter(user=user)
-        medicine_stats = []
-        for medicine in medicines:
-            med_logs = logs.filter(medicine=medicine)
-            med_total = med_logs.count()
-            med_taken = med_logs.filter(
-                log_status__in=[MedicineLog.STATUS_TAKEN, MedicineLog.STATUS_LATE]
-            ).count()
-            if med_total > 0:
-                medicine_stats.append({
-                    "medicine": medicine,
-                    "total": med_total,
-                    "taken": med_taken,
-                    "rate": round(med_taken / med_total * 100),
-                })
-        context["medicine_stats"] = sorted(
-            medicine_stats, key=lambda x: x["rate"]
-        )
-
-        # Daily breakdown for chart
-        daily_data = []
-        current = start_date
-        while current <= today:
-            day_logs = logs.filter(scheduled_date=current)
-            day_total = day_logs.count()
-            day_taken = day_logs.filter(
-                log_status__in=[MedicineLog.STATUS_TAKEN, MedicineLog.STATUS_LATE]
-            ).count()
-            daily_data.append({
-                "date": current.isoformat(),
-                "total": day_total,
-                "taken": day_taken,
-                "rate": round(day_taken / day_total * 100) if day_total > 0 else 100,
-            })
-            current += timedelta(days=1)
-        context["daily_data"] = daily_data
+        context["medicine_stats"] = [
+            {
+                "medicine": medicine,
+                "total": counts.total,
+                "taken": counts.taken,
+                "rate": counts.rate,
+            }
+            for medicine, counts in report.by_medicine
+        ]
+
+        # Breakdown for chart: daily up to a month, weekly beyond that
+        buckets = report.daily() if period in ("week", "month") else report.weekly()
+        context["daily_data"] = [
+            {
+                "date": day.isoformat(),
+                "total": counts.total,
+                "taken": counts.taken,
+                "rate": counts.rate if counts.total else 100,
+            }
+            for day, counts in buckets
+        ]
 
         return context
 
@@ -2814,66 +2771,32 @@ class NutritionStatsView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         user = self.request.user
         today = get_user_today(user)
 
-        # Get period from query param (default: 7 days)
+        from apps.health.services.nutrition import MAX_SERIES_DAYS, daily_series, rollup
+
+        # Get period from query param (default: 7 days, at most MAX_SERIES_DAYS)
         period = self.request.GET.get('period', '7')
         try:
             days = int(period)
         except ValueError:
             days = 7
+        days = max(1, min(days, MAX_SERIES_DAYS))
 
         start_date = today - timedelta(days=days - 1)
         context["period"] = days
         context["start_date"] = start_date
         context["end_date"] = today
 
-        # Get entries for period
-        entries = FoodEntry.objects.filter(
-            user=user,
-            logged_date__gte=start_date,
-            logged_date__lte=today,
-        )
-
-        # Daily aggregates
-        from django.db.models import Sum, Avg
-        daily_stats = []
-        current = start_date
-        while current <= today:
-            day_entries = entries.filter(logged_date=current)
-            day_totals = day_entries.aggregate(
-                calories=Sum('total_calories'),
-                protein=Sum('total_protein_g'),
-                carbs=Sum('total_carbohydrates_g'),
-                fat=Sum('total_fat_g'),
-            )
-            daily_stats.append({
-                "date": current,
-                "calories": day_totals['calories'] or 0,
-                "protein": day_totals['protein'] or 0,
-                "carbs": day_totals['carbs'] or 0,
-                "fat": day_totals['fat'] or 0,
-                "entry_count": day_entries.count(),
-            })
-            current += timedelta(days=1)
-
+        # Daily totals for the whole period in a fixed number of queries
+        daily_stats = daily_series(user, start_date, today)
         context["daily_stats"] = daily_stats
 
-        # Period averages
-        total_entries = entries.count()
-        if total_entries > 0:
-            period_totals = entries.aggregate(
-                calories=Sum('total_calories'),
-                protein=Sum('total_protein_g'),
-                carbs=Sum('total_carbohydrates_g'),
-                fat=Sum('total_fat_g'),
-                fiber=Sum('total_fiber_g'),
-                sugar=Sum('total_sugar_g'),
-            )
-            days_with_entries = len([d for d in daily_stats if d['entry_count'] > 0])
-            if days_with_entries > 0:
-                context["avg_daily_calories"] = int(float(period_totals['calories'] or 0) / days_with_entries)
-                context["avg_daily_protein"] = int(float(period_totals['protein'] or 0) / days_with_entries)
-                context["avg_daily_carbs"] = int(float(period_totals['carbs'] or 0) / days_with_entries)
-                context["avg_daily_fat"] = int(float(period_totals['fat'] or 0) / days_with_entries)
+        # Period averages per logged day
+        period_totals = rollup(daily_stats, 'period')[0]
+        if period_totals['days_logged'] > 0:
+            context["avg_daily_calories"] = int(period_totals['avg_calories'])
+            context["avg_daily_protein"] = int(period_totals['avg_protein'])
+            context["avg_daily_carbs"] = int(period_totals['avg_carbs'])
+            context["avg_daily_fat"] = int(period_totals['avg_fat'])
 
         # Get goals for comparison
         context["goals"] = NutritionGoals.objects.filter(
@@ -3397,7 +3320,9 @@ Please provide the following information in JSON format if available:
 Return ONLY valid JSON with no explanation. If information is not available, omit the field.
 Example format: {{"phone": "(555) 123-4567", "address_line1": "123 Main St", "city": "Springfield", "state": "IL", "postal_code": "62701"}}"""
 
-            response = client.chat.completions.create(
+            from apps.ai.instrumentation import create_completion
+            response = create_completion(
+                client, 'provider_lookup', user=request.user,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a helpful assistant that looks up healthcare provider information. Return only valid JSON."},
@@ -3674,10 +3599,12 @@ class DexcomSyncView(LoginRequiredMixin, View):
             )
             return redirect("health:glucose_dashboard")
 
-        # Get days to sync from request or use default
+        # Get days to sync from request or use default; an explicit range
+        # re-syncs all of it instead of starting at the last reading
         days = int(request.POST.get('days', credential.days_to_sync))
+        full = 'days' in request.POST
 
-        created, updated, error = sync_service.sync_from_dexcom(days=days)
+        created, updated, error = sync_service.sync_from_dexcom(days=days, full=full)
 
         if error:
             messages.error(request, f"Sync failed: {error}")
@@ -3725,7 +3652,6 @@ class GlucoseDashboardView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         user = self.request.user
         now = timezone.now()
         today = get_user_today(user)
-        week_ago = now - timedelta(days=7)
 
         # Check Dexcom connection status
         from .models import DexcomCredential
@@ -3746,64 +3672,54 @@ class GlucoseDashboardView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         except Exception:
             context['dexcom_configured'] = False
 
-        # Recent glucose entries (last 7 days)
-        glucose_entries = GlucoseEntry.objects.filter(
-            user=user,
-            recorded_at__gte=week_ago
-        ).order_by('-recorded_at')
+        # Statistics, time in range and AGP bands from one cached load
+        import json
+        from .services.glucose import REPORT_DAYS, glucose_report
 
-        context['glucose_entries'] = glucose_entries[:50]  # Last 50 readings
-        context['glucose_count_week'] = glucose_entries.count()
+        try:
+            days = int(self.request.GET.get('days', 7))
+        except ValueError:
+            days = 7
+        if days not in REPORT_DAYS:
+            days = 7
+        report = glucose_report(user, days=days)
+        context['report'] = report
+        context['report_days'] = days
+        context['report_day_choices'] = REPORT_DAYS
+        context['glucose_count'] = report['count']  # Readings in the selected window
+
+        # Recent readings for the list (newest first)
+        glucose_entries = list(GlucoseEntry.objects.filter(
+            user=user,
+            recorded_at__gte=now - timedelta(days=7)
+        ).order_by('-recorded_at')[:50])
+        context['glucose_entries'] = glucose_entries
 
         # Today's readings
         today_start = timezone.make_aware(
             timezone.datetime.combine(today, timezone.datetime.min.time())
         )
-        today_entries = glucose_entries.filter(recorded_at__gte=today_start)
-        context['today_entries'] = today_entries
-        context['today_count'] = today_entries.count()
+        context['today_count'] = sum(
+            1 for point in report['chart']
+            if timezone.datetime.fromisoformat(point['time']) >= today_start
+        )
 
         # Latest reading
-        if glucose_entries.exists():
-            context['latest_reading'] = glucose_entries.first()
-
-        # Stats for the week
-        if glucose_entries.exists():
-            stats = glucose_entries.aggregate(
-                avg=Avg('value'),
-                min=Min('value'),
-                max=Max('value'),
-            )
-            context['avg_glucose'] = round(stats['avg'], 1) if stats['avg'] else None
-            context['min_glucose'] = stats['min']
-            context['max_glucose'] = stats['max']
-
-            # Time in range (70-180 mg/dL)
-            total = glucose_entries.count()
-            in_range = glucose_entries.filter(value__gte=70, value__lte=180).count()
-            context['time_in_range'] = round((in_range / total) * 100, 1) if total > 0 else 0
-
-            # Low/high counts
-            context['low_count'] = glucose_entries.filter(value__lt=70).count()
-            context['high_count'] = glucose_entries.filter(value__gt=180).count()
-
-        # Prepare chart data (last 24 hours for detailed view)
-        day_ago = now - timedelta(hours=24)
-        chart_entries = GlucoseEntry.objects.filter(
-            user=user,
-            recorded_at__gte=day_ago
-        ).order_by('recorded_at')
-
-        chart_data = []
-        for entry in chart_entries:
-            chart_data.append({
-                'time': entry.recorded_at.isoformat(),
-                'value': float(entry.value),
-                'trend': entry.trend,
-                'trend_arrow': entry.trend_arrow_display,
-                'source': entry.source,
-            })
-        context['chart_data'] = chart_data
+        if glucose_entries:
+            context['latest_reading'] = glucose_entries[0]
+
+        # Stats for the window
+        if report['count']:
+            context['avg_glucose'] = report['mean']
+            context['min_glucose'] = report['min']
+            context['max_glucose'] = report['max']
+            context['time_in_range'] = report['time_in_range']['in_range']
+            context['low_count'] = report['low_count']
+            context['high_count'] = report['high_count']
+            context['agp_data'] = json.dumps(report['agp'])  # Empty hours are null
+
+        # Chart data (last 24 hours for detailed view)
+        context['chart_data'] = report['chart']
 
         return context
 
@@ -52,7 +52,7 @@ from django.views.generic import (
     View,
 )
 
-from apps.core.models import Category, Tag
+from apps.core.models import Category, Tag, UserActivityCounters
 from apps.help.mixins import HelpContextMixin
 
 from .forms import JournalEntryForm, TagForm
@@ -546,12 +546,13 @@ class JournalHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         today = get_user_today(user)
         
         entries = JournalEntry.objects.filter(user=user)
+        counters = UserActivityCounters.for_user(user)
         
         context["stats"] = {
-            "total": entries.count(),
+            "total": counters.journal_entry_count,
             "this_week": entries.filter(created_at__gte=week_ago).count(),
             "this_month": entries.filter(created_at__gte=month_ago).count(),
-            "streak": self._calculate_streak(entries, today),
+            "streak": counters.journal_streak(today),
         }
         
         context["recent_entries"] = entries.order_by("-entry_date")[:5]
@@ -566,20 +567,6 @@ class JournalHomeView(HelpContextMixin, LoginRequiredMixin, TemplateView):
         
         return context
     
-    def _calculate_streak(self, entries, today):
-        dates = entries.order_by('-entry_date').values_list('entry_date', flat=True).distinct()[:60]
-        if not dates:
-            return 0
-        streak = 0
-        expected_date = today
-        for entry_date in dates:
-            if entry_date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            elif entry_date < expected_date:
-                break
-        return streak
-    
     def _get_mood_stats(self, entries, since):
         MOOD_EMOJIS = {'great': '😄', 'good': '🙂', 'okay': '😐', 'low': '😔', 'difficult': '😢'}
         moods = entries.filter(created_at__gte=since).exclude(mood='').values('mood').annotate(count=Count('mood')).order_by('-count')
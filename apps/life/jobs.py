@@ -38,18 +38,14 @@ def recalculate_task_priorities():
     current_time = timezone.now()
     logger.info(f"Starting task priority recalculation at {current_time} UTC")
 
-    try:
-        # Capture command output
-        out = StringIO()
-        call_command('recalculate_task_priorities', stdout=out, verbosity=2)
-        output = out.getvalue().strip()
+    # Capture command output
+    out = StringIO()
+    call_command('recalculate_task_priorities', stdout=out, verbosity=2)
+    output = out.getvalue().strip()
 
-        logger.info(f"Task priority recalculation complete at {timezone.now()} UTC")
-        logger.info(f"Result: {output}")
-        return output
-    except Exception as e:
-        logger.exception(f"Error in task priority recalculation: {e}")
-        return None
+    logger.info(f"Task priority recalculation complete at {timezone.now()} UTC")
+    logger.info(f"Result: {output}")
+    return output
 
 
 def process_recurring_tasks():
@@ -66,14 +62,10 @@ def process_recurring_tasks():
     current_time = timezone.now()
     logger.info(f"Starting recurring task processing at {current_time} UTC")
 
-    try:
-        out = StringIO()
-        call_command('process_recurring_tasks', stdout=out, verbosity=2)
-        output = out.getvalue().strip()
-
-        logger.info(f"Recurring task processing complete at {timezone.now()} UTC")
-        logger.info(f"Result: {output}")
-        return output
-    except Exception as e:
-        logger.exception(f"Error in recurring task processing: {e}")
-        return None
+    out = StringIO()
+    call_command('process_recurring_tasks', stdout=out, verbosity=2)
+    output = out.getvalue().strip()
+
+    logger.info(f"Recurring task processing complete at {timezone.now()} UTC")
+    logger.info(f"Result: {output}")
+    return output
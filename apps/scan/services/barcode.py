@@ -5,7 +5,7 @@
 #              first, then Open Food Facts API, then uses OpenAI as fallback.
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 (Record OpenAI usage via apps.ai.instrumentation)
 # ==============================================================================
 """
 Barcode Service - Lookup nutritional information for product barcodes.
@@ -26,6 +26,8 @@ from typing import Optional
 import requests
 from django.conf import settings
 
+from apps.ai.instrumentation import create_completion
+
 logger = logging.getLogger(__name__)
 
 # Open Food Facts API configuration
@@ -451,7 +453,8 @@ class BarcodeService:
         try:
             prompt = BARCODE_LOOKUP_PROMPT.replace('{barcode}', barcode)
 
-            response = self.client.chat.completions.create(
+            response = create_completion(
+                self.client, 'scan_barcode_ai',
                 model=self.model,
                 messages=[
                     {
@@ -5,7 +5,7 @@
 #              Uses RxNav API (NIH), FDA OpenData, and OpenAI fallback.
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 (Record OpenAI usage via apps.ai.instrumentation)
 # ==============================================================================
 """
 Medicine Lookup Service - Lookup medicine information for barcodes and names.
@@ -28,6 +28,8 @@ import requests
 from django.conf import settings
 from django.core.cache import cache
 
+from apps.ai.instrumentation import create_completion
+
 logger = logging.getLogger(__name__)
 
 # API configurations
@@ -482,7 +484,8 @@ class MedicineLookupService:
         try:
             prompt = MEDICINE_LOOKUP_PROMPT.replace('{query}', query)
 
-            response = self.client.chat.completions.create(
+            response = create_completion(
+                self.client, 'scan_medicine_ai',
                 model=self.model,
                 messages=[
                     {
@@ -5,7 +5,7 @@
 #              household items). Uses UPC Item DB API and OpenAI fallback.
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 (Record OpenAI usage via apps.ai.instrumentation)
 # ==============================================================================
 """
 Product Lookup Service - Lookup product information for barcodes.
@@ -28,6 +28,8 @@ import requests
 from django.conf import settings
 from django.core.cache import cache
 
+from apps.ai.instrumentation import create_completion
+
 logger = logging.getLogger(__name__)
 
 # UPC Item DB API configuration (free tier: no key required for basic lookups)
@@ -313,7 +315,8 @@ class ProductLookupService:
         try:
             prompt = PRODUCT_LOOKUP_PROMPT.replace('{barcode}', barcode)
 
-            response = self.client.chat.completions.create(
+            response = create_completion(
+                self.client, 'scan_product_ai',
                 model=self.model,
                 messages=[
                     {
@@ -6,7 +6,7 @@
 #              and routes to appropriate app modules with pre-filled data.
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-15
-# Last Updated: 2025-12-29
+# Last Updated: 2026-10-16 (Record OpenAI usage via apps.ai.instrumentation)
 # ==============================================================================
 """
 Vision Service - OpenAI Vision API integration for WLJ.
@@ -32,6 +32,8 @@ from dataclasses import dataclass, asdict
 from django.conf import settings
 from django.urls import reverse
 
+from apps.ai.instrumentation import create_completion
+
 logger = logging.getLogger(__name__)
 
 
@@ -367,7 +369,8 @@ class VisionService:
             data_uri = f"data:{media_type};base64,{image_base64}"
 
             # Call OpenAI Vision API
-            response = self.client.chat.completions.create(
+            response = create_completion(
+                self.client, 'scan_vision',
                 model=self.model,
                 messages=[
                     {
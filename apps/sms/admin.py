@@ -4,14 +4,14 @@
 # Description: Django admin configuration for SMS models
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-30
-# Last Updated: 2025-12-30
+# Last Updated: 2026-10-16 - Verified phone index
 # ==============================================================================
 """Django admin configuration for SMS notification models."""
 
 from django.contrib import admin
 from django.utils.html import format_html
 
-from .models import SMSNotification, SMSResponse
+from .models import SMSNotification, SMSResponse, VerifiedPhoneNumber
 
 
 @admin.register(SMSNotification)
@@ -190,3 +190,15 @@ class SMSResponseAdmin(admin.ModelAdmin):
             '<span style="color: #6b7280;">Pending</span>'
         )
     processed_status.short_description = 'Processed'
+
+
+@admin.register(VerifiedPhoneNumber)
+class VerifiedPhoneNumberAdmin(admin.ModelAdmin):
+    """Admin view of the verified phone index (maintained from preferences)."""
+
+    list_display = ['phone_number', 'user', 'verified_at', 'updated_at']
+    search_fields = ['phone_number', 'user__email']
+    readonly_fields = ['phone_number', 'user', 'verified_at', 'created_at', 'updated_at']
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,213 @@
+# ==============================================================================
+# File: dispatch.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Claim-based, concurrent sending of due SMS notifications
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+SMS Dispatcher - Send due notifications in claimed, parallel batches.
+
+Each batch goes through three steps:
+
+1. Claim: due pending rows are selected with select_for_update(skip_locked)
+   and moved to 'sending' under a fresh claim token. The update only
+   matches rows that are still claimable, so two processes running the
+   send job (e.g. two gunicorn workers) never take the same row.
+2. Send: messages go out through a bounded thread pool sharing one pooled
+   Twilio HTTP session. Threads only make HTTP calls; all database work
+   stays on the calling thread.
+3. Write back: statuses are saved with one bulk_update, for the rows
+   this batch still holds.
+
+A claim left in 'sending' by a process that died is taken again after
+CLAIM_TIMEOUT, measured from when it was claimed. Batch sizes and
+timings are logged and returned.
+"""
+
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import SMSNotification
+
+logger = logging.getLogger(__name__)
+
+# A claim older than this is assumed abandoned and can be taken again
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+RESULT_FIELDS = ['status', 'sent_at', 'failed_at', 'failure_reason', 'twilio_sid', 'updated_at']
+
+
+class SMSDispatcher:
+    """
+    Sends due SMS notifications for one run of the send job.
+
+    Args:
+        service: SMSNotificationService (its TwilioService sends the SMS)
+        batch_size: Rows claimed per batch (default SMS_DISPATCH_BATCH_SIZE)
+        workers: Concurrent sends (default SMS_DISPATCH_WORKERS)
+    """
+
+    def __init__(self, service=None, batch_size=None, workers=None):
+        if service is None:
+            from .services import SMSNotificationService
+            service = SMSNotificationService()
+        self.service = service
+        self.batch_size = batch_size or getattr(settings, 'SMS_DISPATCH_BATCH_SIZE', 100)
+        self.workers = workers or getattr(settings, 'SMS_DISPATCH_WORKERS', 8)
+
+    def run(self, now=None) -> dict:
+        """
+        Claim and send batches until no due notifications are left.
+
+        Returns:
+            dict with 'sent', 'failed', 'skipped' counts and 'batches', a
+            list of per-batch dicts with size, claim_ms, send_ms and write_ms
+        """
+        now = now or timezone.now()
+        results = {'sent': 0, 'failed': 0, 'skipped': 0, 'batches': []}
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='sms-send') as pool:
+            while True:
+                started = time.monotonic()
+                batch = self.claim_batch(now)
+                if not batch:
+                    break
+                claimed = time.monotonic()
+
+                counts = self.send_batch(batch, pool)
+                sent = time.monotonic()
+
+                self.save_results(batch)
+                written = time.monotonic()
+
+                for key, value in counts.items():
+                    results[key] += value
+                timing = {
+                    'size': len(batch),
+                    'claim_ms': round((claimed - started) * 1000, 1),
+                    'send_ms': round((sent - claimed) * 1000, 1),
+                    'write_ms': round((written - sent) * 1000, 1),
+                }
+                results['batches'].append(timing)
+                logger.info(f"SMS batch dispatched: {counts} {timing}")
+
+                if len(batch) < self.batch_size:
+                    break
+        return results
+
+    def claim_batch(self, now=None) -> list:
+        """
+        Claim up to batch_size due notifications for this dispatcher.
+
+        Args:
+            now: Cutoff for scheduled_for (default: now). Claims are always
+                stamped with the current time, so a long run never hands out
+                claims that already look abandoned.
+
+        Returns:
+            List of claimed SMSNotification (status 'sending'), with user
+            preferences loaded
+        """
+        claimed_at = timezone.now()
+        now = now or claimed_at
+        token = uuid.uuid4()
+        claimable = Q(status=SMSNotification.STATUS_PENDING) | Q(
+            status=SMSNotification.STATUS_SENDING, claimed_at__lt=claimed_at - CLAIM_TIMEOUT
+        )
+
+        with transaction.atomic():
+            ids = list(
+                SMSNotification.objects.select_for_update(skip_locked=True).filter(
+                    claimable, scheduled_for__lte=now
+                ).order_by('scheduled_for').values_list('pk', flat=True)[:self.batch_size]
+            )
+            if not ids:
+                return []
+            # Re-checking claimable makes the claim safe where row locks are unavailable
+            SMSNotification.objects.filter(claimable, pk__in=ids).update(
+                status=SMSNotification.STATUS_SENDING,
+                claim_token=token,
+                claimed_at=claimed_at,
+                updated_at=claimed_at,
+            )
+
+        return list(
+            SMSNotification.objects.filter(claim_token=token).select_related('user__preferences')
+        )
+
+    def send_batch(self, batch, pool) -> dict:
+        """
+        Send a claimed batch through the thread pool.
+
+        Sets each notification's result fields in memory; save_results()
+        writes them.
+        """
+        counts = {'sent': 0, 'failed': 0, 'skipped': 0}
+        now = timezone.now()
+
+        to_send = []
+        for notification in batch:
+            notification.updated_at = now
+            phone = self.service._get_user_phone(notification.user)
+            if not phone:
+                self._fail(notification, "No verified phone number", now)
+                counts['skipped'] += 1
+            elif not self.service._is_sms_enabled(notification.user, notification.category):
+                notification.status = SMSNotification.STATUS_CANCELLED
+                counts['skipped'] += 1
+            else:
+                to_send.append((notification, phone))
+
+        twilio = self.service.twilio
+        responses = pool.map(lambda item: twilio.send_sms(item[1], item[0].message), to_send)
+
+        finished = timezone.now()
+        for (notification, _), result in zip(to_send, responses):
+            if result['success']:
+                notification.status = SMSNotification.STATUS_SENT
+                notification.sent_at = finished
+                notification.twilio_sid = result.get('sid') or ''
+                counts['sent'] += 1
+            else:
+                self._fail(notification, result.get('error') or 'Unknown error', finished)
+                counts['failed'] += 1
+        return counts
+
+    def save_results(self, batch):
+        """
+        Write the batch's statuses with one bulk_update.
+
+        Rows another dispatcher has since reclaimed (their claim token
+        changed) are left to that dispatcher.
+        """
+        if not batch:
+            return
+        token = batch[0].claim_token
+        with transaction.atomic():
+            held = set(
+                SMSNotification.objects.select_for_update().filter(
+                    pk__in=[notification.pk for notification in batch], claim_token=token
+                ).values_list('pk', flat=True)
+            )
+            owned = [notification for notification in batch if notification.pk in held]
+            if len(owned) < len(batch):
+                logger.warning(
+                    f"SMS batch {token}: {len(batch) - len(owned)} notification(s) were "
+                    f"reclaimed by another dispatcher; not writing their results"
+                )
+            SMSNotification.objects.bulk_update(owned, RESULT_FIELDS, batch_size=self.batch_size)
+
+    def _fail(self, notification, reason, when):
+        notification.status = SMSNotification.STATUS_FAILED
+        notification.failed_at = when
+        notification.failure_reason = reason[:500]
@@ -4,7 +4,7 @@
 # Description: SMS scheduler job functions (must be importable by APScheduler)
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 - Hourly rolling reminder scheduling
 # ==============================================================================
 """
 SMS Jobs - Background job functions for APScheduler.
@@ -19,24 +19,39 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def schedule_rolling_reminders(now=None):
+    """
+    Schedule SMS reminders for users whose local day just started.
+
+    This job runs hourly; each run creates SMSNotification records for
+    the users whose local time is midnight-to-1 AM, so every user's day is
+    scheduled once, on their own date.
+    """
+    from apps.sms.scheduler import SMSScheduler
+
+    logger.debug("Running rolling SMS scheduling job...")
+    scheduler = SMSScheduler()
+    results = scheduler.schedule_day_start(now)
+    if results['users_processed']:
+        logger.info(f"Rolling SMS scheduling complete: {results}")
+    return results
+
+
 def schedule_daily_reminders():
     """
     Schedule SMS reminders for all users.
 
-    This job runs daily at midnight to create SMSNotification records
-    for the upcoming day's reminders.
+    Schedules every user's current day at once. The hourly
+    schedule_rolling_reminders job does this per timezone; this is kept
+    for manual runs and catch-up.
     """
     from apps.sms.scheduler import SMSScheduler
 
     logger.info("Running daily SMS scheduling job...")
-    try:
-        scheduler = SMSScheduler()
-        results = scheduler.schedule_for_all_users()
-        logger.info(f"Daily SMS scheduling complete: {results}")
-        return results
-    except Exception as e:
-        logger.exception(f"Error in daily SMS scheduling: {e}")
-        return None
+    scheduler = SMSScheduler()
+    results = scheduler.schedule_for_all_users()
+    logger.info(f"Daily SMS scheduling complete: {results}")
+    return results
 
 
 def send_pending_sms():
@@ -49,14 +64,10 @@ def send_pending_sms():
     from apps.sms.services import SMSNotificationService
 
     logger.info("Running pending SMS send job...")
-    try:
-        service = SMSNotificationService()
-        results = service.send_pending_notifications()
-        if results['sent'] > 0 or results['failed'] > 0:
-            logger.info(f"SMS send complete: {results}")
-        else:
-            logger.debug("No pending SMS to send")
-        return results
-    except Exception as e:
-        logger.exception(f"Error sending pending SMS: {e}")
-        return None
+    service = SMSNotificationService()
+    results = service.send_pending_notifications()
+    if results['sent'] > 0 or results['failed'] > 0:
+        logger.info(f"SMS send complete: {results}")
+    else:
+        logger.debug("No pending SMS to send")
+    return results
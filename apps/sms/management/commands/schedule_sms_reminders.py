@@ -4,7 +4,7 @@
 # Description: Management command to schedule SMS reminders for all users
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-30
-# Last Updated: 2025-12-30
+# Last Updated: 2026-10-16 - Show significant event totals
 # ==============================================================================
 """
 Schedule SMS Reminders Management Command
@@ -156,7 +156,7 @@ class Command(BaseCommand):
         self.stdout.write(f"\nProcessed {results['users_processed']} users")
 
         total = 0
-        for category in ['medicine', 'medicine_refill', 'task', 'event', 'prayer', 'fasting']:
+        for category in ['medicine', 'medicine_refill', 'task', 'event', 'prayer', 'fasting', 'significant_event']:
             count = results.get(category, 0)
             if count > 0:
                 self.stdout.write(f"  {category}: {count}")
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sms", "0002_alter_smsnotification_category"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="smsnotification",
+            name="claim_token",
+            field=models.UUIDField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Batch that claimed this notification for sending",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="smsnotification",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the notification was claimed for sending",
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="smsnotification",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("delivered", "Delivered"),
+                    ("failed", "Failed"),
+                    ("cancelled", "Cancelled"),
+                ],
+                db_index=True,
+                default="pending",
+                help_text="Delivery status",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_verified_phones(apps, schema_editor):
+    """Index every verified number (the most recently verified user wins)."""
+    from apps.sms.services import normalize_phone_number
+
+    UserPreferences = apps.get_model("users", "UserPreferences")
+    VerifiedPhoneNumber = apps.get_model("sms", "VerifiedPhoneNumber")
+
+    owners = {}
+    verified = UserPreferences.objects.filter(phone_verified=True).exclude(phone_number="")
+    for prefs in verified.order_by(F("phone_verified_at").asc(nulls_first=True), "pk"):
+        normalized = normalize_phone_number(prefs.phone_number)
+        if normalized:
+            owners[normalized] = prefs
+
+    VerifiedPhoneNumber.objects.bulk_create(
+        [
+            VerifiedPhoneNumber(
+                phone_number=number, user_id=prefs.user_id, verified_at=prefs.phone_verified_at
+            )
+            for number, prefs in owners.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("sms", "0003_dispatch_claim"),
+        ("users", "0028_userpreferences_utc_offset"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerifiedPhoneNumber",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "phone_number",
+                    models.CharField(
+                        help_text="Verified number in E.164 format (+1XXXXXXXXXX)",
+                        max_length=16,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "verified_at",
+                    models.DateTimeField(
+                        blank=True, help_text="When the number was verified", null=True
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Verified Phone Number",
+                "verbose_name_plural": "Verified Phone Numbers",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="smsnotification",
+            index=models.Index(
+                condition=models.Q(("status__in", ["sent", "delivered"])),
+                fields=["user", "-sent_at"],
+                name="sms_open_by_user_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="verifiedphonenumber",
+            name="user",
+            field=models.OneToOneField(
+                help_text="User the number is verified for",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="verified_phone",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(populate_verified_phones, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,7 @@
 # Description: SMS notification models for tracking sent/scheduled SMS and responses
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-30
-# Last Updated: 2025-12-30
+# Last Updated: 2026-10-16 - Dispatch claims, verified phone index
 # ==============================================================================
 """
 SMS Models - Tracking SMS notifications and user responses.
@@ -12,6 +12,7 @@ SMS Models - Tracking SMS notifications and user responses.
 This module provides models for:
 - SMSNotification: Scheduled/sent SMS notifications with delivery status
 - SMSResponse: Incoming SMS replies and parsed actions
+- VerifiedPhoneNumber: Normalized verified numbers for resolving reply senders
 
 The SMS system supports reminders for:
 - Medicine doses and refill alerts
@@ -27,6 +28,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 from apps.core.models import TimeStampedModel
@@ -42,6 +44,7 @@ class SMSNotification(TimeStampedModel):
 
     # Status choices
     STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
     STATUS_SENT = 'sent'
     STATUS_DELIVERED = 'delivered'
     STATUS_FAILED = 'failed'
@@ -49,6 +52,7 @@ class SMSNotification(TimeStampedModel):
 
     STATUS_CHOICES = [
         (STATUS_PENDING, 'Pending'),
+        (STATUS_SENDING, 'Sending'),
         (STATUS_SENT, 'Sent'),
         (STATUS_DELIVERED, 'Delivered'),
         (STATUS_FAILED, 'Failed'),
@@ -141,6 +145,20 @@ class SMSNotification(TimeStampedModel):
         help_text="Error message if failed"
     )
 
+    # Dispatch claim (set when a sender takes the row, see SMSDispatcher)
+    claim_token = models.UUIDField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Batch that claimed this notification for sending"
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the notification was claimed for sending"
+    )
+
     # Twilio tracking
     twilio_sid = models.CharField(
         max_length=50,
@@ -188,6 +206,12 @@ class SMSNotification(TimeStampedModel):
             models.Index(fields=['status', 'scheduled_for']),
             models.Index(fields=['category', '-scheduled_for']),
             models.Index(fields=['content_type', 'object_id']),
+            # Most recent open notification per user, for matching replies
+            models.Index(
+                fields=['user', '-sent_at'],
+                condition=Q(status__in=['sent', 'delivered']),
+                name='sms_open_by_user_idx',
+            ),
         ]
 
     def __str__(self):
@@ -387,3 +411,38 @@ class SMSResponse(TimeStampedModel):
                     return (cls.ACTION_REMIND, 5)
 
         return (cls.ACTION_UNKNOWN, None)
+
+
+class VerifiedPhoneNumber(TimeStampedModel):
+    """
+    A user's verified phone number in normalized E.164 form.
+
+    Kept in step with UserPreferences by a post_save signal, so an inbound
+    reply resolves its sender with one unique-index lookup (see
+    apps/sms/phone_index.py). A number belongs to one user at a time; the
+    latest verification wins.
+    """
+
+    phone_number = models.CharField(
+        max_length=16,
+        unique=True,
+        help_text="Verified number in E.164 format (+1XXXXXXXXXX)"
+    )
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='verified_phone',
+        help_text="User the number is verified for"
+    )
+    verified_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the number was verified"
+    )
+
+    class Meta:
+        verbose_name = 'Verified Phone Number'
+        verbose_name_plural = 'Verified Phone Numbers'
+
+    def __str__(self):
+        return f"{self.phone_number} ({self.user_id})"
@@ -0,0 +1,139 @@
+# ==============================================================================
+# File: phone_index.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Verified phone number index and cached sender lookup for replies
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Phone Index - Resolve inbound SMS senders without scanning preferences.
+
+- sync_verified_phone(): keeps VerifiedPhoneNumber in step with a user's
+  preferences (called from the UserPreferences post_save signal)
+- find_user_id_by_phone(): normalizes the sender to E.164 and resolves it
+  through an in-process LRU, falling back to the unique index
+
+Cached entries expire after LOOKUP_TTL seconds. The process that changes a
+number updates its cache straight away; other processes may resolve the
+old owner until the entry expires. Misses are not cached, so a newly
+verified number works immediately everywhere.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_CACHE_SIZE = 10000
+LOOKUP_TTL = 5 * 60  # Seconds
+
+
+class PhoneLookupCache:
+    """Thread-safe LRU of E.164 number -> user id with a time to live."""
+
+    def __init__(self, maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, phone_number):
+        """Cached user id for a number, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(phone_number)
+            if entry is None:
+                return None
+            user_id, expires = entry
+            if expires <= self.clock():
+                del self._entries[phone_number]
+                return None
+            self._entries.move_to_end(phone_number)
+            return user_id
+
+    def set(self, phone_number, user_id):
+        with self._lock:
+            self._entries[phone_number] = (user_id, self.clock() + self.ttl)
+            self._entries.move_to_end(phone_number)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, phone_number):
+        with self._lock:
+            self._entries.pop(phone_number, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+lookup_cache = PhoneLookupCache()
+
+
+def find_user_id_by_phone(phone_number):
+    """
+    Id of the user who verified a phone number, or None.
+
+    Args:
+        phone_number: Number in any format normalize_phone_number accepts
+    """
+    from .models import VerifiedPhoneNumber
+    from .services import normalize_phone_number
+
+    normalized = normalize_phone_number(phone_number)
+    if not normalized:
+        return None
+
+    user_id = lookup_cache.get(normalized)
+    if user_id is None:
+        user_id = VerifiedPhoneNumber.objects.filter(
+            phone_number=normalized
+        ).values_list('user_id', flat=True).first()
+        if user_id is not None:
+            lookup_cache.set(normalized, user_id)
+    return user_id
+
+
+def sync_verified_phone(prefs):
+    """
+    Make the user's VerifiedPhoneNumber match their preferences.
+
+    A verified, valid number is stored normalized (taking it over from any
+    other user); otherwise the user's row is removed.
+    """
+    from .models import VerifiedPhoneNumber
+    from .services import normalize_phone_number
+
+    normalized = normalize_phone_number(prefs.phone_number) if prefs.phone_verified else ''
+    current = VerifiedPhoneNumber.objects.filter(user_id=prefs.user_id).first()
+
+    if not normalized:
+        if current is not None:
+            current.delete()
+        return None
+
+    if current is not None and current.phone_number == normalized:
+        lookup_cache.set(normalized, prefs.user_id)
+        return current
+
+    taken = VerifiedPhoneNumber.objects.filter(phone_number=normalized).exclude(user_id=prefs.user_id)
+    if taken.exists():
+        logger.warning(f"Phone {normalized} verified by user {prefs.user_id}; removing it from its previous user")
+        taken.delete()
+
+    if current is None:
+        current = VerifiedPhoneNumber(user_id=prefs.user_id)
+    elif current.phone_number:
+        lookup_cache.discard(current.phone_number)
+    current.phone_number = normalized
+    current.verified_at = prefs.phone_verified_at
+    current.save()
+
+    lookup_cache.set(normalized, prefs.user_id)
+    return current
@@ -4,7 +4,7 @@
 # Description: SMS scheduling for medicine, tasks, events, and other reminders
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-30
-# Last Updated: 2025-12-30
+# Last Updated: 2026-10-16 - Set-based bulk scheduling, hourly rolling by UTC offset
 # ==============================================================================
 """
 SMS Scheduler - Schedule SMS reminders for various notification categories.
@@ -16,11 +16,17 @@ This module provides functions to schedule SMS notifications for:
 - Calendar event reminders
 - Prayer reminders
 - Fasting window reminders
+- Significant event reminders
+
+Reminders are scheduled hourly: each run takes the users whose local day
+started in the last hour (found by UserPreferences.utc_offset_minutes)
+and schedules their day, so dates follow the user's timezone and the
+work is spread over 24 small runs.
 """
 
 import logging
 from datetime import datetime, time, timedelta
-from typing import List, Optional
+from typing import List
 
 from django.contrib.auth import get_user_model
 from django.db.models import Q
@@ -32,6 +38,75 @@ from .services import SMSNotificationService
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# Reminder categories scheduled by SMSScheduler, with their preference toggle
+REMINDER_PREFS = {
+    SMSNotification.CATEGORY_MEDICINE: 'sms_medicine_reminders',
+    SMSNotification.CATEGORY_MEDICINE_REFILL: 'sms_medicine_refill_alerts',
+    SMSNotification.CATEGORY_TASK: 'sms_task_reminders',
+    SMSNotification.CATEGORY_EVENT: 'sms_event_reminders',
+    SMSNotification.CATEGORY_PRAYER: 'sms_prayer_reminders',
+    SMSNotification.CATEGORY_FASTING: 'sms_fasting_reminders',
+    SMSNotification.CATEGORY_SIGNIFICANT_EVENT: 'sms_significant_event_reminders',
+}
+
+# Notifications that still count as scheduled when deduplicating; a claimed
+# (sending) reminder may still go out, so it must not be scheduled again
+OPEN_STATUSES = (
+    SMSNotification.STATUS_PENDING,
+    SMSNotification.STATUS_SENDING,
+    SMSNotification.STATUS_SENT,
+)
+
+# An existing notification within this window of a reminder is the same reminder
+DEDUPE_WINDOW = timedelta(minutes=5)
+
+# Rows per INSERT when creating notifications
+BULK_CREATE_BATCH_SIZE = 500
+
+# Local hour in which a user's day is scheduled by the hourly run
+DAY_START_LOCAL_HOUR = 0
+
+# Every UTC offset in use is a multiple of 15 minutes from UTC-12 to UTC+14
+UTC_OFFSETS = range(-12 * 60, 14 * 60 + 1, 15)
+
+
+def offsets_at_local_hour(hour, now=None) -> List[int]:
+    """UTC offsets (minutes) whose local time is in the given hour."""
+    now = now or timezone.now()
+    return [offset for offset in UTC_OFFSETS if (now + timedelta(minutes=offset)).hour == hour]
+
+
+def day_started_within(tz_name, now, window=timedelta(hours=1)) -> bool:
+    """
+    True if the local date in tz_name changed during (now - window, now].
+
+    Catches zones whose DST change skips local midnight (00:00 -> 01:00):
+    no hourly run sees their local hour 0 that day, but their date still
+    turns over.
+    """
+    import pytz
+
+    from apps.users.models import UserPreferences
+
+    try:
+        tz = pytz.timezone(UserPreferences.TIMEZONE_LEGACY_MAP.get(tz_name, tz_name) or 'UTC')
+    except pytz.UnknownTimeZoneError:
+        return False
+    return now.astimezone(tz).date() != (now - window).astimezone(tz).date()
+
+
+class ReminderCandidate:
+    """A reminder that should exist for a user, before deduplication."""
+
+    __slots__ = ('user', 'category', 'source', 'due', 'message')
+
+    def __init__(self, user, category, due, message, source=None):
+        self.user = user
+        self.category = category
+        self.source = source  # Medicine, Task, etc. (None for prayer)
+        self.due = due        # UTC datetime, before quiet hours
+        self.message = message
+
 
 class SMSScheduler:
     """
@@ -39,6 +114,11 @@ class SMSScheduler:
 
     This class is designed to be run periodically (e.g., daily at midnight)
     to schedule notifications for the next 24 hours.
+
+    Scheduling is set-based: candidates for every user are built from one
+    query per source model, checked against existing notifications with one
+    query, and inserted with bulk_create (generic FK included), so the
+    query count does not grow with the number of users or reminders.
     """
 
     def __init__(self):
@@ -56,49 +136,10 @@ class SMSScheduler:
         Returns:
             dict with counts of scheduled notifications by category
         """
-        if date is None:
-            date = self._get_user_today(user)
-
-        results = {
-            'medicine': 0,
-            'medicine_refill': 0,
-            'task': 0,
-            'event': 0,
-            'prayer': 0,
-            'fasting': 0,
-            'significant_event': 0,
-        }
-
-        try:
-            prefs = user.preferences
-        except Exception:
-            return results
-
-        if not prefs.sms_enabled or not prefs.sms_consent or not prefs.phone_verified:
-            return results
-
-        # Schedule each enabled category
-        if prefs.sms_medicine_reminders:
-            results['medicine'] = self.schedule_medicine_reminders(user, date)
-
-        if prefs.sms_medicine_refill_alerts:
-            results['medicine_refill'] = self.schedule_medicine_refill_alerts(user, date)
-
-        if prefs.sms_task_reminders:
-            results['task'] = self.schedule_task_reminders(user, date)
-
-        if prefs.sms_event_reminders:
-            results['event'] = self.schedule_event_reminders(user, date)
-
-        if prefs.sms_prayer_reminders:
-            results['prayer'] = self.schedule_prayer_reminders(user, date)
-
-        if prefs.sms_fasting_reminders:
-            results['fasting'] = self.schedule_fasting_reminders(user, date)
-
-        if prefs.sms_significant_event_reminders:
-            results['significant_event'] = self.schedule_significant_event_reminders(user, date)
+        from apps.users.models import UserPreferences
 
+        results = self.schedule_users(UserPreferences.objects.filter(user=user), date)
+        del results['users_processed']
         return results
 
     def schedule_for_all_users(self, date=None) -> dict:
@@ -106,402 +147,387 @@ class SMSScheduler:
         Schedule notifications for all users with SMS enabled.
 
         Args:
-            date: Date to schedule for (defaults to today)
+            date: Date to schedule for (defaults to each user's today)
 
         Returns:
             dict with total counts by category
         """
         from apps.users.models import UserPreferences
 
-        # Find all users with SMS enabled
-        enabled_prefs = UserPreferences.objects.filter(
-            sms_enabled=True,
-            sms_consent=True,
-            phone_verified=True
-        ).select_related('user')
-
-        totals = {
-            'users_processed': 0,
-            'medicine': 0,
-            'medicine_refill': 0,
-            'task': 0,
-            'event': 0,
-            'prayer': 0,
-            'fasting': 0,
-            'significant_event': 0,
-        }
-
-        for pref in enabled_prefs:
-            user_results = self.schedule_all_for_user(pref.user, date)
-            totals['users_processed'] += 1
-            for key in user_results:
-                totals[key] += user_results[key]
-
+        totals = self.schedule_users(UserPreferences.objects.all(), date)
         logger.info(f"Scheduled SMS for {totals['users_processed']} users: {totals}")
         return totals
 
-    def schedule_medicine_reminders(self, user, date) -> int:
+    def schedule_day_start(self, now=None) -> dict:
         """
-        Schedule medicine dose reminders for the given date.
+        Schedule today's reminders for users whose local day just started.
+
+        Run hourly. Stored UTC offsets are refreshed first so DST changes
+        move users to the right run; the users are then selected with an
+        indexed utc_offset_minutes__in filter. Timezones now in the hour
+        after DAY_START_LOCAL_HOUR whose DST change skipped it (their date
+        turned over within the last hour) are included too.
 
         Returns:
-            Number of notifications scheduled
+            dict with users_processed, counts by category and the offsets run
         """
-        from apps.health.models import Medicine, MedicineSchedule
-
-        count = 0
+        from apps.users.models import UserPreferences
 
-        # Get active medicines with schedules
-        medicines = Medicine.objects.filter(
-            user=user,
-            status='active',
-            medicine_status=Medicine.STATUS_ACTIVE
-        ).prefetch_related('schedules')
+        now = now or timezone.now()
+        UserPreferences.refresh_utc_offsets(UserPreferences.objects.filter(sms_enabled=True), now)
 
-        for medicine in medicines:
-            for schedule in medicine.schedules.filter(is_active=True):
-                # Check if this schedule applies to this day of week
-                weekday = date.weekday()
-                if str(weekday) not in schedule.days_of_week:
-                    continue
+        offsets = offsets_at_local_hour(DAY_START_LOCAL_HOUR, now)
+        next_hour = UserPreferences.objects.filter(
+            sms_enabled=True,
+            utc_offset_minutes__in=offsets_at_local_hour(DAY_START_LOCAL_HOUR + 1, now),
+        ).order_by().values_list('timezone', flat=True).distinct()
+        skipped = [tz_name for tz_name in next_hour if day_started_within(tz_name, now)]
+
+        totals = self.schedule_users(
+            UserPreferences.objects.filter(
+                Q(utc_offset_minutes__in=offsets) | Q(timezone__in=skipped)
+            ),
+            now=now,
+        )
+        totals['offsets'] = offsets
+        totals['skipped_midnight_timezones'] = skipped
+        if totals['users_processed']:
+            logger.info(f"Scheduled SMS for {totals['users_processed']} users at local midnight: {totals}")
+        return totals
 
-                # Check if notification already exists
-                scheduled_datetime = self._combine_date_time(date, schedule.scheduled_time, user)
-                if self._notification_exists(user, SMSNotification.CATEGORY_MEDICINE, medicine, scheduled_datetime):
-                    continue
+    def schedule_users(self, preferences, date=None, now=None) -> dict:
+        """
+        Schedule every enabled reminder category for a set of users in bulk.
 
-                # Build message
-                message = f"Time for {medicine.name} {medicine.dose}. Reply D=Done, R=5min, N=Skip"
+        Args:
+            preferences: UserPreferences queryset; users without SMS enabled,
+                consent and a verified phone are skipped
+            date: Date to schedule for (defaults to each user's local date
+                at now)
+            now: Current time (defaults to timezone.now())
 
-                # Schedule notification
-                notification = self.service.schedule_notification(
-                    user=user,
-                    category=SMSNotification.CATEGORY_MEDICINE,
-                    message=message,
-                    scheduled_for=scheduled_datetime,
-                    source_object=medicine
-                )
+        Returns:
+            dict with users_processed and counts by category
+        """
+        enabled_prefs = list(preferences.filter(
+            sms_enabled=True,
+            sms_consent=True,
+            phone_verified=True
+        ).select_related('user'))
+
+        totals = {'users_processed': len(enabled_prefs)}
+        totals.update({category: 0 for category in REMINDER_PREFS})
+
+        # user_id -> (user, date), and the users who want each category
+        now = now or timezone.now()
+        users = {}
+        enabled = {category: set() for category in REMINDER_PREFS}
+        for prefs in enabled_prefs:
+            user = prefs.user
+            users[user.pk] = (user, date or now.astimezone(self._get_user_tz(user)).date())
+            for category, field in REMINDER_PREFS.items():
+                if getattr(prefs, field):
+                    enabled[category].add(user.pk)
+
+        if not users:
+            return totals
+
+        candidates = []
+        candidates += self._medicine_candidates(
+            users,
+            enabled[SMSNotification.CATEGORY_MEDICINE],
+            enabled[SMSNotification.CATEGORY_MEDICINE_REFILL],
+        )
+        candidates += self._task_candidates(users, enabled[SMSNotification.CATEGORY_TASK])
+        candidates += self._event_candidates(users, enabled[SMSNotification.CATEGORY_EVENT], now)
+        candidates += self._prayer_candidates(users, enabled[SMSNotification.CATEGORY_PRAYER], now)
+        candidates += self._fasting_candidates(users, enabled[SMSNotification.CATEGORY_FASTING], now)
+        candidates += self._significant_event_candidates(
+            users, enabled[SMSNotification.CATEGORY_SIGNIFICANT_EVENT], now
+        )
 
-                if notification:
-                    count += 1
+        for notification in self._create_notifications(candidates):
+            totals[notification.category] += 1
+        return totals
 
-        return count
+    # ==========================================================================
+    # Candidate builders (one query per source model)
+    # ==========================================================================
 
-    def schedule_medicine_refill_alerts(self, user, date) -> int:
-        """
-        Schedule medicine refill alerts for low supplies.
+    def _medicine_candidates(self, users, dose_users, refill_users) -> List[ReminderCandidate]:
+        """Dose reminders for the day's schedules and refill alerts at 9 AM."""
+        from django.db.models import Prefetch
 
-        Returns:
-            Number of notifications scheduled
-        """
-        from apps.health.models import Medicine
+        from apps.health.models import Medicine, MedicineSchedule
 
-        count = 0
+        if not dose_users and not refill_users:
+            return []
 
-        # Get active medicines with supply tracking
         medicines = Medicine.objects.filter(
-            user=user,
-            status='active',
+            user_id__in=dose_users | refill_users,
             medicine_status=Medicine.STATUS_ACTIVE,
-            current_supply__isnull=False,
+        ).prefetch_related(
+            Prefetch(
+                'schedules',
+                queryset=MedicineSchedule.objects.filter(is_active=True),
+                to_attr='active_schedules',
+            )
         )
 
+        candidates = []
         for medicine in medicines:
-            # Check if medicine needs refill (supply at or below threshold)
-            if not medicine.needs_refill:
-                continue
-
-            # Estimate days remaining
-            days_remaining = medicine.estimated_days_remaining
+            user, date = users[medicine.user_id]
+            medicine.user = user
 
-            # Schedule for 9 AM in user's timezone
-            scheduled_datetime = self._combine_date_time(date, time(9, 0), user)
-
-            # Check if notification already exists today
-            if self._notification_exists(user, SMSNotification.CATEGORY_MEDICINE_REFILL, medicine, scheduled_datetime):
-                continue
-
-            # Build message
-            if days_remaining is None or days_remaining <= 0:
-                message = f"Refill needed: {medicine.name} is out. Time to refill!"
-            else:
-                message = f"Low supply: {medicine.name} ({days_remaining} days left). Time to refill!"
-
-            notification = self.service.schedule_notification(
-                user=user,
-                category=SMSNotification.CATEGORY_MEDICINE_REFILL,
-                message=message,
-                scheduled_for=scheduled_datetime,
-                source_object=medicine
-            )
-
-            if notification:
-                count += 1
-
-        return count
-
-    def schedule_task_reminders(self, user, date) -> int:
-        """
-        Schedule task due date reminders.
-
-        Returns:
-            Number of notifications scheduled
-        """
+            # PRN medicines still get reminders for any schedules they have
+            if medicine.user_id in dose_users:
+                weekday = date.weekday()
+                for schedule in medicine.active_schedules:
+                    if not schedule.applies_to_day(weekday):
+                        continue
+                    candidates.append(ReminderCandidate(
+                        user,
+                        SMSNotification.CATEGORY_MEDICINE,
+                        self._combine_date_time(date, schedule.scheduled_time, user),
+                        f"Time for {medicine.name} {medicine.dose}. Reply D=Done, R=5min, N=Skip",
+                        source=medicine,
+                    ))
+
+            if medicine.user_id in refill_users and medicine.needs_refill:
+                days_remaining = medicine.days_until_empty
+                if days_remaining is None or days_remaining <= 0:
+                    message = f"Refill needed: {medicine.name} is out. Time to refill!"
+                else:
+                    message = f"Low supply: {medicine.name} ({days_remaining} days left). Time to refill!"
+                candidates.append(ReminderCandidate(
+                    user,
+                    SMSNotification.CATEGORY_MEDICINE_REFILL,
+                    self._combine_date_time(date, time(9, 0), user),
+                    message,
+                    source=medicine,
+                ))
+
+        return candidates
+
+    def _task_candidates(self, users, task_users) -> List[ReminderCandidate]:
+        """Reminders at 9 AM for incomplete tasks due that day."""
         from apps.life.models import Task
 
-        count = 0
+        if not task_users:
+            return []
 
-        # Get tasks due today that aren't completed
         tasks = Task.objects.filter(
-            user=user,
-            status='active',
+            user_id__in=task_users,
             is_completed=False,
-            due_date=date
+            due_date__in={users[user_id][1] for user_id in task_users},
         )
 
+        candidates = []
         for task in tasks:
-            # Schedule for due time or 9 AM if no time set
-            if task.due_time:
-                scheduled_time = task.due_time
-            else:
-                scheduled_time = time(9, 0)
-
-            scheduled_datetime = self._combine_date_time(date, scheduled_time, user)
-
-            # Check if notification already exists
-            if self._notification_exists(user, SMSNotification.CATEGORY_TASK, task, scheduled_datetime):
+            user, date = users[task.user_id]
+            if task.due_date != date:
                 continue
-
-            # Build message
-            message = f"Due today: {task.title}. Reply D=Done, R=1hr, N=Not today"
-
-            notification = self.service.schedule_notification(
-                user=user,
-                category=SMSNotification.CATEGORY_TASK,
-                message=message,
-                scheduled_for=scheduled_datetime,
-                source_object=task
-            )
-
-            if notification:
-                count += 1
-
-        return count
-
-    def schedule_event_reminders(self, user, date) -> int:
-        """
-        Schedule calendar event reminders.
-
-        Returns:
-            Number of notifications scheduled
-        """
+            task.user = user
+            # Tasks have no due time, so remind at 9 AM
+            candidates.append(ReminderCandidate(
+                user,
+                SMSNotification.CATEGORY_TASK,
+                self._combine_date_time(date, time(9, 0), user),
+                f"Due today: {task.title}. Reply D=Done, R=1hr, N=Not today",
+                source=task,
+            ))
+        return candidates
+
+    def _event_candidates(self, users, event_users, now) -> List[ReminderCandidate]:
+        """Reminders 30 minutes before timed events that day, if still ahead."""
         from apps.life.models import LifeEvent
 
-        count = 0
+        if not event_users:
+            return []
 
-        # Get events happening today
         events = LifeEvent.objects.filter(
-            user=user,
-            status='active',
-            start_date=date
+            user_id__in=event_users,
+            start_date__in={users[user_id][1] for user_id in event_users},
+            start_time__isnull=False,
         )
 
+        candidates = []
         for event in events:
-            if not event.start_time:
-                continue
-
-            # Schedule reminder 30 minutes before event
-            event_datetime = self._combine_date_time(date, event.start_time, user)
-            reminder_time = event_datetime - timedelta(minutes=30)
-
-            # Don't schedule if it's in the past
-            if reminder_time < timezone.now():
+            user, date = users[event.user_id]
+            if event.start_date != date:
                 continue
+            event.user = user
 
-            # Check if notification already exists
-            if self._notification_exists(user, SMSNotification.CATEGORY_EVENT, event, reminder_time):
+            reminder_time = self._combine_date_time(date, event.start_time, user) - timedelta(minutes=30)
+            if reminder_time < now:
                 continue
 
-            # Build message
             time_str = event.start_time.strftime("%I:%M %p")
-            message = f"In 30 min: {event.title} at {time_str}"
-
-            notification = self.service.schedule_notification(
-                user=user,
-                category=SMSNotification.CATEGORY_EVENT,
-                message=message,
-                scheduled_for=reminder_time,
-                source_object=event
-            )
-
-            if notification:
-                count += 1
-
-        return count
-
-    def schedule_prayer_reminders(self, user, date) -> int:
+            candidates.append(ReminderCandidate(
+                user,
+                SMSNotification.CATEGORY_EVENT,
+                reminder_time,
+                f"In 30 min: {event.title} at {time_str}",
+                source=event,
+            ))
+        return candidates
+
+    def _prayer_candidates(self, users, prayer_users, now) -> List[ReminderCandidate]:
         """
-        Schedule daily prayer reminders.
+        A daily prayer reminder at 7 AM, if still ahead.
 
-        For now, schedules a generic reminder at 7 AM.
         Future enhancement: user-configurable prayer times.
-
-        Returns:
-            Number of notifications scheduled
         """
-        count = 0
-
-        # Schedule for 7 AM in user's timezone
-        scheduled_datetime = self._combine_date_time(date, time(7, 0), user)
-
-        # Don't schedule if it's in the past
-        if scheduled_datetime < timezone.now():
-            return 0
-
-        # Check if notification already exists today
-        existing = SMSNotification.objects.filter(
-            user=user,
-            category=SMSNotification.CATEGORY_PRAYER,
-            scheduled_for__date=date,
-            status__in=[SMSNotification.STATUS_PENDING, SMSNotification.STATUS_SENT]
-        ).exists()
-
-        if existing:
-            return 0
-
-        message = "Good morning! Take a moment for prayer and reflection today."
-
-        notification = self.service.schedule_notification(
-            user=user,
-            category=SMSNotification.CATEGORY_PRAYER,
-            message=message,
-            scheduled_for=scheduled_datetime,
+        candidates = []
+        for user_id in prayer_users:
+            user, date = users[user_id]
+            scheduled_datetime = self._combine_date_time(date, time(7, 0), user)
+            if scheduled_datetime < now:
+                continue
+            candidates.append(ReminderCandidate(
+                user,
+                SMSNotification.CATEGORY_PRAYER,
+                scheduled_datetime,
+                "Good morning! Take a moment for prayer and reflection today.",
+            ))
+        return candidates
+
+    def _fasting_candidates(self, users, fasting_users, now) -> List[ReminderCandidate]:
+        """Reminders 30 minutes before the eating window of fasts in progress opens."""
+        from apps.health.models import FastingWindow
+
+        if not fasting_users:
+            return []
+
+        fasts = FastingWindow.objects.filter(
+            user_id__in=fasting_users,
+            ended_at__isnull=True,
+            target_hours__isnull=False,
         )
 
-        if notification:
-            count += 1
-
-        return count
-
-    def schedule_fasting_reminders(self, user, date) -> int:
-        """
-        Schedule fasting window reminders.
-
-        Checks for active fasts and schedules reminders for window open/close.
+        candidates = []
+        for fast in fasts:
+            user, _ = users[fast.user_id]
+            fast.user = user
 
-        Returns:
-            Number of notifications scheduled
-        """
-        from apps.health.models import FastingSession
-
-        count = 0
-
-        # Get active fasting sessions
-        active_fasts = FastingSession.objects.filter(
-            user=user,
-            status='active',
-            is_active=True
-        )
+            window_open = fast.target_end_time
+            reminder_time = window_open - timedelta(minutes=30)
+            if reminder_time <= now:
+                continue
 
-        for fast in active_fasts:
-            # Schedule reminder 30 minutes before eating window opens
-            if fast.planned_end:
-                window_open = fast.planned_end
-                reminder_time = window_open - timedelta(minutes=30)
-
-                if reminder_time > timezone.now():
-                    # Check if notification already exists
-                    existing = SMSNotification.objects.filter(
-                        user=user,
-                        category=SMSNotification.CATEGORY_FASTING,
-                        content_type__app_label='health',
-                        content_type__model='fastingsession',
-                        object_id=fast.pk,
-                        scheduled_for=reminder_time
-                    ).exists()
-
-                    if not existing:
-                        time_str = window_open.strftime("%I:%M %p")
-                        message = f"Eating window opens at {time_str}. Keep going!"
-
-                        notification = self.service.schedule_notification(
-                            user=user,
-                            category=SMSNotification.CATEGORY_FASTING,
-                            message=message,
-                            scheduled_for=reminder_time,
-                            source_object=fast
-                        )
-
-                        if notification:
-                            count += 1
-
-        return count
-
-    def schedule_significant_event_reminders(self, user, date) -> int:
+            time_str = window_open.astimezone(self._get_user_tz(user)).strftime("%I:%M %p")
+            candidates.append(ReminderCandidate(
+                user,
+                SMSNotification.CATEGORY_FASTING,
+                reminder_time,
+                f"Eating window opens at {time_str}. Keep going!",
+                source=fast,
+            ))
+        return candidates
+
+    def _significant_event_candidates(self, users, event_users, now) -> List[ReminderCandidate]:
         """
-        Schedule reminders for significant events (birthdays, anniversaries, etc.).
-
-        For each significant event with SMS reminders enabled, schedules a
-        notification based on the configured reminder days (e.g., 7 days before,
-        1 day before, day of).
-
-        Returns:
-            Number of notifications scheduled
+        Reminders at 9 AM for significant events (birthdays, anniversaries,
+        etc.) whose configured reminder days (e.g. 7 days before, 1 day
+        before, day of) fall on the date.
         """
         from apps.life.models import SignificantEvent
 
-        count = 0
+        if not event_users:
+            return []
 
-        # Get all significant events with SMS reminders enabled
         events = SignificantEvent.objects.filter(
-            user=user,
-            status='active',
+            user_id__in=event_users,
             sms_reminder_enabled=True
         )
 
+        candidates = []
         for event in events:
-            # Get reminder days configuration
+            user, date = users[event.user_id]
+            event.user = user
+
             reminder_days_list = event.get_reminder_days_list()
             if not reminder_days_list:
                 continue
 
-            # Get next occurrence of this event
             next_occurrence = event.get_next_occurrence(date)
+            scheduled_datetime = self._combine_date_time(date, time(9, 0), user)
+            if scheduled_datetime < now:
+                continue
 
             for days_before in reminder_days_list:
-                # Calculate when this reminder should be sent
-                reminder_date = next_occurrence - timedelta(days=days_before)
-
-                # Only schedule if reminder_date is today
-                if reminder_date != date:
+                if next_occurrence - timedelta(days=days_before) != date:
                     continue
+                candidates.append(ReminderCandidate(
+                    user,
+                    SMSNotification.CATEGORY_SIGNIFICANT_EVENT,
+                    scheduled_datetime,
+                    self._build_significant_event_message(event, days_before),
+                    source=event,
+                ))
+        return candidates
+
+    # ==========================================================================
+    # Deduplication and insert
+    # ==========================================================================
+
+    def _create_notifications(self, candidates) -> List[SMSNotification]:
+        """
+        Create notifications for candidates that are not already scheduled.
 
-                # Schedule for 9 AM in user's timezone
-                scheduled_datetime = self._combine_date_time(date, time(9, 0), user)
-
-                # Don't schedule if it's in the past
-                if scheduled_datetime < timezone.now():
-                    continue
-
-                # Check if notification already exists
-                if self._significant_event_notification_exists(user, event, scheduled_datetime):
-                    continue
-
-                # Build message
-                message = self._build_significant_event_message(event, days_before)
-
-                notification = self.service.schedule_notification(
-                    user=user,
-                    category=SMSNotification.CATEGORY_SIGNIFICANT_EVENT,
-                    message=message,
-                    scheduled_for=scheduled_datetime,
-                    source_object=event
-                )
+        A candidate is a duplicate when an open notification for the same
+        user, category and source object is within DEDUPE_WINDOW of its due
+        time or its quiet-hours adjusted time. Existing notifications are
+        read with one query and new ones written with bulk_create.
+        """
+        from django.contrib.contenttypes.models import ContentType
 
-                if notification:
-                    count += 1
+        if not candidates:
+            return []
+
+        notifications = []
+        for candidate in candidates:
+            content_type = None
+            if candidate.source is not None:
+                content_type = ContentType.objects.get_for_model(candidate.source)
+            notifications.append(SMSNotification(
+                user=candidate.user,
+                category=candidate.category,
+                message=self.service.format_message(candidate.message),
+                scheduled_for=self.service._adjust_for_quiet_hours(candidate.user, candidate.due),
+                content_type=content_type,
+                object_id=candidate.source.pk if candidate.source is not None else None,
+            ))
+
+        times = [c.due for c in candidates] + [n.scheduled_for for n in notifications]
+        existing = {}
+        rows = SMSNotification.objects.filter(
+            user_id__in={c.user.pk for c in candidates},
+            category__in={c.category for c in candidates},
+            status__in=OPEN_STATUSES,
+            scheduled_for__range=(min(times) - DEDUPE_WINDOW, max(times) + DEDUPE_WINDOW),
+        ).values_list('user_id', 'category', 'content_type_id', 'object_id', 'scheduled_for')
+        for user_id, category, content_type_id, object_id, scheduled_for in rows:
+            existing.setdefault((user_id, category, content_type_id, object_id), []).append(scheduled_for)
+
+        new = []
+        for candidate, notification in zip(candidates, notifications):
+            key = (notification.user_id, notification.category,
+                   notification.content_type_id, notification.object_id)
+            scheduled = existing.setdefault(key, [])
+            if any(
+                abs(when - other) <= DEDUPE_WINDOW
+                for when in (candidate.due, notification.scheduled_for)
+                for other in scheduled
+            ):
+                continue
+            # Also stops the same reminder being created twice in one run
+            scheduled.append(notification.scheduled_for)
+            new.append(notification)
 
-        return count
+        SMSNotification.objects.bulk_create(new, batch_size=BULK_CREATE_BATCH_SIZE)
+        logger.info(f"Bulk scheduled {len(new)} SMS ({len(candidates) - len(new)} already scheduled)")
+        return new
 
     def _build_significant_event_message(self, event, days_before: int) -> str:
         """
@@ -554,51 +580,28 @@ class SMSScheduler:
 
         return base
 
-    def _significant_event_notification_exists(self, user, event, scheduled_for) -> bool:
-        """
-        Check if a significant event notification already exists.
-        """
-        from django.contrib.contenttypes.models import ContentType
-
-        content_type = ContentType.objects.get_for_model(event)
-
-        # Allow some time tolerance (within 5 minutes)
-        time_min = scheduled_for - timedelta(minutes=5)
-        time_max = scheduled_for + timedelta(minutes=5)
-
-        return SMSNotification.objects.filter(
-            user=user,
-            category=SMSNotification.CATEGORY_SIGNIFICANT_EVENT,
-            content_type=content_type,
-            object_id=event.pk,
-            scheduled_for__range=(time_min, time_max),
-            status__in=[SMSNotification.STATUS_PENDING, SMSNotification.STATUS_SENT]
-        ).exists()
-
-    def _get_user_today(self, user):
-        """Get today's date in user's timezone."""
-        from apps.core.utils import get_user_today
-        return get_user_today(user)
-
     def _combine_date_time(self, date, time_obj, user):
         """
         Combine date and time in user's timezone, return as UTC datetime.
         """
         import pytz
 
-        try:
-            prefs = user.preferences
-            user_tz = pytz.timezone(prefs.timezone)
-        except Exception:
-            user_tz = pytz.UTC
-
         # Create datetime in user's timezone
         local_dt = datetime.combine(date, time_obj)
-        local_dt = user_tz.localize(local_dt)
+        local_dt = self._get_user_tz(user).localize(local_dt)
 
         # Convert to UTC
         return local_dt.astimezone(pytz.UTC)
 
+    def _get_user_tz(self, user):
+        """Get the user's pytz timezone (UTC if unset or invalid)."""
+        import pytz
+
+        try:
+            return pytz.timezone(user.preferences.timezone_iana)
+        except Exception:
+            return pytz.UTC
+
     def _notification_exists(self, user, category, source_object, scheduled_for) -> bool:
         """
         Check if a notification already exists for this object and time.
@@ -608,8 +611,8 @@ class SMSScheduler:
         content_type = ContentType.objects.get_for_model(source_object)
 
         # Allow some time tolerance (within 5 minutes)
-        time_min = scheduled_for - timedelta(minutes=5)
-        time_max = scheduled_for + timedelta(minutes=5)
+        time_min = scheduled_for - DEDUPE_WINDOW
+        time_max = scheduled_for + DEDUPE_WINDOW
 
         return SMSNotification.objects.filter(
             user=user,
@@ -617,5 +620,5 @@ class SMSScheduler:
             content_type=content_type,
             object_id=source_object.pk,
             scheduled_for__range=(time_min, time_max),
-            status__in=[SMSNotification.STATUS_PENDING, SMSNotification.STATUS_SENT]
+            status__in=OPEN_STATUSES
         ).exists()
@@ -4,7 +4,7 @@
 # Description: Twilio SMS service and notification management
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-30
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 - Pooled Messages API session, claim-based dispatch, phone index
 # ==============================================================================
 """
 SMS Services - Twilio integration and notification management.
@@ -12,6 +12,8 @@ SMS Services - Twilio integration and notification management.
 Provides:
 - TwilioService: Direct Twilio API integration for sending SMS and verification
 - SMSNotificationService: High-level service for scheduling and managing notifications
+
+Pending notifications are sent by SMSDispatcher (apps/sms/dispatch.py).
 """
 
 import hashlib
@@ -34,6 +36,43 @@ logger = logging.getLogger(__name__)
 # E.164 phone number format regex
 E164_PATTERN = re.compile(r'^\+[1-9]\d{1,14}$')
 
+# Seconds to wait for the Messages API before giving up on a send
+SEND_TIMEOUT = 15
+
+
+class TwilioAPIError(Exception):
+    """Error response from the Twilio REST API."""
+
+
+def normalize_phone_number(phone: str) -> str:
+    """
+    Normalize a phone number to E.164 format.
+
+    Args:
+        phone: Raw phone number string
+
+    Returns:
+        Normalized phone number or empty string if invalid
+    """
+    if not phone:
+        return ''
+
+    # Remove whitespace, dashes, parentheses, dots
+    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone.strip())
+
+    # If it doesn't start with +, assume US number and add +1
+    if cleaned and not cleaned.startswith('+'):
+        if cleaned.startswith('1') and len(cleaned) == 11:
+            cleaned = '+' + cleaned
+        elif len(cleaned) == 10:
+            cleaned = '+1' + cleaned
+
+    # Validate E.164 format
+    if E164_PATTERN.match(cleaned):
+        return cleaned
+
+    return ''
+
 
 class TwilioService:
     """
@@ -45,8 +84,13 @@ class TwilioService:
     - Webhook signature validation
 
     In test mode (TWILIO_TEST_MODE=True), logs messages instead of sending.
+
+    SMS go straight to the Messages REST API through one pooled HTTP
+    session, which is safe to share between SMSDispatcher's send threads.
     """
 
+    MESSAGES_PATH = '/2010-04-01/Accounts/{account_sid}/Messages.json'
+
     def __init__(self):
         """Initialize Twilio client with credentials from settings."""
         self.account_sid = getattr(settings, 'TWILIO_ACCOUNT_SID', '') or ''
@@ -54,6 +98,8 @@ class TwilioService:
         raw_phone = getattr(settings, 'TWILIO_PHONE_NUMBER', '') or ''
         self.verify_service_sid = getattr(settings, 'TWILIO_VERIFY_SERVICE_SID', '') or ''
         self.test_mode = getattr(settings, 'TWILIO_TEST_MODE', False)
+        self.api_base_url = getattr(settings, 'TWILIO_API_BASE_URL', 'https://api.twilio.com').rstrip('/')
+        self.pool_size = getattr(settings, 'SMS_DISPATCH_WORKERS', 8)
 
         # Normalize and validate the phone number
         self.phone_number = self._normalize_phone_number(raw_phone)
@@ -64,35 +110,11 @@ class TwilioService:
             )
 
         self._client = None
+        self._session = None
 
     def _normalize_phone_number(self, phone: str) -> str:
-        """
-        Normalize a phone number to E.164 format.
-
-        Args:
-            phone: Raw phone number string
-
-        Returns:
-            Normalized phone number or empty string if invalid
-        """
-        if not phone:
-            return ''
-
-        # Remove whitespace, dashes, parentheses, dots
-        cleaned = re.sub(r'[\s\-\(\)\.]', '', phone.strip())
-
-        # If it doesn't start with +, assume US number and add +1
-        if cleaned and not cleaned.startswith('+'):
-            if cleaned.startswith('1') and len(cleaned) == 11:
-                cleaned = '+' + cleaned
-            elif len(cleaned) == 10:
-                cleaned = '+1' + cleaned
-
-        # Validate E.164 format
-        if E164_PATTERN.match(cleaned):
-            return cleaned
-
-        return ''
+        """Normalize a phone number to E.164 format (see normalize_phone_number)."""
+        return normalize_phone_number(phone)
 
     @property
     def is_configured(self):
@@ -120,6 +142,49 @@ class TwilioService:
                 raise ImportError("twilio package is required for SMS functionality")
         return self._client
 
+    @property
+    def session(self):
+        """Lazy-load the pooled HTTP session for the Messages API."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.auth = (self.account_sid, self.auth_token)
+            # One connection per dispatch thread, kept alive between sends
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._session = session
+        return self._session
+
+    def _create_message(self, to: str, body: str) -> str:
+        """
+        POST a message to the Messages API.
+
+        Returns:
+            The message SID
+
+        Raises:
+            TwilioAPIError: on an error response (message includes Twilio's code)
+        """
+        url = self.api_base_url + self.MESSAGES_PATH.format(account_sid=self.account_sid)
+        response = self.session.post(
+            url,
+            data={'To': to, 'From': self.phone_number, 'Body': body},
+            timeout=SEND_TIMEOUT,
+        )
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        if response.status_code >= 400:
+            raise TwilioAPIError(
+                f"HTTP {response.status_code} error {payload.get('code', '')}: "
+                f"{payload.get('message', response.text[:200])}"
+            )
+        return payload.get('sid', '')
+
     def send_sms(self, to: str, message: str) -> dict:
         """
         Send an SMS message via Twilio.
@@ -173,15 +238,11 @@ class TwilioService:
 
         try:
             logger.info(f"Sending SMS from {self.phone_number} to {normalized_to}")
-            sms = self.client.messages.create(
-                body=message,
-                from_=self.phone_number,
-                to=normalized_to
-            )
-            logger.info(f"SMS sent successfully to {normalized_to}, SID: {sms.sid}")
+            sid = self._create_message(normalized_to, message)
+            logger.info(f"SMS sent successfully to {normalized_to}, SID: {sid}")
             return {
                 'success': True,
-                'sid': sms.sid,
+                'sid': sid,
                 'error': None
             }
         except Exception as e:
@@ -390,67 +451,40 @@ class SMSNotificationService:
         # Check quiet hours
         adjusted_time = self._adjust_for_quiet_hours(user, scheduled_for)
 
-        # Build full message
-        full_message = f"{self.MESSAGE_PREFIX} {message}"
-        if len(full_message) > 320:
-            full_message = full_message[:317] + "..."
-
-        # Create notification
+        # Create notification, linked to the source object if provided
         notification = SMSNotification.objects.create(
             user=user,
             category=category,
-            message=full_message,
+            message=self.format_message(message),
             scheduled_for=adjusted_time,
+            content_type=ContentType.objects.get_for_model(source_object) if source_object else None,
+            object_id=source_object.pk if source_object else None,
         )
 
-        # Link source object if provided
-        if source_object:
-            notification.content_type = ContentType.objects.get_for_model(source_object)
-            notification.object_id = source_object.pk
-            notification.save(update_fields=['content_type', 'object_id'])
-
         logger.info(f"Scheduled SMS {notification.notification_id} for {user.email} at {adjusted_time}")
         return notification
 
+    def format_message(self, message: str) -> str:
+        """Prefix a message with WLJ: and fit it into two SMS segments."""
+        full_message = f"{self.MESSAGE_PREFIX} {message}"
+        if len(full_message) > 320:
+            full_message = full_message[:317] + "..."
+        return full_message
+
     def send_pending_notifications(self) -> dict:
         """
         Send all pending notifications that are due.
 
+        Rows are claimed in batches so concurrent senders never send the
+        same notification, and each batch is sent in parallel (see
+        SMSDispatcher).
+
         Returns:
-            dict with 'sent', 'failed', 'skipped' counts
+            dict with 'sent', 'failed', 'skipped' counts and 'batches'
         """
-        now = timezone.now()
-        pending = SMSNotification.objects.filter(
-            status=SMSNotification.STATUS_PENDING,
-            scheduled_for__lte=now
-        ).select_related('user')
-
-        results = {'sent': 0, 'failed': 0, 'skipped': 0}
-
-        for notification in pending:
-            # Get user's phone number
-            phone = self._get_user_phone(notification.user)
-            if not phone:
-                notification.mark_failed("No verified phone number")
-                results['skipped'] += 1
-                continue
-
-            # Check if SMS is still enabled
-            if not self._is_sms_enabled(notification.user, notification.category):
-                notification.mark_cancelled()
-                results['skipped'] += 1
-                continue
-
-            # Send the SMS
-            result = self.twilio.send_sms(phone, notification.message)
-
-            if result['success']:
-                notification.mark_sent(result.get('sid'))
-                results['sent'] += 1
-            else:
-                notification.mark_failed(result.get('error', 'Unknown error'))
-                results['failed'] += 1
+        from .dispatch import SMSDispatcher
 
+        results = SMSDispatcher(self).run()
         logger.info(f"Sent {results['sent']} SMS, {results['failed']} failed, {results['skipped']} skipped")
         return results
 
@@ -466,15 +500,16 @@ class SMSNotificationService:
         Returns:
             dict with processing results
         """
-        # Find user by phone number
-        user = self._find_user_by_phone(from_number)
+        # Find user by phone number (cached, see phone_index)
+        user_id = self._find_user_by_phone(from_number)
 
         # Find the most recent notification to this user within 24 hours
+        # (served by the sms_open_by_user_idx partial index)
         notification = None
-        if user:
+        if user_id:
             cutoff = timezone.now() - timedelta(hours=24)
             notification = SMSNotification.objects.filter(
-                user=user,
+                user_id=user_id,
                 status__in=[SMSNotification.STATUS_SENT, SMSNotification.STATUS_DELIVERED],
                 sent_at__gte=cutoff
             ).order_by('-sent_at').first()
@@ -485,7 +520,7 @@ class SMSNotificationService:
         # Create response record
         response = SMSResponse.objects.create(
             notification=notification,
-            user=user,
+            user_id=user_id,
             from_number=from_number,
             body=body,
             twilio_sms_sid=twilio_sid,
@@ -502,7 +537,7 @@ class SMSNotificationService:
 
         return {
             'response_id': str(response.response_id),
-            'user_found': user is not None,
+            'user_found': user_id is not None,
             'notification_found': notification is not None,
             'action': action,
             'result': result
@@ -529,6 +564,7 @@ class SMSNotificationService:
             SMSNotification.CATEGORY_EVENT: prefs.sms_event_reminders,
             SMSNotification.CATEGORY_PRAYER: prefs.sms_prayer_reminders,
             SMSNotification.CATEGORY_FASTING: prefs.sms_fasting_reminders,
+            SMSNotification.CATEGORY_SIGNIFICANT_EVENT: prefs.sms_significant_event_reminders,
             SMSNotification.CATEGORY_VERIFICATION: True,  # Always allow verification
             SMSNotification.CATEGORY_SYSTEM: True,  # Always allow system messages
         }
@@ -606,21 +642,11 @@ class SMSNotificationService:
             pass
         return None
 
-    def _find_user_by_phone(self, phone_number: str):
-        """Find a user by their phone number."""
-        from apps.users.models import UserPreferences
-
-        # Normalize phone number (remove spaces, dashes)
-        normalized = ''.join(c for c in phone_number if c.isdigit() or c == '+')
+    def _find_user_by_phone(self, phone_number: str) -> Optional[int]:
+        """Find the id of the user who verified a phone number."""
+        from .phone_index import find_user_id_by_phone
 
-        try:
-            prefs = UserPreferences.objects.select_related('user').get(
-                phone_number=normalized,
-                phone_verified=True
-            )
-            return prefs.user
-        except UserPreferences.DoesNotExist:
-            return None
+        return find_user_id_by_phone(phone_number)
 
     def _execute_action(self, response: SMSResponse, notification: Optional[SMSNotification]) -> str:
         """
@@ -675,7 +701,7 @@ class SMSNotificationService:
 
         # Create a new notification
         new_notification = SMSNotification.objects.create(
-            user=notification.user,
+            user_id=notification.user_id,
             category=notification.category,
             message=notification.message,
             scheduled_for=new_time,
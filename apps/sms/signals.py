@@ -4,7 +4,7 @@
 # Description: Django signals for real-time SMS notification scheduling
 # Owner: Danny Jenkins (dannyjenkins71@gmail.com)
 # Created: 2025-12-31
-# Last Updated: 2025-12-31
+# Last Updated: 2026-10-16 - Verified phone index sync
 # ==============================================================================
 """
 SMS Signals - Real-time scheduling of SMS notifications.
@@ -14,6 +14,9 @@ automatically schedule SMS notifications for any upcoming reminders today.
 
 This provides immediate scheduling rather than waiting for the nightly
 batch job.
+
+Preference saves also keep the verified phone index used to resolve
+inbound replies up to date.
 """
 
 import logging
@@ -270,3 +273,22 @@ def on_event_save(sender, instance, created, **kwargs):
             logger.info(f"Scheduled SMS notification for event '{instance.title}'")
     except Exception as e:
         logger.error(f"Error scheduling SMS for event {instance.id}: {e}")
+
+
+@receiver(post_save, sender='users.UserPreferences')
+def on_preferences_save(sender, instance, update_fields=None, **kwargs):
+    """Keep the verified phone index in step with the user's phone."""
+    if update_fields is not None and not {'phone_number', 'phone_verified'} & set(update_fields):
+        return
+    try:
+        from apps.sms.phone_index import sync_verified_phone
+        sync_verified_phone(instance)
+    except Exception as e:
+        logger.error(f"Error syncing verified phone for user {instance.user_id}: {e}")
+
+
+@receiver(post_delete, sender='sms.VerifiedPhoneNumber')
+def on_verified_phone_delete(sender, instance, **kwargs):
+    """Forget a removed number in this process's lookup cache."""
+    from apps.sms.phone_index import lookup_cache
+    lookup_cache.discard(instance.phone_number)
@@ -0,0 +1,247 @@
+# ==============================================================================
+# File: test_dispatch.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for claim-based concurrent SMS dispatch
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+SMS Dispatch Tests
+
+Tests for:
+- Claiming due notifications (no double claims, stale claims retaken)
+- Sending through a local fake Twilio Messages endpoint
+- Status write-back and per-batch timings
+- Send throughput scaling with the pool size
+"""
+
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.sms.dispatch import CLAIM_TIMEOUT, SMSDispatcher
+from apps.sms.models import SMSNotification
+from apps.sms.services import SMSNotificationService
+from apps.sms.tests.test_sms_comprehensive import SMSTestMixin
+
+# Destination the fake endpoint rejects as an invalid number
+REJECTED_NUMBER = '+15550009999'
+
+
+class FakeTwilioHandler(BaseHTTPRequestHandler):
+    """Accepts Messages API POSTs after a fixed delay."""
+
+    delay = 0.0
+    received = []
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        data = parse_qs(self.rfile.read(length).decode())
+        type(self).received.append(data)
+        time.sleep(self.delay)
+
+        if data['To'][0] == REJECTED_NUMBER:
+            status, body = 400, {'code': 21211, 'message': "The 'To' number is not valid."}
+        else:
+            status, body = 201, {'sid': f"SM{len(type(self).received):032d}", 'status': 'queued'}
+
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DispatchTestBase(SMSTestMixin, TestCase):
+    """Runs a fake Twilio endpoint on localhost for each test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeTwilioHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.settings_override = override_settings(
+            TWILIO_TEST_MODE=False,
+            TWILIO_ACCOUNT_SID='AC00000000000000000000000000000000',
+            TWILIO_AUTH_TOKEN='test-token',
+            TWILIO_PHONE_NUMBER='+15550001111',
+            TWILIO_API_BASE_URL=f'http://127.0.0.1:{cls.server.server_port}',
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        FakeTwilioHandler.delay = 0.0
+        FakeTwilioHandler.received = []
+        self.user = self.create_user()
+        self.enable_sms_for_user(self.user)
+
+    def make_due(self, count, user=None, minutes_ago=1):
+        return SMSNotification.objects.bulk_create([
+            SMSNotification(
+                user=user or self.user,
+                category=SMSNotification.CATEGORY_TASK,
+                message=f'WLJ: Reminder {i}',
+                scheduled_for=timezone.now() - timedelta(minutes=minutes_ago),
+            )
+            for i in range(count)
+        ])
+
+
+class ClaimTests(DispatchTestBase):
+    """Tests for SMSDispatcher.claim_batch."""
+
+    def test_claims_are_disjoint(self):
+        """Two dispatchers never claim the same notification."""
+        self.make_due(5)
+
+        first = SMSDispatcher(batch_size=3).claim_batch()
+        second = SMSDispatcher(batch_size=3).claim_batch()
+        third = SMSDispatcher(batch_size=3).claim_batch()
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertEqual(third, [])
+        self.assertFalse({n.pk for n in first} & {n.pk for n in second})
+        self.assertEqual(
+            SMSNotification.objects.filter(status=SMSNotification.STATUS_SENDING).count(), 5
+        )
+
+    def test_future_notifications_not_claimed(self):
+        """Only due notifications are claimed."""
+        self.make_due(2, minutes_ago=-30)
+
+        self.assertEqual(SMSDispatcher().claim_batch(), [])
+
+    def test_stale_claim_is_retaken(self):
+        """A claim abandoned for longer than CLAIM_TIMEOUT can be taken again."""
+        self.make_due(1)
+        SMSDispatcher().claim_batch()
+        SMSNotification.objects.update(claimed_at=timezone.now() - CLAIM_TIMEOUT - timedelta(minutes=1))
+
+        self.assertEqual(len(SMSDispatcher().claim_batch()), 1)
+
+    def test_claim_stamped_at_claim_time(self):
+        """A claim made late in a long run is not already stale."""
+        self.make_due(1)
+
+        batch = SMSDispatcher().claim_batch(now=timezone.now() - CLAIM_TIMEOUT * 2)
+
+        self.assertEqual(len(batch), 1)
+        self.assertGreater(batch[0].claimed_at, timezone.now() - timedelta(minutes=1))
+        self.assertEqual(SMSDispatcher().claim_batch(), [])
+
+    def test_reclaimed_rows_not_overwritten(self):
+        """Results are only written for rows the batch still holds."""
+        self.make_due(1)
+        dispatcher = SMSDispatcher()
+        batch = dispatcher.claim_batch()
+        SMSNotification.objects.update(claimed_at=timezone.now() - CLAIM_TIMEOUT - timedelta(minutes=1))
+        retaken = SMSDispatcher().claim_batch()
+
+        batch[0].status = SMSNotification.STATUS_FAILED
+        dispatcher.save_results(batch)
+
+        notification = SMSNotification.objects.get()
+        self.assertEqual(notification.status, SMSNotification.STATUS_SENDING)
+        self.assertEqual(notification.claim_token, retaken[0].claim_token)
+
+
+class DispatchTests(DispatchTestBase):
+    """Tests for SMSDispatcher.run against the fake endpoint."""
+
+    def test_sends_and_writes_back(self):
+        """Due notifications are sent and saved as sent with their SID."""
+        self.make_due(3)
+
+        results = SMSNotificationService().send_pending_notifications()
+
+        self.assertEqual(results['sent'], 3)
+        self.assertEqual(len(FakeTwilioHandler.received), 3)
+        self.assertEqual(FakeTwilioHandler.received[0]['To'], ['+15551234567'])
+        self.assertEqual(FakeTwilioHandler.received[0]['From'], ['+15550001111'])
+        for notification in SMSNotification.objects.all():
+            self.assertEqual(notification.status, SMSNotification.STATUS_SENT)
+            self.assertTrue(notification.twilio_sid.startswith('SM'))
+            self.assertIsNotNone(notification.sent_at)
+
+    def test_rejected_send_is_failed(self):
+        """An API error marks the notification failed with Twilio's code."""
+        other = self.create_user(email='rejected@example.com')
+        self.enable_sms_for_user(other, phone=REJECTED_NUMBER)
+        self.make_due(1, user=other)
+        self.make_due(1)
+
+        results = SMSDispatcher().run()
+
+        self.assertEqual(results['sent'], 1)
+        self.assertEqual(results['failed'], 1)
+        failed = SMSNotification.objects.get(user=other)
+        self.assertEqual(failed.status, SMSNotification.STATUS_FAILED)
+        self.assertIn("Invalid 'To' number", failed.failure_reason)
+
+    def test_disabled_user_cancelled(self):
+        """Notifications for users who turned SMS off are cancelled, not sent."""
+        self.make_due(1)
+        prefs = self.user.preferences
+        prefs.sms_task_reminders = False
+        prefs.save()
+
+        results = SMSDispatcher().run()
+
+        self.assertEqual(results['skipped'], 1)
+        self.assertEqual(FakeTwilioHandler.received, [])
+        self.assertEqual(SMSNotification.objects.get().status, SMSNotification.STATUS_CANCELLED)
+
+    def test_batches_and_timings(self):
+        """Work is split into batches, each with its latency recorded."""
+        self.make_due(5)
+
+        results = SMSDispatcher(batch_size=2).run()
+
+        self.assertEqual(results['sent'], 5)
+        self.assertEqual([batch['size'] for batch in results['batches']], [2, 2, 1])
+        for batch in results['batches']:
+            self.assertIn('send_ms', batch)
+            self.assertIn('claim_ms', batch)
+            self.assertIn('write_ms', batch)
+
+    def test_second_run_sends_nothing(self):
+        """Sent notifications are not sent again."""
+        self.make_due(2)
+        SMSDispatcher().run()
+
+        results = SMSDispatcher().run()
+
+        self.assertEqual(results['sent'], 0)
+        self.assertEqual(len(FakeTwilioHandler.received), 2)
+
+    def test_throughput_scales_with_pool_size(self):
+        """Sends run concurrently, so a larger pool finishes sooner."""
+        FakeTwilioHandler.delay = 0.1
+        self.make_due(16)
+
+        started = time.monotonic()
+        results = SMSDispatcher(workers=8, batch_size=16).run()
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(results['sent'], 16)
+        # 16 sends one at a time would take at least 1.6 seconds
+        self.assertLess(elapsed, 1.0)
@@ -0,0 +1,170 @@
+# ==============================================================================
+# File: test_phone_index.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for the verified phone index and cached sender lookup
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+Phone Index Tests
+
+Tests for:
+- VerifiedPhoneNumber kept in step with UserPreferences
+- Normalization of stored and inbound numbers
+- Cached lookups (no queries on a hit)
+- LRU eviction and expiry
+- Inbound replies resolved through the index
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.sms.models import SMSNotification, SMSResponse, VerifiedPhoneNumber
+from apps.sms.phone_index import PhoneLookupCache, find_user_id_by_phone, lookup_cache
+from apps.sms.services import SMSNotificationService
+from apps.sms.tests.test_sms_comprehensive import SMSTestMixin
+
+
+@override_settings(TWILIO_TEST_MODE=True)
+class VerifiedPhoneSyncTests(SMSTestMixin, TestCase):
+    """Tests for syncing VerifiedPhoneNumber from preferences."""
+
+    def setUp(self):
+        lookup_cache.clear()
+        self.user = self.create_user()
+
+    def test_verified_number_indexed(self):
+        """Verifying a number adds it to the index."""
+        self.enable_sms_for_user(self.user)
+
+        entry = VerifiedPhoneNumber.objects.get(user=self.user)
+        self.assertEqual(entry.phone_number, '+15551234567')
+        self.assertIsNotNone(entry.verified_at)
+
+    def test_number_stored_normalized(self):
+        """A ten digit US number is stored in E.164."""
+        self.enable_sms_for_user(self.user, phone='(555) 123-4567')
+
+        self.assertEqual(VerifiedPhoneNumber.objects.get(user=self.user).phone_number, '+15551234567')
+        self.assertEqual(find_user_id_by_phone('555-123-4567'), self.user.pk)
+
+    def test_removed_number_unindexed(self):
+        """Clearing verification removes the number and its cache entry."""
+        prefs = self.enable_sms_for_user(self.user)
+        self.assertEqual(find_user_id_by_phone('+15551234567'), self.user.pk)
+
+        prefs.phone_number = ''
+        prefs.phone_verified = False
+        prefs.save()
+
+        self.assertFalse(VerifiedPhoneNumber.objects.filter(user=self.user).exists())
+        self.assertIsNone(find_user_id_by_phone('+15551234567'))
+
+    def test_changed_number_replaces_old(self):
+        """A new verified number replaces the user's previous one."""
+        prefs = self.enable_sms_for_user(self.user)
+        find_user_id_by_phone('+15551234567')
+
+        prefs.phone_number = '+15557654321'
+        prefs.save()
+
+        self.assertIsNone(find_user_id_by_phone('+15551234567'))
+        self.assertEqual(find_user_id_by_phone('+15557654321'), self.user.pk)
+
+    def test_number_moves_to_new_user(self):
+        """A number verified by another user is taken over by that user."""
+        self.enable_sms_for_user(self.user)
+        other = self.create_user(email='newowner@example.com')
+
+        self.enable_sms_for_user(other)
+
+        self.assertFalse(VerifiedPhoneNumber.objects.filter(user=self.user).exists())
+        self.assertEqual(find_user_id_by_phone('+15551234567'), other.pk)
+
+    def test_unrelated_update_fields_skip_sync(self):
+        """Saves that don't touch the phone fields leave the index alone."""
+        prefs = self.enable_sms_for_user(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            prefs.save(update_fields=['sms_task_reminders'])
+
+        self.assertEqual(len(queries.captured_queries), 1)
+
+
+@override_settings(TWILIO_TEST_MODE=True)
+class PhoneLookupTests(SMSTestMixin, TestCase):
+    """Tests for find_user_id_by_phone and PhoneLookupCache."""
+
+    def setUp(self):
+        lookup_cache.clear()
+        self.user = self.create_user()
+        self.enable_sms_for_user(self.user)
+        lookup_cache.clear()
+
+    def test_cached_lookup_runs_no_queries(self):
+        """Only the first lookup of a number queries the database."""
+        with CaptureQueriesContext(connection) as first:
+            self.assertEqual(find_user_id_by_phone('+15551234567'), self.user.pk)
+        with CaptureQueriesContext(connection) as second:
+            self.assertEqual(find_user_id_by_phone('+1 555 123 4567'), self.user.pk)
+
+        self.assertEqual(len(first.captured_queries), 1)
+        self.assertEqual(len(second.captured_queries), 0)
+
+    def test_unknown_and_invalid_numbers(self):
+        """Unknown numbers are not cached; invalid ones don't query."""
+        self.assertIsNone(find_user_id_by_phone('+15550000000'))
+        self.assertEqual(len(lookup_cache), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIsNone(find_user_id_by_phone('12'))
+        self.assertEqual(len(queries.captured_queries), 0)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is dropped past maxsize."""
+        cache = PhoneLookupCache(maxsize=2)
+        cache.set('+15550000001', 1)
+        cache.set('+15550000002', 2)
+        cache.get('+15550000001')
+        cache.set('+15550000003', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('+15550000001'), 1)
+        self.assertIsNone(cache.get('+15550000002'))
+
+    def test_entries_expire(self):
+        """Entries older than the TTL are treated as missing."""
+        now = [1000.0]
+        cache = PhoneLookupCache(ttl=60, clock=lambda: now[0])
+        cache.set('+15550000001', 1)
+
+        now[0] += 59
+        self.assertEqual(cache.get('+15550000001'), 1)
+        now[0] += 2
+        self.assertIsNone(cache.get('+15550000001'))
+        self.assertEqual(len(cache), 0)
+
+    def test_incoming_reply_resolved_through_index(self):
+        """Inbound replies find the user and their latest sent notification."""
+        notification = SMSNotification.objects.create(
+            user=self.user,
+            category=SMSNotification.CATEGORY_TASK,
+            message='WLJ: Test',
+            scheduled_for=timezone.now() - timedelta(minutes=5),
+        )
+        notification.mark_sent('SM12345')
+
+        result = SMSNotificationService().process_incoming_reply(
+            from_number='5551234567', body='D', twilio_sid='SM67890'
+        )
+
+        self.assertTrue(result['user_found'])
+        self.assertTrue(result['notification_found'])
+        response = SMSResponse.objects.get(twilio_sms_sid='SM67890')
+        self.assertEqual(response.user, self.user)
+        self.assertEqual(response.notification, notification)
@@ -0,0 +1,320 @@
+# ==============================================================================
+# File: test_scheduler.py
+# Project: Whole Life Journey - Django 5.x Personal Wellness/Journaling App
+# Description: Tests for set-based SMS reminder scheduling
+# Owner: Danny Jenkins (dannyjenkins71@gmail.com)
+# Created: 2026-10-16
+# Last Updated: 2026-10-16
+# ==============================================================================
+"""
+SMS Scheduler Tests
+
+Tests for:
+- Bulk candidate building across users and categories
+- Deduplication against existing notifications
+- Generic FK set on insert
+- Query count independent of the number of users
+- Hourly scheduling by UTC offset
+"""
+
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.utils import get_user_today, get_utc_offset_minutes
+from apps.health.models import FastingWindow, Medicine, MedicineSchedule
+from apps.life.models import LifeEvent, SignificantEvent, Task
+from apps.sms.models import SMSNotification
+from apps.sms.scheduler import SMSScheduler, offsets_at_local_hour
+from apps.sms.services import SMSNotificationService
+from apps.sms.tests.test_sms_comprehensive import SMSTestMixin
+from apps.users.models import UserPreferences
+
+
+@override_settings(TWILIO_TEST_MODE=True)
+class BulkSchedulerTests(SMSTestMixin, TestCase):
+    """Tests for SMSScheduler.schedule_users and schedule_for_all_users."""
+
+    def setUp(self):
+        self.scheduler = SMSScheduler()
+        self.user = self.make_sms_user('bulk1@example.com')
+        # Tomorrow, so real-time signal scheduling (today only) stays out of the way
+        self.date = get_user_today(self.user) + timedelta(days=1)
+
+    def make_sms_user(self, email):
+        user = self.create_user(email=email)
+        prefs = self.enable_sms_for_user(user)
+        prefs.sms_significant_event_reminders = True
+        prefs.sms_fasting_reminders = True
+        prefs.save()
+        return user
+
+    def add_items(self, user):
+        """One medicine with two doses, a task, an event and a birthday."""
+        medicine = Medicine.objects.create(
+            user=user,
+            name='Metformin',
+            dose='500mg',
+            frequency='twice_daily',
+            start_date=self.date - timedelta(days=30),
+        )
+        MedicineSchedule.objects.create(medicine=medicine, scheduled_time=time(8, 0))
+        MedicineSchedule.objects.create(medicine=medicine, scheduled_time=time(20, 0))
+        Task.objects.create(user=user, title='Call the pharmacy', due_date=self.date)
+        LifeEvent.objects.create(
+            user=user, title='Dentist', start_date=self.date, start_time=time(14, 0)
+        )
+        SignificantEvent.objects.create(
+            user=user,
+            title='Birthday',
+            person_name='Sam',
+            event_date=self.date.replace(year=1990),
+            sms_reminder_enabled=True,
+            reminder_days=[0, 7],
+        )
+        # Drop any of today's reminders the real-time signals scheduled
+        SMSNotification.objects.filter(user=user).delete()
+        return medicine
+
+    def test_schedules_every_category(self):
+        """Each enabled category gets its reminders with the source linked."""
+        medicine = self.add_items(self.user)
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['medicine'], 2)
+        self.assertEqual(results['task'], 1)
+        self.assertEqual(results['event'], 1)
+        self.assertEqual(results['significant_event'], 1)
+        self.assertNotIn('users_processed', results)
+
+        doses = SMSNotification.objects.filter(
+            user=self.user, category=SMSNotification.CATEGORY_MEDICINE
+        )
+        self.assertEqual(doses.count(), 2)
+        for notification in doses:
+            self.assertEqual(notification.content_type, ContentType.objects.get_for_model(Medicine))
+            self.assertEqual(notification.object_id, medicine.pk)
+            self.assertTrue(notification.message.startswith('WLJ: Time for Metformin 500mg'))
+
+        birthday = SMSNotification.objects.get(
+            user=self.user, category=SMSNotification.CATEGORY_SIGNIFICANT_EVENT
+        )
+        self.assertIn("Sam's Birthday is today!", birthday.message)
+
+    def test_rerun_creates_nothing(self):
+        """Reminders already scheduled are not scheduled again."""
+        self.add_items(self.user)
+        self.scheduler.schedule_all_for_user(self.user, self.date)
+        count = SMSNotification.objects.count()
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(sum(results.values()), 0)
+        self.assertEqual(SMSNotification.objects.count(), count)
+
+    def test_existing_notification_within_window_is_kept(self):
+        """A reminder scheduled a few minutes off is treated as the same one."""
+        task = Task.objects.create(user=self.user, title='Renew passport', due_date=self.date)
+        SMSNotificationService().schedule_notification(
+            user=self.user,
+            category=SMSNotification.CATEGORY_TASK,
+            message='Due today: Renew passport',
+            scheduled_for=self.scheduler._combine_date_time(self.date, time(9, 3), self.user),
+            source_object=task,
+        )
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['task'], 0)
+        self.assertEqual(SMSNotification.objects.filter(object_id=task.pk).count(), 1)
+
+    def test_notification_being_sent_is_kept(self):
+        """A reminder claimed by the dispatcher is not scheduled a second time."""
+        task = Task.objects.create(user=self.user, title='Renew passport', due_date=self.date)
+        scheduled_for = self.scheduler._combine_date_time(self.date, time(9, 0), self.user)
+        notification = SMSNotificationService().schedule_notification(
+            user=self.user,
+            category=SMSNotification.CATEGORY_TASK,
+            message='Due today: Renew passport',
+            scheduled_for=scheduled_for,
+            source_object=task,
+        )
+        SMSNotification.objects.filter(pk=notification.pk).update(
+            status=SMSNotification.STATUS_SENDING
+        )
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['task'], 0)
+        self.assertTrue(self.scheduler._notification_exists(
+            self.user, SMSNotification.CATEGORY_TASK, task, scheduled_for
+        ))
+        self.assertEqual(SMSNotification.objects.filter(object_id=task.pk).count(), 1)
+
+    def test_prn_medicine_with_schedule_is_reminded(self):
+        """As-needed medicines keep dose reminders for their active schedules."""
+        medicine = Medicine.objects.create(
+            user=self.user,
+            name='Ibuprofen',
+            dose='200mg',
+            frequency='as_needed',
+            is_prn=True,
+            start_date=self.date - timedelta(days=30),
+        )
+        MedicineSchedule.objects.create(medicine=medicine, scheduled_time=time(21, 0))
+        SMSNotification.objects.filter(user=self.user).delete()
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['medicine'], 1)
+        notification = SMSNotification.objects.get(category=SMSNotification.CATEGORY_MEDICINE)
+        self.assertEqual(notification.object_id, medicine.pk)
+
+    def test_disabled_category_is_skipped(self):
+        """Category toggles are respected."""
+        self.add_items(self.user)
+        prefs = self.user.preferences
+        prefs.sms_medicine_reminders = False
+        prefs.save()
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['medicine'], 0)
+        self.assertEqual(results['task'], 1)
+
+    def test_fasting_reminder(self):
+        """A fast in progress gets a reminder before its eating window opens."""
+        fast = FastingWindow.objects.create(
+            user=self.user, started_at=timezone.now(), target_hours=16
+        )
+
+        results = self.scheduler.schedule_all_for_user(self.user, self.date)
+
+        self.assertEqual(results['fasting'], 1)
+        notification = SMSNotification.objects.get(category=SMSNotification.CATEGORY_FASTING)
+        self.assertEqual(notification.object_id, fast.pk)
+
+    def test_query_count_independent_of_users(self):
+        """Scheduling more users with more items does not add queries."""
+        self.add_items(self.user)
+        with CaptureQueriesContext(connection) as one_user:
+            self.scheduler.schedule_for_all_users(self.date)
+        SMSNotification.objects.all().delete()
+
+        for i in range(2, 5):
+            self.add_items(self.make_sms_user(f'bulk{i}@example.com'))
+        with CaptureQueriesContext(connection) as four_users:
+            totals = self.scheduler.schedule_for_all_users(self.date)
+
+        self.assertEqual(totals['users_processed'], 4)
+        self.assertEqual(totals['medicine'], 8)
+        self.assertEqual(len(four_users.captured_queries), len(one_user.captured_queries))
+
+    def test_significant_event_not_cancelled_when_sent(self):
+        """Significant event reminders pass the category check at send time."""
+        service = SMSNotificationService()
+        self.assertTrue(
+            service._is_sms_enabled(self.user, SMSNotification.CATEGORY_SIGNIFICANT_EVENT)
+        )
+
+
+@override_settings(TWILIO_TEST_MODE=True)
+class DayStartSchedulingTests(SMSTestMixin, TestCase):
+    """Tests for hourly scheduling of users whose local day just started."""
+
+    # 15:10 UTC is 00:10 the next day in Tokyo and 10:10 in New York
+    NOW = datetime(2030, 1, 15, 15, 10, tzinfo=dt_timezone.utc)
+
+    def setUp(self):
+        self.scheduler = SMSScheduler()
+        self.tokyo = self.make_sms_user('tokyo@example.com', 'Asia/Tokyo')
+        self.new_york = self.make_sms_user('ny@example.com', 'America/New_York')
+
+    def make_sms_user(self, email, tz_name):
+        user = self.create_user(email=email)
+        prefs = self.enable_sms_for_user(user)
+        prefs.timezone = tz_name
+        prefs.save()
+        return user
+
+    def test_offsets_at_local_hour(self):
+        """Each offset maps to the hour its local clock shows."""
+        self.assertIn(540, offsets_at_local_hour(0, self.NOW))
+        self.assertNotIn(-300, offsets_at_local_hour(0, self.NOW))
+        self.assertIn(-300, offsets_at_local_hour(10, self.NOW))
+
+        # Half-hour zones land in the run after their midnight
+        india_run = datetime(2030, 1, 15, 19, 0, tzinfo=dt_timezone.utc)
+        self.assertIn(330, offsets_at_local_hour(0, india_run))
+
+        # Offsets a day apart can share a local hour
+        both = offsets_at_local_hour(0, datetime(2030, 1, 15, 10, 0, tzinfo=dt_timezone.utc))
+        self.assertIn(-600, both)
+        self.assertIn(840, both)
+
+    def test_offset_kept_on_save(self):
+        """Saving preferences stores the timezone's current UTC offset."""
+        self.assertEqual(self.tokyo.preferences.utc_offset_minutes, 540)
+        self.assertEqual(
+            self.new_york.preferences.utc_offset_minutes,
+            get_utc_offset_minutes('America/New_York'),
+        )
+
+    def test_refresh_fixes_stale_offsets(self):
+        """A DST change is picked up by refresh_utc_offsets."""
+        UserPreferences.objects.filter(user=self.new_york).update(utc_offset_minutes=-240)
+
+        updated = UserPreferences.refresh_utc_offsets(now=self.NOW)  # January: EST
+
+        self.assertEqual(updated, 1)
+        self.new_york.preferences.refresh_from_db()
+        self.assertEqual(self.new_york.preferences.utc_offset_minutes, -300)
+
+    def test_schedules_only_users_at_day_start(self):
+        """Only users whose local day just started are scheduled, on their date."""
+        Task.objects.create(user=self.tokyo, title='Tokyo task', due_date=date(2030, 1, 16))
+        Task.objects.create(user=self.new_york, title='New York task', due_date=date(2030, 1, 15))
+
+        results = self.scheduler.schedule_day_start(self.NOW)
+
+        self.assertEqual(results['users_processed'], 1)
+        self.assertEqual(results['task'], 1)
+        notification = SMSNotification.objects.get(category=SMSNotification.CATEGORY_TASK)
+        self.assertEqual(notification.user, self.tokyo)
+        # 9 AM Tokyo time
+        self.assertEqual(notification.scheduled_for, datetime(2030, 1, 16, 0, 0, tzinfo=dt_timezone.utc))
+
+    def test_stale_offset_refreshed_before_selecting(self):
+        """A user with an out-of-date offset is still scheduled in the right run."""
+        UserPreferences.objects.filter(user=self.new_york).update(utc_offset_minutes=0)
+        new_york_midnight = datetime(2030, 1, 15, 5, 10, tzinfo=dt_timezone.utc)
+
+        results = self.scheduler.schedule_day_start(new_york_midnight)
+
+        self.assertEqual(results['users_processed'], 1)
+        self.assertIn(-300, results['offsets'])
+
+    def test_dst_change_skipping_midnight(self):
+        """Users in a zone whose DST change skips 00:00 are scheduled at 01:00."""
+        santiago = self.make_sms_user('santiago@example.com', 'America/Santiago')
+        Task.objects.create(user=santiago, title='Santiago task', due_date=date(2030, 9, 8))
+        # Chile springs forward at 00:00 on 8 Sep 2030: 03:00 UTC is 23:00
+        # on the 7th (-04:00) and 04:00 UTC is already 01:00 (-03:00)
+        before = datetime(2030, 9, 8, 3, 0, tzinfo=dt_timezone.utc)
+        after = datetime(2030, 9, 8, 4, 0, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(self.scheduler.schedule_day_start(before)['task'], 0)
+        results = self.scheduler.schedule_day_start(after)
+
+        self.assertEqual(results['skipped_midnight_timezones'], ['America/Santiago'])
+        self.assertEqual(results['task'], 1)
+        self.assertEqual(SMSNotification.objects.get(category=SMSNotification.CATEGORY_TASK).user, santiago)
+
+        # An ordinary day is scheduled once, at local midnight
+        ordinary = datetime(2030, 9, 9, 3, 0, tzinfo=dt_timezone.utc)
+        self.assertEqual(self.scheduler.schedule_day_start(ordinary)['skipped_midnight_timezones'], [])
@@ -355,8 +355,8 @@ def sms_history(request):
     ).order_by('-scheduled_for')[:100]
 
     # Get user timezone for display (use timezone_iana for legacy format support)
-    import pytz
-    user_tz = pytz.timezone(request.user.preferences.timezone_iana)
+    from apps.core.utils import get_user_timezone
+    user_tz = get_user_timezone(request.user)
 
     # Group by date (in user's timezone)
     grouped = {}
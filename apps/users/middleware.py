@@ -11,6 +11,8 @@ Description:
     wizard before they can access the main application.
 
 Key Responsibilities:
+    - UserContextMiddleware: Load preferences and latest terms acceptance once
+      per request and memoize the user's timezone and "today"
     - TermsAcceptanceMiddleware: Redirect to terms page if not accepted
     - Redirect to onboarding wizard if not completed
     - Exempt certain paths (login, logout, admin, static files)
@@ -34,10 +36,112 @@ Copyright:
 
 import zoneinfo
 
+import pytz
 from django.conf import settings
+from django.contrib.auth.middleware import get_user
+from django.db.models import OuterRef, Subquery
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+
+
+class UserRequestContext:
+    """
+    Request-scoped user state shared by middleware, context processors,
+    views and apps.core.utils helpers.
+
+    Attached to the user as ``user._request_context`` by
+    UserContextMiddleware. The timezone and "today" are resolved once and
+    re-resolved only if the preferences' timezone changes mid-request.
+    """
+
+    def __init__(self, user, latest_terms_version):
+        self.user = user
+        self.latest_terms_version = latest_terms_version
+        self._tz_name = None
+        self._tzinfo = None
+        self._zoneinfo = None
+        self._today = None
+
+    @property
+    def preferences(self):
+        return self.user.preferences
+
+    def _resolve_timezone(self):
+        name = self.preferences.timezone_iana
+        if name != self._tz_name:
+            self._tz_name = name
+            self._tzinfo = pytz.timezone(name)
+            self._zoneinfo = None
+            self._today = None
+
+    @property
+    def tzinfo(self):
+        """pytz timezone, as used by get_user_now/get_user_today."""
+        self._resolve_timezone()
+        return self._tzinfo
+
+    @property
+    def zoneinfo(self):
+        """zoneinfo timezone, as activated by TimezoneMiddleware."""
+        self._resolve_timezone()
+        if self._zoneinfo is None:
+            self._zoneinfo = zoneinfo.ZoneInfo(self._tz_name)
+        return self._zoneinfo
+
+    def now(self):
+        return timezone.now().astimezone(self.tzinfo)
+
+    @property
+    def today(self):
+        self._resolve_timezone()
+        if self._today is None:
+            self._today = self.now().date()
+        return self._today
+
+
+def attach_user_context(user):
+    """
+    Load preferences and the latest accepted terms version in one query and
+    attach a UserRequestContext to the user.
+
+    Users without a preferences row are returned untouched so
+    ``user.preferences`` keeps its usual behaviour.
+    """
+    if not user.is_authenticated:
+        return user
+
+    from .models import TermsAcceptance, UserPreferences
+
+    latest_terms = TermsAcceptance.objects.filter(
+        user=OuterRef("user")
+    ).order_by("-accepted_at").values("terms_version")[:1]
+    prefs = UserPreferences.objects.annotate(
+        latest_terms_version=Subquery(latest_terms)
+    ).filter(user=user).first()
+    if prefs is None:
+        return user
+
+    user.preferences = prefs
+    user._request_context = UserRequestContext(user, prefs.latest_terms_version)
+    return user
+
+
+class UserContextMiddleware:
+    """
+    Install a request-scoped UserRequestContext on request.user.
+
+    Must run after AuthenticationMiddleware. The user is still loaded
+    lazily, so requests that never touch request.user pay nothing.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.user = SimpleLazyObject(lambda: attach_user_context(get_user(request)))
+        return self.get_response(request)
 
 
 class TermsAcceptanceMiddleware:
@@ -120,12 +224,15 @@ class TimezoneMiddleware:
     def __call__(self, request):
         if request.user.is_authenticated:
             try:
-                # Use timezone_iana property which handles legacy US/Eastern format
-                user_timezone = request.user.preferences.timezone_iana
-                if user_timezone:
-                    tz = zoneinfo.ZoneInfo(user_timezone)
-                    timezone.activate(tz)
-            except (AttributeError, zoneinfo.ZoneInfoNotFoundError):
+                context = getattr(request.user, "_request_context", None)
+                if context is not None:
+                    timezone.activate(context.zoneinfo)
+                else:
+                    # Use timezone_iana property which handles legacy US/Eastern format
+                    user_timezone = request.user.preferences.timezone_iana
+                    if user_timezone:
+                        timezone.activate(zoneinfo.ZoneInfo(user_timezone))
+            except (AttributeError, zoneinfo.ZoneInfoNotFoundError, pytz.UnknownTimeZoneError):
                 # If timezone is invalid or preferences don't exist, use UTC
                 timezone.deactivate()
         else:
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:59
+
+import pytz
+from django.db import migrations, models
+from django.utils import timezone
+
+# UserPreferences.TIMEZONE_LEGACY_MAP as of this migration
+LEGACY_TIMEZONES = {
+    "US/Eastern": "America/New_York",
+    "US/Central": "America/Chicago",
+    "US/Mountain": "America/Denver",
+    "US/Pacific": "America/Los_Angeles",
+}
+
+
+def utc_offset_minutes(tz_name, now):
+    """UTC offset in minutes at ``now``; unknown names are treated as UTC."""
+    try:
+        tz = pytz.timezone(tz_name or "UTC")
+    except pytz.UnknownTimeZoneError:
+        return 0
+    return int(now.astimezone(tz).utcoffset().total_seconds() // 60)
+
+
+def populate_utc_offsets(apps, schema_editor):
+    """Set utc_offset_minutes from each stored timezone (one update per timezone)."""
+    UserPreferences = apps.get_model("users", "UserPreferences")
+    now = timezone.now()
+    timezones = UserPreferences.objects.order_by().values_list("timezone", flat=True).distinct()
+    for tz_name in list(timezones):
+        offset = utc_offset_minutes(LEGACY_TIMEZONES.get(tz_name, tz_name), now)
+        UserPreferences.objects.filter(timezone=tz_name).update(utc_offset_minutes=offset)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0027_signup_security"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userpreferences",
+            name="utc_offset_minutes",
+            field=models.SmallIntegerField(
+                db_index=True,
+                default=0,
+                editable=False,
+                help_text="Current UTC offset of the timezone in minutes",
+            ),
+        ),
+        migrations.RunPython(populate_utc_offsets, migrations.RunPython.noop),
+    ]
@@ -146,6 +146,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     def has_accepted_current_terms(self):
         """Check if user has accepted the current version of terms."""
         current_version = settings.WLJ_SETTINGS.get("TERMS_VERSION", "1.0")
+        # Loaded alongside preferences by UserContextMiddleware
+        context = getattr(self, "_request_context", None)
+        if context is not None:
+            return context.latest_terms_version == current_version
         try:
             acceptance = self.terms_acceptances.latest("accepted_at")
             return acceptance.terms_version == current_version
@@ -337,6 +341,14 @@ class UserPreferences(models.Model):
         default="UTC",
         help_text="User's timezone for date/time display",
     )
+    # Kept in step with timezone on save and by refresh_utc_offsets() across
+    # DST changes, so hourly jobs can find users at a local hour by index
+    utc_offset_minutes = models.SmallIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        help_text="Current UTC offset of the timezone in minutes",
+    )
 
     # Dashboard configuration (JSON field for flexibility)
     dashboard_config = models.JSONField(
@@ -539,6 +551,40 @@ class UserPreferences(models.Model):
     def __str__(self):
         return f"Preferences for {self.user.email}"
 
+    def save(self, *args, **kwargs):
+        from apps.core.utils import get_utc_offset_minutes
+
+        self.utc_offset_minutes = get_utc_offset_minutes(self.timezone_iana)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "timezone" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "utc_offset_minutes"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_utc_offsets(cls, queryset=None, now=None):
+        """
+        Update stored UTC offsets that a DST change has made stale.
+
+        One grouped query finds the (timezone, offset) pairs in use; only
+        pairs whose offset changed are updated.
+
+        Returns:
+            int: Number of preferences updated
+        """
+        from apps.core.utils import get_utc_offset_minutes
+
+        queryset = cls.objects.all() if queryset is None else queryset
+        pairs = queryset.order_by().values_list("timezone", "utc_offset_minutes").distinct()
+
+        updated = 0
+        for tz_name, stored in list(pairs):
+            current = get_utc_offset_minutes(cls.TIMEZONE_LEGACY_MAP.get(tz_name, tz_name), now)
+            if current != stored:
+                updated += queryset.filter(
+                    timezone=tz_name, utc_offset_minutes=stored
+                ).update(utc_offset_minutes=current)
+        return updated
+
     @property
     def timezone_iana(self):
         """
@@ -659,7 +705,7 @@ class UserPreferences(models.Model):
         Returns dict with current totals, goals, and progress percentages.
         """
         from django.utils import timezone
-        from apps.health.models import FoodEntry, DailyNutritionSummary
+        from apps.health.services.nutrition import day_totals
         from apps.core.utils import get_user_today
 
         if not self.has_nutrition_goals:
@@ -668,29 +714,12 @@ class UserPreferences(models.Model):
         if date is None:
             date = get_user_today(self.user) if self.user_id else timezone.now().date()
 
-        # Get today's nutrition data
-        summary = DailyNutritionSummary.objects.filter(
-            user=self.user,
-            summary_date=date,
-            status='active'
-        ).first()
-
-        if not summary:
-            # Calculate from food entries if no summary
-            entries = FoodEntry.objects.filter(
-                user=self.user,
-                logged_date=date,
-                status='active'
-            )
-            total_calories = sum(float(e.total_calories) for e in entries)
-            total_protein_g = sum(float(e.total_protein_g) for e in entries)
-            total_carbs_g = sum(float(e.total_carbohydrates_g) for e in entries)
-            total_fat_g = sum(float(e.total_fat_g) for e in entries)
-        else:
-            total_calories = float(summary.total_calories)
-            total_protein_g = float(summary.total_protein_g)
-            total_carbs_g = float(summary.total_carbohydrates_g)
-            total_fat_g = float(summary.total_fat_g)
+        # Today's nutrition data (fresh DailyNutritionSummary or FoodEntry totals)
+        totals = day_totals(self.user, date)
+        total_calories = float(totals['calories'])
+        total_protein_g = float(totals['protein'])
+        total_carbs_g = float(totals['carbs'])
+        total_fat_g = float(totals['fat'])
 
         # Calculate goal targets in grams from percentages
         calorie_goal = self.daily_calorie_goal or 2000
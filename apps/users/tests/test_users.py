@@ -247,4 +247,63 @@ class PreferencesViewTest(TestCase):
             self.user.preferences.theme,
             'dark',
             f"Theme should be 'dark', got '{self.user.preferences.theme}'"
-        )
\ No newline at end of file
+        )
+
+class UserRequestContextTest(TestCase):
+    """Tests for the request-scoped user context middleware."""
+
+    def setUp(self):
+        from django.conf import settings
+        from apps.users.models import TermsAcceptance
+
+        self.user = User.objects.create_user(
+            email='context@example.com',
+            password='testpass123'
+        )
+        self.terms_version = settings.WLJ_SETTINGS.get('TERMS_VERSION', '1.0')
+        TermsAcceptance.objects.create(user=self.user, terms_version='0.1')
+        TermsAcceptance.objects.create(user=self.user, terms_version=self.terms_version)
+        self.user.preferences.timezone = 'America/New_York'
+        self.user.preferences.save()
+
+    def load(self, user=None):
+        from apps.users.middleware import attach_user_context
+
+        return attach_user_context(user or User.objects.get(pk=self.user.pk))
+
+    def test_preferences_and_terms_loaded_together(self):
+        """Terms acceptance and preferences come from a single query."""
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.load(user)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_accepted_current_terms)
+            self.assertEqual(user.preferences.timezone, 'America/New_York')
+
+    def test_timezone_helpers_reuse_context(self):
+        """get_user_today/get_user_now resolve through the memoized context."""
+        from apps.core.utils import get_user_now, get_user_timezone, get_user_today
+
+        user = self.load()
+        with self.assertNumQueries(0):
+            self.assertEqual(str(get_user_timezone(user)), 'America/New_York')
+            self.assertEqual(get_user_today(user), get_user_now(user).date())
+
+    def test_timezone_change_is_picked_up(self):
+        """Changing the timezone mid-request re-resolves the memoized tzinfo."""
+        from apps.core.utils import get_user_timezone
+
+        user = self.load()
+        get_user_timezone(user)
+        user.preferences.timezone = 'Asia/Tokyo'
+
+        self.assertEqual(str(get_user_timezone(user)), 'Asia/Tokyo')
+
+    def test_outdated_terms_not_accepted(self):
+        """Only the latest acceptance counts."""
+        from apps.users.models import TermsAcceptance
+
+        TermsAcceptance.objects.create(user=self.user, terms_version='0.1')
+
+        self.assertFalse(self.load().has_accepted_current_terms)
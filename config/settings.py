@@ -31,6 +31,8 @@ Dependencies:
 Environment Variables Required:
     - SECRET_KEY: Django secret key (required)
     - DATABASE_URL: PostgreSQL connection string (optional, defaults to SQLite)
+    - CACHE_URL / CACHE_VERSION: Shared cache backend and key version (optional)
+    - CACHE_MAX_ENTRIES / CACHE_CULL_FREQUENCY: Cache size and culling (optional)
     - OPENAI_API_KEY: OpenAI API key for AI features
     - CLOUDINARY_*: Cloud storage credentials
     - BIBLE_API_KEY: API.Bible key for Scripture lookups
@@ -49,6 +51,15 @@ import environ
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
 OPENAI_VISION_MODEL = os.environ.get('OPENAI_VISION_MODEL', 'gpt-4o')
+# Outbound OpenAI request limits (see apps/ai/executor.py)
+OPENAI_BASE_URL = os.environ.get('OPENAI_BASE_URL', '')  # e.g. a local stub server
+OPENAI_TIMEOUT = float(os.environ.get('OPENAI_TIMEOUT', '20'))
+OPENAI_MAX_RETRIES = int(os.environ.get('OPENAI_MAX_RETRIES', '1'))
+OPENAI_MAX_CONCURRENCY = int(os.environ.get('OPENAI_MAX_CONCURRENCY', '4'))
+
+# Persistent prompt/response cache (apps.ai.models.AIResponseCache)
+AI_RESPONSE_CACHE_TTL = int(os.environ.get('AI_RESPONSE_CACHE_TTL', '3600'))  # 0 disables
+AI_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('AI_RESPONSE_CACHE_MAX_ENTRIES', '5000'))
 
 # Claude Code API Key for task fetching
 # Used by Claude Code to authenticate with the Ready Tasks API endpoint
@@ -141,6 +152,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.users.middleware.UserContextMiddleware",  # Request-scoped preferences/timezone
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -192,6 +204,43 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Shared between gunicorn workers so rate limits, SiteConfiguration and the
+# dashboard fragment cache are not warmed separately in every process.
+# Defaults to the database cache when DATABASE_URL is set (run
+# `manage.py createcachetable` on deploy) and to LocMemCache for local
+# SQLite development. Set CACHE_URL to use another backend, e.g.
+# redis://host:6379/0 or filecache:///tmp/wlj-cache. Bump CACHE_VERSION to
+# invalidate every key after a deploy that changes cached data shapes.
+CACHES = {
+    "default": env.cache(
+        "CACHE_URL",
+        default="dbcache://wlj_cache_table" if DATABASE_URL else "locmemcache://",
+    ),
+}
+CACHES["default"].update({
+    "KEY_PREFIX": env("CACHE_KEY_PREFIX", default="wlj"),
+    "VERSION": env.int("CACHE_VERSION", default=1),
+})
+# A ?timeout= in CACHE_URL wins over the default
+CACHES["default"].setdefault("TIMEOUT", 300)
+
+# The database, file and local-memory backends cull on overflow. Django's
+# default (300 entries, cull a third) thrashes once each user holds a few
+# dozen keys (dashboard fragments, generation tokens, workout analytics,
+# glucose reports, AI lookups), so size for users x keys and cull a tenth.
+# Values given as CACHE_URL query options win.
+if CACHES["default"]["BACKEND"] in (
+    "django.core.cache.backends.db.DatabaseCache",
+    "django.core.cache.backends.filebased.FileBasedCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+):
+    cache_options = CACHES["default"].setdefault("OPTIONS", {})
+    cache_options.setdefault("MAX_ENTRIES", env.int("CACHE_MAX_ENTRIES", default=100000))
+    cache_options.setdefault("CULL_FREQUENCY", env.int("CACHE_CULL_FREQUENCY", default=10))
+
+
 
 
 # Password validation
@@ -647,6 +696,12 @@ PLAID_ENV = env('PLAID_ENV', default='sandbox')  # sandbox, development, product
 # Token encryption key - generate with: Fernet.generate_key()
 BANK_TOKEN_ENCRYPTION_KEY = env('BANK_TOKEN_ENCRYPTION_KEY', default='')
 
+# Bulk sync of all connections (apps/finance/services/sync_orchestrator.py)
+FINANCE_SYNC_MAX_WORKERS = env.int('FINANCE_SYNC_MAX_WORKERS', default=4)
+FINANCE_SYNC_PER_INSTITUTION = env.int('FINANCE_SYNC_PER_INSTITUTION', default=2)
+FINANCE_SYNC_MIN_INTERVAL_MINUTES = env.int('FINANCE_SYNC_MIN_INTERVAL_MINUTES', default=360)
+FINANCE_SYNC_MAX_ATTEMPTS = env.int('FINANCE_SYNC_MAX_ATTEMPTS', default=3)
+
 # Webhook URL for real-time transaction updates
 if DEBUG:
     PLAID_WEBHOOK_URL = ''  # Webhooks don't work with localhost
@@ -683,6 +738,13 @@ TWILIO_TEST_MODE = env.bool('TWILIO_TEST_MODE', default=DEBUG)
 # Trigger token for protected API endpoints (used by external cron)
 SMS_TRIGGER_TOKEN = env('SMS_TRIGGER_TOKEN', default='')
 
+# Twilio REST API root; point at a local fake endpoint for load testing
+TWILIO_API_BASE_URL = env('TWILIO_API_BASE_URL', default='https://api.twilio.com')
+
+# Pending SMS dispatch: rows claimed per batch and concurrent sends (threads)
+SMS_DISPATCH_BATCH_SIZE = env.int('SMS_DISPATCH_BATCH_SIZE', default=100)
+SMS_DISPATCH_WORKERS = env.int('SMS_DISPATCH_WORKERS', default=8)
+
 # Log Twilio configuration status at startup
 if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
     print(f"Twilio configured - Test Mode: {TWILIO_TEST_MODE}")
@@ -729,6 +791,14 @@ APSCHEDULER_DATETIME_FORMAT = "N j, Y, f:s a"
 # Run scheduler only in production (managed by run_scheduler command)
 APSCHEDULER_RUN_NOW_TIMEOUT = 25  # Seconds
 
+# Scheduled jobs run in a leader-elected runner that holds a DB lease for
+# JOBS_LEASE_TTL seconds. Until a worker service (python manage.py run_jobs)
+# is deployed, the web process runs it (RUN_JOBS_IN_WEB, default True); the
+# lease keeps web and worker runners from running jobs twice. Set
+# RUN_JOBS_IN_WEB=False on the web service once the worker is running.
+RUN_JOBS_IN_WEB = env.bool("RUN_JOBS_IN_WEB", default=True)
+JOBS_LEASE_TTL = env.int("JOBS_LEASE_TTL", default=60)
+
 
 # ==============================================================================
 # Google reCAPTCHA v3 Configuration